@@ -0,0 +1,34 @@
+"""add_embedding_changes_outbox
+
+Revision ID: a3c1e9d27b40
+Revises: f4ce455d8933
+Create Date: 2026-10-18 09:12:41.208315
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'a3c1e9d27b40'
+down_revision = 'f4ce455d8933'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_table('embedding_changes',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('source', sa.String(length=20), nullable=False),
+    sa.Column('content_id', sa.UUID(), nullable=False),
+    sa.Column('operation', sa.String(length=10), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_embedding_changes'))
+    )
+    op.create_index('ix_embedding_changes_operation', 'embedding_changes', ['operation'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_embedding_changes_operation', table_name='embedding_changes')
+    op.drop_table('embedding_changes')
@@ -0,0 +1,128 @@
+"""achievement_counters
+
+Revision ID: a8e5c3f7d264
+Revises: e6b1d4f8a237
+Create Date: 2026-10-18 21:47:12.604318
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'a8e5c3f7d264'
+down_revision = 'e6b1d4f8a237'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Keep the earliest award of each achievement, then enforce one per user
+    op.execute("""
+        DELETE FROM user_achievements
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY user_id, achievement_id ORDER BY earned_at NULLS LAST, id
+                ) AS rn
+                FROM user_achievements
+            ) AS ranked
+            WHERE rn > 1
+        )
+    """)
+    op.create_index(
+        'ix_user_achievements_user_achievement', 'user_achievements',
+        ['user_id', 'achievement_id'], unique=True
+    )
+
+    # Counters are now maintained incrementally; rebuild them from the source tables
+    op.execute("""
+        INSERT INTO user_stats (
+            id, user_id, total_plants, active_plants, plants_identified, total_care_logs,
+            care_streak_days, longest_care_streak, questions_asked, questions_answered,
+            helpful_answers, trades_completed, total_achievements, total_points, level,
+            last_updated, created_at
+        )
+        SELECT gen_random_uuid(), u.id, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1,
+               now() at time zone 'utc', now() at time zone 'utc'
+        FROM users AS u
+        ON CONFLICT (user_id) DO NOTHING
+    """)
+    op.execute("""
+        UPDATE user_stats AS s SET
+            total_plants = (SELECT count(*) FROM user_plants AS p WHERE p.user_id = s.user_id),
+            active_plants = (
+                SELECT count(*) FROM user_plants AS p WHERE p.user_id = s.user_id AND p.is_active
+            ),
+            plants_identified = (
+                SELECT count(*) FROM plant_identifications AS i WHERE i.user_id = s.user_id
+            ),
+            total_care_logs = (
+                SELECT count(*) FROM plant_care_logs AS l
+                JOIN user_plants AS p ON p.id = l.plant_id
+                WHERE p.user_id = s.user_id
+            ),
+            last_care_activity = (
+                SELECT max(l.performed_at) FROM plant_care_logs AS l
+                JOIN user_plants AS p ON p.id = l.plant_id
+                WHERE p.user_id = s.user_id
+            ),
+            questions_asked = (SELECT count(*) FROM plant_questions AS q WHERE q.user_id = s.user_id),
+            questions_answered = (SELECT count(*) FROM plant_answers AS a WHERE a.user_id = s.user_id),
+            helpful_answers = (
+                SELECT coalesce(sum(a.upvotes), 0) FROM plant_answers AS a WHERE a.user_id = s.user_id
+            ),
+            total_achievements = (
+                SELECT count(*) FROM user_achievements AS ua WHERE ua.user_id = s.user_id
+            ),
+            total_points = (
+                SELECT coalesce(sum(pa.points), 0) FROM user_achievements AS ua
+                JOIN plant_achievements AS pa ON pa.id = ua.achievement_id
+                WHERE ua.user_id = s.user_id
+            ),
+            last_updated = now() at time zone 'utc'
+    """)
+    # Care streaks: runs of consecutive care days; the current one must reach yesterday
+    op.execute("""
+        WITH days AS (
+            SELECT DISTINCT p.user_id, l.performed_at::date AS day
+            FROM plant_care_logs AS l
+            JOIN user_plants AS p ON p.id = l.plant_id
+            WHERE l.performed_at IS NOT NULL
+        ),
+        runs AS (
+            SELECT user_id, count(*) AS length, max(day) AS last_day
+            FROM (
+                SELECT user_id, day, day - (row_number() OVER (PARTITION BY user_id ORDER BY day))::int AS grp
+                FROM days
+            ) AS numbered
+            GROUP BY user_id, grp
+        ),
+        streaks AS (
+            SELECT
+                user_id,
+                max(length) AS longest,
+                max(length) FILTER (WHERE last_day >= (now() at time zone 'utc')::date - 1) AS current
+            FROM runs
+            GROUP BY user_id
+        )
+        UPDATE user_stats AS s
+        SET longest_care_streak = streaks.longest,
+            care_streak_days = coalesce(streaks.current, 0)
+        FROM streaks
+        WHERE streaks.user_id = s.user_id
+    """)
+    op.execute("""
+        UPDATE user_stats SET level = CASE
+            WHEN total_points < 100 THEN 1
+            WHEN total_points < 300 THEN 2
+            WHEN total_points < 600 THEN 3
+            WHEN total_points < 1000 THEN 4
+            WHEN total_points < 1500 THEN 5
+            ELSE least(10, 5 + (total_points - 1500) / 500)
+        END
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_user_achievements_user_achievement', table_name='user_achievements')
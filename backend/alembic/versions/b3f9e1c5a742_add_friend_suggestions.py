@@ -0,0 +1,66 @@
+"""add_friend_suggestions
+
+Revision ID: b3f9e1c5a742
+Revises: a8e5c3f7d264
+Create Date: 2026-10-18 22:31:05.218846
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b3f9e1c5a742'
+down_revision = 'a8e5c3f7d264'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_table('friend_suggestions',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('suggested_user_id', sa.UUID(), nullable=False),
+    sa.Column('mutual_count', sa.Integer(), nullable=False),
+    sa.Column('computed_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], name=op.f('fk_friend_suggestions_user_id_users'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['suggested_user_id'], ['users.id'], name=op.f('fk_friend_suggestions_suggested_user_id_users'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'suggested_user_id', name=op.f('pk_friend_suggestions'))
+    )
+    op.create_index('ix_friend_suggestions_user_rank', 'friend_suggestions', ['user_id', 'mutual_count'], unique=False)
+
+    # Backfill the top 50 friends-of-friends per user with one join over the accepted edges
+    op.execute("""
+        WITH edges AS (
+            SELECT requester_id AS user_id, addressee_id AS friend_id
+            FROM friendships WHERE status = 'accepted'
+            UNION ALL
+            SELECT addressee_id, requester_id
+            FROM friendships WHERE status = 'accepted'
+        ),
+        mutuals AS (
+            SELECT a.user_id, b.friend_id AS suggested_user_id, count(*) AS mutual_count
+            FROM edges AS a
+            JOIN edges AS b ON b.user_id = a.friend_id
+            WHERE b.friend_id <> a.user_id
+              AND NOT EXISTS (
+                  SELECT 1 FROM edges AS direct
+                  WHERE direct.user_id = a.user_id AND direct.friend_id = b.friend_id
+              )
+            GROUP BY a.user_id, b.friend_id
+        )
+        INSERT INTO friend_suggestions (user_id, suggested_user_id, mutual_count, computed_at)
+        SELECT user_id, suggested_user_id, mutual_count, now() at time zone 'utc'
+        FROM (
+            SELECT *, row_number() OVER (
+                PARTITION BY user_id ORDER BY mutual_count DESC, suggested_user_id
+            ) AS rn
+            FROM mutuals
+        ) AS ranked
+        WHERE rn <= 50
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_friend_suggestions_user_rank', table_name='friend_suggestions')
+    op.drop_table('friend_suggestions')
@@ -0,0 +1,60 @@
+"""add_friendship_counters
+
+Revision ID: b7d2f4a1c8e3
+Revises: a3c1e9d27b40
+Create Date: 2026-10-18 11:40:03.517214
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b7d2f4a1c8e3'
+down_revision = 'a3c1e9d27b40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_table('friendship_counters',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('friends_count', sa.Integer(), nullable=False),
+    sa.Column('close_friends_count', sa.Integer(), nullable=False),
+    sa.Column('pending_received_count', sa.Integer(), nullable=False),
+    sa.Column('pending_sent_count', sa.Integer(), nullable=False),
+    sa.Column('blocked_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], name=op.f('fk_friendship_counters_user_id_users'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', name=op.f('pk_friendship_counters'))
+    )
+
+    # Backfill from existing friendships in one pass
+    op.execute("""
+        INSERT INTO friendship_counters (
+            user_id, friends_count, close_friends_count,
+            pending_received_count, pending_sent_count, blocked_count, updated_at
+        )
+        SELECT
+            sides.user_id,
+            COUNT(*) FILTER (WHERE sides.status = 'accepted'),
+            COUNT(*) FILTER (WHERE sides.status = 'accepted' AND sides.is_close_friend),
+            COUNT(*) FILTER (WHERE sides.status = 'pending' AND NOT sides.is_requester),
+            COUNT(*) FILTER (WHERE sides.status = 'pending' AND sides.is_requester),
+            COUNT(*) FILTER (WHERE sides.status = 'blocked' AND sides.is_requester),
+            now()
+        FROM (
+            SELECT requester_id AS user_id, status, COALESCE(is_close_friend, false) AS is_close_friend,
+                   true AS is_requester
+            FROM friendships
+            UNION ALL
+            SELECT addressee_id, status, COALESCE(is_close_friend, false), false
+            FROM friendships
+        ) AS sides
+        GROUP BY sides.user_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_table('friendship_counters')
@@ -0,0 +1,28 @@
+"""add_nursery_location_index
+
+Revision ID: c4e8a2d6f913
+Revises: b7d2f4a1c8e3
+Create Date: 2026-10-18 13:05:27.904118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c4e8a2d6f913'
+down_revision = 'b7d2f4a1c8e3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_index(
+        'ix_local_nurseries_lat_lon', 'local_nurseries', ['latitude', 'longitude'],
+        unique=False, postgresql_where=sa.text('is_active')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_local_nurseries_lat_lon', table_name='local_nurseries')
@@ -0,0 +1,62 @@
+"""add_full_text_search
+
+Revision ID: d9a3f6b2e571
+Revises: c4e8a2d6f913
+Create Date: 2026-10-18 14:21:09.615832
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'd9a3f6b2e571'
+down_revision = 'c4e8a2d6f913'
+branch_labels = None
+depends_on = None
+
+
+def _search_vector(title_column: str, body_column: str) -> sa.Computed:
+    return sa.Computed(
+        f"setweight(to_tsvector('english', coalesce({title_column}, '')), 'A') || "
+        f"setweight(to_tsvector('english', coalesce({body_column}, '')), 'B')",
+        persisted=True
+    )
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    op.add_column('plant_trades', sa.Column(
+        'search_vector', postgresql.TSVECTOR(), _search_vector('title', 'description'), nullable=True
+    ))
+    op.add_column('plant_questions', sa.Column(
+        'search_vector', postgresql.TSVECTOR(), _search_vector('title', 'content'), nullable=True
+    ))
+    op.add_column('messages', sa.Column(
+        'search_vector', postgresql.TSVECTOR(), _search_vector('text_content', 'caption'), nullable=True
+    ))
+
+    op.create_index('ix_plant_trades_search_vector', 'plant_trades', ['search_vector'],
+                    unique=False, postgresql_using='gin')
+    op.create_index('ix_plant_questions_search_vector', 'plant_questions', ['search_vector'],
+                    unique=False, postgresql_using='gin')
+    op.create_index('ix_messages_search_vector', 'messages', ['search_vector'],
+                    unique=False, postgresql_using='gin')
+    op.create_index('ix_plant_trades_title_trgm', 'plant_trades', ['title'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+    op.create_index('ix_plant_questions_title_trgm', 'plant_questions', ['title'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_plant_questions_title_trgm', table_name='plant_questions')
+    op.drop_index('ix_plant_trades_title_trgm', table_name='plant_trades')
+    op.drop_index('ix_messages_search_vector', table_name='messages')
+    op.drop_index('ix_plant_questions_search_vector', table_name='plant_questions')
+    op.drop_index('ix_plant_trades_search_vector', table_name='plant_trades')
+    op.drop_column('messages', 'search_vector')
+    op.drop_column('plant_questions', 'search_vector')
+    op.drop_column('plant_trades', 'search_vector')
@@ -0,0 +1,62 @@
+"""add_care_reminders
+
+Revision ID: e6b1d4f8a237
+Revises: d9a3f6b2e571
+Create Date: 2026-10-18 16:22:48.351902
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'e6b1d4f8a237'
+down_revision = 'd9a3f6b2e571'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_table('care_reminders',
+    sa.Column('plant_id', sa.UUID(), nullable=False),
+    sa.Column('care_type', sa.String(length=50), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('last_care_at', sa.DateTime(), nullable=False),
+    sa.Column('interval_days', sa.Integer(), nullable=False),
+    sa.Column('next_due_at', sa.DateTime(), nullable=False),
+    sa.Column('notified_at', sa.DateTime(), nullable=True),
+    sa.Column('retry_after', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['plant_id'], ['user_plants.id'], name=op.f('fk_care_reminders_plant_id_user_plants'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], name=op.f('fk_care_reminders_user_id_users'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('plant_id', 'care_type', name=op.f('pk_care_reminders'))
+    )
+    op.create_index('ix_care_reminders_user_due', 'care_reminders', ['user_id', 'next_due_at'], unique=False)
+    op.create_index(
+        'ix_care_reminders_pending_due', 'care_reminders', ['next_due_at'],
+        unique=False, postgresql_where=sa.text('notified_at IS NULL')
+    )
+
+    # Backfill watering schedules. Plants that are already overdue are marked
+    # as notified so the first dispatcher run does not send the whole backlog.
+    op.execute("""
+        INSERT INTO care_reminders (
+            plant_id, care_type, user_id, last_care_at, interval_days, next_due_at, notified_at, updated_at
+        )
+        SELECT
+            p.id, 'watering', p.user_id, p.last_watered, s.water_frequency_days,
+            p.last_watered + make_interval(days => s.water_frequency_days),
+            CASE WHEN p.last_watered + make_interval(days => s.water_frequency_days) <= now() at time zone 'utc'
+                 THEN now() at time zone 'utc' END,
+            now() at time zone 'utc'
+        FROM user_plants AS p
+        JOIN plant_species AS s ON s.id = p.species_id
+        WHERE p.is_active AND p.last_watered IS NOT NULL AND s.water_frequency_days > 0
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_care_reminders_pending_due', table_name='care_reminders')
+    op.drop_index('ix_care_reminders_user_due', table_name='care_reminders')
+    op.drop_table('care_reminders')
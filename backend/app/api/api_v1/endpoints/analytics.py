@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.services.analytics_service import AnalyticsService
-from app.services.ml_plant_health_service import MLPlantHealthService
+from app.services.ml_plant_health_service import get_ml_plant_health_service
 from app.services.ml_trending_topics_service import MLTrendingTopicsService
 from app.services.embedding_service import EmbeddingService
 from app.services.auth_service import get_current_user_from_token as get_current_user
@@ -21,7 +21,7 @@ def get_analytics_service(
     db: AsyncSession = Depends(get_db)
 ):
     """Get analytics service instance with dependencies."""
-    ml_health_service = MLPlantHealthService()
+    ml_health_service = get_ml_plant_health_service()
     ml_trending_service = MLTrendingTopicsService()
     embedding_service = EmbeddingService()
     
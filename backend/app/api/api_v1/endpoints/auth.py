@@ -4,11 +4,12 @@ This module provides user registration, login, logout,
 and authentication management using FastAPI-Users.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.security import LoginThrottled, PasswordHashingBusy, get_login_throttle
 from app.schemas.auth import UserCreate, UserRead, UserUpdate, Token, LoginRequest
 from app.services.auth_service import get_auth_service
 from app.services.user_service import get_user_service
@@ -17,6 +18,14 @@ from app.models.user import User
 router = APIRouter()
 
 
+def _hashing_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication is busy, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
 async def get_current_user(
     token: str = Depends(OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")),
     db: AsyncSession = Depends(get_db),
@@ -68,13 +77,17 @@ async def register(
         )
     
     # Create new user
-    user = await user_service.create_user(user_data, db)
+    try:
+        user = await user_service.create_user(user_data, db)
+    except PasswordHashingBusy:
+        raise _hashing_busy()
     return UserRead.from_orm(user)
 
 
 @router.post("/login", response_model=Token)
 async def login(
     login_data: LoginRequest,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     auth_service = Depends(get_auth_service)
 ):
@@ -84,16 +97,29 @@ async def login(
     
     Args:
         login_data: Login request data (email/username and password)
+        request: Incoming request, used for per-client throttling
         db: Database session
         
     Returns:
         Token: Access and refresh tokens
         
     Raises:
-        HTTPException: If authentication fails
+        HTTPException: If authentication fails, too many logins for the
+            account or client are in flight, or password hashing is saturated
     """
     # Authenticate user (supports both email and username)
-    user = await auth_service.authenticate_user(login_data.username, login_data.password, db)
+    client_ip = request.client.host if request.client else None
+    try:
+        async with get_login_throttle().admit(login_data.username, client_ip):
+            user = await auth_service.authenticate_user(login_data.username, login_data.password, db)
+    except LoginThrottled:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many concurrent login attempts",
+            headers={"Retry-After": "1"},
+        )
+    except PasswordHashingBusy:
+        raise _hashing_busy()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -175,6 +175,7 @@ async def update_challenge_progress(
 async def get_challenge_leaderboard(
     challenge_id: str,
     limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> List[Dict[str, Any]]:
@@ -183,6 +184,7 @@ async def get_challenge_leaderboard(
     Args:
         challenge_id: ID of the challenge
         limit: Maximum number of entries to return
+        offset: Number of ranks to skip
         current_user: Current authenticated user
         db: Database session
         
@@ -191,7 +193,7 @@ async def get_challenge_leaderboard(
     """
     try:
         leaderboard = await community_challenge_service.get_challenge_leaderboard(
-            db, challenge_id, limit
+            db, challenge_id, limit, offset
         )
         return leaderboard
         
@@ -202,6 +204,31 @@ async def get_challenge_leaderboard(
         )
 
 
+@router.get("/{challenge_id}/leaderboard/me")
+async def get_my_challenge_rank(
+    challenge_id: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    """Get the current user's rank in a challenge.
+    
+    Args:
+        challenge_id: ID of the challenge
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Dict: Rank, score and participant count
+    """
+    rank = await community_challenge_service.get_user_rank(db, challenge_id, current_user.id)
+    if not rank:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not participating in this challenge"
+        )
+    return rank
+
+
 @router.get("/my-challenges")
 async def get_my_challenges(
     limit: int = Query(20, ge=1, le=50),
@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-# from app.services.contextual_discovery_service import ContextualDiscoveryService, DiscoveryItem
+from app.services.contextual_discovery_service import ContextualDiscoveryService
 from app.services.vector_database_service import VectorDatabaseService
 from app.services.embedding_service import EmbeddingService
 from pydantic import BaseModel
@@ -16,7 +16,7 @@ router = APIRouter()
 # Initialize services
 embedding_service = EmbeddingService()
 vector_service = VectorDatabaseService(embedding_service)
-# discovery_service = ContextualDiscoveryService(vector_service, embedding_service)
+discovery_service = ContextualDiscoveryService(vector_service, embedding_service)
 
 
 class FeedResponse(BaseModel):
@@ -201,6 +201,19 @@ async def get_contextual_recommendations(
         )
 
 
+@router.get("/feed-latency")
+async def get_feed_latency():
+    """Get feed generation p50/p95 latency for cold and warm candidate pools."""
+    try:
+        return discovery_service.get_feed_latency_stats()
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error getting feed latency: {str(e)}"
+        )
+
+
 @router.get("/feed-stats/{user_id}")
 async def get_feed_statistics(
     user_id: str,
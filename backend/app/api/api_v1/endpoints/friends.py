@@ -5,7 +5,7 @@ friend requests, and social connections.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -179,24 +179,45 @@ async def remove_friend_endpoint(
 
 @router.get("/list", response_model=List[UserSearch])
 async def get_friends_list_endpoint(
+    response: Response,
     limit: int = Query(50, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get list of current user's friends.
     
     Args:
+        response: Response (the next page cursor is sent in ``X-Next-Cursor``)
         limit: Maximum number of friends to return
-        offset: Number of friends to skip
+        cursor: Cursor from the previous page
         current_user: Current authenticated user
         db: Database session
         
     Returns:
         List[UserSearch]: List of friends
     """
-    friends = await get_friends_list(db, current_user.id, limit, offset)
-    return [UserSearch.from_orm(friend) for friend in friends]
+    try:
+        friends_list = await get_friends_list(str(current_user.id), db, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if friends_list.next_cursor:
+        response.headers["X-Next-Cursor"] = friends_list.next_cursor
+    response.headers["X-Total-Count"] = str(friends_list.total_count)
+    return [
+        UserSearch(
+            id=friend.user_id,
+            username=friend.username,
+            display_name=friend.display_name,
+            avatar_url=friend.avatar_url,
+            bio=friend.bio,
+            gardening_experience=friend.gardening_experience,
+            friendship_status="accepted",
+            is_close_friend=friend.is_close_friend,
+            mutual_friends_count=friend.mutual_friends_count
+        )
+        for friend in friends_list.friends
+    ]
 
 
 @router.get("/requests/pending", response_model=List[FriendshipRead])
@@ -9,12 +9,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.services.ml_plant_health_service import (
-    MLPlantHealthService, 
     HealthPrediction, 
-    CareOptimization
+    CareOptimization,
+    get_ml_plant_health_service
 )
-from app.services.rag_service import RAGService
-from app.services.embedding_service import EmbeddingService
 from app.api.api_v1.endpoints.auth import get_current_user
 from app.models.user import User
 
@@ -22,10 +20,8 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Initialize ML services
-rag_service = RAGService()
-embedding_service = EmbeddingService()
-ml_plant_health_service = MLPlantHealthService(rag_service, embedding_service)
+# Shared service; fitted models are loaded once per process
+ml_plant_health_service = get_ml_plant_health_service()
 
 
 @router.post("/predict-health/{plant_id}")
@@ -313,12 +309,11 @@ async def get_model_status(
                 "recommended_feedback_days": 30,
                 "minimum_training_samples": 100
             },
-            "status": "healthy" if all([
-                ml_plant_health_service.health_classifier,
-                ml_plant_health_service.risk_predictor,
-                ml_plant_health_service.care_optimizer,
-                ml_plant_health_service.success_predictor
-            ]) else "needs_initialization"
+            "inference": ml_plant_health_service.inference.get_stats(),
+            "status": "healthy" if (
+                ml_plant_health_service.health_classifier is not None or
+                ml_plant_health_service.success_predictor is not None
+            ) else "needs_initialization"
         }
         
     except Exception as e:
@@ -16,7 +16,8 @@ from app.schemas.nursery import (
     NurseryReviewResponse,
     NurseryReviewCreate,
     NurseryEventResponse,
-    NurserySearchFilters
+    NurserySearchFilters,
+    NearbyNurseryPage
 )
 from app.api.api_v1.endpoints.auth import get_current_user
 from app.models.user import User
@@ -50,6 +51,42 @@ async def search_nurseries(
     return nurseries
 
 
+@router.get("/nurseries/nearby", response_model=NearbyNurseryPage)
+async def search_nearby_nurseries(
+    latitude: float = Query(..., ge=-90, le=90, description="User's latitude"),
+    longitude: float = Query(..., ge=-180, le=180, description="User's longitude"),
+    radius_km: float = Query(50, ge=1, le=200, description="Search radius in kilometers"),
+    business_type: Optional[str] = Query(None, description="Type of business"),
+    specialties: Optional[List[str]] = Query(None, description="Plant specialties"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    db: AsyncSession = Depends(get_db)
+):
+    """Find nurseries nearest first, paged with a cursor."""
+    filters = NurserySearchFilters(
+        latitude=latitude,
+        longitude=longitude,
+        radius_km=radius_km,
+        business_type=business_type,
+        specialties=specialties
+    )
+    
+    try:
+        rows, next_cursor = await LocalNurseryService.search_nearby_nurseries(
+            db, filters, limit, cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    return NearbyNurseryPage(
+        items=[{"nursery": nursery, "distance_km": distance_km} for nursery, distance_km in rows],
+        next_cursor=next_cursor
+    )
+
+
 @router.get("/nurseries/{nursery_id}", response_model=LocalNurseryResponse)
 async def get_nursery(
     nursery_id: UUID,
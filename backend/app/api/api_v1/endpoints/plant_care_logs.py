@@ -3,16 +3,21 @@
 This module provides REST API endpoints for managing plant care logs.
 """
 
+import json
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime, date
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
 from app.api.api_v1.endpoints.auth import get_current_user
 from app.models.user import User
+from app.models.user_plant import UserPlant
 from app.schemas.plant_care_log import (
     PlantCareLogCreate,
     PlantCareLogUpdate,
@@ -32,6 +37,7 @@ from app.services.plant_care_log_service import (
 from app.services.personalized_plant_care_service import PersonalizedPlantCareService
 from app.services.vector_database_service import VectorDatabaseService
 from app.services.embedding_service import EmbeddingService
+from app.services.rag_service import RAGService, UserContext, PlantData
 
 router = APIRouter()
 
@@ -39,6 +45,7 @@ router = APIRouter()
 embedding_service = EmbeddingService()
 vector_service = VectorDatabaseService(embedding_service)
 personalized_care_service = PersonalizedPlantCareService(vector_service, embedding_service)
+rag_service = RAGService(embedding_service=embedding_service, vector_service=vector_service)
 
 
 @router.post(
@@ -370,6 +377,55 @@ async def get_personalized_care_advice(
         )
 
 
+@router.post("/personalized/{user_id}/{plant_id}/care-advice/stream")
+async def stream_personalized_care_advice(
+    user_id: str,
+    plant_id: str,
+    question: str,
+    db: AsyncSession = Depends(get_db)
+) -> StreamingResponse:
+    """Stream personalized plant care advice as server-sent events.
+    
+    Emits a ``sources`` event once retrieval finishes, ``token`` events as
+    the answer is generated and a final ``done`` event with confidence and
+    follow-up questions.
+    """
+    user = await db.get(User, user_id)
+    plant_result = await db.execute(
+        select(UserPlant).options(selectinload(UserPlant.species)).where(UserPlant.id == plant_id)
+    )
+    plant = plant_result.scalar_one_or_none()
+    
+    if not user or not plant or not plant.species:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User or plant not found"
+        )
+    
+    user_context = UserContext(
+        user_id=user_id,
+        experience_level=user.gardening_experience or "beginner",
+        location=user.location
+    )
+    plant_data = PlantData(
+        species_id=str(plant.species.id),
+        species_name=plant.species.scientific_name,
+        care_level=plant.species.care_level or "intermediate",
+        user_plant_id=str(plant.id),
+        current_health=plant.health_status
+    )
+    
+    async def event_stream():
+        async for event in rag_service.stream_plant_care_advice(user_context, plant_data, question):
+            yield f"event: {event['event']}\ndata: {json.dumps(event['data'], default=str)}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/personalized/{user_id}/seasonal-recommendations")
 async def get_seasonal_recommendations(
     user_id: str,
@@ -8,10 +8,12 @@ from uuid import UUID
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.api.api_v1.endpoints.auth import get_current_user
+from app.models.plant_species import PlantSpecies
 from app.models.user import User
 from app.schemas.plant_identification import (
     PlantIdentificationCreate,
@@ -20,6 +22,7 @@ from app.schemas.plant_identification import (
     PlantIdentificationListResponse,
     PlantIdentificationResultResponse
 )
+from app.schemas.plant_species import PlantSpeciesResponse
 from app.services.plant_identification_service import (
     PlantIdentificationService,
     create_identification,
@@ -32,6 +35,8 @@ from app.services.plant_identification_service import (
     get_identification_statistics
 )
 from app.services.auth_service import AuthService
+from app.services.identification_cache import get_identification_cache
+from app.utils.pagination import CountMode
 
 router = APIRouter()
 
@@ -171,30 +176,34 @@ async def analyze_plant_image(
             )
         
         # Perform AI identification without saving
-        identification_result = await plant_id_service._identify_plant_with_ai(
+        identification_result = await plant_id_service.identify_image(
             image_path=None,  # We don't save the image for analysis-only
             image_data=image_data
         )
         
-        # Find species suggestions from database
+        # Resolve the top suggestions against the species lexicon in one pass,
+        # then load the matched species with a single query
         species_suggestions = []
-        if identification_result.get("suggestions"):
-            for suggestion in identification_result["suggestions"][:3]:  # Top 3 suggestions
-                species_match = await plant_id_service._find_species_match(
-                    db,
-                    suggestion.get("name", ""),
-                    [suggestion]
+        suggestion_names = [
+            suggestion.get("name", "")
+            for suggestion in (identification_result.get("suggestions") or [])[:3]  # Top 3 suggestions
+        ]
+        if suggestion_names:
+            lexicon = plant_id_service.species_lexicon
+            await lexicon.ensure_loaded(db)
+            matched_ids = []
+            for match in lexicon.resolve(suggestion_names).values():
+                if match and match.species_id not in matched_ids:
+                    matched_ids.append(match.species_id)
+            if matched_ids:
+                result = await db.execute(
+                    select(PlantSpecies).where(PlantSpecies.id.in_(matched_ids))
                 )
-                if species_match:
-                    # Get the full species data
-                    from app.models.plant_species import PlantSpecies
-                    result = await db.execute(
-                        select(PlantSpecies).where(PlantSpecies.id == species_match["species_id"])
-                    )
-                    species = result.scalar_one_or_none()
-                    if species:
-                        from app.schemas.plant_species import PlantSpeciesResponse
-                        species_suggestions.append(PlantSpeciesResponse.from_orm(species))
+                species_by_id = {species.id: species for species in result.scalars().all()}
+                species_suggestions = [
+                    PlantSpeciesResponse.from_orm(species_by_id[species_id])
+                    for species_id in matched_ids if species_id in species_by_id
+                ]
         
         # Format care recommendations
         care_recommendations = ""
@@ -231,22 +240,29 @@ Difficulty: {care_data.get('difficulty_level', 'Unknown')}
 )
 async def get_my_identifications(
     status_filter: Optional[str] = Query(None, description="Filter by status (pending, completed, failed)"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of records to return"),
+    count: CountMode = Query(CountMode.EXACT, description="Total on the first page (exact, estimated, none)"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> PlantIdentificationListResponse:
     """Get user's plant identifications."""
     try:
-        identifications, total = await get_user_identifications(
-            db, current_user.id, status_filter, skip, limit
+        page = await get_user_identifications(
+            db, current_user.id, status_filter, limit, cursor, count
         )
         
         return PlantIdentificationListResponse(
-            identifications=[PlantIdentificationResponse.from_orm(ident) for ident in identifications],
-            total=total,
-            skip=skip,
-            limit=limit
+            items=[PlantIdentificationResponse.from_orm(ident) for ident in page.items],
+            total=page.total,
+            size=limit,
+            next_cursor=page.next_cursor,
+            total_is_estimate=page.total_is_estimate
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
     except Exception as e:
         raise HTTPException(
@@ -307,6 +323,18 @@ async def get_identification_statistics(
         )
 
 
+@router.get(
+    "/cache-stats",
+    summary="Get identification cache statistics",
+    description="Hit rate and vision model calls avoided by the near-duplicate image cache."
+)
+async def get_identification_cache_stats(
+    current_user: User = Depends(get_current_user)
+) -> dict:
+    """Get identification cache statistics for this process."""
+    return get_identification_cache().get_stats()
+
+
 @router.get(
     "/{identification_id}",
     response_model=PlantIdentificationResponse,
@@ -21,8 +21,10 @@ from app.schemas.plant_question import (
     PlantAnswerResponse,
     PlantQuestionListResponse,
     PlantQuestionSearchRequest,
-    PlantAnswerVoteRequest
+    PlantAnswerVoteRequest,
+    QuestionSortField
 )
+from app.utils.pagination import CountMode, SortOrder
 from app.services.plant_question_service import (
     get_plant_question_service,
     get_plant_answer_service
@@ -72,13 +74,21 @@ async def search_questions(
     category: Optional[str] = Query(None, description="Filter by category"),
     species_id: Optional[UUID] = Query(None, description="Filter by plant species"),
     is_solved: Optional[bool] = Query(None, description="Filter by solved status"),
-    sort_by: Optional[str] = Query("created_at", description="Sort by field (created_at, votes, answers)"),
-    sort_order: Optional[str] = Query("desc", description="Sort order (asc, desc)"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    sort_by: Optional[QuestionSortField] = Query(
+        None, description="Sort by (relevance, created_at); relevance when a query is given, else created_at"
+    ),
+    sort_order: SortOrder = Query(SortOrder.DESC, description="Sort order (asc, desc)"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of records to return"),
+    count: CountMode = Query(CountMode.EXACT, description="Total on the first page (exact, estimated, none)"),
     db: AsyncSession = Depends(get_db)
 ) -> PlantQuestionListResponse:
     """Search plant questions."""
+    if sort_by == QuestionSortField.RELEVANCE and not query:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Sorting by relevance requires a search query"
+        )
     try:
         search_request = PlantQuestionSearchRequest(
             query=query,
@@ -90,13 +100,19 @@ async def search_questions(
         )
         
         question_service = get_plant_question_service()
-        questions, total = await question_service.search_questions(db, search_request, skip, limit)
+        page = await question_service.search_questions(db, search_request, limit, cursor, count)
         
         return PlantQuestionListResponse(
-            questions=[PlantQuestionResponse.from_orm(q) for q in questions],
-            total=total,
-            skip=skip,
-            limit=limit
+            items=[PlantQuestionResponse.from_orm(q) for q in page.items],
+            total=page.total,
+            size=limit,
+            next_cursor=page.next_cursor,
+            total_is_estimate=page.total_is_estimate
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
     except Exception as e:
         raise HTTPException(
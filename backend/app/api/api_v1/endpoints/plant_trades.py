@@ -19,8 +19,10 @@ from app.schemas.plant_trade import (
     PlantTradeResponse,
     PlantTradeListResponse,
     PlantTradeSearchRequest,
-    PlantTradeInterestRequest
+    PlantTradeInterestRequest,
+    TradeSortField
 )
+from app.utils.pagination import CountMode, SortOrder
 from app.services.plant_trade_service import (
     create_trade,
     get_trade_by_id,
@@ -73,21 +75,31 @@ async def create_trade_listing(
     description="Search and browse plant trade listings."
 )
 async def search_trade_listings(
+    query: Optional[str] = Query(None, description="Full-text search query"),
     trade_type: Optional[str] = Query(None, description="Filter by trade type (sell, trade, giveaway)"),
     species_id: Optional[UUID] = Query(None, description="Filter by plant species"),
     location: Optional[str] = Query(None, description="Filter by location"),
     min_price: Optional[Decimal] = Query(None, description="Minimum price filter"),
     max_price: Optional[Decimal] = Query(None, description="Maximum price filter"),
     is_available: Optional[bool] = Query(True, description="Filter by availability"),
-    sort_by: Optional[str] = Query("created_at", description="Sort by field (created_at, price, title)"),
-    sort_order: Optional[str] = Query("desc", description="Sort order (asc, desc)"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    sort_by: Optional[TradeSortField] = Query(
+        None, description="Sort by (relevance, created_at, title); relevance when a query is given, else created_at"
+    ),
+    sort_order: SortOrder = Query(SortOrder.DESC, description="Sort order (asc, desc)"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of records to return"),
+    count: CountMode = Query(CountMode.EXACT, description="Total on the first page (exact, estimated, none)"),
     db: AsyncSession = Depends(get_db)
 ) -> PlantTradeListResponse:
     """Search plant trade listings."""
+    if sort_by == TradeSortField.RELEVANCE and not query:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Sorting by relevance requires a search query"
+        )
     try:
         search_request = PlantTradeSearchRequest(
+            query=query,
             trade_type=trade_type,
             species_id=species_id,
             location=location,
@@ -98,13 +110,19 @@ async def search_trade_listings(
             sort_order=sort_order
         )
         
-        trades, total = await search_trades(db, search_request, skip, limit)
+        page = await search_trades(db, search_request, limit, cursor, count)
         
         return PlantTradeListResponse(
-            trades=[PlantTradeResponse.from_orm(trade) for trade in trades],
-            total=total,
-            skip=skip,
-            limit=limit
+            items=[PlantTradeResponse.from_orm(trade) for trade in page.items],
+            total=page.total,
+            size=limit,
+            next_cursor=page.next_cursor,
+            total_is_estimate=page.total_is_estimate
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
     except Exception as e:
         raise HTTPException(
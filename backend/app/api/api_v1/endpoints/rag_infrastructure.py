@@ -15,6 +15,7 @@ from app.models.user import User
 from app.services.rag_content_pipeline import RAGContentPipeline
 from app.services.embedding_service import EmbeddingService
 from app.services.vector_database_service import VectorDatabaseService
+from app.services.semantic_answer_cache import get_semantic_answer_cache
 
 logger = logging.getLogger(__name__)
 
@@ -404,6 +405,7 @@ async def clear_search_cache(
             )
         
         await vector_service.clear_search_cache(db)
+        await get_semantic_answer_cache().clear()
         
         response_data = CacheClearResponse(
             success=True,
@@ -419,4 +421,12 @@ async def clear_search_cache(
         raise HTTPException(
             status_code=500,
             detail=f"Failed to clear search cache: {str(e)}"
-        ) 
\ No newline at end of file
+        )
+
+
+@router.get("/semantic-cache-stats")
+async def get_semantic_cache_stats(
+    current_user: User = Depends(get_current_user)
+) -> JSONResponse:
+    """Get hit rate and latency saved by the semantic answer cache."""
+    return JSONResponse(content=get_semantic_answer_cache().get_stats(), status_code=status.HTTP_200_OK)
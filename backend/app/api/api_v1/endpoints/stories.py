@@ -5,7 +5,7 @@ ephemeral stories that disappear after 24 hours.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -112,6 +112,9 @@ async def get_stories_feed(
 @router.get("/user/{user_id}", response_model=List[StoryRead])
 async def get_user_stories_endpoint(
     user_id: str,
+    response: Response,
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> List[StoryRead]:
@@ -119,6 +122,9 @@ async def get_user_stories_endpoint(
     
     Args:
         user_id: ID of the user whose stories to retrieve
+        response: Response (the next page cursor is sent in ``X-Next-Cursor``)
+        limit: Maximum number of stories to return
+        cursor: Cursor from the previous page
         current_user: Current authenticated user
         db: Database session
         
@@ -129,8 +135,12 @@ async def get_user_stories_endpoint(
     based on privacy settings and friendship status.
     """
     try:
-        stories = await get_user_stories(db, user_id, viewer_id=current_user.id)
-        return [StoryRead.from_orm(story) for story in stories]
+        page = await get_user_stories(user_id, str(current_user.id), db, limit=limit, cursor=cursor)
+        if page.next_cursor:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+        return page.items
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -140,20 +150,34 @@ async def get_user_stories_endpoint(
 
 @router.get("/my-stories", response_model=List[StoryRead])
 async def get_my_stories(
+    response: Response,
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get current user's own stories.
     
     Args:
+        response: Response (the next page cursor is sent in ``X-Next-Cursor``)
+        limit: Maximum number of stories to return
+        cursor: Cursor from the previous page
         current_user: Current authenticated user
         db: Database session
         
     Returns:
         List[StoryRead]: List of current user's stories
     """
-    stories = await get_user_stories(db, current_user.id, viewer_id=current_user.id, include_all=True)
-    return [StoryRead.from_orm(story) for story in stories]
+    try:
+        page = await get_user_stories(
+            str(current_user.id), str(current_user.id), db,
+            include_expired=True, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return page.items
 
 
 @router.get("/{story_id}", response_model=StoryRead)
@@ -8,7 +8,7 @@ from datetime import datetime, timedelta
 from uuid import UUID, uuid4
 import json
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response, UploadFile, File, Form
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import desc, and_, select
@@ -462,23 +462,25 @@ async def upload_growth_photo(
 
 @router.get("/growth-photos", response_model=List[GrowthPhotoResponse])
 async def get_growth_photos(
+    response: Response,
     plant_id: Optional[UUID] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = Query(None, description="End date for filtering photos"),
     is_processed: Optional[bool] = None,
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> Any:
-    """Get growth photos with filtering and pagination.
+    """Get growth photos with filtering and cursor pagination.
     
     Args:
+        response: Response (the next page cursor is sent in ``X-Next-Cursor``)
         plant_id: Filter by plant ID
         start_date: Filter by start date
         end_date: Filter by end date
         is_processed: Filter by processing status
-        skip: Number of records to skip (pagination)
+        cursor: Cursor from the previous page
         limit: Maximum number of records to return (pagination)
         db: Database session
         current_user: Authenticated user
@@ -488,17 +490,22 @@ async def get_growth_photos(
     """
     # Use the telemetry service
     telemetry_service = TelemetryService(db)
-    photos = await telemetry_service.get_growth_photos(
-        user_id=current_user.id,
-        plant_id=plant_id,
-        start_date=start_date,
-        end_date=end_date,
-        is_processed=is_processed,
-        skip=skip,
-        limit=limit
-    )
+    try:
+        page = await telemetry_service.get_growth_photos_page(
+            user_id=current_user.id,
+            plant_id=plant_id,
+            start_date=start_date,
+            end_date=end_date,
+            is_processed=is_processed,
+            limit=limit,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
-    return photos
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return page.items
 
 @router.get("/growth-photos/{photo_id}", response_model=GrowthPhotoResponse)
 async def get_growth_photo(
@@ -638,6 +645,7 @@ async def complete_growth_photo(
 
 @router.get("/light-readings", response_model=List[LightReadingResponse])
 async def get_light_readings(
+    response: Response,
     plant_id: Optional[UUID] = None,
     source: Optional[LightSource] = None,
     location_name: Optional[str] = None,
@@ -645,14 +653,15 @@ async def get_light_readings(
     end_date: Optional[datetime] = Query(None, description="End date for filtering readings"),
     min_lux: Optional[float] = Query(None, description="Minimum lux value"),
     max_lux: Optional[float] = Query(None, description="Maximum lux value"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> Any:
-    """Get light readings with filtering and pagination.
+    """Get light readings with filtering and cursor pagination.
     
     Args:
+        response: Response (the next page cursor is sent in ``X-Next-Cursor``)
         plant_id: Filter by plant ID
         source: Filter by light source type
         location_name: Filter by location name
@@ -660,7 +669,7 @@ async def get_light_readings(
         end_date: Filter by end date
         min_lux: Filter by minimum lux value
         max_lux: Filter by maximum lux value
-        skip: Number of records to skip (pagination)
+        cursor: Cursor from the previous page
         limit: Maximum number of records to return (pagination)
         db: Database session
         current_user: Authenticated user
@@ -670,20 +679,25 @@ async def get_light_readings(
     """
     # Use the telemetry service
     telemetry_service = TelemetryService(db)
-    readings = await telemetry_service.get_light_readings(
-        user_id=current_user.id,
-        plant_id=plant_id,
-        source=source,
-        location_name=location_name,
-        start_date=start_date,
-        end_date=end_date,
-        min_lux=min_lux,
-        max_lux=max_lux,
-        skip=skip,
-        limit=limit
-    )
+    try:
+        page = await telemetry_service.get_light_readings_page(
+            user_id=current_user.id,
+            plant_id=plant_id,
+            source=source,
+            location_name=location_name,
+            start_date=start_date,
+            end_date=end_date,
+            min_lux=min_lux,
+            max_lux=max_lux,
+            limit=limit,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
-    return readings
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return page.items
 
 @router.get("/light-readings/{reading_id}", response_model=LightReadingResponse)
 async def get_light_reading(
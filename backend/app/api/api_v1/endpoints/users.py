@@ -200,23 +200,13 @@ async def get_user_suggestions(
         db: Database session
         
     Returns:
-        List[UserSearch]: List of suggested users
+        List[UserSearch]: Friends of friends, most mutual friends first
         
-    Note: This is a basic implementation. In production, this would
-    use more sophisticated algorithms based on mutual friends,
-    interests, location, etc.
+    Note: Suggestions are precomputed in the background and refreshed
+    when friendships change, so this is a read of stored rows.
     """
-    # For now, return random users excluding current user and existing friends
-    # TODO: Implement sophisticated recommendation algorithm
-    users = await search_users(
-        db, 
-        query="", 
-        limit=limit, 
-        offset=0, 
-        exclude_user_id=current_user.id,
-        random_order=True
-    )
-    return [UserSearch.from_orm(user) for user in users]
+    user_service = UserService()
+    return await user_service.get_user_suggestions(str(current_user.id), db, limit)
 
 
 @router.post("/{user_id}/block")
@@ -88,6 +88,95 @@ class Settings(BaseSettings):
     WEATHER_CACHE_TTL: int = 3600  # 1 hour in seconds
     CLIMATE_DATA_CACHE_TTL: int = 86400  # 24 hours in seconds
     
+    # RAG embedding updates
+    EMBEDDING_OUTBOX_ENABLED: bool = True
+    EMBEDDING_OUTBOX_BATCH_SIZE: int = 200
+    EMBEDDING_OUTBOX_POLL_SECONDS: float = 2.0
+    
+    # Semantic answer cache for RAG care advice
+    SEMANTIC_CACHE_ENABLED: bool = True
+    SEMANTIC_CACHE_SIMILARITY_THRESHOLD: float = 0.92
+    SEMANTIC_CACHE_TTL_SECONDS: int = 6 * 3600
+    SEMANTIC_CACHE_MAX_ENTRIES_PER_PARTITION: int = 1000
+    # Publish invalidations to other worker processes through a Redis stream
+    SEMANTIC_CACHE_SHARED_INVALIDATION: bool = False
+    
+    # Discovery feed candidate pools
+    DISCOVERY_POOL_REFRESH_ENABLED: bool = True
+    DISCOVERY_POOL_SIZE: int = 500
+    DISCOVERY_POOL_TTL_SECONDS: float = 60.0
+    DISCOVERY_KNOWLEDGE_PER_SPECIES: int = 10
+    
+    # Friend graph cache
+    FRIEND_GRAPH_TTL_SECONDS: float = 300.0
+    FRIEND_GRAPH_MAX_USERS: int = 50000
+    
+    # Community challenge leaderboards (Redis sorted sets are opt-in; in-memory otherwise)
+    LEADERBOARD_USE_REDIS: bool = False
+    
+    # Species name index for identification matching
+    SPECIES_LEXICON_TTL_SECONDS: float = 600.0
+    SPECIES_LEXICON_FUZZY_THRESHOLD: float = 0.45
+    
+    # Plant identification vision model and near-duplicate result cache
+    PLANT_ID_VISION_MODEL: str = "gpt-4-vision-preview"
+    PLANT_ID_CACHE_ENABLED: bool = True
+    PLANT_ID_CACHE_TTL_SECONDS: float = 7 * 24 * 3600
+    PLANT_ID_CACHE_MAX_DISTANCE: int = 6
+    PLANT_ID_CACHE_MAX_ENTRIES: int = 50000
+    
+    # Community growth benchmarks (rebuilt after the TTL; one snapshot per analysis window)
+    COMMUNITY_GROWTH_CACHE_TTL_SECONDS: float = 900.0
+    COMMUNITY_GROWTH_MAX_SNAPSHOTS: int = 8
+    
+    # Authenticated principal cache (token claims and user snapshots)
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: float = 30.0
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    
+    # Password hashing pool and login concurrency caps
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    LOGIN_MAX_CONCURRENT_PER_ACCOUNT: int = 2
+    LOGIN_MAX_CONCURRENT_PER_IP: int = 10
+    
+    # Plant health inference (versioned model artifacts and micro-batching)
+    HEALTH_MODEL_DIR: str = "backend/models/plant_health"
+    HEALTH_INFERENCE_MAX_BATCH: int = 64
+    HEALTH_INFERENCE_MAX_WAIT_MS: float = 5.0
+    HEALTH_MODEL_RELOAD_SECONDS: float = 60.0
+    
+    # Windowed per-plant care features (updated in place on new care logs by
+    # the writing process; other workers pick changes up when the TTL expires)
+    PLANT_FEATURE_WINDOW_DAYS: int = 180
+    PLANT_FEATURE_CACHE_TTL_SECONDS: float = 300.0
+    PLANT_FEATURE_CACHE_MAX_ENTRIES: int = 50000
+    
+    # Care reminder due-date index and background dispatch
+    CARE_REMINDER_DISPATCH_ENABLED: bool = True
+    CARE_REMINDER_BATCH_SIZE: int = 500
+    CARE_REMINDER_POLL_SECONDS: float = 60.0
+    CARE_REMINDER_RETRY_SECONDS: float = 900.0
+    
+    # Batch care-plan regeneration (stale or changed plans of active plants)
+    CARE_PLAN_BATCH_ENABLED: bool = True
+    CARE_PLAN_BATCH_INTERVAL_HOURS: float = 1.0
+    CARE_PLAN_BATCH_CONCURRENCY: int = 8
+    CARE_PLAN_BATCH_PAGE_SIZE: int = 200
+    CARE_PLAN_MAX_AGE_HOURS: float = 24.0
+    
+    # Event-driven achievements (index refresh and nightly time-based awards)
+    ACHIEVEMENT_INDEX_TTL_SECONDS: float = 300.0
+    ACHIEVEMENT_NIGHTLY_ENABLED: bool = True
+    ACHIEVEMENT_NIGHTLY_HOUR_UTC: int = 3
+    ACHIEVEMENT_NIGHTLY_BATCH_SIZE: int = 1000
+    
+    # Precomputed friend-of-friend suggestions (incremental refresh and periodic sweep)
+    FRIEND_SUGGESTIONS_ENABLED: bool = True
+    FRIEND_SUGGESTIONS_PER_USER: int = 50
+    FRIEND_SUGGESTIONS_BATCH_SIZE: int = 200
+    FRIEND_SUGGESTIONS_REFRESH_SECONDS: float = 30.0
+    FRIEND_SUGGESTIONS_SWEEP_HOURS: float = 24.0
+    
     # Email settings (for future use)
     SMTP_TLS: bool = True
     SMTP_PORT: Optional[int] = None
@@ -4,8 +4,9 @@ This module sets up the SQLAlchemy async engine, session factory,
 and base model class for the application.
 """
 
-from typing import AsyncGenerator
-from sqlalchemy import MetaData, text
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Callable
+from sqlalchemy import MetaData, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -55,6 +56,32 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+@asynccontextmanager
+async def try_advisory_lock(
+    key: int,
+    session_factory: Callable[[], AsyncSession] = AsyncSessionLocal
+) -> AsyncIterator[bool]:
+    """Try to take a transaction-level PostgreSQL advisory lock.
+    
+    Background jobs started in every worker process wrap a pass in this so
+    only one process runs it at a time. The lock is held by an open
+    transaction on its own session and released when the block exits.
+    
+    Args:
+        key: Lock key, unique per job
+        session_factory: Session factory to hold the lock on
+        
+    Yields:
+        bool: Whether this process holds the lock
+    """
+    async with session_factory() as session:
+        acquired = bool(await session.scalar(select(func.pg_try_advisory_xact_lock(key))))
+        try:
+            yield acquired
+        finally:
+            await session.rollback()
+
+
 async def init_db() -> None:
     """Initialize database tables.
     
@@ -64,6 +91,8 @@ async def init_db() -> None:
     async with engine.begin() as conn:
         # Enable vector extension
         await conn.execute(text('CREATE EXTENSION IF NOT EXISTS vector;'))
+        # Trigram operators for fuzzy search indexes
+        await conn.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm;'))
         # Create all tables
         await conn.run_sync(Base.metadata.create_all)
 
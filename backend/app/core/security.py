@@ -0,0 +1,154 @@
+"""Shared cryptographic contexts and password hashing controls.
+
+Building a ``CryptContext`` parses its configuration and probes the bcrypt
+backend, so the application builds it once at import time and every
+service hashes and verifies passwords through this instance.
+
+bcrypt is deliberately slow (100-300 ms per call), so async code must not
+call it on the event loop. ``PasswordHasher`` runs it on a small dedicated
+thread pool (bcrypt releases the GIL while hashing) and rejects work once
+too many calls are queued. ``LoginThrottle`` caps concurrent login
+attempts per account and per client IP so a credential flood cannot fill
+that queue on its own.
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when the password hashing queue is full."""
+
+
+class LoginThrottled(Exception):
+    """Raised when an account or client already has too many logins in flight."""
+
+
+class PasswordHasher:
+    """Runs password hashing on a bounded worker pool."""
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 64, context: CryptContext = pwd_context):
+        self.context = context
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+
+    async def hash(self, password: str) -> str:
+        """Hash a password off the event loop."""
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Verify a password against its hash off the event loop."""
+        return await self._run(self.context.verify, password, hashed_password)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.max_workers,
+            "pending": self._pending,
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_ms": self.total_seconds / self.completed * 1000 if self.completed else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordHashingBusy("Password hashing queue is full")
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hash")
+
+        self._pending += 1
+        start = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+            self.completed += 1
+            self.total_seconds += time.perf_counter() - start
+
+
+class LoginThrottle:
+    """Per-account and per-IP caps on concurrent login attempts."""
+
+    def __init__(self, max_per_account: int = 2, max_per_ip: int = 10):
+        self.max_per_account = max_per_account
+        self.max_per_ip = max_per_ip
+        self._accounts: Dict[str, int] = defaultdict(int)
+        self._ips: Dict[str, int] = defaultdict(int)
+        self.throttled = 0
+
+    @asynccontextmanager
+    async def admit(self, account: str, ip: Optional[str]) -> AsyncIterator[None]:
+        """Hold a login slot for the account and client IP.
+
+        Raises:
+            LoginThrottled: If either already has the maximum in flight
+        """
+        account = account.strip().lower()
+        if self._accounts.get(account, 0) >= self.max_per_account or (
+            ip is not None and self._ips.get(ip, 0) >= self.max_per_ip
+        ):
+            self.throttled += 1
+            raise LoginThrottled("Too many concurrent login attempts")
+
+        self._accounts[account] += 1
+        if ip is not None:
+            self._ips[ip] += 1
+        try:
+            yield
+        finally:
+            self._release(self._accounts, account)
+            if ip is not None:
+                self._release(self._ips, ip)
+
+    @staticmethod
+    def _release(counters: Dict[str, int], key: str) -> None:
+        counters[key] -= 1
+        if counters[key] <= 0:
+            del counters[key]
+
+
+_password_hasher: Optional[PasswordHasher] = None
+_login_throttle: Optional[LoginThrottle] = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Get the process-wide password hasher."""
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            max_pending=settings.PASSWORD_HASH_MAX_PENDING
+        )
+    return _password_hasher
+
+
+def get_login_throttle() -> LoginThrottle:
+    """Get the process-wide login throttle."""
+    global _login_throttle
+    if _login_throttle is None:
+        _login_throttle = LoginThrottle(
+            max_per_account=settings.LOGIN_MAX_CONCURRENT_PER_ACCOUNT,
+            max_per_ip=settings.LOGIN_MAX_CONCURRENT_PER_IP
+        )
+    return _login_throttle
@@ -28,10 +28,60 @@ async def lifespan(app: FastAPI):
     await init_db()
     print("Database initialized successfully")
     
+    # Record content changes for incremental embedding updates
+    from app.services.embedding_outbox_service import (
+        register_embedding_outbox,
+        get_embedding_outbox_worker
+    )
+    register_embedding_outbox()
+    if settings.EMBEDDING_OUTBOX_ENABLED:
+        get_embedding_outbox_worker().start()
+    
+    # Keep discovery feed candidate pools warm
+    from app.services.discovery_feed_pools import get_discovery_candidate_pools
+    if settings.DISCOVERY_POOL_REFRESH_ENABLED:
+        get_discovery_candidate_pools().start()
+    
+    # Push care reminders as plants come due
+    from app.services.care_reminder_service import get_care_reminder_dispatcher
+    if settings.CARE_REMINDER_DISPATCH_ENABLED:
+        get_care_reminder_dispatcher().start()
+    
+    # Regenerate stale care plans into the cache
+    from app.services.care_plan_batch_runner import get_care_plan_batch_runner
+    if settings.CARE_PLAN_BATCH_ENABLED:
+        get_care_plan_batch_runner().start()
+    
+    # Award time-based achievements nightly
+    from app.services.achievement_engine import get_achievement_engine
+    if settings.ACHIEVEMENT_NIGHTLY_ENABLED:
+        get_achievement_engine().start()
+    
+    # Refresh friend-of-friend suggestions after friendship changes
+    from app.services.friend_suggestion_service import get_friend_suggestion_service
+    if settings.FRIEND_SUGGESTIONS_ENABLED:
+        get_friend_suggestion_service().start()
+    
     yield
     
     # Shutdown
     print("Shutting down LeafWise API...")
+    if settings.EMBEDDING_OUTBOX_ENABLED:
+        await get_embedding_outbox_worker().stop()
+    if settings.DISCOVERY_POOL_REFRESH_ENABLED:
+        await get_discovery_candidate_pools().stop()
+    if settings.CARE_REMINDER_DISPATCH_ENABLED:
+        await get_care_reminder_dispatcher().stop()
+    if settings.CARE_PLAN_BATCH_ENABLED:
+        await get_care_plan_batch_runner().stop()
+    if settings.ACHIEVEMENT_NIGHTLY_ENABLED:
+        await get_achievement_engine().stop()
+    if settings.FRIEND_SUGGESTIONS_ENABLED:
+        await get_friend_suggestion_service().stop()
+    from app.core.security import get_password_hasher
+    get_password_hasher().shutdown()
+    from app.services.health_inference import get_health_inference_engine
+    get_health_inference_engine().shutdown()
     from app.core.database import close_db
     await close_db()
 
@@ -7,9 +7,10 @@ registered with SQLAlchemy when the package is imported.
 from app.models.user import User
 from app.models.message import Message
 from app.models.story import Story, StoryView
-from app.models.friendship import Friendship, FriendshipStatus
+from app.models.friendship import Friendship, FriendshipCounter, FriendshipStatus, FriendSuggestion
 from app.models.plant_species import PlantSpecies
 from app.models.user_plant import UserPlant
+from app.models.care_reminder import CareReminder
 from app.models.plant_care_log import PlantCareLog
 from app.models.plant_photo import PlantPhoto
 from app.models.plant_identification import PlantIdentification
@@ -22,7 +23,8 @@ from app.models.rag_models import (
     UserPreferenceEmbedding, 
     RAGInteraction, 
     PlantKnowledgeBase,
-    SemanticSearchCache
+    SemanticSearchCache,
+    EmbeddingChange
 )
 from app.models.seasonal_ai import (
     SeasonalPrediction,
@@ -60,9 +62,12 @@ __all__ = [
     "Story",
     "StoryView",
     "Friendship",
+    "FriendshipCounter",
     "FriendshipStatus",
+    "FriendSuggestion",
     "PlantSpecies",
     "UserPlant",
+    "CareReminder",
     "PlantCareLog",
     "PlantPhoto",
     "PlantIdentification",
@@ -84,6 +89,7 @@ __all__ = [
     "RAGInteraction",
     "PlantKnowledgeBase",
     "SemanticSearchCache",
+    "EmbeddingChange",
     "SeasonalPrediction",
     "EnvironmentalDataCache",
     "SeasonalTransition",
@@ -0,0 +1,44 @@
+"""Care reminder schedule model.
+
+This module defines the CareReminder model, a due-date index holding the
+next time each active plant needs each scheduled kind of care.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Index, text
+from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
+
+from app.core.database import Base
+
+
+class CareReminder(Base):
+    """Next due date for one plant and care type.
+
+    Rows are written whenever a plant's last care timestamp, species or
+    active flag changes, so reminder reads and the dispatcher are range
+    scans over ``next_due_at`` instead of per-plant checks.
+    """
+
+    __tablename__ = "care_reminders"
+    __table_args__ = (
+        Index("ix_care_reminders_user_due", "user_id", "next_due_at"),
+        Index(
+            "ix_care_reminders_pending_due",
+            "next_due_at",
+            postgresql_where=text("notified_at IS NULL")
+        ),
+    )
+
+    plant_id = Column(PostgresUUID(as_uuid=True), ForeignKey("user_plants.id", ondelete="CASCADE"), primary_key=True)
+    care_type = Column(String(50), primary_key=True)  # watering, ...
+    user_id = Column(PostgresUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    last_care_at = Column(DateTime, nullable=False)
+    interval_days = Column(Integer, nullable=False)
+    next_due_at = Column(DateTime, nullable=False)
+    notified_at = Column(DateTime)  # set once the reminder for this due date was delivered
+    retry_after = Column(DateTime)  # undelivered reminders are not retried before this time
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<CareReminder(plant_id={self.plant_id}, care_type='{self.care_type}', next_due_at={self.next_due_at})>"
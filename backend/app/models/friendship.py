@@ -9,7 +9,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -206,4 +206,50 @@ class Friendship(Base):
             requester_id=requester_id,
             addressee_id=addressee_id,
             status=FriendshipStatus.PENDING
-        )
\ No newline at end of file
+        )
+
+
+class FriendshipCounter(Base):
+    """Denormalized per-user friendship counts.
+    
+    Maintained in the same transaction as every friendship mutation so
+    profile and friends screens can read counts without scanning the
+    friendships table.
+    """
+    
+    __tablename__ = "friendship_counters"
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    friends_count = Column(Integer, default=0, nullable=False)
+    close_friends_count = Column(Integer, default=0, nullable=False)
+    pending_received_count = Column(Integer, default=0, nullable=False)
+    pending_sent_count = Column(Integer, default=0, nullable=False)
+    blocked_count = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self) -> str:
+        """String representation of the counters."""
+        return f"<FriendshipCounter(user={self.user_id}, friends={self.friends_count})>"
+
+
+class FriendSuggestion(Base):
+    """Precomputed friend-of-friend suggestion for a user.
+    
+    Rows are rebuilt per user by the background suggestion job, ranked by
+    the number of mutual friends, so the suggestions endpoint reads a
+    handful of indexed rows instead of walking the friendship graph.
+    """
+    
+    __tablename__ = "friend_suggestions"
+    __table_args__ = (
+        Index("ix_friend_suggestions_user_rank", "user_id", "mutual_count"),
+    )
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    suggested_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    mutual_count = Column(Integer, nullable=False)
+    computed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self) -> str:
+        """String representation of the suggestion."""
+        return f"<FriendSuggestion(user={self.user_id}, suggested={self.suggested_user_id}, mutual={self.mutual_count})>"
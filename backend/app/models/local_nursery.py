@@ -7,7 +7,7 @@ from datetime import datetime, time
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, String, Text, DateTime, Boolean, Float, JSON, Time, Integer, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, Boolean, Float, JSON, Time, Integer, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.orm import relationship
 
@@ -60,6 +60,11 @@ class LocalNursery(Base):
     reviews = relationship("NurseryReview", back_populates="nursery")
     events = relationship("NurseryEvent", back_populates="nursery")
     
+    # Serves the bounding-box prefilter of proximity searches
+    __table_args__ = (
+        Index("ix_local_nurseries_lat_lon", "latitude", "longitude", postgresql_where=is_active),
+    )
+    
     def __repr__(self) -> str:
         return f"<LocalNursery(id={self.id}, name='{self.name}', city='{self.city}')>"
 
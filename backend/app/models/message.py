@@ -8,8 +8,8 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Column, Computed, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -58,6 +58,17 @@ class Message(Base):
     expires_at = Column(DateTime, nullable=True)  # When message should be deleted
     deleted_at = Column(DateTime, nullable=True)
     
+    # Full-text search
+    search_vector = Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(text_content, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(caption, '')), 'B')",
+        persisted=True
+    ))
+    
+    __table_args__ = (
+        Index("ix_messages_search_vector", "search_vector", postgresql_using="gin"),
+    )
+    
     # Relationships
     sender = relationship("User", foreign_keys=[sender_id], backref="sent_messages")
     recipient = relationship("User", foreign_keys=[recipient_id], backref="received_messages")
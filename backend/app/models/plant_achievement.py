@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey, Integer, JSON
+from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey, Integer, JSON, Index
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.orm import relationship
 
@@ -42,6 +42,10 @@ class UserAchievement(Base):
     """User achievement model for tracking earned achievements."""
     
     __tablename__ = "user_achievements"
+    __table_args__ = (
+        # An achievement is earned once; lets awards use ON CONFLICT DO NOTHING
+        Index("ix_user_achievements_user_achievement", "user_id", "achievement_id", unique=True),
+    )
     
     id = Column(PostgresUUID(as_uuid=True), primary_key=True, default=uuid4)
     user_id = Column(PostgresUUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
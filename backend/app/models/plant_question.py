@@ -8,8 +8,8 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, Integer
-from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, Integer, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID as PostgresUUID
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -31,6 +31,17 @@ class PlantQuestion(Base):
     view_count = Column(Integer, default=0)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    search_vector = Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(content, '')), 'B')",
+        persisted=True
+    ))
+    
+    __table_args__ = (
+        Index("ix_plant_questions_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_plant_questions_title_trgm", "title", postgresql_using="gin",
+              postgresql_ops={"title": "gin_trgm_ops"}),
+    )
     
     # Relationships
     user = relationship("User")
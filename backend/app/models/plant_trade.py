@@ -8,8 +8,8 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, Computed, Index, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID as PostgresUUID
 from sqlalchemy.orm import relationship
 from enum import Enum
 
@@ -50,6 +50,17 @@ class PlantTrade(Base):
     completed_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    search_vector = Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+        persisted=True
+    ))
+    
+    __table_args__ = (
+        Index("ix_plant_trades_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_plant_trades_title_trgm", "title", postgresql_using="gin",
+              postgresql_ops={"title": "gin_trgm_ops"}),
+    )
     
     # Relationships
     owner = relationship("User", foreign_keys=[owner_id])
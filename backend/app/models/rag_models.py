@@ -4,7 +4,7 @@ from datetime import datetime
 from uuid import UUID, uuid4
 from typing import Optional, List
 
-from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey, DECIMAL, Index
+from sqlalchemy import BigInteger, Column, String, Text, DateTime, Integer, ForeignKey, DECIMAL, Index
 from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB
 from sqlalchemy.orm import relationship
 from pgvector.sqlalchemy import Vector
@@ -142,4 +142,23 @@ class SemanticSearchCache(Base):
     __table_args__ = (
         Index('ix_semantic_search_cache_query_hash', 'query_hash'),
         Index('ix_semantic_search_cache_expires', 'expires_at'),
-    )
\ No newline at end of file
+    )
+
+
+class EmbeddingChange(Base):
+    """Outbox of writes to indexable content awaiting re-embedding.
+    
+    Rows are written in the same transaction as the content change and
+    deleted once the embedding worker has applied them.
+    """
+    __tablename__ = "embedding_changes"
+    
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    source = Column(String(20), nullable=False)  # species, knowledge, question, answer, story
+    content_id = Column(PGUUID, nullable=False)
+    operation = Column(String(10), nullable=False)  # upsert, delete
+    created_at = Column(DateTime, default=utc_now)
+    
+    __table_args__ = (
+        Index('ix_embedding_changes_operation', 'operation'),
+    )
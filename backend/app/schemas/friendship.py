@@ -109,6 +109,7 @@ class FriendsList(BaseModel):
     total_count: int
     close_friends_count: int
     online_friends_count: int
+    next_cursor: Optional[str] = None
     
     class Config:
         from_attributes = True
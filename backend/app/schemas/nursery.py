@@ -123,6 +123,18 @@ class NurserySearchFilters(BaseModel):
     specialties: Optional[List[str]] = None
 
 
+class NearbyNurseryResponse(BaseModel):
+    """A nursery with its distance from the search point."""
+    nursery: LocalNurseryResponse
+    distance_km: float
+
+
+class NearbyNurseryPage(BaseModel):
+    """Distance-ordered page of nurseries."""
+    items: List[NearbyNurseryResponse]
+    next_cursor: Optional[str] = None
+
+
 class UserNurseryFavoriteResponse(BaseModel):
     """User nursery favorite response schema."""
     id: UUID
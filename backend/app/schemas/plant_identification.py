@@ -56,10 +56,12 @@ class PlantIdentificationListResponse(BaseModel):
     """Schema for paginated plant identification list responses."""
     
     items: List[PlantIdentificationResponse]
-    total: int
-    page: int
-    size: int
-    pages: int
+    total: Optional[int] = None
+    page: Optional[int] = None
+    size: Optional[int] = None
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
 
 class PlantIdentificationResultResponse(BaseModel):
@@ -5,6 +5,7 @@ validation and serialization in API requests and responses.
 """
 
 from datetime import datetime
+from enum import Enum
 from typing import List, Optional
 from uuid import UUID
 
@@ -12,6 +13,13 @@ from pydantic import BaseModel, Field
 
 from app.schemas.plant_species import PlantSpeciesResponse
 from app.schemas.user import UserPublicResponse
+from app.utils.pagination import SortOrder
+
+
+class QuestionSortField(str, Enum):
+    """Orders question searches can use (``relevance`` needs a text query)."""
+    RELEVANCE = "relevance"
+    CREATED_AT = "created_at"
 
 
 class PlantQuestionBase(BaseModel):
@@ -97,10 +105,12 @@ class PlantQuestionListResponse(BaseModel):
     """Schema for paginated plant question list responses."""
     
     items: List[PlantQuestionResponse]
-    total: int
-    page: int
-    size: int
-    pages: int
+    total: Optional[int] = None
+    page: Optional[int] = None
+    size: Optional[int] = None
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
 
 class PlantQuestionSearchRequest(BaseModel):
@@ -111,6 +121,8 @@ class PlantQuestionSearchRequest(BaseModel):
     tags: Optional[List[str]] = None
     is_solved: Optional[bool] = None
     user_id: Optional[UUID] = None
+    sort_by: Optional[QuestionSortField] = None  # relevance with a query, else created_at
+    sort_order: SortOrder = SortOrder.DESC
     page: int = Field(default=1, ge=1)
     size: int = Field(default=20, ge=1, le=100)
 
@@ -5,6 +5,7 @@ validation and serialization in API requests and responses.
 """
 
 from datetime import datetime
+from enum import Enum
 from typing import List, Optional
 from uuid import UUID
 
@@ -13,6 +14,18 @@ from pydantic import BaseModel, Field
 from app.models.plant_trade import TradeStatus, TradeType
 from app.schemas.plant_species import PlantSpeciesResponse
 from app.schemas.user import UserPublicResponse
+from app.utils.pagination import SortOrder
+
+
+class TradeSortField(str, Enum):
+    """Orders trade searches can use.
+    
+    ``relevance`` needs a text query. ``price`` is free text ("Free",
+    "$10", "Trade only") and has no meaningful order, so it is not offered.
+    """
+    RELEVANCE = "relevance"
+    CREATED_AT = "created_at"
+    TITLE = "title"
 
 
 class PlantTradeBase(BaseModel):
@@ -67,10 +80,12 @@ class PlantTradeListResponse(BaseModel):
     """Schema for paginated plant trade list responses."""
     
     items: List[PlantTradeResponse]
-    total: int
-    page: int
-    size: int
-    pages: int
+    total: Optional[int] = None
+    page: Optional[int] = None
+    size: Optional[int] = None
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
 
 class PlantTradeSearchRequest(BaseModel):
@@ -81,6 +96,8 @@ class PlantTradeSearchRequest(BaseModel):
     location: Optional[str] = None
     species_id: Optional[UUID] = None
     max_price: Optional[float] = None
+    sort_by: Optional[TradeSortField] = None  # relevance with a query, else created_at
+    sort_order: SortOrder = SortOrder.DESC
     page: int = Field(default=1, ge=1)
     size: int = Field(default=20, ge=1, le=100)
 
@@ -58,6 +58,7 @@ class UserSearch(BaseModel):
     # Friendship status (computed field)
     friendship_status: Optional[str] = None  # none, pending, accepted, blocked
     is_close_friend: Optional[bool] = None
+    mutual_friends_count: Optional[int] = None
     
     class Config:
         from_attributes = True
@@ -79,4 +79,5 @@ class PlantCareReminderResponse(BaseModel):
     care_type: str
     days_overdue: int
     last_care_date: Optional[datetime]
-    recommended_frequency_days: Optional[int]
\ No newline at end of file
+    recommended_frequency_days: Optional[int]
+    next_due_at: Optional[datetime] = None
\ No newline at end of file
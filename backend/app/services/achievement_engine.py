@@ -0,0 +1,494 @@
+"""Event-driven achievement evaluation.
+
+Services that record user activity (care logs, plant collection changes,
+identifications, questions and answers) call
+``AchievementEngine.record_event`` inside their own transaction. The event
+updates the user's ``UserStats`` counters with one ``UPDATE ... RETURNING``.
+Only the achievements indexed under that event type are then compared
+with the returned counters, and the newly met ones are awarded in one
+bulk insert, so an event costs no per-achievement queries.
+
+Achievement definitions are held in an in-process index refreshed every
+``ACHIEVEMENT_INDEX_TTL_SECONDS``. Time-based achievements (``plant_age``)
+and the expiry of broken care streaks are handled by a nightly job.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import Date, and_, case, cast, exists, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.plant_achievement import PlantAchievement, UserAchievement, UserStats
+from app.models.user_plant import UserPlant
+
+logger = logging.getLogger(__name__)
+
+
+class AchievementEvent(str, Enum):
+    """User activity that can change achievement progress."""
+    CARE_LOGGED = "care_logged"
+    PLANT_ADDED = "plant_added"
+    PLANT_REACTIVATED = "plant_reactivated"
+    PLANT_DEACTIVATED = "plant_deactivated"
+    PLANT_IDENTIFIED = "plant_identified"
+    QUESTION_ASKED = "question_asked"
+    QUESTION_ANSWERED = "question_answered"
+    ANSWER_MARKED_HELPFUL = "answer_marked_helpful"
+
+
+@dataclass(frozen=True)
+class CounterCriterion:
+    """How an achievement type is decided from a ``UserStats`` counter."""
+    stat: str
+    criteria_key: str
+    default_threshold: int
+    events: Tuple[AchievementEvent, ...]
+
+
+# Achievement type -> counter, unlock_criteria key and the events that move the counter up
+COUNTER_CRITERIA: Dict[str, CounterCriterion] = {
+    "care_streak": CounterCriterion(
+        "care_streak_days", "days", 7, (AchievementEvent.CARE_LOGGED,)
+    ),
+    "plant_collection": CounterCriterion(
+        "active_plants", "count", 5, (AchievementEvent.PLANT_ADDED, AchievementEvent.PLANT_REACTIVATED)
+    ),
+    "identification": CounterCriterion(
+        "plants_identified", "count", 10, (AchievementEvent.PLANT_IDENTIFIED,)
+    ),
+    "community_helper": CounterCriterion(
+        "helpful_answers", "helpful_answers", 5, (AchievementEvent.ANSWER_MARKED_HELPFUL,)
+    ),
+}
+
+# Awarded by the nightly job: an active plant owned for at least ``days``
+PLANT_AGE_TYPE = "plant_age"
+PLANT_AGE_DEFAULT_DAYS = 365
+
+COUNTER_STATS: Tuple[str, ...] = tuple(sorted({c.stat for c in COUNTER_CRITERIA.values()}))
+
+_COUNTER_DELTAS: Dict[AchievementEvent, Dict[str, int]] = {
+    AchievementEvent.PLANT_ADDED: {"total_plants": 1, "active_plants": 1},
+    AchievementEvent.PLANT_REACTIVATED: {"active_plants": 1},
+    AchievementEvent.PLANT_DEACTIVATED: {"active_plants": -1},
+    AchievementEvent.PLANT_IDENTIFIED: {"plants_identified": 1},
+    AchievementEvent.QUESTION_ASKED: {"questions_asked": 1},
+    AchievementEvent.QUESTION_ANSWERED: {"questions_answered": 1},
+    AchievementEvent.ANSWER_MARKED_HELPFUL: {"helpful_answers": 1},
+}
+
+
+def _counter_updates(event: AchievementEvent, occurred_at: datetime) -> Dict[str, Any]:
+    """SET clause applying an event to a user's counters."""
+    if event == AchievementEvent.CARE_LOGGED:
+        # A streak continues from yesterday, holds for more care the same day
+        # (or backdated care) and otherwise restarts at one day
+        last_day = cast(UserStats.last_care_activity, Date)
+        day = occurred_at.date()
+        streak = case(
+            (UserStats.last_care_activity.is_(None), 1),
+            (last_day >= day, UserStats.care_streak_days),
+            (last_day == day - timedelta(days=1), UserStats.care_streak_days + 1),
+            else_=1
+        )
+        return {
+            "total_care_logs": UserStats.total_care_logs + 1,
+            "care_streak_days": streak,
+            "longest_care_streak": func.greatest(UserStats.longest_care_streak, streak),
+            "last_care_activity": func.greatest(UserStats.last_care_activity, occurred_at),
+        }
+    return {
+        stat: func.greatest(getattr(UserStats, stat) + delta, 0)
+        for stat, delta in _COUNTER_DELTAS[event].items()
+    }
+
+
+def level_expression(points):
+    """SQL form of ``PlantAchievementService._calculate_level``."""
+    return case(
+        (points < 100, 1),
+        (points < 300, 2),
+        (points < 600, 3),
+        (points < 1000, 4),
+        (points < 1500, 5),
+        else_=func.least(10, 5 + (points - 1500) // 500)
+    )
+
+
+@dataclass(frozen=True)
+class IndexedAchievement:
+    """An active achievement with its unlock threshold resolved."""
+    id: UUID
+    achievement_type: str
+    threshold: int
+    points: int
+    stat: Optional[str] = None
+
+
+class AchievementIndex:
+    """Active achievements grouped by the event types that can unlock them."""
+
+    def __init__(self, achievements: Iterable[PlantAchievement]):
+        self.by_event: Dict[AchievementEvent, List[IndexedAchievement]] = {}
+        self.counter_based: List[IndexedAchievement] = []
+        self.plant_age: List[IndexedAchievement] = []
+        for achievement in achievements:
+            criteria = achievement.unlock_criteria or {}
+            counter = COUNTER_CRITERIA.get(achievement.achievement_type)
+            if counter is not None:
+                indexed = IndexedAchievement(
+                    id=achievement.id,
+                    achievement_type=achievement.achievement_type,
+                    threshold=int(criteria.get(counter.criteria_key, counter.default_threshold)),
+                    points=achievement.points or 0,
+                    stat=counter.stat
+                )
+                self.counter_based.append(indexed)
+                for event in counter.events:
+                    self.by_event.setdefault(event, []).append(indexed)
+            elif achievement.achievement_type == PLANT_AGE_TYPE:
+                self.plant_age.append(IndexedAchievement(
+                    id=achievement.id,
+                    achievement_type=achievement.achievement_type,
+                    threshold=int(criteria.get("days", PLANT_AGE_DEFAULT_DAYS)),
+                    points=achievement.points or 0
+                ))
+        self.loaded_at = time.monotonic()
+
+
+def _met(achievements: Iterable[IndexedAchievement], stats: Mapping[str, Any]) -> List[IndexedAchievement]:
+    return [a for a in achievements if (stats.get(a.stat) or 0) >= a.threshold]
+
+
+class AchievementEngine:
+    """Applies activity events to user counters and awards achievements."""
+
+    def __init__(
+        self,
+        index_ttl_seconds: float = 300.0,
+        nightly_hour_utc: int = 3,
+        batch_size: int = 1000,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ):
+        self.index_ttl_seconds = index_ttl_seconds
+        self.nightly_hour_utc = nightly_hour_utc
+        self.batch_size = batch_size
+        self.session_factory = session_factory
+        self._index: Optional[AchievementIndex] = None
+        self._index_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.events = 0
+        self.evaluated = 0
+        self.awarded = 0
+        self.nightly_runs = 0
+        self.last_nightly: Optional[Dict[str, Any]] = None
+
+    async def get_index(self, db: AsyncSession) -> AchievementIndex:
+        """The achievement index, reloaded once it is older than the TTL."""
+        index = self._index
+        if index is None or time.monotonic() - index.loaded_at > self.index_ttl_seconds:
+            async with self._index_lock:
+                index = self._index
+                if index is None or time.monotonic() - index.loaded_at > self.index_ttl_seconds:
+                    result = await db.execute(
+                        select(PlantAchievement).where(PlantAchievement.is_active == True)
+                    )
+                    index = self._index = AchievementIndex(result.scalars().all())
+        return index
+
+    def invalidate(self) -> None:
+        """Reload achievement definitions on next use."""
+        self._index = None
+
+    async def record_event(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        event: AchievementEvent,
+        occurred_at: Optional[datetime] = None
+    ) -> List[IndexedAchievement]:
+        """Apply an event to a user's counters and award what it unlocks (caller commits).
+
+        Args:
+            db: Database session
+            user_id: User the event belongs to
+            event: Event type
+            occurred_at: When the activity happened (now if None)
+
+        Returns:
+            Achievements awarded by this event
+        """
+        stats = await self._apply_counters(
+            db, user_id, _counter_updates(event, occurred_at or datetime.utcnow())
+        )
+        self.events += 1
+        candidates = (await self.get_index(db)).by_event.get(event)
+        if not candidates:
+            return []
+        self.evaluated += len(candidates)
+        return await self._award(db, user_id, _met(candidates, stats))
+
+    async def evaluate_user(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        stats: Mapping[str, Any]
+    ) -> List[IndexedAchievement]:
+        """Check every active achievement for one user and award the met ones (caller commits).
+
+        Args:
+            db: Database session
+            user_id: User ID
+            stats: The user's current counters
+
+        Returns:
+            Newly awarded achievements
+        """
+        index = await self.get_index(db)
+        met = _met(index.counter_based, stats)
+        if index.plant_age:
+            oldest = await db.scalar(
+                select(func.min(UserPlant.acquired_date)).where(
+                    and_(UserPlant.user_id == user_id, UserPlant.is_active == True)
+                )
+            )
+            if oldest is not None:
+                age_days = (datetime.utcnow() - oldest).days
+                met.extend(a for a in index.plant_age if age_days >= a.threshold)
+        self.evaluated += len(index.counter_based) + len(index.plant_age)
+        return await self._award(db, user_id, met)
+
+    async def _apply_counters(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        updates: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Update a user's counters, creating the row if needed; returns the new values."""
+        stmt = (
+            update(UserStats)
+            .where(UserStats.user_id == user_id)
+            .values(**updates, last_updated=datetime.utcnow())
+            .returning(*[getattr(UserStats, stat) for stat in COUNTER_STATS])
+            .execution_options(synchronize_session=False)
+        )
+        row = (await db.execute(stmt)).one_or_none()
+        if row is None:
+            await self._ensure_stats(db, [user_id])
+            row = (await db.execute(stmt)).one()
+        return dict(row._mapping)
+
+    async def _ensure_stats(self, db: AsyncSession, user_ids: List[UUID]) -> None:
+        await db.execute(
+            insert(UserStats)
+            .values([{"id": uuid4(), "user_id": user_id} for user_id in user_ids])
+            .on_conflict_do_nothing(index_elements=[UserStats.user_id])
+        )
+
+    async def _award(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        achievements: List[IndexedAchievement]
+    ) -> List[IndexedAchievement]:
+        """Award the achievements the user has not earned yet."""
+        if not achievements:
+            return []
+        pending = {a.id: a for a in achievements}
+        earned = await db.execute(
+            select(UserAchievement.achievement_id).where(
+                and_(
+                    UserAchievement.user_id == user_id,
+                    UserAchievement.achievement_id.in_(pending)
+                )
+            )
+        )
+        for achievement_id in earned.scalars():
+            pending.pop(achievement_id, None)
+        if not pending:
+            return []
+        awarded = await self._insert_awards(db, [(user_id, a) for a in pending.values()])
+        return [achievement for _, achievement in awarded]
+
+    async def _insert_awards(
+        self,
+        db: AsyncSession,
+        awards: List[Tuple[UUID, IndexedAchievement]]
+    ) -> List[Tuple[UUID, IndexedAchievement]]:
+        """Insert awards in one statement and add their points to the owners' stats.
+
+        Awards that already exist are skipped, so concurrent or repeated
+        evaluation never counts an achievement twice.
+        """
+        now = datetime.utcnow()
+        result = await db.execute(
+            insert(UserAchievement)
+            .values([
+                {"id": uuid4(), "user_id": user_id, "achievement_id": achievement.id, "earned_at": now}
+                for user_id, achievement in awards
+            ])
+            .on_conflict_do_nothing(index_elements=[UserAchievement.user_id, UserAchievement.achievement_id])
+            .returning(UserAchievement.user_id, UserAchievement.achievement_id)
+        )
+        by_key = {(user_id, achievement.id): achievement for user_id, achievement in awards}
+        awarded = [(user_id, by_key[(user_id, achievement_id)]) for user_id, achievement_id in result.all()]
+
+        # Users with the same (count, points) gain are updated together
+        totals: Dict[UUID, Tuple[int, int]] = {}
+        for user_id, achievement in awarded:
+            count, points = totals.get(user_id, (0, 0))
+            totals[user_id] = (count + 1, points + achievement.points)
+        groups: Dict[Tuple[int, int], List[UUID]] = {}
+        for user_id, gain in totals.items():
+            groups.setdefault(gain, []).append(user_id)
+        for (count, points), user_ids in groups.items():
+            new_points = UserStats.total_points + points
+            await db.execute(
+                update(UserStats)
+                .where(UserStats.user_id.in_(user_ids))
+                .values(
+                    total_achievements=UserStats.total_achievements + count,
+                    total_points=new_points,
+                    level=level_expression(new_points),
+                    last_updated=now
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+        self.awarded += len(awarded)
+        if awarded:
+            logger.info(f"Awarded {len(awarded)} achievements to {len(totals)} users")
+        return awarded
+
+    async def run_nightly(self, db: AsyncSession) -> Dict[str, Any]:
+        """Award plant-age achievements and expire broken care streaks.
+
+        Qualifying users are found with one query per plant-age achievement
+        and awarded in batches of ``batch_size``, each batch committed.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Counts of awards and expired streaks
+        """
+        start = time.perf_counter()
+        index = await self.get_index(db)
+        today = datetime.utcnow().date()
+        awarded = 0
+        for achievement in index.plant_age:
+            # acquired_date is a timestamp; compare against a datetime, not a date
+            cutoff = datetime.combine(today - timedelta(days=achievement.threshold), datetime.min.time())
+            result = await db.execute(
+                select(UserPlant.user_id)
+                .where(
+                    and_(
+                        UserPlant.is_active == True,
+                        UserPlant.acquired_date <= cutoff,
+                        ~exists().where(
+                            and_(
+                                UserAchievement.user_id == UserPlant.user_id,
+                                UserAchievement.achievement_id == achievement.id
+                            )
+                        )
+                    )
+                )
+                .distinct()
+            )
+            user_ids = list(result.scalars())
+            for offset in range(0, len(user_ids), self.batch_size):
+                batch = user_ids[offset:offset + self.batch_size]
+                await self._ensure_stats(db, batch)
+                awarded += len(await self._insert_awards(db, [(user_id, achievement) for user_id in batch]))
+                await db.commit()
+
+        # A streak survives while the last care was yesterday or today
+        yesterday = datetime.combine(today - timedelta(days=1), datetime.min.time())
+        expired = await db.execute(
+            update(UserStats)
+            .where(
+                and_(
+                    UserStats.care_streak_days > 0,
+                    UserStats.last_care_activity < yesterday
+                )
+            )
+            .values(care_streak_days=0)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+        self.nightly_runs += 1
+        self.last_nightly = {
+            "awarded": awarded,
+            "streaks_expired": expired.rowcount,
+            "seconds": time.perf_counter() - start,
+        }
+        logger.info(f"Nightly achievement run: {self.last_nightly}")
+        return self.last_nightly
+
+    def _seconds_until_next_run(self, now: datetime) -> float:
+        next_run = now.replace(hour=self.nightly_hour_utc, minute=0, second=0, microsecond=0)
+        if next_run <= now:
+            next_run += timedelta(days=1)
+        return (next_run - now).total_seconds()
+
+    async def run_forever(self) -> None:
+        """Run the nightly job at ``nightly_hour_utc`` every day until cancelled."""
+        while True:
+            await asyncio.sleep(self._seconds_until_next_run(datetime.utcnow()))
+            try:
+                async with self.session_factory() as db:
+                    await self.run_nightly(db)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Nightly achievement run failed: {str(e)}")
+
+    def start(self) -> None:
+        """Start the nightly job task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        """Cancel the nightly job task."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "events": self.events,
+            "achievements_evaluated": self.evaluated,
+            "awarded": self.awarded,
+            "nightly_runs": self.nightly_runs,
+            "last_nightly": self.last_nightly,
+        }
+
+
+_achievement_engine: Optional[AchievementEngine] = None
+
+
+def get_achievement_engine() -> AchievementEngine:
+    """Get the process-wide achievement engine."""
+    global _achievement_engine
+    if _achievement_engine is None:
+        _achievement_engine = AchievementEngine(
+            index_ttl_seconds=settings.ACHIEVEMENT_INDEX_TTL_SECONDS,
+            nightly_hour_utc=settings.ACHIEVEMENT_NIGHTLY_HOUR_UTC,
+            batch_size=settings.ACHIEVEMENT_NIGHTLY_BATCH_SIZE,
+        )
+    return _achievement_engine
@@ -6,7 +6,8 @@ Provides comprehensive insights and analytics for plant care, community engageme
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func, text, desc, asc
+from sqlalchemy import func, text, desc, asc, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 import json
 import statistics
 from collections import defaultdict
@@ -16,7 +17,7 @@ from app.models.plant_care_log import PlantCareLog
 from app.models.rag_models import RAGInteraction
 from app.models.plant_achievement import PlantAchievement
 from app.models.plant_question import PlantQuestion
-from app.models.plant_trade import PlantTrade
+from app.models.plant_trade import PlantTrade, TradeStatus
 from app.models.user import User
 from app.services.ml_plant_health_service import MLPlantHealthService
 from app.services.ml_trending_topics_service import MLTrendingTopicsService
@@ -113,7 +114,7 @@ class AnalyticsService:
 
     async def get_community_analytics(
         self,
-        db: Session,
+        db: AsyncSession,
         user_id: str,
         time_period: int = 30
     ) -> Dict[str, Any]:
@@ -121,27 +122,33 @@ class AnalyticsService:
         
         start_date = datetime.utcnow() - timedelta(days=time_period)
         
-        # Get user's questions and answers
-        questions_asked = db.query(PlantQuestion).filter(
+        # Count questions asked and completed trades in one round trip
+        questions_asked_query = select(func.count()).select_from(PlantQuestion).where(
             PlantQuestion.user_id == user_id,
             PlantQuestion.created_at >= start_date
-        ).count()
-        
-        # Get RAG interactions
-        rag_interactions = db.query(RAGInteraction).filter(
-            RAGInteraction.user_id == user_id,
-            RAGInteraction.created_at >= start_date
-        ).all()
-        
-        # Get trading activity
-        trades = db.query(PlantTrade).filter(
-            (PlantTrade.seller_id == user_id) | (PlantTrade.buyer_id == user_id),
+        ).scalar_subquery()
+        successful_trades_query = select(func.count()).select_from(PlantTrade).where(
+            or_(PlantTrade.owner_id == user_id, PlantTrade.interested_user_id == user_id),
+            PlantTrade.status == TradeStatus.COMPLETED,
             PlantTrade.created_at >= start_date
-        ).all()
+        ).scalar_subquery()
+        counts = await db.execute(select(questions_asked_query, successful_trades_query))
+        questions_asked, successful_trades = counts.one()
+        
+        # Get RAG interactions (only the columns the summaries use)
+        rag_result = await db.execute(
+            select(
+                RAGInteraction.interaction_type,
+                RAGInteraction.user_feedback.label("feedback_score")
+            ).where(
+                RAGInteraction.user_id == user_id,
+                RAGInteraction.created_at >= start_date
+            )
+        )
+        rag_interactions = rag_result.all()
         
         # Calculate engagement metrics
         ai_interactions = len(rag_interactions)
-        successful_trades = len([t for t in trades if t.status == "completed"])
         
         # Get trending topics the user engaged with
         trending_topics = await self.ml_trending_service.get_trending_topics(
@@ -14,16 +14,17 @@ from fastapi_users.password import PasswordHelper
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 import redis.asyncio as redis
 import secrets
 import json
 
 from app.core.config import settings
 from app.core.database import AsyncSessionLocal
+from app.core.security import get_password_hasher, pwd_context
 from app.models.user import User
 from app.models.user_plant import UserPlant
 from app.schemas.auth import UserCreate, UserUpdate
+from app.services.principal_cache import get_principal_cache
 
 
 class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
@@ -57,6 +58,7 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         request: Optional[Any] = None,
     ):
         """Called after user update."""
+        get_principal_cache().invalidate_user(user.id)
         print(f"User {user.id} has been updated with {update_dict}.")
     
     async def on_after_request_verify(
@@ -137,7 +139,7 @@ class AuthService:
     
     def __init__(self):
         """Initialize the authentication service."""
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.pwd_context = pwd_context
         self.redis_client = None
     
     async def get_redis_client(self):
@@ -158,6 +160,22 @@ class AuthService:
         """Hash a password."""
         return self.pwd_context.hash(password)
     
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password on the password hashing pool.
+        
+        Raises:
+            PasswordHashingBusy: If the hashing queue is full
+        """
+        return await get_password_hasher().verify(plain_password, hashed_password)
+    
+    async def get_password_hash_async(self, password: str) -> str:
+        """Hash a password on the password hashing pool.
+        
+        Raises:
+            PasswordHashingBusy: If the hashing queue is full
+        """
+        return await get_password_hasher().hash(password)
+    
     def create_access_token(
         self, 
         data: dict, 
@@ -363,7 +381,7 @@ class AuthService:
         if not user:
             return None
         
-        if not self.verify_password(password, user.hashed_password):
+        if not await self.verify_password_async(password, user.hashed_password):
             return None
         
         return user
@@ -373,19 +391,37 @@ class AuthService:
         token: str, 
         session: AsyncSession
     ) -> Optional[User]:
-        """Get current user from JWT token."""
-        payload = await self.verify_token(token)
-        if not payload:
-            return None
+        """Get current user from JWT token.
+        
+        Decoded claims and the user row are served from the principal cache
+        when possible, so most requests need neither a JWT decode nor a query.
+        Inactive users are rejected.
+        """
+        cache = get_principal_cache()
+        payload = cache.get_claims(token)
+        if payload is None:
+            payload = await self.verify_token(token)
+            if not payload:
+                return None
+            cache.put_claims(token, payload)
         
         user_id = payload.get("sub")
         if not user_id:
             return None
         
-        result = await session.execute(
-            select(User).where(User.id == user_id)
-        )
-        return result.scalar_one_or_none()
+        user = await cache.get_user(user_id, session)
+        if user is None:
+            result = await session.execute(
+                select(User).where(User.id == user_id)
+            )
+            user = result.scalar_one_or_none()
+            if user is None:
+                return None
+            cache.put_user(user)
+        
+        if not user.is_active:
+            return None
+        return user
     
     async def verify_refresh_token(
         self, 
@@ -713,6 +749,7 @@ class AuthService:
         user.updated_at = datetime.utcnow()
         await db.commit()
         await db.refresh(user)
+        get_principal_cache().invalidate_user(user_id)
         
         return True
     
@@ -765,6 +802,7 @@ class AuthService:
         user.updated_at = datetime.utcnow()
         await db.commit()
         await db.refresh(user)
+        get_principal_cache().invalidate_user(user_id)
         
         return True
 
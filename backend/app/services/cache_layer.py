@@ -12,7 +12,6 @@ Key Features:
 - TTL management based on data volatility
 """
 
-import asyncio
 import json
 import logging
 from datetime import datetime, timedelta
@@ -23,7 +22,6 @@ import hashlib
 import time
 
 import redis.asyncio as redis
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.cache import get_redis_client
@@ -539,42 +537,29 @@ async def get_cache_service():
     return CacheLayerService()
 
 # Cache warming background task
-async def warm_cache_background(cache_service: CacheLayerService, db: AsyncSession):
-    """Background task to warm frequently accessed cache entries"""
-    try:
-        from app.services.care_plan import CarePlanService
-        from app.services.environmental_data import EnvironmentalDataService
-        
-        care_plan_service = CarePlanService(db)
-        env_service = EnvironmentalDataService(db)
-        
-        # Get list of active plants (implement based on your needs)
-        # This is a placeholder - implement based on your plant activity tracking
-        active_plant_ids = [1, 2, 3]  # Replace with actual logic
-        
-        for plant_id in active_plant_ids:
-            try:
-                # Warm care plan cache
-                await cache_service.warm_cache(
-                    plant_id,
-                    lambda pid: care_plan_service.get_latest_care_plan(pid),
-                    'care_plan'
-                )
-                
-                # Warm environmental data cache
-                await cache_service.warm_cache(
-                    plant_id,
-                    lambda pid: env_service.get_environmental_context(pid),
-                    'environmental_data'
-                )
-                
-                # Small delay to avoid overwhelming the system
-                await asyncio.sleep(0.1)
-                
-            except Exception as e:
-                logger.error(f"Error warming cache for plant {plant_id}: {e}")
+async def warm_cache_background(cache_service: Optional[CacheLayerService] = None) -> Dict[str, Any]:
+    """Background task regenerating stale care plans for all active plants into the cache
+    
+    Args:
+        cache_service: Cache to write plans through (the runner's own if None)
         
-        logger.info(f"Cache warming completed for {len(active_plant_ids)} plants")
+    Returns:
+        Batch progress metrics
+    """
+    from app.services.care_plan_batch_runner import CarePlanBatchRunner, get_care_plan_batch_runner
+    
+    try:
+        if cache_service is None:
+            runner = get_care_plan_batch_runner()
+        else:
+            runner = CarePlanBatchRunner(
+                cache=cache_service,
+                concurrency=settings.CARE_PLAN_BATCH_CONCURRENCY,
+                page_size=settings.CARE_PLAN_BATCH_PAGE_SIZE,
+                max_plan_age_hours=settings.CARE_PLAN_MAX_AGE_HOURS
+            )
+        return await runner.run()
         
     except Exception as e:
-        logger.error(f"Cache warming background task error: {e}")
\ No newline at end of file
+        logger.error(f"Cache warming background task error: {e}")
+        return {}
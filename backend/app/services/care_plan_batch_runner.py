@@ -0,0 +1,358 @@
+"""Batch care-plan generation for all active plants.
+
+``CarePlanBatchRunner`` walks active plants in primary-key order with
+keyset pagination. For each page it selects the plants whose latest plan
+is missing, older than ``max_plan_age_hours``, or older than a change to
+its inputs (a plant edit or a newer care log), and regenerates those
+with at most ``concurrency`` plans in flight, each on its own session.
+
+Plants of one page share a context lookup memo (species data). Their
+contexts are aggregated first and scored in one
+``RuleEngineService.evaluate_contexts`` call, which looks candidate
+rules up once per (species, season) pair; the whole run shares one
+compiled care rule set. Environmental data is loaded in one query per
+page for the owner locations the pass has not seen yet, and reused for
+the rest of the pass. Generated plans are written through
+``CacheLayerService`` so the next read is a cache hit.
+
+Started from the application lifespan, the runner makes its first pass
+one ``run_interval`` after startup and then one every ``run_interval``
+seconds. A pass runs under a PostgreSQL advisory lock, so when several
+worker processes start the runner only one of them regenerates plans
+at a time; the others skip that pass.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, try_advisory_lock
+from app.models.care_plan import CarePlanV2
+from app.models.plant_care_log import PlantCareLog
+from app.models.user import User
+from app.models.user_plant import UserPlant
+from app.services.cache_layer import CacheLayerService
+from app.services.care_plan_service import CarePlanService
+from app.services.context_aggregation_service import ContextAggregationService
+from app.services.rule_engine_service import CareRecommendation, RuleEngineService
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock key serializing batch passes across worker processes
+ADVISORY_LOCK_KEY = 4_702_001
+
+
+@dataclass
+class BatchProgress:
+    """Progress of one batch run."""
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+    pages: int = 0
+    scanned: int = 0
+    due: int = 0
+    generated: int = 0
+    failed: int = 0
+    cursor: Optional[str] = None
+    generation_seconds: float = 0.0
+
+    @property
+    def elapsed_seconds(self) -> float:
+        end = self.finished_at or datetime.utcnow()
+        return (end - self.started_at).total_seconds()
+
+    @property
+    def plans_per_second(self) -> float:
+        elapsed = self.elapsed_seconds
+        return self.generated / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["started_at"] = self.started_at.isoformat()
+        data["finished_at"] = self.finished_at.isoformat() if self.finished_at else None
+        data["elapsed_seconds"] = self.elapsed_seconds
+        data["plans_per_second"] = self.plans_per_second
+        data["avg_generation_ms"] = (
+            self.generation_seconds / self.generated * 1000 if self.generated else 0.0
+        )
+        return data
+
+
+class CarePlanBatchRunner:
+    """Regenerates stale care plans for all active plants."""
+
+    def __init__(
+        self,
+        cache: Optional[CacheLayerService] = None,
+        concurrency: int = 8,
+        page_size: int = 200,
+        max_plan_age_hours: float = 24.0,
+        context_window_days: int = 30,
+        run_interval: float = 3600.0,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ):
+        self.cache = cache or CacheLayerService()
+        self.concurrency = concurrency
+        self.page_size = page_size
+        self.max_plan_age = timedelta(hours=max_plan_age_hours)
+        self.context_window_days = context_window_days
+        self.run_interval = run_interval
+        self.session_factory = session_factory
+        self.progress: Optional[BatchProgress] = None
+        self._rule_engine: Optional[RuleEngineService] = None
+        self._run_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    async def run(self) -> Dict[str, Any]:
+        """Walk all active plants once and regenerate the plans that need it.
+
+        Runs do not overlap; a call made during a run in this process
+        waits for it and then starts a new pass. While another process
+        holds the batch lock the pass is skipped.
+
+        Returns:
+            Final progress metrics, or ``{"skipped": True}``
+        """
+        async with self._run_lock:
+            async with try_advisory_lock(ADVISORY_LOCK_KEY, self.session_factory) as acquired:
+                if not acquired:
+                    logger.info("Care plan batch pass already running in another process; skipping")
+                    return {"skipped": True}
+                return await self._run()
+
+    async def _run(self) -> Dict[str, Any]:
+        progress = self.progress = BatchProgress()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        cursor: Optional[UUID] = None
+        # Environmental context per owner location, loaded once per pass
+        environment: Dict[str, Dict[str, Any]] = {}
+
+        while True:
+            async with self.session_factory() as db:
+                page = await self._fetch_page(db, cursor)
+                due = [row for row in page if self._needs_plan(row, datetime.utcnow())]
+                locations = {row.owner_location for row in due if row.owner_location}
+                missing = locations - environment.keys()
+                if missing:
+                    environment.update(await self._load_environment(db, missing))
+            if not page:
+                break
+
+            cursor = page[-1].id
+            progress.pages += 1
+            progress.scanned += len(page)
+            progress.due += len(due)
+            progress.cursor = str(cursor)
+
+            # Lookups shared by the plants of this page
+            shared_lookups: Dict[Any, Any] = {}
+            ContextAggregationService(None, shared_lookups=shared_lookups).seed_environment(
+                {location: environment[location] for location in locations},
+                self.context_window_days
+            )
+            contexts = await asyncio.gather(*[
+                self._aggregate(row.id, row.user_id, semaphore, shared_lookups)
+                for row in due
+            ])
+            ready = [(row, context) for row, context in zip(due, contexts) if context is not None]
+
+            start = time.perf_counter()
+            rule_results = self._get_rule_engine().evaluate_contexts([context for _, context in ready])
+            progress.generation_seconds += time.perf_counter() - start
+
+            await asyncio.gather(*[
+                self._regenerate(row.id, row.user_id, semaphore, shared_lookups, context, rule_result)
+                for (row, context), rule_result in zip(ready, rule_results)
+            ])
+
+            logger.info(
+                f"Care plan batch page {progress.pages}: scanned {progress.scanned}, "
+                f"generated {progress.generated}, failed {progress.failed}, "
+                f"{progress.plans_per_second:.1f} plans/s"
+            )
+            if len(page) < self.page_size:
+                break
+
+        progress.finished_at = datetime.utcnow()
+        logger.info(f"Care plan batch finished: {progress.to_dict()}")
+        return progress.to_dict()
+
+    async def run_forever(self) -> None:
+        """Make a pass every ``run_interval`` seconds until cancelled.
+
+        The first pass waits one interval, so restarts and reloads do not
+        each start a full pass.
+        """
+        while True:
+            await asyncio.sleep(self.run_interval)
+            try:
+                await self.run()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Care plan batch runner error: {str(e)}")
+
+    def start(self) -> None:
+        """Start the background batch task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        """Cancel the background batch task."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_progress(self) -> Optional[Dict[str, Any]]:
+        """Metrics of the current or last run."""
+        return self.progress.to_dict() if self.progress else None
+
+    async def _fetch_page(self, db: AsyncSession, cursor: Optional[UUID]) -> List[Any]:
+        """Next page of active plants with the timestamps that decide staleness."""
+        latest_plan = (
+            select(func.max(CarePlanV2.created_at))
+            .where(CarePlanV2.plant_id == UserPlant.id)
+            .scalar_subquery()
+        )
+        latest_care = (
+            select(func.max(PlantCareLog.performed_at))
+            .where(PlantCareLog.plant_id == UserPlant.id)
+            .scalar_subquery()
+        )
+        conditions = [UserPlant.is_active == True]
+        if cursor is not None:
+            conditions.append(UserPlant.id > cursor)
+
+        result = await db.execute(
+            select(
+                UserPlant.id,
+                UserPlant.user_id,
+                UserPlant.updated_at,
+                User.location.label("owner_location"),
+                latest_plan.label("plan_created_at"),
+                latest_care.label("last_care_at")
+            )
+            .join(User, User.id == UserPlant.user_id)
+            .where(and_(*conditions))
+            .order_by(UserPlant.id)
+            .limit(self.page_size)
+        )
+        return result.all()
+
+    async def _load_environment(self, db: AsyncSession, locations: Set[str]) -> Dict[str, Dict[str, Any]]:
+        """Environmental context of many owner locations, in one query."""
+        return await ContextAggregationService(db).load_environmental_contexts(
+            locations, self.context_window_days
+        )
+
+    def _needs_plan(self, row: Any, now: datetime) -> bool:
+        """Whether a plant's latest plan is missing, too old or older than its inputs."""
+        plan_created_at = row.plan_created_at
+        if plan_created_at is None or now - plan_created_at > self.max_plan_age:
+            return True
+        if row.updated_at and row.updated_at > plan_created_at:
+            return True
+        return bool(row.last_care_at and row.last_care_at > plan_created_at)
+
+    def _get_rule_engine(self) -> RuleEngineService:
+        """Rule engine holding the default rule set, built and compiled once per runner."""
+        if self._rule_engine is None:
+            self._rule_engine = RuleEngineService(None)
+        return self._rule_engine
+
+    async def _aggregate(
+        self,
+        plant_id: UUID,
+        user_id: UUID,
+        semaphore: asyncio.Semaphore,
+        shared_lookups: Dict[Any, Any]
+    ) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                async with self.session_factory() as db:
+                    return await self._aggregate_context(db, plant_id, user_id, shared_lookups)
+            except Exception as e:
+                self.progress.failed += 1
+                logger.error(f"Error aggregating care plan context for plant {plant_id}: {e}")
+                return None
+            finally:
+                self.progress.generation_seconds += time.perf_counter() - start
+
+    async def _aggregate_context(
+        self,
+        db: AsyncSession,
+        plant_id: UUID,
+        user_id: UUID,
+        shared_lookups: Dict[Any, Any]
+    ) -> Dict[str, Any]:
+        context_service = ContextAggregationService(db, shared_lookups=shared_lookups)
+        return await context_service.aggregate_plant_context(plant_id, user_id, self.context_window_days)
+
+    async def _regenerate(
+        self,
+        plant_id: UUID,
+        user_id: UUID,
+        semaphore: asyncio.Semaphore,
+        shared_lookups: Dict[Any, Any],
+        context: Dict[str, Any],
+        rule_result: Tuple[List[CareRecommendation], Dict[str, Any]]
+    ) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                async with self.session_factory() as db:
+                    plan = await self._generate_plan(db, plant_id, user_id, shared_lookups, context, rule_result)
+                await self.cache.set_care_plan(plant_id, plan)
+                self.progress.generated += 1
+            except Exception as e:
+                self.progress.failed += 1
+                logger.error(f"Error generating care plan for plant {plant_id}: {e}")
+            finally:
+                self.progress.generation_seconds += time.perf_counter() - start
+
+    async def _generate_plan(
+        self,
+        db: AsyncSession,
+        plant_id: UUID,
+        user_id: UUID,
+        shared_lookups: Dict[Any, Any],
+        context: Dict[str, Any],
+        rule_result: Tuple[List[CareRecommendation], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        service = CarePlanService(db, rules=self._get_rule_engine().rules, shared_lookups=shared_lookups)
+        return await service.generate_care_plan(
+            plant_id,
+            user_id,
+            context_window_days=self.context_window_days,
+            force_regenerate=True,
+            context=context,
+            rule_result=rule_result
+        )
+
+
+_batch_runner: Optional[CarePlanBatchRunner] = None
+
+
+def get_care_plan_batch_runner() -> CarePlanBatchRunner:
+    """Get the process-wide care plan batch runner."""
+    global _batch_runner
+    if _batch_runner is None:
+        _batch_runner = CarePlanBatchRunner(
+            concurrency=settings.CARE_PLAN_BATCH_CONCURRENCY,
+            page_size=settings.CARE_PLAN_BATCH_PAGE_SIZE,
+            max_plan_age_hours=settings.CARE_PLAN_MAX_AGE_HOURS,
+            run_interval=settings.CARE_PLAN_BATCH_INTERVAL_HOURS * 3600,
+        )
+    return _batch_runner
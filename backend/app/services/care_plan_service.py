@@ -16,7 +16,7 @@ from sqlalchemy import and_, desc
 from app.models.care_plan import CarePlanV2
 from app.models.user_plant import UserPlant
 from app.services.context_aggregation_service import ContextAggregationService
-from app.services.rule_engine_service import RuleEngineService, CareRecommendation
+from app.services.rule_engine_service import RuleEngineService, CareRecommendation, CareRule
 from app.services.ml_adjustment_service import MLAdjustmentService
 from app.services.rationale_builder_service import RationaleBuilderService
 
@@ -24,15 +24,22 @@ from app.services.rationale_builder_service import RationaleBuilderService
 class CarePlanService:
     """Main service for generating and managing context-aware care plans."""
     
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        rules: Optional[List[CareRule]] = None,
+        shared_lookups: Optional[Dict[Any, Any]] = None
+    ):
         """Initialize the care plan service.
         
         Args:
             db: Database session
+            rules: Care rule set to share with other services (defaults if None)
+            shared_lookups: Context lookup memo shared across a batch of plants
         """
         self.db = db
-        self.context_service = ContextAggregationService(db)
-        self.rule_engine = RuleEngineService(db)
+        self.context_service = ContextAggregationService(db, shared_lookups=shared_lookups)
+        self.rule_engine = RuleEngineService(db, rules=rules, context_service=self.context_service)
         self.ml_service = MLAdjustmentService(db)
         self.rationale_service = RationaleBuilderService()
     
@@ -41,7 +48,9 @@ class CarePlanService:
         plant_id: UUID,
         user_id: UUID,
         context_window_days: int = 30,
-        force_regenerate: bool = False
+        force_regenerate: bool = False,
+        context: Optional[Dict[str, Any]] = None,
+        rule_result: Optional[Tuple[List[CareRecommendation], Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """Generate a comprehensive context-aware care plan.
         
@@ -50,6 +59,9 @@ class CarePlanService:
             user_id: User ID
             context_window_days: Days of historical data to consider
             force_regenerate: Force regeneration even if recent plan exists
+            context: Already aggregated context for this plant, if any
+            rule_result: Rule engine output for ``context``, if already
+                evaluated (e.g. by ``RuleEngineService.evaluate_contexts``)
             
         Returns:
             Complete care plan with recommendations and rationale
@@ -61,14 +73,17 @@ class CarePlanService:
                 return await self._format_existing_plan(existing_plan)
         
         # Step 1: Aggregate context data
-        context = await self.context_service.aggregate_plant_context(
-            plant_id, user_id, context_window_days
-        )
+        if context is None:
+            context = await self.context_service.aggregate_plant_context(
+                plant_id, user_id, context_window_days
+            )
         
         # Step 2: Generate base recommendations using rule engine
-        base_recommendations, rule_metadata = await self.rule_engine.generate_care_recommendations(
-            plant_id, user_id, context_window_days
-        )
+        if rule_result is None:
+            rule_result = await self.rule_engine.generate_care_recommendations(
+                plant_id, user_id, context_window_days, context=context
+            )
+        base_recommendations, rule_metadata = rule_result
         
         # Step 3: Apply ML adjustments
         adjusted_recommendations, ml_metadata = await self.ml_service.adjust_recommendations(
@@ -0,0 +1,344 @@
+"""Due-date index for care reminders.
+
+``care_reminders`` holds the next due time for each plant and scheduled
+care type. It is rewritten in the same transaction as every change that
+moves a due date (care activity, care-log creation, plant edits and
+removal, species care interval edits), so:
+
+- a user's reminders are one range read on ``(user_id, next_due_at)``
+  instead of loading every plant and checking it in Python;
+- ``CareReminderDispatcher`` pops due, not yet notified rows in due-date
+  order from a partial index, in batches, and pushes them through the
+  notification service. Rows are marked notified only once their user's
+  notification was delivered; the others are retried after
+  ``CARE_REMINDER_RETRY_SECONDS``.
+
+Scheduled care types and the plant and species columns that drive them
+are listed in ``SCHEDULED_CARE``.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, case, delete, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.care_reminder import CareReminder
+from app.models.plant_species import PlantSpecies
+from app.models.user_plant import UserPlant
+from app.services.notification_service import seasonal_notification_service
+
+logger = logging.getLogger(__name__)
+
+# Care type -> (UserPlant last-care column, PlantSpecies interval column in days)
+SCHEDULED_CARE: Dict[str, Tuple[str, str]] = {
+    "watering": ("last_watered", "water_frequency_days"),
+}
+
+
+def reminder_due_at(last_care_at: Optional[datetime], interval_days: Optional[int]) -> Optional[datetime]:
+    """When care is next due, or None if the plant has no schedule for it."""
+    if last_care_at is None or not interval_days or interval_days <= 0:
+        return None
+    return last_care_at + timedelta(days=interval_days)
+
+
+def reminder_payload(
+    reminder: CareReminder,
+    plant_nickname: Optional[str],
+    species_name: str,
+    now: datetime
+) -> Dict[str, Any]:
+    """Reminder fields as returned by the reminders endpoint."""
+    return {
+        "plant_id": reminder.plant_id,
+        "plant_nickname": plant_nickname,
+        "species_name": species_name,
+        "care_type": reminder.care_type,
+        "days_overdue": (now - reminder.next_due_at).days,
+        "last_care_date": reminder.last_care_at,
+        "recommended_frequency_days": reminder.interval_days,
+        "next_due_at": reminder.next_due_at,
+    }
+
+
+async def schedule_plant(db: AsyncSession, plant: UserPlant) -> None:
+    """Rewrite a plant's reminder rows from its current state (caller commits).
+
+    Inactive plants, plants whose species has no interval and care types
+    that were never performed have no row. A row whose due date changes
+    becomes pending again so the dispatcher sends a new reminder.
+
+    Args:
+        db: Database session
+        plant: Plant with its pending changes applied
+    """
+    intervals: Dict[str, Optional[int]] = {}
+    if plant.is_active:
+        species_columns = [getattr(PlantSpecies, column) for _, column in SCHEDULED_CARE.values()]
+        row = (await db.execute(
+            select(*species_columns).where(PlantSpecies.id == plant.species_id)
+        )).one_or_none()
+        if row is not None:
+            intervals = dict(zip(SCHEDULED_CARE, row))
+
+    now = datetime.utcnow()
+    unscheduled: List[str] = []
+    for care_type, (plant_column, _) in SCHEDULED_CARE.items():
+        last_care_at = getattr(plant, plant_column)
+        interval_days = intervals.get(care_type)
+        next_due_at = reminder_due_at(last_care_at, interval_days)
+        if next_due_at is None:
+            unscheduled.append(care_type)
+            continue
+
+        stmt = insert(CareReminder).values(
+            plant_id=plant.id,
+            care_type=care_type,
+            user_id=plant.user_id,
+            last_care_at=last_care_at,
+            interval_days=interval_days,
+            next_due_at=next_due_at,
+            notified_at=None,
+            retry_after=None,
+            updated_at=now
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CareReminder.plant_id, CareReminder.care_type],
+            set_={
+                "user_id": stmt.excluded.user_id,
+                "last_care_at": stmt.excluded.last_care_at,
+                "interval_days": stmt.excluded.interval_days,
+                "next_due_at": stmt.excluded.next_due_at,
+                "notified_at": case(
+                    (CareReminder.next_due_at == stmt.excluded.next_due_at, CareReminder.notified_at),
+                    else_=None
+                ),
+                "retry_after": case(
+                    (CareReminder.next_due_at == stmt.excluded.next_due_at, CareReminder.retry_after),
+                    else_=None
+                ),
+                "updated_at": stmt.excluded.updated_at,
+            }
+        )
+        await db.execute(stmt)
+
+    if unscheduled:
+        await db.execute(
+            delete(CareReminder).where(
+                and_(
+                    CareReminder.plant_id == plant.id,
+                    CareReminder.care_type.in_(unscheduled)
+                )
+            )
+        )
+
+
+async def schedule_species(db: AsyncSession, species_id: UUID) -> int:
+    """Rewrite the reminder rows of every active plant of a species (caller commits).
+
+    Called after a species' care intervals change.
+
+    Args:
+        db: Database session
+        species_id: Species whose intervals changed
+
+    Returns:
+        Number of plants rescheduled
+    """
+    result = await db.execute(
+        select(UserPlant).where(
+            and_(
+                UserPlant.species_id == species_id,
+                UserPlant.is_active.is_(True)
+            )
+        )
+    )
+    plants = result.scalars().all()
+    for plant in plants:
+        await schedule_plant(db, plant)
+    return len(plants)
+
+
+async def get_due_reminders(db: AsyncSession, user_id: UUID) -> List[Dict[str, Any]]:
+    """A user's due reminders, most overdue first.
+
+    Args:
+        db: Database session
+        user_id: User ID
+
+    Returns:
+        List of care reminder data
+    """
+    now = datetime.utcnow()
+    result = await db.execute(
+        select(CareReminder, UserPlant.nickname, PlantSpecies.scientific_name)
+        .join(UserPlant, UserPlant.id == CareReminder.plant_id)
+        .join(PlantSpecies, PlantSpecies.id == UserPlant.species_id)
+        .where(
+            and_(
+                CareReminder.user_id == user_id,
+                CareReminder.next_due_at <= now
+            )
+        )
+        .order_by(CareReminder.next_due_at)
+    )
+    return [
+        reminder_payload(reminder, nickname, species_name, now)
+        for reminder, nickname, species_name in result.all()
+    ]
+
+
+class CareReminderDispatcher:
+    """Pops due reminders in due-date order and sends them in batches."""
+
+    def __init__(
+        self,
+        batch_size: int = 500,
+        poll_interval: float = 60.0,
+        retry_seconds: float = 900.0,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.retry_seconds = retry_seconds
+        self.session_factory = session_factory
+        self.notifier = seasonal_notification_service
+        self._task: Optional[asyncio.Task] = None
+        self.batches = 0
+        self.dispatched = 0
+        self.delivered = 0
+        self.batch_seconds = 0.0
+        self.last_lag_seconds = 0.0
+
+    async def process_once(self, db: AsyncSession) -> Dict[str, int]:
+        """Send one batch of due reminders and mark the delivered ones notified.
+
+        Rows are locked with ``SKIP LOCKED`` so several workers can drain
+        the index concurrently. Reminders for the same user are sent as
+        one notification. Reminders whose notification was not delivered
+        stay pending and are skipped until ``retry_seconds`` have passed.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Counts of reminders due, users notified and deliveries
+        """
+        start = time.perf_counter()
+        now = datetime.utcnow()
+        stmt = (
+            select(CareReminder, UserPlant.nickname, PlantSpecies.scientific_name)
+            .join(UserPlant, UserPlant.id == CareReminder.plant_id)
+            .join(PlantSpecies, PlantSpecies.id == UserPlant.species_id)
+            .where(
+                and_(
+                    CareReminder.notified_at.is_(None),
+                    CareReminder.next_due_at <= now,
+                    or_(CareReminder.retry_after.is_(None), CareReminder.retry_after <= now)
+                )
+            )
+            .order_by(CareReminder.next_due_at)
+            .limit(self.batch_size)
+            .with_for_update(of=CareReminder, skip_locked=True)
+        )
+        rows = (await db.execute(stmt)).all()
+        result = {"due": len(rows), "users": 0, "delivered": 0}
+        if not rows:
+            await db.commit()
+            return result
+
+        by_user: Dict[UUID, List[Tuple[CareReminder, Dict[str, Any]]]] = {}
+        for reminder, nickname, species_name in rows:
+            by_user.setdefault(reminder.user_id, []).append(
+                (reminder, reminder_payload(reminder, nickname, species_name, now))
+            )
+
+        retry_after = now + timedelta(seconds=self.retry_seconds)
+        for user_id, entries in by_user.items():
+            try:
+                delivered = await self.notifier.send_care_due_reminders(
+                    user_id, [payload for _, payload in entries]
+                )
+            except Exception as e:
+                logger.error(f"Error sending care reminders to user {user_id}: {str(e)}")
+                delivered = False
+            for reminder, _ in entries:
+                if delivered:
+                    reminder.notified_at = now
+                    reminder.retry_after = None
+                else:
+                    reminder.retry_after = retry_after
+            if delivered:
+                result["delivered"] += 1
+        result["users"] = len(by_user)
+        await db.commit()
+
+        self.batches += 1
+        self.dispatched += len(rows)
+        self.delivered += result["delivered"]
+        self.batch_seconds += time.perf_counter() - start
+        self.last_lag_seconds = (now - rows[0][0].next_due_at).total_seconds()
+        logger.info(f"Dispatched care reminder batch: {result}")
+        return result
+
+    async def run_forever(self) -> None:
+        """Poll the due index until cancelled."""
+        while True:
+            try:
+                async with self.session_factory() as db:
+                    result = await self.process_once(db)
+                # Keep draining while there is a backlog
+                if result["due"] >= self.batch_size:
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Care reminder dispatcher error: {str(e)}")
+            await asyncio.sleep(self.poll_interval)
+
+    def start(self) -> None:
+        """Start the background dispatcher task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        """Cancel the background dispatcher task."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "dispatched": self.dispatched,
+            "delivered": self.delivered,
+            "avg_batch_ms": self.batch_seconds / self.batches * 1000 if self.batches else 0.0,
+            "last_lag_seconds": self.last_lag_seconds,
+        }
+
+
+_dispatcher: Optional[CareReminderDispatcher] = None
+
+
+def get_care_reminder_dispatcher() -> CareReminderDispatcher:
+    """Get the process-wide care reminder dispatcher."""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = CareReminderDispatcher(
+            batch_size=settings.CARE_REMINDER_BATCH_SIZE,
+            poll_interval=settings.CARE_REMINDER_POLL_SECONDS,
+            retry_seconds=settings.CARE_REMINDER_RETRY_SECONDS,
+        )
+    return _dispatcher
@@ -0,0 +1,201 @@
+"""Sorted-set leaderboards for community challenges.
+
+With ``LEADERBOARD_USE_REDIS`` on, scores live in a Redis sorted set per
+challenge (``ZADD``/``ZREVRANK``/``ZREVRANGE``), with each participant's
+plant id in a companion hash. Otherwise (the default) an in-process store
+with the same interface keeps each board as a binary-searched sorted
+list: rank lookups are O(log n) and a score update is a binary search
+plus an O(n) list shift, so no request sorts the whole participant list.
+
+The in-process store only sees updates made by its own process, so each
+challenge is hydrated from its stored participants before the process
+first reads or writes its board. Deployments running more than one
+worker should enable Redis so every worker shares the same boards.
+"""
+
+import bisect
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.core.cache import get_redis_client
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LeaderboardEntry:
+    """A participant's position on a challenge leaderboard."""
+    user_id: str
+    plant_id: Optional[str]
+    score: float
+    rank: int
+
+
+class InMemoryLeaderboardStore:
+    """Process-local leaderboard store used when Redis is unavailable."""
+
+    def __init__(self):
+        # challenge id -> ascending list of (-score, user_id)
+        self._boards: Dict[str, List[Tuple[float, str]]] = {}
+        self._scores: Dict[str, Dict[str, float]] = {}
+        self._plants: Dict[str, Dict[str, str]] = {}
+        self._hydrated: Set[str] = set()
+
+    async def hydrate(self, challenge_id: str, participants: List[Dict[str, Any]]) -> None:
+        """Rebuild a board from stored participants once per process."""
+        if challenge_id in self._hydrated:
+            return
+        scores = {p["user_id"]: float(p.get("score", 0)) for p in participants}
+        self._scores[challenge_id] = scores
+        self._boards[challenge_id] = sorted((-score, user_id) for user_id, score in scores.items())
+        self._plants[challenge_id] = {p["user_id"]: p["plant_id"] for p in participants if p.get("plant_id")}
+        self._hydrated.add(challenge_id)
+
+    async def update_score(
+        self,
+        challenge_id: str,
+        user_id: str,
+        score: float,
+        plant_id: Optional[str] = None
+    ) -> None:
+        board = self._boards.setdefault(challenge_id, [])
+        scores = self._scores.setdefault(challenge_id, {})
+        previous = scores.get(user_id)
+        if previous is not None:
+            index = bisect.bisect_left(board, (-previous, user_id))
+            del board[index]
+        bisect.insort(board, (-score, user_id))
+        scores[user_id] = score
+        if plant_id is not None:
+            self._plants.setdefault(challenge_id, {})[user_id] = plant_id
+
+    async def remove(self, challenge_id: str, user_id: str) -> None:
+        scores = self._scores.get(challenge_id, {})
+        previous = scores.pop(user_id, None)
+        if previous is not None:
+            board = self._boards[challenge_id]
+            del board[bisect.bisect_left(board, (-previous, user_id))]
+        self._plants.get(challenge_id, {}).pop(user_id, None)
+
+    async def get_rank(self, challenge_id: str, user_id: str) -> Optional[LeaderboardEntry]:
+        score = self._scores.get(challenge_id, {}).get(user_id)
+        if score is None:
+            return None
+        index = bisect.bisect_left(self._boards[challenge_id], (-score, user_id))
+        return LeaderboardEntry(
+            user_id=user_id,
+            plant_id=self._plants.get(challenge_id, {}).get(user_id),
+            score=score,
+            rank=index + 1
+        )
+
+    async def get_top(self, challenge_id: str, offset: int = 0, limit: int = 50) -> List[LeaderboardEntry]:
+        board = self._boards.get(challenge_id, [])
+        plants = self._plants.get(challenge_id, {})
+        return [
+            LeaderboardEntry(user_id=user_id, plant_id=plants.get(user_id), score=-negative_score, rank=offset + i + 1)
+            for i, (negative_score, user_id) in enumerate(board[offset:offset + limit])
+        ]
+
+    async def count(self, challenge_id: str) -> int:
+        return len(self._boards.get(challenge_id, []))
+
+    async def clear(self, challenge_id: str) -> None:
+        self._boards.pop(challenge_id, None)
+        self._scores.pop(challenge_id, None)
+        self._plants.pop(challenge_id, None)
+        self._hydrated.discard(challenge_id)
+
+
+class RedisLeaderboardStore:
+    """Leaderboard store backed by Redis sorted sets."""
+
+    def __init__(self, redis_client, key_prefix: str = "leaderboard:challenge"):
+        self.redis = redis_client
+        self.key_prefix = key_prefix
+
+    def _scores_key(self, challenge_id: str) -> str:
+        return f"{self.key_prefix}:{challenge_id}"
+
+    def _plants_key(self, challenge_id: str) -> str:
+        return f"{self.key_prefix}:{challenge_id}:plants"
+
+    async def hydrate(self, challenge_id: str, participants: List[Dict[str, Any]]) -> None:
+        """Seed a board from stored participants if Redis has none yet."""
+        if not participants or await self.redis.exists(self._scores_key(challenge_id)):
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zadd(
+            self._scores_key(challenge_id),
+            {p["user_id"]: float(p.get("score", 0)) for p in participants},
+            nx=True
+        )
+        plants = {p["user_id"]: p["plant_id"] for p in participants if p.get("plant_id")}
+        if plants:
+            pipe.hset(self._plants_key(challenge_id), mapping=plants)
+        await pipe.execute()
+
+    async def update_score(
+        self,
+        challenge_id: str,
+        user_id: str,
+        score: float,
+        plant_id: Optional[str] = None
+    ) -> None:
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zadd(self._scores_key(challenge_id), {user_id: score})
+        if plant_id is not None:
+            pipe.hset(self._plants_key(challenge_id), user_id, plant_id)
+        await pipe.execute()
+
+    async def remove(self, challenge_id: str, user_id: str) -> None:
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zrem(self._scores_key(challenge_id), user_id)
+        pipe.hdel(self._plants_key(challenge_id), user_id)
+        await pipe.execute()
+
+    async def get_rank(self, challenge_id: str, user_id: str) -> Optional[LeaderboardEntry]:
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zrevrank(self._scores_key(challenge_id), user_id)
+        pipe.zscore(self._scores_key(challenge_id), user_id)
+        pipe.hget(self._plants_key(challenge_id), user_id)
+        rank, score, plant_id = await pipe.execute()
+        if rank is None:
+            return None
+        return LeaderboardEntry(user_id=user_id, plant_id=plant_id, score=float(score), rank=rank + 1)
+
+    async def get_top(self, challenge_id: str, offset: int = 0, limit: int = 50) -> List[LeaderboardEntry]:
+        rows = await self.redis.zrevrange(
+            self._scores_key(challenge_id), offset, offset + limit - 1, withscores=True
+        )
+        if not rows:
+            return []
+        plant_ids = await self.redis.hmget(self._plants_key(challenge_id), [user_id for user_id, _ in rows])
+        return [
+            LeaderboardEntry(user_id=user_id, plant_id=plant_id, score=float(score), rank=offset + i + 1)
+            for i, ((user_id, score), plant_id) in enumerate(zip(rows, plant_ids))
+        ]
+
+    async def count(self, challenge_id: str) -> int:
+        return await self.redis.zcard(self._scores_key(challenge_id))
+
+    async def clear(self, challenge_id: str) -> None:
+        await self.redis.delete(self._scores_key(challenge_id), self._plants_key(challenge_id))
+
+
+_leaderboard_store = None
+
+
+def get_leaderboard_store():
+    """Get the process-wide leaderboard store (Redis when configured)."""
+    global _leaderboard_store
+    if _leaderboard_store is None:
+        redis_client = get_redis_client() if settings.LEADERBOARD_USE_REDIS else None
+        if redis_client is not None:
+            _leaderboard_store = RedisLeaderboardStore(redis_client)
+        else:
+            logger.info("Using in-memory challenge leaderboards")
+            _leaderboard_store = InMemoryLeaderboardStore()
+    return _leaderboard_store
@@ -21,6 +21,7 @@ from app.models.growth_photo import GrowthPhoto
 from app.models.seasonal_ai import SeasonalPrediction
 from app.models.friendship import Friendship, FriendshipStatus
 from app.services.notification_service import seasonal_notification_service, NotificationPriority
+from app.services.challenge_leaderboard_service import get_leaderboard_store
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +60,7 @@ class CommunityChallengeService:
     
     def __init__(self):
         self.notification_service = seasonal_notification_service
+        self.leaderboard_store = get_leaderboard_store()
     
     async def create_seasonal_challenge(
         self,
@@ -157,8 +159,10 @@ class CommunityChallengeService:
             }
             
             # Add to challenge participants
+            await self.leaderboard_store.hydrate(challenge_id, challenge["participants"])
             challenge["participants"].append(participation)
             await self._update_challenge(db, challenge)
+            await self.leaderboard_store.update_score(challenge_id, str(user_id), 0, str(plant_id))
             
             # Initialize tracking for the challenge
             await self._initialize_challenge_tracking(db, challenge_id, user_id, plant_id)
@@ -281,40 +285,55 @@ class CommunityChallengeService:
         self,
         db: AsyncSession,
         challenge_id: str,
-        limit: int = 50
+        limit: int = 50,
+        offset: int = 0
     ) -> List[Dict[str, Any]]:
-        """Get challenge leaderboard with user details."""
+        """Get challenge leaderboard with user details.
+        
+        Reads one page of the challenge's sorted set and hydrates it with a
+        single bulk fetch of users and plants.
+        """
         try:
             challenge = await self._get_challenge(db, challenge_id)
             if not challenge:
                 return []
             
-            # Sort participants by score
-            sorted_participants = sorted(
-                challenge["participants"],
-                key=lambda p: p.get("score", 0),
-                reverse=True
-            )[:limit]
+            await self.leaderboard_store.hydrate(challenge_id, challenge["participants"])
+            entries = await self.leaderboard_store.get_top(challenge_id, offset, limit)
+            if not entries:
+                return []
+            
+            participants = {p["user_id"]: p for p in challenge["participants"]}
+            
+            # Bulk fetch users and plants for the page
+            user_ids = [UUID(entry.user_id) for entry in entries]
+            plant_ids = [UUID(entry.plant_id) for entry in entries if entry.plant_id]
+            users_result = await db.execute(select(User).where(User.id.in_(user_ids)))
+            users = {str(user.id): user for user in users_result.scalars()}
+            plants_result = await db.execute(
+                select(UserPlant).options(selectinload(UserPlant.species)).where(UserPlant.id.in_(plant_ids))
+            )
+            plants = {str(plant.id): plant for plant in plants_result.scalars()}
             
-            # Enrich with user details
             leaderboard = []
-            for i, participant in enumerate(sorted_participants):
-                user = await db.get(User, UUID(participant["user_id"]))
-                plant = await db.get(UserPlant, UUID(participant["plant_id"]))
+            for entry in entries:
+                user = users.get(entry.user_id)
+                plant = plants.get(entry.plant_id)
+                participant = participants.get(entry.user_id, {})
                 
                 if user and plant:
                     leaderboard_entry = {
-                        "rank": i + 1,
-                        "user_id": participant["user_id"],
+                        "rank": entry.rank,
+                        "user_id": entry.user_id,
                         "username": user.username,
                         "display_name": user.display_name,
                         "avatar_url": user.avatar_url,
-                        "plant_id": participant["plant_id"],
+                        "plant_id": entry.plant_id,
                         "plant_nickname": plant.nickname,
-                        "plant_species": plant.species.common_names[0] if plant.species else "Unknown",
-                        "score": participant.get("score", 0),
+                        "plant_species": plant.species.common_names[0] if plant.species and plant.species.common_names else "Unknown",
+                        "score": entry.score,
                         "achievements": participant.get("achievements", []),
-                        "joined_at": participant["joined_at"],
+                        "joined_at": participant.get("joined_at"),
                         "progress": participant.get("progress", {})
                     }
                     leaderboard.append(leaderboard_entry)
@@ -325,6 +344,30 @@ class CommunityChallengeService:
             logger.error(f"Error getting challenge leaderboard: {str(e)}")
             return []
     
+    async def get_user_rank(
+        self,
+        db: AsyncSession,
+        challenge_id: str,
+        user_id: UUID
+    ) -> Optional[Dict[str, Any]]:
+        """Get a user's rank and score in a challenge."""
+        challenge = await self._get_challenge(db, challenge_id)
+        if not challenge:
+            return None
+        
+        await self.leaderboard_store.hydrate(challenge_id, challenge["participants"])
+        entry = await self.leaderboard_store.get_rank(challenge_id, str(user_id))
+        if not entry:
+            return None
+        
+        return {
+            "user_id": entry.user_id,
+            "plant_id": entry.plant_id,
+            "rank": entry.rank,
+            "score": entry.score,
+            "total_participants": await self.leaderboard_store.count(challenge_id)
+        }
+    
     async def complete_challenge(
         self,
         db: AsyncSession,
@@ -644,20 +687,16 @@ class CommunityChallengeService:
         new_score: float
     ) -> None:
         """Update challenge leaderboard."""
-        # Sort participants by score and update leaderboard
-        sorted_participants = sorted(
-            challenge["participants"],
-            key=lambda p: p.get("score", 0),
-            reverse=True
-        )
+        await self.leaderboard_store.hydrate(challenge["id"], challenge["participants"])
+        await self.leaderboard_store.update_score(challenge["id"], str(user_id), new_score)
         
         challenge["leaderboard"] = [
             {
-                "user_id": p["user_id"],
-                "score": p.get("score", 0),
-                "rank": i + 1
+                "user_id": entry.user_id,
+                "score": entry.score,
+                "rank": entry.rank
             }
-            for i, p in enumerate(sorted_participants[:10])  # Top 10
+            for entry in await self.leaderboard_store.get_top(challenge["id"], 0, 10)  # Top 10
         ]
     
     async def _distribute_challenge_rewards(
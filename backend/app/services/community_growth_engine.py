@@ -0,0 +1,386 @@
+"""
+Columnar community growth analytics with cached benchmarks.
+
+A snapshot covers one analysis window (the last N days). It is built from
+the photo timelines of every plant in the community, loaded with one
+query, plus one grouped care-log query. Per-plant metrics are computed
+with grouped NumPy operations over the timeline offsets: first and last
+heights, days tracked, growth rate, mean leaf count and care frequency.
+
+Benchmarks, success patterns and care correlations are computed the first
+time a (species, location) cell is requested and then kept on the
+snapshot. Comparing a plant with its community is then a lookup plus a
+``searchsorted`` over the cell's sorted growth rates.
+
+Snapshots are rebuilt after ``COMMUNITY_GROWTH_CACHE_TTL_SECONDS``; new
+growth photos and care logs show up in benchmarks on the next rebuild.
+At most ``COMMUNITY_GROWTH_MAX_SNAPSHOTS`` analysis windows are kept; the
+least recently used one is dropped first.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.services.growth_data_service import GrowthTimelines, fetch_care_counts, fetch_growth_timelines
+
+logger = logging.getLogger(__name__)
+
+# Plants need this many photos in the window to count towards benchmarks
+MIN_PHOTOS_PER_PLANT = 3
+# Care correlations below this strength are not reported
+MIN_CARE_CORRELATION = 0.3
+
+
+@dataclass
+class PlantGrowthMetrics:
+    """Growth metrics for many plants, one array element per plant."""
+    plant_ids: List[Any]
+    species_ids: List[Any]
+    locations: List[Optional[str]]
+    total_growth: np.ndarray
+    growth_rate: np.ndarray
+    days_tracked: np.ndarray
+    photo_count: np.ndarray
+    initial_height: np.ndarray
+    final_height: np.ndarray
+    avg_leaf_count: np.ndarray
+    care_per_week: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.plant_ids)
+
+    def as_dict(self, index: int) -> Dict[str, Any]:
+        return {
+            "plant_id": self.plant_ids[index],
+            "species_id": self.species_ids[index],
+            "location": self.locations[index],
+            "total_growth": float(self.total_growth[index]),
+            "growth_rate": float(self.growth_rate[index]),
+            "days_tracked": int(self.days_tracked[index]),
+            "photo_count": int(self.photo_count[index]),
+            "initial_height": float(self.initial_height[index]),
+            "final_height": float(self.final_height[index]),
+            "avg_leaf_count": float(self.avg_leaf_count[index])
+        }
+
+
+def compute_plant_metrics(
+    timelines: GrowthTimelines,
+    care_counts: Optional[Dict[str, np.ndarray]] = None
+) -> PlantGrowthMetrics:
+    """
+    Compute per-plant growth metrics from photo timelines.
+
+    Plants with fewer than ``MIN_PHOTOS_PER_PLANT`` photos, or whose photos
+    all fall on the same day, are left out.
+
+    Args:
+        timelines: Photo timelines
+        care_counts: Care activity counts per type, aligned with the timelines
+
+    Returns:
+        PlantGrowthMetrics for the qualifying plants
+    """
+    counts = timelines.photo_counts()
+    starts = timelines.offsets[:-1]
+    ends = timelines.offsets[1:] - 1
+
+    initial_height = np.nan_to_num(timelines.height_cm[starts])
+    final_height = np.nan_to_num(timelines.height_cm[ends])
+    days_tracked = (timelines.captured_at[ends] - timelines.captured_at[starts]) // np.timedelta64(1, "D")
+    if len(timelines):
+        leaf_totals = np.add.reduceat(np.nan_to_num(timelines.leaf_count), starts)
+    else:
+        leaf_totals = np.zeros(0)
+
+    keep = np.flatnonzero((counts >= MIN_PHOTOS_PER_PLANT) & (days_tracked > 0))
+    days = days_tracked[keep].astype(np.int64)
+    total_growth = final_height[keep] - initial_height[keep]
+    weeks = np.maximum(days / 7.0, 1.0)
+
+    return PlantGrowthMetrics(
+        plant_ids=[timelines.plant_ids[i] for i in keep],
+        species_ids=[timelines.species_ids[i] for i in keep],
+        locations=[timelines.locations[i] for i in keep],
+        total_growth=total_growth,
+        growth_rate=total_growth / days,
+        days_tracked=days,
+        photo_count=counts[keep],
+        initial_height=initial_height[keep],
+        final_height=final_height[keep],
+        avg_leaf_count=leaf_totals[keep] / counts[keep],
+        care_per_week={
+            care_type: care[keep] / weeks for care_type, care in (care_counts or {}).items()
+        }
+    )
+
+
+def _quantiles(values: np.ndarray, percents: List[float]) -> np.ndarray:
+    # Weibull plotting positions match statistics.quantiles' default method
+    return np.percentile(values, percents, method="weibull")
+
+
+def growth_benchmarks(metrics: PlantGrowthMetrics, rows: np.ndarray) -> Dict[str, Any]:
+    """Growth rate and total growth distribution over the selected plants."""
+    if not len(rows):
+        return {}
+    growth_rates = metrics.growth_rate[rows]
+    growth_rates = growth_rates[growth_rates > 0]
+    total_growths = metrics.total_growth[rows]
+    total_growths = total_growths[total_growths > 0]
+    if not len(growth_rates):
+        return {}
+
+    rate_25, rate_75, rate_90 = _quantiles(growth_rates, [25, 75, 90])
+    growth_25, growth_75 = _quantiles(total_growths, [25, 75])
+    return {
+        "growth_rate": {
+            "mean": round(float(growth_rates.mean()), 3),
+            "median": round(float(np.median(growth_rates)), 3),
+            "percentile_25": round(float(rate_25), 3),
+            "percentile_75": round(float(rate_75), 3),
+            "top_10_percent": round(float(rate_90), 3)
+        },
+        "total_growth": {
+            "mean": round(float(total_growths.mean()), 2),
+            "median": round(float(np.median(total_growths)), 2),
+            "percentile_25": round(float(growth_25), 2),
+            "percentile_75": round(float(growth_75), 2)
+        },
+        "sample_size": int(len(rows))
+    }
+
+
+def success_patterns(metrics: PlantGrowthMetrics, rows: np.ndarray) -> List[Dict[str, Any]]:
+    """Photo frequency and growth consistency of the top 20% of growers."""
+    if len(rows) < 5:
+        return []
+
+    top_count = max(1, len(rows) // 5)
+    rates = metrics.growth_rate[rows]
+    top = rows[np.argpartition(-rates, top_count - 1)[:top_count]]
+    confidence = "high" if top_count >= 3 else "medium"
+
+    patterns = []
+    photo_frequency = float((metrics.photo_count[top] / metrics.days_tracked[top]).mean())
+    patterns.append({
+        "pattern_type": "photo_frequency",
+        "description": f"Top performers take photos every {round(1 / photo_frequency, 1)} days on average",
+        "metric_value": round(photo_frequency, 3),
+        "confidence": confidence
+    })
+
+    top_rates = metrics.growth_rate[top]
+    if top_count >= 2 and top_rates.mean() > 0:
+        consistency_score = float(1 - top_rates.std(ddof=1) / top_rates.mean())
+        patterns.append({
+            "pattern_type": "growth_consistency",
+            "description": f"Top performers maintain consistent growth with {round(consistency_score * 100, 1)}% consistency",
+            "metric_value": round(consistency_score, 3),
+            "confidence": confidence
+        })
+
+    return patterns
+
+
+def care_correlations(metrics: PlantGrowthMetrics, rows: np.ndarray) -> List[Dict[str, Any]]:
+    """Locations and care frequencies associated with faster growth."""
+    correlations = []
+    if len(rows) < 10:
+        return correlations
+
+    rates = metrics.growth_rate[rows]
+    overall_avg = rates.mean()
+
+    # Locations at least 20% better than average
+    locations = np.array([metrics.locations[i] or "unknown" for i in rows], dtype=object)
+    names, groups = np.unique(locations, return_inverse=True)
+    sizes = np.bincount(groups)
+    means = np.bincount(groups, weights=rates) / sizes
+    if overall_avg > 0:
+        for name, size, mean in zip(names, sizes, means):
+            if size >= 3 and mean > overall_avg * 1.2:
+                correlations.append({
+                    "correlation_type": "location",
+                    "factor": name,
+                    "improvement": round(float(mean / overall_avg - 1) * 100, 1),
+                    "sample_size": int(size),
+                    "confidence": "high" if size >= 5 else "medium"
+                })
+
+    # How often each kind of care is done versus growth rate
+    for care_type, per_week in sorted(metrics.care_per_week.items()):
+        frequency = per_week[rows]
+        if frequency.std() == 0 or rates.std() == 0:
+            continue
+        correlation = float(np.corrcoef(frequency, rates)[0, 1])
+        if abs(correlation) >= MIN_CARE_CORRELATION:
+            correlations.append({
+                "correlation_type": "care_frequency",
+                "factor": care_type,
+                "correlation": round(correlation, 3),
+                "direction": "positive" if correlation > 0 else "negative",
+                "sample_size": int(len(rows)),
+                "confidence": "high" if len(rows) >= 30 else "medium"
+            })
+
+    return correlations
+
+
+@dataclass
+class CommunityCell:
+    """Cached analysis of the plants matching one species/location filter."""
+    plant_count: int
+    benchmarks: Dict[str, Any]
+    success_patterns: List[Dict[str, Any]]
+    care_correlations: List[Dict[str, Any]]
+    sorted_growth_rates: np.ndarray
+
+
+class CommunityGrowthSnapshot:
+    """Per-plant metrics for one analysis window, with per-cell results cached."""
+
+    def __init__(
+        self,
+        metrics: PlantGrowthMetrics,
+        period_days: int,
+        start_date: datetime,
+        end_date: datetime
+    ):
+        self.metrics = metrics
+        self.period_days = period_days
+        self.start_date = start_date
+        self.end_date = end_date
+        self.built_at = time.monotonic()
+        self._plant_index = {str(plant_id): i for i, plant_id in enumerate(metrics.plant_ids)}
+        self._species = np.array([str(species_id) for species_id in metrics.species_ids], dtype=str)
+        self._locations = np.array([(location or "").lower() for location in metrics.locations], dtype=str)
+        self._cells: Dict[Tuple[Optional[str], Optional[str]], CommunityCell] = {}
+
+    def select(self, species_id: Optional[Any] = None, location: Optional[str] = None) -> np.ndarray:
+        """Indices of plants of a species and/or whose location contains ``location``."""
+        mask = np.ones(len(self.metrics), dtype=bool)
+        if species_id is not None:
+            mask &= self._species == str(species_id)
+        if location:
+            mask &= np.char.find(self._locations, location.lower()) >= 0
+        return np.flatnonzero(mask)
+
+    def cell(self, species_id: Optional[Any] = None, location: Optional[str] = None) -> CommunityCell:
+        """Benchmarks and patterns for a filter, computed on first use."""
+        key = (str(species_id) if species_id is not None else None, location.lower() if location else None)
+        cell = self._cells.get(key)
+        if cell is None:
+            rows = self.select(species_id, location)
+            cell = CommunityCell(
+                plant_count=int(len(rows)),
+                benchmarks=growth_benchmarks(self.metrics, rows),
+                success_patterns=success_patterns(self.metrics, rows),
+                care_correlations=care_correlations(self.metrics, rows),
+                sorted_growth_rates=np.sort(self.metrics.growth_rate[rows])
+            )
+            self._cells[key] = cell
+        return cell
+
+    def plant_metrics(self, plant_id: Any) -> Optional[Dict[str, Any]]:
+        index = self._plant_index.get(str(plant_id))
+        return None if index is None else self.metrics.as_dict(index)
+
+    def percentile_rank(self, cell: CommunityCell, growth_rate: float) -> float:
+        """Share of the cell's plants growing no faster than ``growth_rate`` (0-100)."""
+        if not len(cell.sorted_growth_rates):
+            return 0.0
+        position = np.searchsorted(cell.sorted_growth_rates, growth_rate, side="right")
+        return round(float(position) / len(cell.sorted_growth_rates) * 100, 1)
+
+
+class CommunityGrowthEngine:
+    """Builds and caches community growth snapshots per analysis window."""
+
+    def __init__(self, ttl_seconds: float = 900.0, max_snapshots: int = 8):
+        self.ttl_seconds = ttl_seconds
+        self.max_snapshots = max_snapshots
+        self._snapshots: "OrderedDict[int, CommunityGrowthSnapshot]" = OrderedDict()
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.builds = 0
+
+    def is_fresh(self, snapshot: Optional[CommunityGrowthSnapshot]) -> bool:
+        return snapshot is not None and time.monotonic() - snapshot.built_at <= self.ttl_seconds
+
+    async def get_snapshot(self, db: AsyncSession, period_days: int) -> CommunityGrowthSnapshot:
+        """
+        Get the snapshot for the last ``period_days`` days, rebuilding it if stale.
+
+        Args:
+            db: Database session
+            period_days: Analysis window in days
+
+        Returns:
+            CommunityGrowthSnapshot for the window
+        """
+        snapshot = self._snapshots.get(period_days)
+        if self.is_fresh(snapshot):
+            self._snapshots.move_to_end(period_days)
+            self.hits += 1
+            return snapshot
+
+        async with self._lock:
+            snapshot = self._snapshots.get(period_days)
+            if self.is_fresh(snapshot):
+                self.hits += 1
+                return snapshot
+
+            end_date = datetime.utcnow()
+            start_date = end_date - timedelta(days=period_days)
+            started = time.perf_counter()
+
+            timelines = await fetch_growth_timelines(db, since=start_date, min_photos=MIN_PHOTOS_PER_PLANT)
+            care_counts = await fetch_care_counts(db, timelines.plant_ids, since=start_date)
+            snapshot = CommunityGrowthSnapshot(
+                compute_plant_metrics(timelines, care_counts),
+                period_days=period_days,
+                start_date=start_date,
+                end_date=end_date
+            )
+            self._snapshots[period_days] = snapshot
+            self._snapshots.move_to_end(period_days)
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+            self.builds += 1
+            logger.info(
+                f"Community growth snapshot for {period_days} days built from "
+                f"{timelines.photo_count} photos of {len(snapshot.metrics)} plants "
+                f"in {(time.perf_counter() - started) * 1000:.0f} ms"
+            )
+            return snapshot
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "snapshots": len(self._snapshots),
+            "hits": self.hits,
+            "builds": self.builds,
+        }
+
+
+_community_growth_engine: Optional[CommunityGrowthEngine] = None
+
+
+def get_community_growth_engine() -> CommunityGrowthEngine:
+    """Get the process-wide community growth engine."""
+    global _community_growth_engine
+    if _community_growth_engine is None:
+        _community_growth_engine = CommunityGrowthEngine(
+            ttl_seconds=settings.COMMUNITY_GROWTH_CACHE_TTL_SECONDS,
+            max_snapshots=settings.COMMUNITY_GROWTH_MAX_SNAPSHOTS
+        )
+    return _community_growth_engine
@@ -5,37 +5,49 @@ from various sources for generating context-aware care plans.
 It gathers environmental data, plant history, user preferences, and seasonal patterns.
 """
 
+import asyncio
+import hashlib
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
 from uuid import UUID
 
 from sqlalchemy import and_, func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
+from app.models.user import User
 from app.models.user_plant import UserPlant
 from app.models.plant_species import PlantSpecies
 from app.models.plant_care_log import PlantCareLog
 from app.models.seasonal_ai import EnvironmentalDataCache
 from app.models.seasonal_ai import SeasonalPrediction
 from app.models.growth_photo import GrowthPhoto
-from app.services.environmental_data_service import EnvironmentalDataService
-from app.services.seasonal_ai_service import SeasonalAIService
+
+NO_ENVIRONMENTAL_DATA = {
+    "has_data": False,
+    "message": "No environmental data available"
+}
+
+
+def location_hash(location: str) -> str:
+    """Key of environmental data cached for a free-text location."""
+    return hashlib.md5(location.strip().lower().encode()).hexdigest()
 
 
 class ContextAggregationService:
     """Service for aggregating context data for care plan generation."""
     
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, shared_lookups: Optional[Dict[Any, Any]] = None):
         """Initialize the context aggregation service.
         
         Args:
             db: Database session
+            shared_lookups: Memo for lookups that do not depend on the plant
+                (species and environment by location); pass the same dict to
+                services aggregating context for plants of one batch
         """
         self.db = db
-        self.env_service = EnvironmentalDataService()
-        self.seasonal_service = SeasonalAIService()
+        self.shared_lookups = shared_lookups if shared_lookups is not None else {}
     
     async def aggregate_plant_context(
         self,
@@ -62,7 +74,10 @@ class ContextAggregationService:
         context = {
             "plant_info": plant_data,
             "care_history": await self._get_care_history(plant_id, context_window_days),
-            "environmental_data": await self._get_environmental_context(plant_id, context_window_days),
+            "environmental_data": await self._shared(
+                ("environment", plant_data["owner_location"], context_window_days),
+                lambda: self._get_environmental_context(plant_data["owner_location"], context_window_days)
+            ),
             "seasonal_context": await self._get_seasonal_context(plant_id),
             "growth_patterns": await self._get_growth_patterns(plant_id, context_window_days),
             "user_preferences": await self._get_user_preferences(user_id),
@@ -90,8 +105,8 @@ class ContextAggregationService:
             Plant data dictionary or None if not found
         """
         result = await self.db.execute(
-            select(UserPlant)
-            .options(selectinload(UserPlant.species))
+            select(UserPlant, User.location)
+            .join(User, User.id == UserPlant.user_id)
             .where(
                 and_(
                     UserPlant.id == plant_id,
@@ -100,124 +115,166 @@ class ContextAggregationService:
                 )
             )
         )
-        plant = result.scalar_one_or_none()
+        row = result.one_or_none()
         
-        if not plant:
+        if not row:
             return None
         
+        plant, owner_location = row
+        species = await self._shared(
+            ("species", plant.species_id),
+            lambda: self._get_species_data(plant.species_id)
+        )
+        
         return {
             "id": str(plant.id),
             "nickname": plant.nickname,
             "species_id": str(plant.species_id),
-            "species_name": plant.species.common_name if plant.species else None,
-            "scientific_name": plant.species.scientific_name if plant.species else None,
+            "species_name": species.get("common_name") or species.get("scientific_name"),
+            "scientific_name": species.get("scientific_name"),
             "location": plant.location,
-            "pot_size": plant.pot_size,
-            "soil_type": plant.soil_type,
-            "acquisition_date": plant.acquisition_date.isoformat() if plant.acquisition_date else None,
+            "owner_location": owner_location,
+            "acquisition_date": plant.acquired_date.isoformat() if plant.acquired_date else None,
             "created_at": plant.created_at.isoformat(),
             "plant_age_days": (datetime.utcnow() - plant.created_at).days,
-            "care_difficulty": plant.species.care_difficulty if plant.species else None,
-            "light_requirements": plant.species.light_requirements if plant.species else None,
-            "water_requirements": plant.species.water_requirements if plant.species else None
+            "care_difficulty": species.get("care_level"),
+            "light_requirements": species.get("light_requirements"),
+            "water_frequency_days": species.get("water_frequency_days")
         }
     
-    async def _get_care_history(
+    async def _get_species_data(self, species_id: UUID) -> Dict[str, Any]:
+        """Get the species fields used in plant context.
+        
+        Args:
+            species_id: Species ID
+            
+        Returns:
+            Species data dictionary (empty if the species is missing)
+        """
+        result = await self.db.execute(
+            select(
+                PlantSpecies.scientific_name,
+                PlantSpecies.common_names,
+                PlantSpecies.care_level,
+                PlantSpecies.light_requirements,
+                PlantSpecies.water_frequency_days
+            ).where(PlantSpecies.id == species_id)
+        )
+        row = result.one_or_none()
+        if not row:
+            return {}
+        
+        return {
+            "scientific_name": row.scientific_name,
+            "common_name": row.common_names[0] if row.common_names else None,
+            "care_level": row.care_level,
+            "light_requirements": row.light_requirements,
+            "water_frequency_days": row.water_frequency_days
+        }
+    
+    async def _shared(self, key: Any, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``loader`` once per key; concurrent callers await the same result."""
+        future = self.shared_lookups.get(key)
+        if future is None:
+            future = asyncio.ensure_future(loader())
+            self.shared_lookups[key] = future
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            self.shared_lookups.pop(key, None)
+            raise
+    
+    def seed_environment(self, environment: Dict[str, Dict[str, Any]], days_back: int) -> None:
+        """Store already loaded environmental contexts in the shared lookup memo.
+        
+        Args:
+            environment: Environmental context per owner location
+            days_back: Window the contexts were loaded for
+        """
+        loop = asyncio.get_running_loop()
+        for location, data in environment.items():
+            future = loop.create_future()
+            future.set_result(data)
+            self.shared_lookups[("environment", location, days_back)] = future
+    
+    async def load_environmental_contexts(
         self,
-        plant_id: UUID,
+        locations: Iterable[str],
         days_back: int
-    ) -> Dict[str, Any]:
-        """Get plant care history for the specified time window.
+    ) -> Dict[str, Dict[str, Any]]:
+        """Summarize cached weather readings for many locations in one query.
         
         Args:
-            plant_id: Plant ID
+            locations: Owner locations
             days_back: Number of days to look back
             
         Returns:
-            Care history data
+            Environmental context per location
         """
-        cutoff_date = datetime.utcnow() - timedelta(days=days_back)
+        by_hash = {location_hash(location): location for location in locations}
+        if not by_hash:
+            return {}
         
+        cutoff_date = datetime.utcnow() - timedelta(days=days_back)
         result = await self.db.execute(
-            select(PlantCareLog)
+            select(
+                EnvironmentalDataCache.location_hash,
+                EnvironmentalDataCache.data,
+                EnvironmentalDataCache.created_at
+            )
             .where(
                 and_(
-                    PlantCareLog.plant_id == plant_id,
-                    PlantCareLog.performed_at >= cutoff_date
+                    EnvironmentalDataCache.location_hash.in_(list(by_hash)),
+                    EnvironmentalDataCache.data_type == "weather",
+                    EnvironmentalDataCache.created_at >= cutoff_date
                 )
             )
-            .order_by(desc(PlantCareLog.performed_at))
+            .order_by(desc(EnvironmentalDataCache.created_at))
         )
-        care_logs = result.scalars().all()
-        
-        # Aggregate care activities by type
-        care_summary = {}
-        recent_activities = []
-        
-        for log in care_logs:
-            care_type = log.care_type
-            if care_type not in care_summary:
-                care_summary[care_type] = {
-                    "count": 0,
-                    "last_performed": None,
-                    "average_interval_days": None
-                }
-            
-            care_summary[care_type]["count"] += 1
-            if not care_summary[care_type]["last_performed"]:
-                care_summary[care_type]["last_performed"] = log.performed_at.isoformat()
-            
-            recent_activities.append({
-                "care_type": care_type,
-                "performed_at": log.performed_at.isoformat(),
-                "notes": log.notes
-            })
+        readings: Dict[str, List[Any]] = {}
+        for row in result.all():
+            readings.setdefault(row.location_hash, []).append(row)
         
         return {
-            "care_summary": care_summary,
-            "recent_activities": recent_activities[:10],  # Last 10 activities
-            "total_care_events": len(care_logs)
+            location: self._summarize_environment(readings.get(key, []))
+            for key, location in by_hash.items()
         }
     
     async def _get_environmental_context(
         self,
-        plant_id: UUID,
+        location: Optional[str],
         days_back: int
     ) -> Dict[str, Any]:
-        """Get environmental data context.
+        """Get environmental data context for the owner's location.
+        
+        Environmental data is cached per location, so plants sharing a
+        location share this lookup.
         
         Args:
-            plant_id: Plant ID
+            location: Owner's location, if set
             days_back: Number of days to look back
             
         Returns:
             Environmental context data
         """
-        cutoff_date = datetime.utcnow() - timedelta(days=days_back)
-        
-        # Get cached environmental data
-        result = await self.db.execute(
-            select(EnvironmentalDataCache)
-            .where(
-                and_(
-                    EnvironmentalDataCache.plant_id == plant_id,
-                    EnvironmentalDataCache.recorded_at >= cutoff_date
-                )
-            )
-            .order_by(desc(EnvironmentalDataCache.recorded_at))
-        )
-        env_data = result.scalars().all()
-        
-        if not env_data:
+        if not location:
             return {
                 "has_data": False,
-                "message": "No environmental data available"
+                "message": "No location set for environmental data"
             }
         
+        environment = await self.load_environmental_contexts([location], days_back)
+        return environment[location]
+    
+    def _summarize_environment(self, env_data: List[Any]) -> Dict[str, Any]:
+        """Averages, ranges and latest values of weather readings, newest first."""
+        if not env_data:
+            return dict(NO_ENVIRONMENTAL_DATA)
+        
         # Calculate averages and trends
-        temperatures = [d.temperature for d in env_data if d.temperature]
-        humidity_levels = [d.humidity for d in env_data if d.humidity]
-        light_levels = [d.light_intensity for d in env_data if d.light_intensity]
+        temperatures = [d.data.get("temperature") for d in env_data if d.data.get("temperature")]
+        humidity_levels = [d.data.get("humidity") for d in env_data if d.data.get("humidity")]
+        light_levels = [d.data.get("light_intensity") for d in env_data if d.data.get("light_intensity")]
         
         return {
             "has_data": True,
@@ -238,11 +295,68 @@ class ContextAggregationService:
                 "max": max(light_levels) if light_levels else None
             },
             "latest_reading": {
-                "timestamp": env_data[0].recorded_at.isoformat(),
-                "temperature": env_data[0].temperature,
-                "humidity": env_data[0].humidity,
-                "light_intensity": env_data[0].light_intensity
-            } if env_data else None
+                "timestamp": env_data[0].created_at.isoformat(),
+                "temperature": env_data[0].data.get("temperature"),
+                "humidity": env_data[0].data.get("humidity"),
+                "light_intensity": env_data[0].data.get("light_intensity")
+            }
+        }
+    
+    async def _get_care_history(
+        self,
+        plant_id: UUID,
+        days_back: int
+    ) -> Dict[str, Any]:
+        """Get plant care history for the specified time window.
+        
+        Args:
+            plant_id: Plant ID
+            days_back: Number of days to look back
+            
+        Returns:
+            Care history data
+        """
+        cutoff_date = datetime.utcnow() - timedelta(days=days_back)
+        
+        result = await self.db.execute(
+            select(PlantCareLog)
+            .where(
+                and_(
+                    PlantCareLog.plant_id == plant_id,
+                    PlantCareLog.performed_at >= cutoff_date
+                )
+            )
+            .order_by(desc(PlantCareLog.performed_at))
+        )
+        care_logs = result.scalars().all()
+        
+        # Aggregate care activities by type
+        care_summary = {}
+        recent_activities = []
+        
+        for log in care_logs:
+            care_type = log.care_type
+            if care_type not in care_summary:
+                care_summary[care_type] = {
+                    "count": 0,
+                    "last_performed": None,
+                    "average_interval_days": None
+                }
+            
+            care_summary[care_type]["count"] += 1
+            if not care_summary[care_type]["last_performed"]:
+                care_summary[care_type]["last_performed"] = log.performed_at.isoformat()
+            
+            recent_activities.append({
+                "care_type": care_type,
+                "performed_at": log.performed_at.isoformat(),
+                "notes": log.notes
+            })
+        
+        return {
+            "care_summary": care_summary,
+            "recent_activities": recent_activities[:10],  # Last 10 activities
+            "total_care_events": len(care_logs)
         }
     
     async def _get_seasonal_context(self, plant_id: UUID) -> Dict[str, Any]:
@@ -268,9 +382,9 @@ class ContextAggregationService:
         return {
             "current_season": current_season,
             "has_predictions": prediction is not None,
-            "seasonal_adjustments": prediction.seasonal_adjustments if prediction else {},
-            "growth_phase": prediction.growth_phase if prediction else None,
-            "seasonal_care_tips": prediction.care_recommendations if prediction else []
+            "seasonal_adjustments": prediction.care_adjustments if prediction else [],
+            "growth_forecast": prediction.growth_forecast if prediction else None,
+            "seasonal_care_tips": (prediction.optimal_activities or []) if prediction else []
         }
     
     async def _get_growth_patterns(self, plant_id: UUID, days_back: int) -> Dict[str, Any]:
@@ -302,7 +416,8 @@ class ContextAggregationService:
             "photo_count": len(photos),
             "latest_photo": {
                 "captured_at": photos[0].captured_at.isoformat(),
-                "growth_stage": photos[0].growth_stage,
+                "plant_height_cm": photos[0].plant_height_cm,
+                "leaf_count": photos[0].leaf_count,
                 "health_score": photos[0].health_score
             } if photos else None,
             "growth_trend": self._analyze_growth_trend(photos)
@@ -396,13 +511,13 @@ class ContextAggregationService:
         if len(photos) < 2:
             return "insufficient_data"
         
-        # Simple trend analysis based on growth stages
-        stages = [p.growth_stage for p in photos if p.growth_stage]
-        if len(stages) < 2:
+        # Simple trend analysis based on measured height (newest first)
+        heights = [p.plant_height_cm for p in photos if p.plant_height_cm]
+        if len(heights) < 2:
             return "stable"
         
         # This would be more sophisticated in a real implementation
-        return "growing" if stages[0] != stages[-1] else "stable"
+        return "growing" if heights[0] > heights[-1] else "stable"
     
     def _calculate_health_trend(self, health_scores: List[float]) -> str:
         """Calculate health trend from scores.
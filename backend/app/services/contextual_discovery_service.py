@@ -1,24 +1,27 @@
 """Contextual discovery feed service for personalized content curation."""
 
 import logging
-from typing import List, Dict, Any, Optional
+import time
+from collections import deque
+from typing import TYPE_CHECKING, List, Dict, Any, Deque, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, desc
+from sqlalchemy import select, and_
 from sqlalchemy.orm import selectinload
 
 from app.models.user import User
 from app.models.user_plant import UserPlant
-from app.models.story import Story
-from app.models.plant_question import PlantQuestion
-from app.models.plant_trade import PlantTrade
-from app.models.rag_models import PlantKnowledgeBase, RAGInteraction, UserPreferenceEmbedding
+from app.models.rag_models import RAGInteraction, UserPreferenceEmbedding
 from app.services.vector_database_service import VectorDatabaseService
 from app.services.embedding_service import EmbeddingService
 
+if TYPE_CHECKING:
+    from app.services.discovery_feed_pools import DiscoveryCandidatePools
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,9 +69,21 @@ class FeedContext:
 class ContextualDiscoveryService:
     """Service for curating personalized discovery feeds using RAG."""
     
-    def __init__(self, vector_service: VectorDatabaseService, embedding_service: EmbeddingService):
+    def __init__(
+        self,
+        vector_service: VectorDatabaseService,
+        embedding_service: EmbeddingService,
+        candidate_pools: Optional["DiscoveryCandidatePools"] = None
+    ):
+        from app.services.discovery_feed_pools import get_discovery_candidate_pools
+        
         self.vector_service = vector_service
         self.embedding_service = embedding_service
+        self.candidate_pools = candidate_pools or get_discovery_candidate_pools()
+        self.feed_latencies: Dict[str, Deque[float]] = {
+            "cold": deque(maxlen=1000),
+            "warm": deque(maxlen=1000),
+        }
     
     async def generate_personalized_feed(
         self,
@@ -77,36 +92,36 @@ class ContextualDiscoveryService:
         feed_type: str = "home",
         limit: int = 20
     ) -> List[DiscoveryItem]:
-        """Generate personalized discovery feed for user."""
+        """Generate personalized discovery feed for user.
+        
+        Candidates come from the precomputed segment pools, which are fetched
+        concurrently and scored in a single vectorized pass.
+        """
+        from app.services.discovery_feed_pools import score_pool
+        
+        started = time.perf_counter()
         try:
             # Build feed context
             context = await self._build_feed_context(db, user_id, feed_type)
             
-            # Get content from different sources
-            content_items = []
-            
-            # Stories from similar users
-            stories = await self._get_relevant_stories(db, context, limit // 4)
-            content_items.extend(stories)
-            
-            # Plant questions user might be interested in
-            questions = await self._get_relevant_questions(db, context, limit // 4)
-            content_items.extend(questions)
-            
-            # Trading opportunities
-            trades = await self._get_relevant_trades(db, context, limit // 6)
-            content_items.extend(trades)
-            
-            # Knowledge base articles
-            knowledge = await self._get_relevant_knowledge(db, context, limit // 6)
-            content_items.extend(knowledge)
+            segment_limits = {
+                ContentType.STORY: limit // 4,
+                ContentType.QUESTION: limit // 4,
+                ContentType.TRADE: limit // 6,
+                ContentType.KNOWLEDGE: limit // 6,
+            }
+            pools, cold = await self.candidate_pools.get_pools(list(segment_limits))
             
-            # Rank all content by relevance and engagement
-            ranked_items = await self._rank_content_items(db, context, content_items)
+            # Score every segment against the user's context
+            content_items = []
+            for content_type, segment_limit in segment_limits.items():
+                content_items.extend(score_pool(pools[content_type], context, segment_limit))
+            content_items.sort(key=lambda x: x.relevance_score, reverse=True)
             
             # Apply diversity filters
-            final_feed = self._apply_feed_filters(ranked_items, context)
+            final_feed = self._apply_feed_filters(content_items, context)
             
+            self.feed_latencies["cold" if cold else "warm"].append(time.perf_counter() - started)
             logger.info(f"Generated personalized feed with {len(final_feed)} items for user {user_id}")
             return final_feed[:limit]
             
@@ -114,6 +129,21 @@ class ContextualDiscoveryService:
             logger.error(f"Error generating personalized feed: {str(e)}")
             return []
     
+    def get_feed_latency_stats(self) -> Dict[str, Any]:
+        """Feed generation latency percentiles for cold and warm pool caches."""
+        stats = {}
+        for cache_state, samples in self.feed_latencies.items():
+            if samples:
+                p50, p95 = np.percentile(np.array(samples) * 1000, [50, 95])
+                stats[cache_state] = {
+                    "requests": len(samples),
+                    "p50_ms": round(float(p50), 1),
+                    "p95_ms": round(float(p95), 1),
+                }
+            else:
+                stats[cache_state] = {"requests": 0, "p50_ms": None, "p95_ms": None}
+        return stats
+    
     async def analyze_user_behavior(
         self,
         db: AsyncSession,
@@ -345,218 +375,6 @@ class ContextualDiscoveryService:
             logger.error(f"Error building feed context: {str(e)}")
             raise
     
-    async def _get_relevant_stories(
-        self,
-        db: AsyncSession,
-        context: FeedContext,
-        limit: int
-    ) -> List[DiscoveryItem]:
-        """Get relevant stories for the user."""
-        try:
-            stories_stmt = select(Story).options(
-                selectinload(Story.author)
-            ).where(
-                Story.created_at >= datetime.utcnow() - timedelta(days=7)
-            ).order_by(desc(Story.created_at)).limit(limit * 2)
-            
-            stories_result = await db.execute(stories_stmt)
-            stories = stories_result.scalars().all()
-            
-            discovery_items = []
-            for story in stories:
-                relevance_score = self._calculate_story_relevance(story, context)
-                
-                if relevance_score > 0.3:
-                    item = DiscoveryItem(
-                        id=str(story.id),
-                        content_type=ContentType.STORY,
-                        title=f"Story by {story.author.username}",
-                        content=story.content[:200] + "..." if len(story.content) > 200 else story.content,
-                        author_id=str(story.author.id),
-                        author_name=story.author.username,
-                        relevance_score=relevance_score,
-                        engagement_score=0.7,
-                        personalization_factors=["user_plants", "content_preferences"],
-                        tags=["story", "community"],
-                        plant_species=None,
-                        created_at=story.created_at,
-                        metadata={"story_type": story.story_type}
-                    )
-                    discovery_items.append(item)
-            
-            return discovery_items[:limit]
-            
-        except Exception as e:
-            logger.error(f"Error getting relevant stories: {str(e)}")
-            return []
-    
-    async def _get_relevant_questions(
-        self,
-        db: AsyncSession,
-        context: FeedContext,
-        limit: int
-    ) -> List[DiscoveryItem]:
-        """Get relevant plant questions for the user."""
-        try:
-            questions_stmt = select(PlantQuestion).options(
-                selectinload(PlantQuestion.author),
-                selectinload(PlantQuestion.species)
-            ).where(
-                PlantQuestion.created_at >= datetime.utcnow() - timedelta(days=3)
-            ).order_by(desc(PlantQuestion.created_at)).limit(limit * 2)
-            
-            questions_result = await db.execute(questions_stmt)
-            questions = questions_result.scalars().all()
-            
-            discovery_items = []
-            for question in questions:
-                relevance_score = self._calculate_question_relevance(question, context)
-                
-                if relevance_score > 0.4:
-                    item = DiscoveryItem(
-                        id=str(question.id),
-                        content_type=ContentType.QUESTION,
-                        title=question.title,
-                        content=question.content[:150] + "..." if len(question.content) > 150 else question.content,
-                        author_id=str(question.author.id),
-                        author_name=question.author.username,
-                        relevance_score=relevance_score,
-                        engagement_score=0.6,
-                        personalization_factors=["plant_expertise", "similar_plants"],
-                        tags=["question", "help_needed"],
-                        plant_species=question.species.scientific_name if question.species else None,
-                        created_at=question.created_at,
-                        metadata={"question_type": "plant_care"}
-                    )
-                    discovery_items.append(item)
-            
-            return discovery_items[:limit]
-            
-        except Exception as e:
-            logger.error(f"Error getting relevant questions: {str(e)}")
-            return []
-    
-    async def _get_relevant_trades(
-        self,
-        db: AsyncSession,
-        context: FeedContext,
-        limit: int
-    ) -> List[DiscoveryItem]:
-        """Get relevant plant trades for the user."""
-        try:
-            trades_stmt = select(PlantTrade).options(
-                selectinload(PlantTrade.trader)
-            ).where(
-                PlantTrade.status == "available"
-            ).order_by(desc(PlantTrade.created_at)).limit(limit * 2)
-            
-            trades_result = await db.execute(trades_stmt)
-            trades = trades_result.scalars().all()
-            
-            discovery_items = []
-            for trade in trades:
-                relevance_score = self._calculate_trade_relevance(trade, context)
-                
-                if relevance_score > 0.3:
-                    item = DiscoveryItem(
-                        id=str(trade.id),
-                        content_type=ContentType.TRADE,
-                        title=f"{trade.plant_name} - {trade.trade_type}",
-                        content=trade.description or f"Trading {trade.plant_name}",
-                        author_id=str(trade.trader.id),
-                        author_name=trade.trader.username,
-                        relevance_score=relevance_score,
-                        engagement_score=0.5,
-                        personalization_factors=["location", "plant_interests"],
-                        tags=["trade", "marketplace"],
-                        plant_species=trade.plant_name,
-                        created_at=trade.created_at,
-                        metadata={"trade_type": trade.trade_type}
-                    )
-                    discovery_items.append(item)
-            
-            return discovery_items[:limit]
-            
-        except Exception as e:
-            logger.error(f"Error getting relevant trades: {str(e)}")
-            return []
-    
-    async def _get_relevant_knowledge(
-        self,
-        db: AsyncSession,
-        context: FeedContext,
-        limit: int
-    ) -> List[DiscoveryItem]:
-        """Get relevant knowledge base articles."""
-        try:
-            user_species = [plant["species_id"] for plant in context.current_plants]
-            
-            if not user_species:
-                return []
-            
-            knowledge_stmt = select(PlantKnowledgeBase).where(
-                PlantKnowledgeBase.plant_species_id.in_(user_species)
-            ).order_by(desc(PlantKnowledgeBase.helpful_count)).limit(limit)
-            
-            knowledge_result = await db.execute(knowledge_stmt)
-            knowledge_articles = knowledge_result.scalars().all()
-            
-            discovery_items = []
-            for article in knowledge_articles:
-                item = DiscoveryItem(
-                    id=str(article.id),
-                    content_type=ContentType.KNOWLEDGE,
-                    title=article.title,
-                    content=article.content[:200] + "..." if len(article.content) > 200 else article.content,
-                    author_id=None,
-                    author_name="Plant Expert",
-                    relevance_score=0.8,
-                    engagement_score=0.7,
-                    personalization_factors=["user_plants", "care_level"],
-                    tags=["knowledge", "care_guide"],
-                    plant_species=None,
-                    created_at=article.created_at,
-                    metadata={"content_type": article.content_type, "difficulty": article.difficulty_level}
-                )
-                discovery_items.append(item)
-            
-            return discovery_items
-            
-        except Exception as e:
-            logger.error(f"Error getting relevant knowledge: {str(e)}")
-            return []
-    
-    async def _rank_content_items(
-        self,
-        db: AsyncSession,
-        context: FeedContext,
-        items: List[DiscoveryItem]
-    ) -> List[DiscoveryItem]:
-        """Rank content items by relevance and engagement."""
-        try:
-            for item in items:
-                composite_score = (
-                    item.relevance_score * 0.6 +
-                    item.engagement_score * 0.3 +
-                    self._calculate_freshness_score(item) * 0.1
-                )
-                
-                # Apply personalization boosts
-                if context.time_of_day == "morning" and "morning" in item.tags:
-                    composite_score += 0.1
-                
-                if context.seasonal_context.get("season") in item.tags:
-                    composite_score += 0.1
-                
-                item.relevance_score = min(1.0, composite_score)
-            
-            items.sort(key=lambda x: x.relevance_score, reverse=True)
-            return items
-            
-        except Exception as e:
-            logger.error(f"Error ranking content items: {str(e)}")
-            return items
-    
     def _apply_feed_filters(
         self,
         items: List[DiscoveryItem],
@@ -578,54 +396,6 @@ class ContextualDiscoveryService:
         
         return filtered_items
     
-    def _calculate_story_relevance(self, story: Story, context: FeedContext) -> float:
-        """Calculate relevance score for a story."""
-        score = 0.5
-        
-        user_plant_names = [plant["species_name"].lower() for plant in context.current_plants]
-        story_content_lower = story.content.lower()
-        
-        for plant_name in user_plant_names:
-            if plant_name in story_content_lower:
-                score += 0.3
-                break
-        
-        return min(1.0, score)
-    
-    def _calculate_question_relevance(self, question: PlantQuestion, context: FeedContext) -> float:
-        """Calculate relevance score for a question."""
-        score = 0.4
-        
-        if question.species:
-            user_species_ids = [plant["species_id"] for plant in context.current_plants]
-            if str(question.species.id) in user_species_ids:
-                score += 0.4
-        
-        return min(1.0, score)
-    
-    def _calculate_trade_relevance(self, trade: PlantTrade, context: FeedContext) -> float:
-        """Calculate relevance score for a trade."""
-        score = 0.3
-        
-        if context.location and trade.trader.location:
-            if context.location.lower() in trade.trader.location.lower():
-                score += 0.4
-        
-        return min(1.0, score)
-    
-    def _calculate_freshness_score(self, item: DiscoveryItem) -> float:
-        """Calculate freshness score based on content age."""
-        age_hours = (datetime.utcnow() - item.created_at).total_seconds() / 3600
-        
-        if age_hours < 1:
-            return 1.0
-        elif age_hours < 24:
-            return 0.8
-        elif age_hours < 168:
-            return 0.6
-        else:
-            return 0.3
-    
     def _get_current_seasonal_context(self, location: Optional[str]) -> Dict[str, Any]:
         """Get current seasonal context."""
         now = datetime.utcnow()
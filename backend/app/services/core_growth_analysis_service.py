@@ -12,12 +12,10 @@ Focused on core analytics without community features or complex integrations.
 
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.timelapse import TimelapseSession, GrowthMilestone
-from app.models.growth_photo import GrowthPhoto
 from app.models.user_plant import UserPlant
+from app.services.growth_data_service import GrowthPoint, fetch_plant_timeline
 
 
 class CoreGrowthAnalysisService:
@@ -28,7 +26,7 @@ class CoreGrowthAnalysisService:
     
     async def analyze_growth_trends(
         self,
-        db: Session,
+        db: AsyncSession,
         plant_id: str,
         time_period_days: int = 90
     ) -> Dict[str, Any]:
@@ -43,27 +41,18 @@ class CoreGrowthAnalysisService:
         Returns:
             Dictionary containing growth trend analysis
         """
-        plant = db.query(UserPlant).filter(UserPlant.id == plant_id).first()
+        plant = await db.get(UserPlant, plant_id)
         if not plant:
             raise ValueError(f"Plant with id {plant_id} not found")
         
-        # Get time-lapse sessions for the plant
+        # Get growth photos for the plant
         start_date = datetime.utcnow() - timedelta(days=time_period_days)
-        sessions = db.query(TimelapseSession).filter(
-            TimelapseSession.plant_id == plant_id,
-            TimelapseSession.created_at >= start_date
-        ).all()
+        timelines = await fetch_plant_timeline(db, plant_id, since=start_date)
         
-        if not sessions:
+        if not timelines.photo_count:
             return self._empty_growth_trends_response(plant_id)
         
-        # Get growth photos from sessions
-        photos = []
-        for session in sessions:
-            session_photos = db.query(GrowthPhoto).filter(
-                GrowthPhoto.timelapse_session_id == session.id
-            ).all()
-            photos.extend(session_photos)
+        photos = timelines.points(plant_id)
         
         if len(photos) < 3:
             return self._insufficient_data_response(plant_id, len(photos))
@@ -94,7 +83,7 @@ class CoreGrowthAnalysisService:
             }
         }
 
-    def extract_measurement_timeline(self, photos: List[GrowthPhoto]) -> List[Dict[str, Any]]:
+    def extract_measurement_timeline(self, photos: List[GrowthPoint]) -> List[Dict[str, Any]]:
         """
         Extract measurement timeline from growth photos.
         
@@ -109,7 +98,6 @@ class CoreGrowthAnalysisService:
             timeline.append({
                 "date": photo.captured_at,
                 "height": photo.height_cm or 0,
-                "width": photo.width_cm or 0,
                 "leaf_count": photo.leaf_count or 0
             })
         return timeline
@@ -206,7 +194,7 @@ class CoreGrowthAnalysisService:
             }
         ]
 
-    def calculate_measurement_completeness(self, photos: List[GrowthPhoto]) -> float:
+    def calculate_measurement_completeness(self, photos: List[GrowthPoint]) -> float:
         """
         Calculate completeness of measurements in photos.
         
@@ -219,7 +207,7 @@ class CoreGrowthAnalysisService:
         if not photos:
             return 0.0
         
-        complete_measurements = sum(1 for photo in photos if photo.height_cm and photo.width_cm)
+        complete_measurements = sum(1 for photo in photos if photo.height_cm and photo.leaf_count)
         return (complete_measurements / len(photos)) * 100
 
     def _empty_growth_trends_response(self, plant_id: str) -> Dict[str, Any]:
@@ -235,7 +223,7 @@ class CoreGrowthAnalysisService:
         return {
             "plant_id": plant_id,
             "status": "no_data",
-            "message": "No time-lapse sessions found for analysis"
+            "message": "No growth photos found for analysis"
         }
 
     def _insufficient_data_response(self, plant_id: str, photo_count: int) -> Dict[str, Any]:
@@ -0,0 +1,386 @@
+"""Precomputed candidate pools for the personalized discovery feed.
+
+Each feed segment (recent stories, open questions, available trades and
+knowledge articles) keeps a cached pool of candidates stored column-wise so
+personalization is a vectorized NumPy pass instead of per-item Python
+scoring. Pools are loaded on their own sessions, concurrently, and are
+refreshed in the background; a stale pool is served while it refreshes.
+"""
+
+import asyncio
+import dataclasses
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import desc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.plant_question import PlantQuestion
+from app.models.plant_trade import PlantTrade, TradeStatus
+from app.models.rag_models import PlantKnowledgeBase
+from app.models.story import Story
+from app.services.contextual_discovery_service import ContentType, DiscoveryItem, FeedContext
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CandidatePool:
+    """Candidates for one feed segment, with per-item features as arrays."""
+    content_type: ContentType
+    items: List[DiscoveryItem]
+    species_ids: np.ndarray
+    locations: np.ndarray
+    texts: np.ndarray
+    created_ts: np.ndarray
+    engagement: np.ndarray
+    loaded_at: float
+
+    @classmethod
+    def build(
+        cls,
+        content_type: ContentType,
+        rows: List[Tuple[DiscoveryItem, Optional[str], Optional[str], str]]
+    ) -> "CandidatePool":
+        """Build a pool from (item, species_id, location, match_text) tuples."""
+        items = [row[0] for row in rows]
+        return cls(
+            content_type=content_type,
+            items=items,
+            species_ids=np.array([row[1] or "" for row in rows], dtype=object),
+            locations=np.array([(row[2] or "").lower() for row in rows], dtype=str),
+            texts=np.array([row[3].lower() for row in rows], dtype=str),
+            created_ts=np.array([item.created_at.timestamp() for item in items], dtype=np.float64),
+            engagement=np.array([item.engagement_score for item in items], dtype=np.float64),
+            loaded_at=time.monotonic(),
+        )
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def _truncate(text: Optional[str], length: int) -> str:
+    text = text or ""
+    return text[:length] + "..." if len(text) > length else text
+
+
+async def _load_stories(db: AsyncSession, pool_size: int) -> CandidatePool:
+    stmt = select(Story).options(selectinload(Story.user)).where(
+        Story.created_at >= datetime.utcnow() - timedelta(days=7),
+        Story.is_active.is_(True)
+    ).order_by(desc(Story.created_at)).limit(pool_size)
+    stories = (await db.execute(stmt)).scalars().all()
+
+    rows = []
+    for story in stories:
+        username = story.user.username if story.user else None
+        item = DiscoveryItem(
+            id=str(story.id),
+            content_type=ContentType.STORY,
+            title=f"Story by {username}",
+            content=_truncate(story.caption, 200),
+            author_id=str(story.user_id),
+            author_name=username,
+            relevance_score=0.5,
+            engagement_score=0.7,
+            personalization_factors=["user_plants", "content_preferences"],
+            tags=["story", "community"],
+            plant_species=None,
+            created_at=story.created_at,
+            metadata={"story_type": story.content_type}
+        )
+        rows.append((item, None, story.location, f"{story.caption or ''} {story.plant_tags or ''}"))
+    return CandidatePool.build(ContentType.STORY, rows)
+
+
+async def _load_questions(db: AsyncSession, pool_size: int) -> CandidatePool:
+    stmt = select(PlantQuestion).options(
+        selectinload(PlantQuestion.user),
+        selectinload(PlantQuestion.species)
+    ).where(
+        PlantQuestion.created_at >= datetime.utcnow() - timedelta(days=3),
+        PlantQuestion.is_solved.is_(False)
+    ).order_by(desc(PlantQuestion.created_at)).limit(pool_size)
+    questions = (await db.execute(stmt)).scalars().all()
+
+    rows = []
+    for question in questions:
+        item = DiscoveryItem(
+            id=str(question.id),
+            content_type=ContentType.QUESTION,
+            title=question.title,
+            content=_truncate(question.content, 150),
+            author_id=str(question.user_id),
+            author_name=question.user.username if question.user else None,
+            relevance_score=0.4,
+            engagement_score=0.6,
+            personalization_factors=["plant_expertise", "similar_plants"],
+            tags=["question", "help_needed"],
+            plant_species=question.species.scientific_name if question.species else None,
+            created_at=question.created_at,
+            metadata={"question_type": "plant_care"}
+        )
+        species_id = str(question.species_id) if question.species_id else None
+        rows.append((item, species_id, None, question.title))
+    return CandidatePool.build(ContentType.QUESTION, rows)
+
+
+async def _load_trades(db: AsyncSession, pool_size: int) -> CandidatePool:
+    stmt = select(PlantTrade).options(
+        selectinload(PlantTrade.owner),
+        selectinload(PlantTrade.species)
+    ).where(
+        PlantTrade.status == TradeStatus.AVAILABLE
+    ).order_by(desc(PlantTrade.created_at)).limit(pool_size)
+    trades = (await db.execute(stmt)).scalars().all()
+
+    rows = []
+    for trade in trades:
+        trade_type = trade.trade_type.value if trade.trade_type else None
+        species_name = trade.species.scientific_name if trade.species else None
+        item = DiscoveryItem(
+            id=str(trade.id),
+            content_type=ContentType.TRADE,
+            title=f"{trade.title} - {trade_type}",
+            content=trade.description or f"Trading {trade.title}",
+            author_id=str(trade.owner_id),
+            author_name=trade.owner.username if trade.owner else None,
+            relevance_score=0.3,
+            engagement_score=0.5,
+            personalization_factors=["location", "plant_interests"],
+            tags=["trade", "marketplace"],
+            plant_species=species_name,
+            created_at=trade.created_at,
+            metadata={"trade_type": trade_type}
+        )
+        location = trade.location or (trade.owner.location if trade.owner else None)
+        rows.append((item, str(trade.species_id), location, trade.title))
+    return CandidatePool.build(ContentType.TRADE, rows)
+
+
+async def _load_knowledge(db: AsyncSession, pool_size: int) -> CandidatePool:
+    # Top articles of every species, not a global top-N, so users whose
+    # species have fewer helpful votes still get their own articles
+    ranked = select(
+        PlantKnowledgeBase.id,
+        func.row_number().over(
+            partition_by=PlantKnowledgeBase.plant_species_id,
+            order_by=desc(PlantKnowledgeBase.helpful_count)
+        ).label("species_rank")
+    ).where(PlantKnowledgeBase.plant_species_id.isnot(None)).subquery()
+    stmt = select(PlantKnowledgeBase).join(ranked, ranked.c.id == PlantKnowledgeBase.id).where(
+        ranked.c.species_rank <= settings.DISCOVERY_KNOWLEDGE_PER_SPECIES
+    ).order_by(desc(PlantKnowledgeBase.helpful_count)).limit(pool_size)
+    articles = (await db.execute(stmt)).scalars().all()
+
+    rows = []
+    for article in articles:
+        item = DiscoveryItem(
+            id=str(article.id),
+            content_type=ContentType.KNOWLEDGE,
+            title=article.title,
+            content=_truncate(article.content, 200),
+            author_id=None,
+            author_name="Plant Expert",
+            relevance_score=0.8,
+            engagement_score=0.7,
+            personalization_factors=["user_plants", "care_level"],
+            tags=["knowledge", "care_guide"],
+            plant_species=None,
+            created_at=article.created_at,
+            metadata={"content_type": article.content_type, "difficulty": article.difficulty_level}
+        )
+        rows.append((item, str(article.plant_species_id), None, article.title))
+    return CandidatePool.build(ContentType.KNOWLEDGE, rows)
+
+
+POOL_LOADERS: Dict[ContentType, Callable[[AsyncSession, int], Awaitable[CandidatePool]]] = {
+    ContentType.STORY: _load_stories,
+    ContentType.QUESTION: _load_questions,
+    ContentType.TRADE: _load_trades,
+    ContentType.KNOWLEDGE: _load_knowledge,
+}
+
+
+class DiscoveryCandidatePools:
+    """Cache of candidate pools with background refresh."""
+
+    def __init__(
+        self,
+        pool_size: int = 500,
+        ttl_seconds: float = 60.0,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        loaders: Optional[Dict[ContentType, Callable[[AsyncSession, int], Awaitable[CandidatePool]]]] = None,
+    ):
+        self.pool_size = pool_size
+        self.ttl_seconds = ttl_seconds
+        self.session_factory = session_factory
+        self.loaders = loaders or POOL_LOADERS
+        self._pools: Dict[ContentType, CandidatePool] = {}
+        self._locks: Dict[ContentType, asyncio.Lock] = {kind: asyncio.Lock() for kind in self.loaders}
+        # In-flight background refresh per segment; holding the task keeps it
+        # from being garbage-collected and lets callers skip duplicate refreshes
+        self._refresh_tasks: Dict[ContentType, asyncio.Task] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def get_pools(self, kinds: List[ContentType]) -> Tuple[Dict[ContentType, CandidatePool], bool]:
+        """Fetch pools for the given segments concurrently.
+
+        Returns:
+            Pools by content type, and whether any pool had to be loaded
+            synchronously (a cold cache)
+        """
+        cold = any(kind not in self._pools for kind in kinds)
+        pools = await asyncio.gather(*(self.get_pool(kind) for kind in kinds))
+        return dict(zip(kinds, pools)), cold
+
+    async def get_pool(self, kind: ContentType) -> CandidatePool:
+        """Return a cached pool, loading it if missing and refreshing it if stale."""
+        pool = self._pools.get(kind)
+        if pool is None:
+            async with self._locks[kind]:
+                pool = self._pools.get(kind)
+                if pool is None:
+                    pool = await self._load(kind)
+            return pool
+
+        if time.monotonic() - pool.loaded_at > self.ttl_seconds:
+            task = self._refresh_tasks.get(kind)
+            if task is None or task.done():
+                self._refresh_tasks[kind] = asyncio.create_task(self._refresh(kind))
+        return pool
+
+    async def refresh_all(self) -> None:
+        """Reload every pool concurrently."""
+        await asyncio.gather(*(self._refresh(kind) for kind in self.loaders))
+
+    def invalidate(self, kind: Optional[ContentType] = None) -> None:
+        """Drop one or all pools so the next request reloads them."""
+        if kind is None:
+            self._pools.clear()
+        else:
+            self._pools.pop(kind, None)
+
+    def start(self) -> None:
+        """Start periodic background refresh."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        """Stop periodic background refresh and any in-flight pool refresh."""
+        tasks = list(self._refresh_tasks.values())
+        if self._task:
+            tasks.append(self._task)
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._refresh_tasks.clear()
+        self._task = None
+
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                await self.refresh_all()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error refreshing discovery pools: {str(e)}")
+            await asyncio.sleep(self.ttl_seconds)
+
+    async def _refresh(self, kind: ContentType) -> None:
+        try:
+            async with self._locks[kind]:
+                await self._load(kind)
+        except Exception as e:
+            logger.error(f"Error refreshing {kind.value} pool: {str(e)}")
+
+    async def _load(self, kind: ContentType) -> CandidatePool:
+        async with self.session_factory() as db:
+            pool = await self.loaders[kind](db, self.pool_size)
+        self._pools[kind] = pool
+        logger.debug(f"Loaded {len(pool)} {kind.value} feed candidates")
+        return pool
+
+
+def score_pool(
+    pool: CandidatePool,
+    context: FeedContext,
+    limit: int,
+    now: Optional[float] = None
+) -> List[DiscoveryItem]:
+    """Score a pool against a user's context and return its top items.
+
+    Relevance rules match the per-item scoring of ContextualDiscoveryService:
+    stories mentioning one of the user's plants, questions and knowledge for
+    the user's species and trades near the user's location rank higher.
+    """
+    if not len(pool) or limit <= 0:
+        return []
+
+    user_species = np.array([plant["species_id"] for plant in context.current_plants], dtype=object)
+    species_match = np.isin(pool.species_ids, user_species) if len(user_species) else np.zeros(len(pool), dtype=bool)
+
+    if pool.content_type == ContentType.STORY:
+        mentions = np.zeros(len(pool), dtype=bool)
+        for plant in context.current_plants:
+            mentions |= np.char.find(pool.texts, plant["species_name"].lower()) >= 0
+        relevance = 0.5 + 0.3 * mentions
+        eligible = relevance > 0.3
+    elif pool.content_type == ContentType.QUESTION:
+        relevance = 0.4 + 0.4 * species_match
+        eligible = relevance > 0.4
+    elif pool.content_type == ContentType.TRADE:
+        if context.location:
+            nearby = np.char.find(pool.locations, context.location.lower()) >= 0
+        else:
+            nearby = np.zeros(len(pool), dtype=bool)
+        relevance = 0.3 + 0.4 * nearby
+        eligible = relevance > 0.3
+    else:
+        relevance = np.full(len(pool), 0.8)
+        eligible = species_match
+
+    now = now if now is not None else datetime.utcnow().timestamp()
+    age_hours = (now - pool.created_ts) / 3600
+    freshness = np.select([age_hours < 1, age_hours < 24, age_hours < 168], [1.0, 0.8, 0.6], default=0.3)
+
+    composite = relevance * 0.6 + pool.engagement * 0.3 + freshness * 0.1
+    if context.seasonal_context.get("season") in pool.items[0].tags:
+        composite = composite + 0.1
+    composite = np.minimum(composite, 1.0)
+
+    candidates = np.flatnonzero(eligible)
+    if len(candidates) > limit:
+        top = np.argpartition(-composite[candidates], limit - 1)[:limit]
+        candidates = candidates[top]
+    candidates = candidates[np.argsort(-composite[candidates], kind="stable")]
+
+    return [
+        dataclasses.replace(pool.items[i], relevance_score=float(composite[i]))
+        for i in candidates
+    ]
+
+
+_candidate_pools: Optional[DiscoveryCandidatePools] = None
+
+
+def get_discovery_candidate_pools() -> DiscoveryCandidatePools:
+    """Get the process-wide discovery candidate pools."""
+    global _candidate_pools
+    if _candidate_pools is None:
+        _candidate_pools = DiscoveryCandidatePools(
+            pool_size=settings.DISCOVERY_POOL_SIZE,
+            ttl_seconds=settings.DISCOVERY_POOL_TTL_SECONDS,
+        )
+    return _candidate_pools
@@ -0,0 +1,247 @@
+"""Change-data-capture driven incremental embedding updates.
+
+Writes to indexable models (species, knowledge base entries, questions,
+answers and stories) enqueue an ``EmbeddingChange`` outbox row in the same
+transaction via a ``before_flush`` hook. A background worker drains the
+outbox in batches, coalesces repeated changes to the same item, re-embeds
+only dirty content and deletes embeddings of removed content.
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy import and_, delete, event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.plant_question import PlantAnswer, PlantQuestion
+from app.models.plant_species import PlantSpecies
+from app.models.rag_models import EmbeddingChange, PlantContentEmbedding, PlantKnowledgeBase
+from app.models.story import Story
+from app.services.embedding_service import EmbeddingService
+from app.services.rag_reindex_pipeline import EMBEDDING_CONTENT_TYPES, BulkReindexPipeline
+from app.services.semantic_answer_cache import get_semantic_answer_cache
+
+logger = logging.getLogger(__name__)
+
+# Indexed model -> (source key, attributes that feed the embedded text/metadata).
+# Updates that touch none of these attributes (e.g. view counters) are ignored.
+INDEXED_MODELS: Dict[type, Tuple[str, Tuple[str, ...]]] = {
+    PlantSpecies: ("species", (
+        "scientific_name", "common_names", "family", "care_level", "light_requirements",
+        "water_frequency_days", "humidity_preference", "temperature_range",
+        "toxicity_info", "care_notes",
+    )),
+    PlantKnowledgeBase: ("knowledge", (
+        "title", "content", "content_type", "difficulty_level", "season",
+        "climate_zones", "tags", "verified", "plant_species_id",
+    )),
+    PlantQuestion: ("question", ("title", "content", "tags", "is_solved", "species_id")),
+    PlantAnswer: ("answer", ("content", "is_accepted", "upvotes")),
+    Story: ("story", ("caption", "plant_tags", "location")),
+}
+
+_listeners_registered = False
+
+
+def _has_indexed_changes(instance: Any, attributes: Tuple[str, ...]) -> bool:
+    state = inspect(instance)
+    return any(state.attrs[name].history.has_changes() for name in attributes)
+
+
+def _enqueue_content_changes(session: Session, flush_context, instances) -> None:
+    """Add outbox rows for indexable objects touched by this flush."""
+    changes: Dict[Tuple[str, Any], str] = {}
+
+    for instance in session.new:
+        spec = INDEXED_MODELS.get(type(instance))
+        if spec:
+            if instance.id is None:
+                # Assign the primary key now so the outbox row can reference it
+                instance.id = uuid4()
+            changes[(spec[0], instance.id)] = "upsert"
+
+    for instance in session.dirty:
+        spec = INDEXED_MODELS.get(type(instance))
+        if spec and _has_indexed_changes(instance, spec[1]):
+            changes[(spec[0], instance.id)] = "upsert"
+
+    for instance in session.deleted:
+        spec = INDEXED_MODELS.get(type(instance))
+        if spec:
+            changes[(spec[0], instance.id)] = "delete"
+
+    for (source, content_id), operation in changes.items():
+        session.add(EmbeddingChange(source=source, content_id=content_id, operation=operation))
+
+
+def register_embedding_outbox() -> None:
+    """Install the flush hook that records content changes (idempotent)."""
+    global _listeners_registered
+    if _listeners_registered:
+        return
+    event.listen(Session, "before_flush", _enqueue_content_changes)
+    _listeners_registered = True
+
+
+class EmbeddingOutboxWorker:
+    """Drains the embedding outbox and applies changes in batches."""
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        batch_size: int = 200,
+        poll_interval: float = 2.0,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ):
+        self.pipeline = BulkReindexPipeline(embedding_service, session_factory=session_factory)
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.session_factory = session_factory
+        self._task: Optional[asyncio.Task] = None
+
+    async def process_once(self, db: AsyncSession) -> Dict[str, int]:
+        """Apply one batch of pending changes.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Counts of changes read, items re-embedded, deleted and failed
+        """
+        stmt = (
+            select(EmbeddingChange)
+            .order_by(EmbeddingChange.id)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        changes = (await db.execute(stmt)).scalars().all()
+        result = {"changes": len(changes), "embedded": 0, "deleted": 0, "failed": 0}
+        if not changes:
+            await db.commit()
+            return result
+
+        # Coalesce per item: the most recent operation wins
+        latest: Dict[Tuple[str, str], str] = {}
+        change_ids: Dict[str, List[int]] = {}
+        for change in changes:
+            latest[(change.source, str(change.content_id))] = change.operation
+            change_ids.setdefault(change.source, []).append(change.id)
+
+        upserts: Dict[str, List[str]] = {}
+        deletes: Dict[str, List[str]] = {}
+        for (source, content_id), operation in latest.items():
+            target = deletes if operation == "delete" else upserts
+            target.setdefault(source, []).append(content_id)
+
+        result["deleted"] = await self._apply_deletes(db, deletes)
+
+        done_ids: List[int] = []
+        for source, ids in change_ids.items():
+            if source in upserts:
+                stats = await self.pipeline.index_ids(db, source, upserts[source])
+                result["embedded"] += stats["success"]
+                result["failed"] += stats["failed"]
+                if stats["failed"]:
+                    # Leave this source's changes in the outbox for the next pass
+                    continue
+            done_ids.extend(ids)
+
+        if done_ids:
+            await db.execute(delete(EmbeddingChange).where(EmbeddingChange.id.in_(done_ids)))
+        await db.commit()
+
+        logger.info(f"Processed embedding outbox batch: {result}")
+        return result
+
+    async def process_deletes(self, db: AsyncSession) -> int:
+        """Apply only pending delete changes.
+
+        Returns:
+            Number of embeddings removed
+        """
+        stmt = (
+            select(EmbeddingChange)
+            .where(EmbeddingChange.operation == "delete")
+            .order_by(EmbeddingChange.id)
+            .with_for_update(skip_locked=True)
+        )
+        changes = (await db.execute(stmt)).scalars().all()
+        if not changes:
+            return 0
+
+        deletes: Dict[str, List[str]] = {}
+        for change in changes:
+            deletes.setdefault(change.source, []).append(str(change.content_id))
+
+        removed = await self._apply_deletes(db, deletes)
+        await db.execute(
+            delete(EmbeddingChange).where(EmbeddingChange.id.in_([c.id for c in changes]))
+        )
+        await db.commit()
+        return removed
+
+    async def _apply_deletes(self, db: AsyncSession, deletes: Dict[str, List[str]]) -> int:
+        removed = 0
+        for source, ids in deletes.items():
+            result = await db.execute(
+                delete(PlantContentEmbedding).where(
+                    and_(
+                        PlantContentEmbedding.content_type == EMBEDDING_CONTENT_TYPES[source],
+                        PlantContentEmbedding.content_id.in_(ids)
+                    )
+                )
+            )
+            removed += result.rowcount or 0
+            if source == "knowledge":
+                await get_semantic_answer_cache().invalidate_sources(ids)
+        return removed
+
+    async def run_forever(self) -> None:
+        """Poll the outbox until cancelled."""
+        while True:
+            try:
+                async with self.session_factory() as db:
+                    result = await self.process_once(db)
+                # Keep draining while there is a backlog
+                if result["changes"] >= self.batch_size:
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Embedding outbox worker error: {str(e)}")
+            await asyncio.sleep(self.poll_interval)
+
+    def start(self) -> None:
+        """Start the background worker task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        """Cancel the background worker task."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+_outbox_worker: Optional[EmbeddingOutboxWorker] = None
+
+
+def get_embedding_outbox_worker() -> EmbeddingOutboxWorker:
+    """Get the process-wide outbox worker."""
+    global _outbox_worker
+    if _outbox_worker is None:
+        _outbox_worker = EmbeddingOutboxWorker(
+            EmbeddingService(),
+            batch_size=settings.EMBEDDING_OUTBOX_BATCH_SIZE,
+            poll_interval=settings.EMBEDDING_OUTBOX_POLL_SECONDS,
+        )
+    return _outbox_worker
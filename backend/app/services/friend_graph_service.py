@@ -0,0 +1,228 @@
+"""Friend graph cache.
+
+Keeps each user's accepted-friend adjacency set in memory so friendship
+checks are a set lookup and mutual-friend counts for a whole page of
+friends are computed with set intersections after a single batched query.
+Entries expire after a TTL and are updated in place by the friendship
+mutations (accept, remove, block) of this process only, so other workers
+can see an edge change up to ``FRIEND_GRAPH_TTL_SECONDS`` late. That is
+fine for mutual-friend counts and suggestions; privacy and messaging
+checks use ``are_friends`` or ``fresh=True``, which read the database.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, exists, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.friendship import Friendship, FriendshipStatus
+
+logger = logging.getLogger(__name__)
+
+
+class FriendGraph:
+    """LRU cache of per-user accepted-friend sets."""
+
+    def __init__(self, ttl_seconds: float = 300.0, max_users: int = 50000):
+        self.ttl_seconds = ttl_seconds
+        self.max_users = max_users
+        self._adjacency: "OrderedDict[str, Tuple[FrozenSet[str], float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def get_friend_ids(
+        self,
+        session: AsyncSession,
+        user_id: str,
+        fresh: bool = False
+    ) -> FrozenSet[str]:
+        """Get the ids of a user's accepted friends.
+
+        Args:
+            session: Database session
+            user_id: User to look up
+            fresh: Read the database even if the user is cached (for
+                privacy checks that must see other processes' changes)
+        """
+        if fresh:
+            self.misses += 1
+            return (await self._load(session, [str(user_id)]))[str(user_id)]
+        return (await self.get_many(session, [user_id]))[str(user_id)]
+
+    async def get_many(
+        self,
+        session: AsyncSession,
+        user_ids: Iterable[str]
+    ) -> Dict[str, FrozenSet[str]]:
+        """Get friend sets for several users, loading all misses in one query.
+
+        Args:
+            session: Database session
+            user_ids: Users to look up
+
+        Returns:
+            Friend id sets keyed by user id
+        """
+        result: Dict[str, FrozenSet[str]] = {}
+        missing: List[str] = []
+        for user_id in {str(user_id) for user_id in user_ids}:
+            cached = self._get_cached(user_id)
+            if cached is None:
+                missing.append(user_id)
+            else:
+                result[user_id] = cached
+
+        if missing:
+            self.misses += len(missing)
+            result.update(await self._load(session, missing))
+        return result
+
+    async def are_friends(self, session: AsyncSession, user1_id: str, user2_id: str) -> bool:
+        """Check whether two users are accepted friends.
+
+        Always reads the database: messaging and story privacy depend on
+        this, and a cached set may miss a removal made by another process.
+        """
+        result = await session.execute(
+            select(exists().where(
+                and_(
+                    or_(
+                        and_(Friendship.requester_id == user1_id, Friendship.addressee_id == user2_id),
+                        and_(Friendship.requester_id == user2_id, Friendship.addressee_id == user1_id)
+                    ),
+                    Friendship.status == FriendshipStatus.ACCEPTED
+                )
+            ))
+        )
+        return bool(result.scalar())
+
+    async def mutual_friend_counts(
+        self,
+        session: AsyncSession,
+        user_id: str,
+        other_ids: Iterable[str]
+    ) -> Dict[str, int]:
+        """Count mutual friends between a user and each of several others.
+
+        Args:
+            session: Database session
+            user_id: The viewing user
+            other_ids: Users to compare against (e.g. a page of friends)
+
+        Returns:
+            Mutual friend counts keyed by other user id
+        """
+        other_ids = [str(other_id) for other_id in other_ids]
+        graph = await self.get_many(session, [user_id, *other_ids])
+        own = graph[str(user_id)]
+        return {other_id: len(own & graph[other_id]) for other_id in other_ids}
+
+    async def mutual_friend_ids(
+        self,
+        session: AsyncSession,
+        user1_id: str,
+        user2_id: str
+    ) -> FrozenSet[str]:
+        """Get the ids of friends two users have in common."""
+        graph = await self.get_many(session, [user1_id, user2_id])
+        return graph[str(user1_id)] & graph[str(user2_id)]
+
+    def add_friendship(self, user1_id: str, user2_id: str) -> None:
+        """Record a newly accepted friendship in cached entries."""
+        self._update(str(user1_id), str(user2_id), add=True)
+        self._update(str(user2_id), str(user1_id), add=True)
+
+    def remove_friendship(self, user1_id: str, user2_id: str) -> None:
+        """Drop a removed or blocked friendship from cached entries."""
+        self._update(str(user1_id), str(user2_id), add=False)
+        self._update(str(user2_id), str(user1_id), add=False)
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        """Forget one user's friend set, or the whole graph."""
+        if user_id is None:
+            self._adjacency.clear()
+        else:
+            self._adjacency.pop(str(user_id), None)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Cache size and hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            "cached_users": len(self._adjacency),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def _get_cached(self, user_id: str) -> Optional[FrozenSet[str]]:
+        entry = self._adjacency.get(user_id)
+        if entry is None:
+            return None
+        friends, loaded_at = entry
+        if time.monotonic() - loaded_at > self.ttl_seconds:
+            del self._adjacency[user_id]
+            return None
+        self._adjacency.move_to_end(user_id)
+        self.hits += 1
+        return friends
+
+    def _put(self, user_id: str, friends: FrozenSet[str], loaded_at: Optional[float] = None) -> None:
+        self._adjacency[user_id] = (friends, loaded_at or time.monotonic())
+        self._adjacency.move_to_end(user_id)
+        while len(self._adjacency) > self.max_users:
+            self._adjacency.popitem(last=False)
+
+    def _update(self, user_id: str, friend_id: str, add: bool) -> None:
+        entry = self._adjacency.get(user_id)
+        if entry is None:
+            return
+        friends, loaded_at = entry
+        friends = friends | {friend_id} if add else friends - {friend_id}
+        self._adjacency[user_id] = (friends, loaded_at)
+
+    async def _load(self, session: AsyncSession, user_ids: List[str]) -> Dict[str, FrozenSet[str]]:
+        rows = await session.execute(
+            select(Friendship.requester_id, Friendship.addressee_id).where(
+                and_(
+                    or_(
+                        Friendship.requester_id.in_(user_ids),
+                        Friendship.addressee_id.in_(user_ids)
+                    ),
+                    Friendship.status == FriendshipStatus.ACCEPTED
+                )
+            )
+        )
+
+        wanted = set(user_ids)
+        adjacency: Dict[str, set] = {user_id: set() for user_id in user_ids}
+        for requester_id, addressee_id in rows:
+            requester_id, addressee_id = str(requester_id), str(addressee_id)
+            if requester_id in wanted:
+                adjacency[requester_id].add(addressee_id)
+            if addressee_id in wanted:
+                adjacency[addressee_id].add(requester_id)
+
+        loaded_at = time.monotonic()
+        result = {}
+        for user_id, friends in adjacency.items():
+            result[user_id] = frozenset(friends)
+            self._put(user_id, result[user_id], loaded_at)
+        return result
+
+
+_friend_graph: Optional[FriendGraph] = None
+
+
+def get_friend_graph() -> FriendGraph:
+    """Get the process-wide friend graph cache."""
+    global _friend_graph
+    if _friend_graph is None:
+        _friend_graph = FriendGraph(
+            ttl_seconds=settings.FRIEND_GRAPH_TTL_SECONDS,
+            max_users=settings.FRIEND_GRAPH_MAX_USERS,
+        )
+    return _friend_graph
@@ -0,0 +1,402 @@
+"""Precomputed friend-of-friend suggestions.
+
+``FriendSuggestionService`` ranks each user's friends-of-friends by the
+number of mutual friends and stores the top ``per_user`` of them in
+``friend_suggestions``. Candidates are counted from the friend graph
+cache: one batched adjacency load for a page of users, one for all of
+their friends, then a ``Counter`` over the friends' sets per user.
+
+Accepting, removing or blocking a friendship queues the edge. Every
+``refresh_interval`` seconds the background task recomputes both ends
+in full and recounts, by set intersection, the one candidate each of
+their friends gained or lost through that edge. Every
+``sweep_interval`` it recomputes all active users in keyset pages,
+which picks up changes made by other processes and candidates that
+were trimmed from a list before a removal made room for them. Sweeps
+run under a database advisory lock, so only one worker process sweeps
+at a time.
+
+Reads filter out users who are inactive or who already have a
+friendship row of any status with the viewer, so pending requests,
+declines and blocks take effect without a recompute.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from collections import Counter
+from datetime import datetime
+from operator import itemgetter
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, delete, desc, exists, func, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, try_advisory_lock
+from app.models.friendship import Friendship, FriendSuggestion
+from app.models.user import User
+from app.services.friend_graph_service import FriendGraph, get_friend_graph
+
+logger = logging.getLogger(__name__)
+
+# asyncpg allows 32,767 bind parameters per statement; a suggestion row uses four
+INSERT_CHUNK_ROWS = 32767 // 4
+
+# Advisory lock key serializing sweeps across worker processes
+ADVISORY_LOCK_KEY = 4_702_002
+
+
+def rank_friends_of_friends(
+    user_id: str,
+    friends: Iterable[str],
+    graph: Dict[str, Iterable[str]],
+    limit: int
+) -> List[Tuple[str, int]]:
+    """Rank a user's friends-of-friends by mutual friend count.
+
+    Args:
+        user_id: The user to suggest for
+        friends: The user's accepted friends
+        graph: Friend sets of (at least) each of those friends
+        limit: Number of candidates to keep
+
+    Returns:
+        (candidate id, mutual count) pairs, highest count first
+    """
+    friends = set(friends)
+    counts: Counter = Counter()
+    for friend_id in friends:
+        counts.update(graph.get(friend_id, ()))
+    counts.pop(user_id, None)
+    for friend_id in friends:
+        counts.pop(friend_id, None)
+    return heapq.nlargest(limit, counts.items(), key=itemgetter(1))
+
+
+class FriendSuggestionService:
+    """Computes, stores and serves ranked friend-of-friend suggestions."""
+
+    def __init__(
+        self,
+        graph: Optional[FriendGraph] = None,
+        per_user: int = 50,
+        batch_size: int = 200,
+        refresh_interval: float = 30.0,
+        sweep_interval: float = 24 * 3600.0,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ):
+        self.graph = graph or get_friend_graph()
+        self.per_user = per_user
+        self.batch_size = batch_size
+        self.refresh_interval = refresh_interval
+        self.sweep_interval = sweep_interval
+        self.session_factory = session_factory
+        self._changed: Set[Tuple[str, str]] = set()
+        self._last_sweep = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self.users_refreshed = 0
+        self.refresh_seconds = 0.0
+        self.sweeps = 0
+
+    def mark_changed(self, user1_id: str, user2_id: str) -> None:
+        """Queue an added or removed friendship for refresh."""
+        self._changed.add((str(user1_id), str(user2_id)))
+
+    async def get_suggestions(
+        self,
+        session: AsyncSession,
+        user_id: str,
+        limit: int = 10
+    ) -> List[Tuple[User, int]]:
+        """Read a user's stored suggestions, best first.
+
+        Users with friends but no stored suggestions (not yet reached by
+        the background job) have them computed inline, in a session of
+        their own so the caller's transaction is not committed.
+
+        Args:
+            session: Database session
+            user_id: The viewing user
+            limit: Maximum number of suggestions
+
+        Returns:
+            (suggested user, mutual friend count) pairs
+        """
+        rows = await self._read(session, user_id, limit)
+        if rows or not await self.graph.get_friend_ids(session, user_id):
+            return rows
+        if not await self._has_stored(session, user_id):
+            async with self.session_factory() as refresh_session:
+                await self.refresh_users(refresh_session, [str(user_id)])
+            rows = await self._read(session, user_id, limit)
+        return rows
+
+    async def refresh_users(self, session: AsyncSession, user_ids: Iterable[str]) -> int:
+        """Recompute and store suggestions for a batch of users, then commit.
+
+        Args:
+            session: Database session
+            user_ids: Users to refresh
+
+        Returns:
+            Number of suggestion rows written
+        """
+        start = time.perf_counter()
+        user_ids = list({str(user_id) for user_id in user_ids})
+        friends = await self.graph.get_many(session, user_ids)
+        second_hop = set().union(*friends.values()) if friends else set()
+        graph = await self.graph.get_many(session, second_hop) if second_hop else {}
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                "user_id": user_id,
+                "suggested_user_id": candidate_id,
+                "mutual_count": mutual_count,
+                "computed_at": now,
+            }
+            for user_id in user_ids
+            for candidate_id, mutual_count in rank_friends_of_friends(
+                user_id, friends[user_id], graph, self.per_user
+            )
+        ]
+
+        await session.execute(delete(FriendSuggestion).where(FriendSuggestion.user_id.in_(user_ids)))
+        for offset in range(0, len(rows), INSERT_CHUNK_ROWS):
+            await session.execute(
+                insert(FriendSuggestion).values(rows[offset:offset + INSERT_CHUNK_ROWS]).on_conflict_do_nothing()
+            )
+        await session.commit()
+
+        self.users_refreshed += len(user_ids)
+        self.refresh_seconds += time.perf_counter() - start
+        return len(rows)
+
+    async def refresh_changed(self, session: AsyncSession) -> int:
+        """Apply the friendships changed since the last pass.
+
+        Both ends of a changed friendship are recomputed in full. For the
+        friends of one end, only the other end's mutual count can have
+        moved, so those rows are recounted with one set intersection each,
+        upserted (or deleted when no longer a candidate), and each touched
+        user's list is trimmed back to ``per_user``.
+
+        Returns:
+            Number of users whose suggestions changed
+        """
+        if not self._changed:
+            return 0
+        changed, self._changed = self._changed, set()
+        try:
+            endpoints = sorted({user_id for edge in changed for user_id in edge})
+            friends = await self.graph.get_many(session, endpoints)
+            pairs = set()
+            for user1_id, user2_id in changed:
+                pairs.update((friend_id, user2_id) for friend_id in friends[user1_id])
+                pairs.update((friend_id, user1_id) for friend_id in friends[user2_id])
+            pairs = {(user_id, candidate_id) for user_id, candidate_id in pairs if user_id not in friends}
+            graph = await self.graph.get_many(session, {user_id for user_id, _ in pairs})
+            graph.update(friends)
+
+            for offset in range(0, len(endpoints), self.batch_size):
+                await self.refresh_users(session, endpoints[offset:offset + self.batch_size])
+            await self._apply_pair_counts(session, pairs, graph)
+        except Exception:
+            # Retry on the next pass
+            self._changed |= changed
+            raise
+        return len(endpoints) + len({user_id for user_id, _ in pairs})
+
+    async def sweep(self) -> int:
+        """Recompute suggestions for every active user in keyset pages.
+
+        Returns:
+            Number of users refreshed
+        """
+        cursor: Optional[UUID] = None
+        refreshed = 0
+        while True:
+            async with self.session_factory() as session:
+                conditions = [User.is_active == True]
+                if cursor is not None:
+                    conditions.append(User.id > cursor)
+                result = await session.execute(
+                    select(User.id).where(and_(*conditions)).order_by(User.id).limit(self.batch_size)
+                )
+                page = result.scalars().all()
+                if not page:
+                    break
+                await self.refresh_users(session, page)
+            refreshed += len(page)
+            cursor = page[-1]
+            if len(page) < self.batch_size:
+                break
+
+        self.sweeps += 1
+        logger.info(f"Friend suggestion sweep refreshed {refreshed} users")
+        return refreshed
+
+    async def run_forever(self) -> None:
+        """Refresh changed users and run periodic sweeps until cancelled."""
+        # Suggestions are backfilled on migration; the first sweep waits a full interval
+        self._last_sweep = time.monotonic()
+        while True:
+            try:
+                if time.monotonic() - self._last_sweep >= self.sweep_interval:
+                    self._last_sweep = time.monotonic()
+                    async with try_advisory_lock(ADVISORY_LOCK_KEY, self.session_factory) as acquired:
+                        if acquired:
+                            await self.sweep()
+                        else:
+                            logger.info("Friend suggestion sweep already running in another process; skipping")
+                async with self.session_factory() as session:
+                    await self.refresh_changed(session)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Friend suggestion refresh error: {str(e)}")
+            await asyncio.sleep(self.refresh_interval)
+
+    def start(self) -> None:
+        """Start the background refresh task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        """Cancel the background refresh task."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "pending_changes": len(self._changed),
+            "users_refreshed": self.users_refreshed,
+            "sweeps": self.sweeps,
+            "avg_refresh_ms_per_user": (
+                self.refresh_seconds / self.users_refreshed * 1000 if self.users_refreshed else 0.0
+            ),
+        }
+
+    async def _read(self, session: AsyncSession, user_id: str, limit: int) -> List[Tuple[User, int]]:
+        related = exists().where(
+            or_(
+                and_(
+                    Friendship.requester_id == user_id,
+                    Friendship.addressee_id == FriendSuggestion.suggested_user_id
+                ),
+                and_(
+                    Friendship.requester_id == FriendSuggestion.suggested_user_id,
+                    Friendship.addressee_id == user_id
+                )
+            )
+        )
+        result = await session.execute(
+            select(User, FriendSuggestion.mutual_count)
+            .join(User, User.id == FriendSuggestion.suggested_user_id)
+            .where(
+                and_(
+                    FriendSuggestion.user_id == user_id,
+                    User.is_active == True,
+                    ~related
+                )
+            )
+            .order_by(desc(FriendSuggestion.mutual_count), desc(User.created_at))
+            .limit(limit)
+        )
+        return [(user, mutual_count) for user, mutual_count in result.all()]
+
+    async def _apply_pair_counts(
+        self,
+        session: AsyncSession,
+        pairs: Set[Tuple[str, str]],
+        graph: Dict[str, FrozenSet[str]]
+    ) -> None:
+        """Store exact mutual counts for (user, candidate) pairs, then trim and commit."""
+        now = datetime.utcnow()
+        upserts, removals = [], []
+        for user_id, candidate_id in pairs:
+            own = graph[user_id]
+            mutual_count = 0 if candidate_id == user_id or candidate_id in own else len(own & graph[candidate_id])
+            if mutual_count:
+                upserts.append({
+                    "user_id": user_id,
+                    "suggested_user_id": candidate_id,
+                    "mutual_count": mutual_count,
+                    "computed_at": now,
+                })
+            else:
+                removals.append((user_id, candidate_id))
+
+        for offset in range(0, len(removals), self.batch_size):
+            await session.execute(
+                delete(FriendSuggestion).where(
+                    tuple_(FriendSuggestion.user_id, FriendSuggestion.suggested_user_id).in_(
+                        removals[offset:offset + self.batch_size]
+                    )
+                )
+            )
+        for offset in range(0, len(upserts), self.batch_size):
+            stmt = insert(FriendSuggestion).values(upserts[offset:offset + self.batch_size])
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[FriendSuggestion.user_id, FriendSuggestion.suggested_user_id],
+                    set_={"mutual_count": stmt.excluded.mutual_count, "computed_at": stmt.excluded.computed_at}
+                )
+            )
+
+        # Keep the top ``per_user`` rows of every touched user
+        touched = sorted({row["user_id"] for row in upserts})
+        for offset in range(0, len(touched), self.batch_size):
+            ranked = (
+                select(
+                    FriendSuggestion.user_id,
+                    FriendSuggestion.suggested_user_id,
+                    func.row_number().over(
+                        partition_by=FriendSuggestion.user_id,
+                        order_by=(desc(FriendSuggestion.mutual_count), FriendSuggestion.suggested_user_id)
+                    ).label("position")
+                )
+                .where(FriendSuggestion.user_id.in_(touched[offset:offset + self.batch_size]))
+                .subquery()
+            )
+            await session.execute(
+                delete(FriendSuggestion).where(
+                    and_(
+                        FriendSuggestion.user_id == ranked.c.user_id,
+                        FriendSuggestion.suggested_user_id == ranked.c.suggested_user_id,
+                        ranked.c.position > self.per_user
+                    )
+                )
+            )
+        await session.commit()
+
+    async def _has_stored(self, session: AsyncSession, user_id: str) -> bool:
+        result = await session.execute(
+            select(exists().where(FriendSuggestion.user_id == user_id))
+        )
+        return bool(result.scalar())
+
+
+_suggestion_service: Optional[FriendSuggestionService] = None
+
+
+def get_friend_suggestion_service() -> FriendSuggestionService:
+    """Get the process-wide friend suggestion service."""
+    global _suggestion_service
+    if _suggestion_service is None:
+        _suggestion_service = FriendSuggestionService(
+            per_user=settings.FRIEND_SUGGESTIONS_PER_USER,
+            batch_size=settings.FRIEND_SUGGESTIONS_BATCH_SIZE,
+            refresh_interval=settings.FRIEND_SUGGESTIONS_REFRESH_SECONDS,
+            sweep_interval=settings.FRIEND_SUGGESTIONS_SWEEP_HOURS * 3600,
+        )
+    return _suggestion_service
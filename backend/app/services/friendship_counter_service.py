@@ -0,0 +1,191 @@
+"""Denormalized friendship counters.
+
+Every friendship mutation computes how the affected row contributes to
+each user's counts before and after the change, and applies the
+difference to ``friendship_counters`` in the same transaction. A single
+``FILTER`` aggregate over ``friendships`` recomputes a user's counts for
+reconciliation and backfills the row of a user who has none yet.
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+from sqlalchemy import and_, false, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from app.models.friendship import Friendship, FriendshipCounter, FriendshipStatus
+
+COUNTER_COLUMNS = (
+    "friends_count",
+    "close_friends_count",
+    "pending_received_count",
+    "pending_sent_count",
+    "blocked_count",
+)
+
+# (requester_id, addressee_id, status, is_close_friend)
+FriendshipState = Tuple[str, str, FriendshipStatus, bool]
+
+
+def friendship_state(friendship: Optional[Friendship]) -> Optional[FriendshipState]:
+    """Snapshot the fields of a friendship that feed the counters."""
+    if friendship is None:
+        return None
+    return (
+        str(friendship.requester_id),
+        str(friendship.addressee_id),
+        FriendshipStatus(friendship.status),
+        bool(friendship.is_close_friend),
+    )
+
+
+def _contributions(state: Optional[FriendshipState]) -> Dict[str, Dict[str, int]]:
+    if state is None:
+        return {}
+    requester_id, addressee_id, status, is_close_friend = state
+    if status == FriendshipStatus.ACCEPTED:
+        counts = {"friends_count": 1, "close_friends_count": int(is_close_friend)}
+        return {requester_id: dict(counts), addressee_id: dict(counts)}
+    if status == FriendshipStatus.PENDING:
+        return {requester_id: {"pending_sent_count": 1}, addressee_id: {"pending_received_count": 1}}
+    if status == FriendshipStatus.BLOCKED:
+        return {requester_id: {"blocked_count": 1}}
+    return {}
+
+
+def counter_deltas(
+    before: Optional[FriendshipState],
+    after: Optional[FriendshipState]
+) -> Dict[str, Dict[str, int]]:
+    """Counter changes caused by a friendship moving from one state to another.
+
+    Args:
+        before: State before the mutation, or None for a new friendship
+        after: State after the mutation, or None for a deleted friendship
+
+    Returns:
+        Non-zero deltas keyed by user id and counter column
+    """
+    deltas: Dict[str, Dict[str, int]] = {}
+    for state, sign in ((before, -1), (after, 1)):
+        for user_id, counts in _contributions(state).items():
+            user_deltas = deltas.setdefault(user_id, {})
+            for column, value in counts.items():
+                user_deltas[column] = user_deltas.get(column, 0) + sign * value
+
+    return {
+        user_id: {column: value for column, value in counts.items() if value}
+        for user_id, counts in deltas.items()
+        if any(counts.values())
+    }
+
+
+async def apply_counter_deltas(session: AsyncSession, deltas: Dict[str, Dict[str, int]]) -> None:
+    """Add counter deltas in the current transaction (caller commits).
+
+    Call after the mutation is applied to the session: it is flushed
+    first, so a user without a counter row gets one computed from the
+    friendships table, change included, rather than from the delta alone.
+    """
+    await session.flush()
+    now = datetime.utcnow()
+    for user_id, counts in deltas.items():
+        values = {column: counts[column] for column in COUNTER_COLUMNS if counts.get(column)}
+        result = await session.execute(
+            update(FriendshipCounter)
+            .where(FriendshipCounter.user_id == user_id)
+            .values(
+                updated_at=now,
+                **{column: getattr(FriendshipCounter, column) + value for column, value in values.items()}
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            continue
+
+        # No counter row yet: backfill it from source data. If a concurrent
+        # transaction inserted it first, its counts cannot include this
+        # uncommitted change, so the delta is added instead.
+        stmt = insert(FriendshipCounter).values(
+            user_id=user_id, updated_at=now, **await compute_counts(session, user_id)
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[FriendshipCounter.user_id],
+            set_={
+                "updated_at": stmt.excluded.updated_at,
+                **{column: getattr(FriendshipCounter, column) + value for column, value in values.items()},
+            }
+        )
+        await session.execute(stmt)
+
+
+async def record_transition(
+    session: AsyncSession,
+    before: Optional[FriendshipState],
+    after: Optional[FriendshipState]
+) -> None:
+    """Apply the counter changes for one friendship mutation, once it is applied to the session."""
+    deltas = counter_deltas(before, after)
+    if deltas:
+        await apply_counter_deltas(session, deltas)
+
+
+async def compute_counts(session: AsyncSession, user_id: str) -> Dict[str, int]:
+    """Compute a user's counts from the friendships table in one query."""
+    is_requester = Friendship.requester_id == user_id
+    is_addressee = Friendship.addressee_id == user_id
+    accepted = Friendship.status == FriendshipStatus.ACCEPTED
+    pending = Friendship.status == FriendshipStatus.PENDING
+
+    row = (await session.execute(
+        select(
+            func.count().filter(accepted).label("friends_count"),
+            func.count().filter(
+                and_(accepted, func.coalesce(Friendship.is_close_friend, false()))
+            ).label("close_friends_count"),
+            func.count().filter(and_(pending, is_addressee)).label("pending_received_count"),
+            func.count().filter(and_(pending, is_requester)).label("pending_sent_count"),
+            func.count().filter(
+                and_(Friendship.status == FriendshipStatus.BLOCKED, is_requester)
+            ).label("blocked_count"),
+        ).where(or_(is_requester, is_addressee))
+    )).one()
+    return {column: getattr(row, column) or 0 for column in COUNTER_COLUMNS}
+
+
+async def reconcile_counters(session: AsyncSession, user_id: str) -> Dict[str, int]:
+    """Recompute a user's counter row from source data and store it (caller commits).
+
+    Returns:
+        The recomputed counts
+    """
+    counts = await compute_counts(session, user_id)
+    stmt = insert(FriendshipCounter).values(user_id=user_id, updated_at=datetime.utcnow(), **counts)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[FriendshipCounter.user_id],
+        set_={column: getattr(stmt.excluded, column) for column in (*COUNTER_COLUMNS, "updated_at")}
+    )
+    await session.execute(stmt)
+    await session.flush()
+    return counts
+
+
+async def get_counts(
+    session: AsyncSession,
+    user_id: str,
+    session_factory: Callable[[], AsyncSession] = AsyncSessionLocal
+) -> Dict[str, int]:
+    """Read a user's friendship counts, reconciling if no counter row exists.
+
+    The missing row is repaired on a separate session, so a read never
+    commits work the caller has pending.
+    """
+    counter = await session.get(FriendshipCounter, user_id)
+    if counter is None:
+        async with session_factory() as repair_session:
+            counts = await reconcile_counters(repair_session, user_id)
+            await repair_session.commit()
+        return counts
+    return {column: getattr(counter, column) for column in COUNTER_COLUMNS}
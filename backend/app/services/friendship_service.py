@@ -8,7 +8,7 @@ import uuid
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func, desc, asc
+from sqlalchemy import select, and_, or_, func, desc, asc, case
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 
@@ -20,6 +20,10 @@ from app.schemas.friendship import (
     FriendshipStats, FriendSuggestion, FriendActivity
 )
 from app.core.websocket import websocket_manager
+from app.services.friend_graph_service import get_friend_graph
+from app.services.friend_suggestion_service import get_friend_suggestion_service
+from app.services.friendship_counter_service import friendship_state, get_counts, record_transition
+from app.utils.pagination import paginate
 
 
 class FriendshipService:
@@ -27,6 +31,8 @@ class FriendshipService:
     
     def __init__(self):
         self.connection_manager = websocket_manager
+        self.friend_graph = get_friend_graph()
+        self.friend_suggestions = get_friend_suggestion_service()
     
     async def send_friend_request(
         self,
@@ -93,10 +99,12 @@ class FriendshipService:
                 )
             elif existing_friendship.status == FriendshipStatus.DECLINED:
                 # Allow sending new request after decline
+                before = friendship_state(existing_friendship)
                 existing_friendship.status = FriendshipStatus.PENDING
                 existing_friendship.requester_id = requester_id
                 existing_friendship.addressee_id = addressee_id
                 existing_friendship.updated_at = datetime.utcnow()
+                await record_transition(session, before, friendship_state(existing_friendship))
                 await session.commit()
                 await session.refresh(existing_friendship)
                 
@@ -115,6 +123,7 @@ class FriendshipService:
         )
         
         session.add(friendship)
+        await record_transition(session, None, friendship_state(friendship))
         await session.commit()
         await session.refresh(friendship)
         
@@ -139,7 +148,7 @@ class FriendshipService:
                     Friendship.addressee_id == user_id,
                     Friendship.status == FriendshipStatus.PENDING
                 )
-            )
+            ).with_for_update()
         )
         friendship = friendship.scalar_one_or_none()
         
@@ -150,10 +159,14 @@ class FriendshipService:
             )
         
         # Accept the request
+        before = friendship_state(friendship)
         friendship.status = FriendshipStatus.ACCEPTED
         friendship.updated_at = datetime.utcnow()
+        await record_transition(session, before, friendship_state(friendship))
         
         await session.commit()
+        self.friend_graph.add_friendship(friendship.requester_id, friendship.addressee_id)
+        self.friend_suggestions.mark_changed(friendship.requester_id, friendship.addressee_id)
         
         # Send acceptance notification
         await self._send_friend_request_accepted_notification(friendship, session)
@@ -174,7 +187,7 @@ class FriendshipService:
                     Friendship.addressee_id == user_id,
                     Friendship.status == FriendshipStatus.PENDING
                 )
-            )
+            ).with_for_update()
         )
         friendship = friendship.scalar_one_or_none()
         
@@ -185,8 +198,10 @@ class FriendshipService:
             )
         
         # Decline the request
+        before = friendship_state(friendship)
         friendship.status = FriendshipStatus.DECLINED
         friendship.updated_at = datetime.utcnow()
+        await record_transition(session, before, friendship_state(friendship))
         
         await session.commit()
         return True
@@ -213,7 +228,7 @@ class FriendshipService:
                     ),
                     Friendship.status == FriendshipStatus.ACCEPTED
                 )
-            )
+            ).with_for_update()
         )
         friendship = friendship.scalar_one_or_none()
         
@@ -224,8 +239,12 @@ class FriendshipService:
             )
         
         # Remove the friendship
+        before = friendship_state(friendship)
         await session.delete(friendship)
+        await record_transition(session, before, None)
         await session.commit()
+        self.friend_graph.remove_friendship(user_id, friend_id)
+        self.friend_suggestions.mark_changed(user_id, friend_id)
         
         return True
     
@@ -234,23 +253,26 @@ class FriendshipService:
         user_id: str,
         session: AsyncSession,
         limit: int = 50,
-        offset: int = 0,
+        cursor: Optional[str] = None,
         close_friends_only: bool = False
     ) -> FriendsList:
-        """Get user's friends list."""
+        """Get user's friends list, alphabetically, one keyset page at a time."""
+        sort_name = func.coalesce(User.display_name, User.username)
+        
         # Build query for friends
         friends_query = (
             select(
                 Friendship,
                 User,
-                func.case(
+                case(
                     (Friendship.requester_id == user_id, Friendship.addressee_id),
                     else_=Friendship.requester_id
-                ).label("friend_id")
+                ).label("friend_id"),
+                sort_name.label("sort_name")
             )
             .join(
                 User,
-                User.id == func.case(
+                User.id == case(
                     (Friendship.requester_id == user_id, Friendship.addressee_id),
                     else_=Friendship.requester_id
                 )
@@ -270,32 +292,31 @@ class FriendshipService:
         if close_friends_only:
             friends_query = friends_query.where(Friendship.is_close_friend == True)
         
-        # Get total count
-        count_query = select(func.count()).select_from(friends_query.subquery())
-        total_count = await session.scalar(count_query) or 0
+        # Totals come from the denormalized counters
+        counts = await get_counts(session, user_id)
+        total_count = counts["close_friends_count" if close_friends_only else "friends_count"]
         
-        # Add pagination and ordering
-        friends_query = (
-            friends_query
-            .order_by(asc(User.display_name))
-            .offset(offset)
-            .limit(limit)
+        page = await paginate(
+            session, friends_query, [sort_name, Friendship.id], limit, cursor,
+            descending=False, key=lambda row: (row.sort_name, row.Friendship.id)
         )
+        friends_data = page.items
         
-        result = await session.execute(friends_query)
-        friends_data = result.all()
+        # Mutual friend counts for the whole page in one batch
+        mutual_counts = await self.friend_graph.mutual_friend_counts(
+            session, user_id, [str(row.friend_id) for row in friends_data]
+        )
         
         # Convert to FriendProfile format
         friends = []
-        for friendship, user, friend_id in friends_data:
-            # Get mutual friends count
-            mutual_count = await self._get_mutual_friends_count(user_id, str(friend_id), session)
+        for friendship, user, friend_id, _ in friends_data:
+            mutual_count = mutual_counts[str(friend_id)]
             
             friend_profile = FriendProfile(
                 user_id=str(user.id),
                 username=user.username,
                 display_name=user.display_name,
-                avatar_url=user.avatar_url,
+                avatar_url=user.profile_picture_url,
                 bio=user.bio,
                 gardening_experience=user.gardening_experience,
                 favorite_plants=user.favorite_plants,
@@ -310,25 +331,12 @@ class FriendshipService:
             )
             friends.append(friend_profile)
         
-        # Get additional counts
-        close_friends_count = await session.scalar(
-            select(func.count(Friendship.id)).where(
-                and_(
-                    or_(
-                        Friendship.requester_id == user_id,
-                        Friendship.addressee_id == user_id
-                    ),
-                    Friendship.status == FriendshipStatus.ACCEPTED,
-                    Friendship.is_close_friend == True
-                )
-            )
-        ) or 0
-        
         return FriendsList(
             friends=friends,
             total_count=total_count,
-            close_friends_count=close_friends_count,
-            online_friends_count=0  # Would need real-time data
+            close_friends_count=counts["close_friends_count"],
+            online_friends_count=0,  # Would need real-time data
+            next_cursor=page.next_cursor
         )
     
     async def get_friend_requests(
@@ -381,7 +389,7 @@ class FriendshipService:
                 updated_at=friendship.updated_at,
                 requester_username=user.username,
                 requester_display_name=user.display_name,
-                requester_avatar_url=user.avatar_url
+                requester_avatar_url=user.profile_picture_url
             )
             pending_requests.append(request)
         
@@ -397,7 +405,7 @@ class FriendshipService:
                 updated_at=friendship.updated_at,
                 addressee_username=user.username,
                 addressee_display_name=user.display_name,
-                addressee_avatar_url=user.avatar_url
+                addressee_avatar_url=user.profile_picture_url
             )
             sent_requests.append(request)
         
@@ -430,7 +438,7 @@ class FriendshipService:
                     ),
                     Friendship.status == FriendshipStatus.ACCEPTED
                 )
-            )
+            ).with_for_update()
         )
         friendship = friendship.scalar_one_or_none()
         
@@ -441,8 +449,10 @@ class FriendshipService:
             )
         
         # Toggle close friend status
+        before = friendship_state(friendship)
         friendship.is_close_friend = not friendship.is_close_friend
         friendship.updated_at = datetime.utcnow()
+        await record_transition(session, before, friendship_state(friendship))
         
         await session.commit()
         return friendship.is_close_friend
@@ -481,17 +491,19 @@ class FriendshipService:
                         Friendship.addressee_id == blocker_id
                     )
                 )
-            )
+            ).with_for_update()
         )
         existing_friendship = existing_friendship.scalar_one_or_none()
         
         if existing_friendship:
             # Update existing relationship to blocked
+            before = friendship_state(existing_friendship)
             existing_friendship.status = FriendshipStatus.BLOCKED
             existing_friendship.requester_id = blocker_id  # Blocker becomes requester
             existing_friendship.addressee_id = blocked_id
             existing_friendship.is_close_friend = False
             existing_friendship.updated_at = datetime.utcnow()
+            await record_transition(session, before, friendship_state(existing_friendship))
         else:
             # Create new blocked relationship
             friendship = Friendship(
@@ -500,8 +512,11 @@ class FriendshipService:
                 status=FriendshipStatus.BLOCKED
             )
             session.add(friendship)
+            await record_transition(session, None, friendship_state(friendship))
         
         await session.commit()
+        self.friend_graph.remove_friendship(blocker_id, blocked_id)
+        self.friend_suggestions.mark_changed(blocker_id, blocked_id)
         return True
     
     async def unblock_user(
@@ -518,7 +533,7 @@ class FriendshipService:
                     Friendship.addressee_id == blocked_id,
                     Friendship.status == FriendshipStatus.BLOCKED
                 )
-            )
+            ).with_for_update()
         )
         friendship = friendship.scalar_one_or_none()
         
@@ -529,7 +544,9 @@ class FriendshipService:
             )
         
         # Remove the block
+        before = friendship_state(friendship)
         await session.delete(friendship)
+        await record_transition(session, before, None)
         await session.commit()
         
         return True
@@ -588,14 +605,62 @@ class FriendshipService:
         limit: int = 10
     ) -> MutualFriends:
         """Get mutual friends between two users."""
-        # This is a complex query - simplified implementation
-        mutual_friends = []  # Would implement actual mutual friends logic
+        graph = await self.friend_graph.get_many(session, [user1_id, user2_id])
+        mutual_ids = graph[str(user1_id)] & graph[str(user2_id)]
+        
+        mutual_friends = []
+        if mutual_ids:
+            # Profiles of the first mutual friends, with user1's friendship details
+            friend_id = case(
+                (Friendship.requester_id == user1_id, Friendship.addressee_id),
+                else_=Friendship.requester_id
+            )
+            result = await session.execute(
+                select(Friendship, User)
+                .join(User, User.id == friend_id)
+                .where(
+                    and_(
+                        or_(
+                            Friendship.requester_id == user1_id,
+                            Friendship.addressee_id == user1_id
+                        ),
+                        Friendship.status == FriendshipStatus.ACCEPTED,
+                        User.id.in_(list(mutual_ids)),
+                        User.is_active == True
+                    )
+                )
+                .order_by(asc(User.display_name))
+                .limit(limit)
+            )
+            rows = result.all()
+            
+            mutual_counts = await self.friend_graph.mutual_friend_counts(
+                session, user1_id, [str(user.id) for _, user in rows]
+            )
+            for friendship, user in rows:
+                mutual_friends.append(FriendProfile(
+                    user_id=str(user.id),
+                    username=user.username,
+                    display_name=user.display_name,
+                    avatar_url=user.profile_picture_url,
+                    bio=user.bio,
+                    gardening_experience=user.gardening_experience,
+                    favorite_plants=user.favorite_plants,
+                    location=user.location,
+                    friendship_id=str(friendship.id),
+                    is_close_friend=friendship.is_close_friend,
+                    friends_since=friendship.created_at,
+                    last_active=user.last_active,
+                    is_online=False,
+                    mutual_friends_count=mutual_counts[str(user.id)],
+                    stories_count=0
+                ))
         
         return MutualFriends(
             user_id=user2_id,
             mutual_friends=mutual_friends,
-            mutual_friends_count=len(mutual_friends),
-            total_friends_count=0  # Would calculate actual count
+            mutual_friends_count=len(mutual_ids),
+            total_friends_count=len(graph[str(user2_id)])
         )
     
     async def get_friendship_stats(
@@ -604,70 +669,15 @@ class FriendshipService:
         session: AsyncSession
     ) -> FriendshipStats:
         """Get friendship statistics for a user."""
-        # Total friends
-        total_friends = await session.scalar(
-            select(func.count(Friendship.id)).where(
-                and_(
-                    or_(
-                        Friendship.requester_id == user_id,
-                        Friendship.addressee_id == user_id
-                    ),
-                    Friendship.status == FriendshipStatus.ACCEPTED
-                )
-            )
-        ) or 0
-        
-        # Close friends
-        close_friends = await session.scalar(
-            select(func.count(Friendship.id)).where(
-                and_(
-                    or_(
-                        Friendship.requester_id == user_id,
-                        Friendship.addressee_id == user_id
-                    ),
-                    Friendship.status == FriendshipStatus.ACCEPTED,
-                    Friendship.is_close_friend == True
-                )
-            )
-        ) or 0
-        
-        # Pending requests received
-        pending_received = await session.scalar(
-            select(func.count(Friendship.id)).where(
-                and_(
-                    Friendship.addressee_id == user_id,
-                    Friendship.status == FriendshipStatus.PENDING
-                )
-            )
-        ) or 0
-        
-        # Pending requests sent
-        pending_sent = await session.scalar(
-            select(func.count(Friendship.id)).where(
-                and_(
-                    Friendship.requester_id == user_id,
-                    Friendship.status == FriendshipStatus.PENDING
-                )
-            )
-        ) or 0
-        
-        # Blocked users
-        blocked_users = await session.scalar(
-            select(func.count(Friendship.id)).where(
-                and_(
-                    Friendship.requester_id == user_id,
-                    Friendship.status == FriendshipStatus.BLOCKED
-                )
-            )
-        ) or 0
+        counts = await get_counts(session, user_id)
         
         return FriendshipStats(
             user_id=user_id,
-            total_friends=total_friends,
-            close_friends=close_friends,
-            pending_requests_received=pending_received,
-            pending_requests_sent=pending_sent,
-            blocked_users=blocked_users
+            total_friends=counts["friends_count"],
+            close_friends=counts["close_friends_count"],
+            pending_requests_received=counts["pending_received_count"],
+            pending_requests_sent=counts["pending_sent_count"],
+            blocked_users=counts["blocked_count"]
         )
     
     async def _get_mutual_friends_count(
@@ -677,8 +687,7 @@ class FriendshipService:
         session: AsyncSession
     ) -> int:
         """Get count of mutual friends between two users."""
-        # Simplified implementation - would need complex query for actual mutual friends
-        return 0
+        return len(await self.friend_graph.mutual_friend_ids(session, user1_id, user2_id))
     
     async def _send_friend_request_notification(
         self,
@@ -696,7 +705,7 @@ class FriendshipService:
                 "requester_id": str(friendship.requester_id),
                 "requester_username": requester.username,
                 "requester_display_name": requester.display_name,
-                "requester_avatar_url": requester.avatar_url,
+                "requester_avatar_url": requester.profile_picture_url,
                 "message": message,
                 "timestamp": friendship.created_at.isoformat()
             }
@@ -721,7 +730,7 @@ class FriendshipService:
                 "accepter_id": str(friendship.addressee_id),
                 "accepter_username": addressee.username,
                 "accepter_display_name": addressee.display_name,
-                "accepter_avatar_url": addressee.avatar_url,
+                "accepter_avatar_url": addressee.profile_picture_url,
                 "timestamp": friendship.updated_at.isoformat()
             }
             
@@ -820,10 +829,12 @@ async def unblock_user(
 
 async def get_friends_list(
     user_id: str,
-    session: AsyncSession
-) -> List[dict]:
+    session: AsyncSession,
+    limit: int = 50,
+    cursor: Optional[str] = None
+) -> FriendsList:
     """Get friends list."""
-    return await friendship_service.get_friends_list(user_id, session)
+    return await friendship_service.get_friends_list(user_id, session, limit, cursor)
 
 
 async def get_pending_requests(
@@ -0,0 +1,65 @@
+"""Full-text search shared by the trade, question and message searches.
+
+Searchable tables carry a generated, weighted ``search_vector`` tsvector
+column (title ``A``, body ``B``) with a GIN index, and trigram GIN indexes
+on their short title columns. ``text_search`` turns user input into a
+``websearch_to_tsquery`` match ranked with ``ts_rank``; when trigram
+columns are given, rows whose title is merely *similar* to the input
+(typos, partial words) also match, ranked below lexeme matches. Both
+predicates are served by their GIN index and combined with a bitmap OR,
+so no search falls back to a sequential scan.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import func, or_
+
+SEARCH_CONFIG = "english"
+
+# Trigram similarity is scaled down so fuzzy-only matches rank after rows
+# that contain the query lexemes.
+FUZZY_RANK_WEIGHT = 0.2
+
+
+@dataclass
+class TextSearch:
+    """Where clause and rank expression for one search query."""
+    condition: Any
+    rank: Any
+
+
+def text_search(
+    query: Optional[str],
+    vector_column: Any,
+    trigram_columns: Sequence[Any] = (),
+    config: str = SEARCH_CONFIG
+) -> Optional[TextSearch]:
+    """Build the match condition and rank for a search query.
+
+    Args:
+        query: Raw user input (websearch syntax: quotes, ``or``, ``-term``)
+        vector_column: Generated tsvector column to match against
+        trigram_columns: Text columns with a trigram index for fuzzy matching
+        config: Text search configuration used by the tsvector column
+
+    Returns:
+        TextSearch for the query, or None when the query is blank
+    """
+    terms = (query or "").strip()
+    if not terms:
+        return None
+
+    ts_query = func.websearch_to_tsquery(config, terms)
+    condition = vector_column.op("@@")(ts_query)
+    rank = func.ts_rank(vector_column, ts_query)
+
+    if trigram_columns:
+        similarity = (
+            func.similarity(trigram_columns[0], terms) if len(trigram_columns) == 1
+            else func.greatest(*(func.similarity(column, terms) for column in trigram_columns))
+        )
+        condition = or_(condition, *(column.op("%")(terms) for column in trigram_columns))
+        rank = rank + similarity * FUZZY_RANK_WEIGHT
+
+    return TextSearch(condition=condition, rank=rank)
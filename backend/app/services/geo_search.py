@@ -0,0 +1,226 @@
+"""Geo search helpers for proximity queries.
+
+Radius searches first restrict rows with a latitude/longitude bounding box
+that the ``(latitude, longitude)`` index can serve, then compute the exact
+great-circle distance only for the rows inside the box. Results can be
+ordered by distance and paged with an opaque ``(distance, id)`` cursor.
+
+``GridIndex`` is an in-memory equivalent (fixed-size lat/lon cells) used by
+tests and benchmarks.
+"""
+
+import base64
+import json
+import math
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import and_, func, or_, tuple_
+
+EARTH_RADIUS_KM = 6371.0
+
+
+@dataclass
+class BoundingBox:
+    """Latitude range plus one or two longitude ranges (two when crossing ±180°)."""
+    min_lat: float
+    max_lat: float
+    lon_ranges: List[Tuple[float, float]]
+
+
+def bounding_box(latitude: float, longitude: float, radius_km: float) -> BoundingBox:
+    """Smallest lat/lon box containing every point within ``radius_km``.
+
+    Args:
+        latitude: Center latitude in degrees
+        longitude: Center longitude in degrees
+        radius_km: Search radius in kilometers
+
+    Returns:
+        Bounding box of the search circle
+    """
+    angular = radius_km / EARTH_RADIUS_KM
+    min_lat = latitude - math.degrees(angular)
+    max_lat = latitude + math.degrees(angular)
+
+    if min_lat <= -90 or max_lat >= 90:
+        # The circle contains a pole: every longitude qualifies
+        return BoundingBox(max(min_lat, -90.0), min(max_lat, 90.0), [(-180.0, 180.0)])
+
+    delta_lon = math.degrees(math.asin(min(math.sin(angular) / math.cos(math.radians(latitude)), 1.0)))
+    min_lon, max_lon = longitude - delta_lon, longitude + delta_lon
+    if min_lon < -180:
+        lon_ranges = [(min_lon + 360, 180.0), (-180.0, max_lon)]
+    elif max_lon > 180:
+        lon_ranges = [(min_lon, 180.0), (-180.0, max_lon - 360)]
+    else:
+        lon_ranges = [(min_lon, max_lon)]
+    return BoundingBox(min_lat, max_lat, lon_ranges)
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometers."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2 +
+        math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(math.sqrt(a), 1.0))
+
+
+def haversine_sql(latitude: float, longitude: float, lat_column: Any, lon_column: Any):
+    """SQL expression for the haversine distance (km) from a point to a row."""
+    a = (
+        func.power(func.sin((func.radians(lat_column) - math.radians(latitude)) / 2), 2) +
+        math.cos(math.radians(latitude)) * func.cos(func.radians(lat_column)) *
+        func.power(func.sin((func.radians(lon_column) - math.radians(longitude)) / 2), 2)
+    )
+    return 2 * EARTH_RADIUS_KM * func.asin(func.least(func.sqrt(a), 1.0))
+
+
+def bounding_box_clause(box: BoundingBox, lat_column: Any, lon_column: Any):
+    """Index-friendly range predicate for a bounding box."""
+    lon_clauses = [lon_column.between(low, high) for low, high in box.lon_ranges]
+    return and_(
+        lat_column.between(box.min_lat, box.max_lat),
+        lon_clauses[0] if len(lon_clauses) == 1 else or_(*lon_clauses)
+    )
+
+
+def within_radius_clause(
+    latitude: float,
+    longitude: float,
+    radius_km: float,
+    lat_column: Any,
+    lon_column: Any
+):
+    """Bounding-box prefilter followed by the exact distance check.
+
+    Returns:
+        Tuple of (where clause, distance expression)
+    """
+    distance = haversine_sql(latitude, longitude, lat_column, lon_column)
+    box = bounding_box(latitude, longitude, radius_km)
+    return and_(bounding_box_clause(box, lat_column, lon_column), distance <= radius_km), distance
+
+
+def after_cursor_clause(distance: Any, id_column: Any, cursor: Optional[str]):
+    """Keyset predicate for rows after a ``(distance, id)`` cursor, or None."""
+    if not cursor:
+        return None
+    last_distance, last_id = decode_cursor(cursor)
+    return tuple_(distance, id_column) > tuple_(last_distance, last_id)
+
+
+def encode_cursor(distance_km: float, row_id: Any) -> str:
+    """Opaque cursor for the last row of a distance-ordered page."""
+    payload = json.dumps([distance_km, str(row_id)]).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[float, str]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        distance_km, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return float(distance_km), str(row_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {str(e)}")
+
+
+class GridIndex:
+    """In-memory grid index over points for radius and nearest-first queries."""
+
+    def __init__(self, cell_degrees: float = 0.5):
+        self.cell_degrees = cell_degrees
+        self._ids = np.array([], dtype=object)
+        self._lats = np.array([], dtype=np.float64)
+        self._lons = np.array([], dtype=np.float64)
+        self._cells = {}
+
+    def build(self, points: Sequence[Tuple[Any, float, float]]) -> "GridIndex":
+        """Index ``(id, latitude, longitude)`` points, replacing any previous data."""
+        ids = np.array([point[0] for point in points], dtype=object)
+        lats = np.array([point[1] for point in points], dtype=np.float64)
+        lons = np.array([point[2] for point in points], dtype=np.float64)
+
+        rows = np.floor((lats + 90) / self.cell_degrees).astype(np.int64)
+        cols = np.floor((lons + 180) / self.cell_degrees).astype(np.int64)
+        keys = rows * 1_000_000 + cols
+        order = np.argsort(keys, kind="stable")
+
+        self._ids, self._lats, self._lons = ids[order], lats[order], lons[order]
+        keys = keys[order]
+        unique_keys, starts = np.unique(keys, return_index=True)
+        ends = np.append(starts[1:], len(keys))
+        self._cells = {
+            (int(key) // 1_000_000, int(key) % 1_000_000): (int(start), int(end))
+            for key, start, end in zip(unique_keys, starts, ends)
+        }
+        return self
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def search(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Tuple[Any, float]], Optional[str]]:
+        """Points within ``radius_km`` ordered by distance.
+
+        Returns:
+            Page of (id, distance_km) pairs and the cursor for the next page
+        """
+        candidates = self._candidate_indexes(bounding_box(latitude, longitude, radius_km))
+        if not len(candidates):
+            return [], None
+
+        distances = _haversine_np(latitude, longitude, self._lats[candidates], self._lons[candidates])
+        ids = self._ids[candidates].astype(str)
+        mask = distances <= radius_km
+        if cursor:
+            last_distance, last_id = decode_cursor(cursor)
+            mask &= (distances > last_distance) | ((distances == last_distance) & (ids > last_id))
+
+        selected = np.flatnonzero(mask)
+        if len(selected) > limit + 1:
+            # Keep everything up to the (limit + 1)-th distance, ties included
+            threshold = np.partition(distances[selected], limit)[limit]
+            selected = selected[distances[selected] <= threshold]
+        selected = selected[np.lexsort((ids[selected], distances[selected]))]
+
+        page = [(self._ids[candidates[i]], float(distances[i])) for i in selected[:limit]]
+        next_cursor = encode_cursor(page[-1][1], page[-1][0]) if len(selected) > limit else None
+        return page, next_cursor
+
+    def _candidate_indexes(self, box: BoundingBox) -> np.ndarray:
+        row_low = int(math.floor((box.min_lat + 90) / self.cell_degrees))
+        row_high = int(math.floor((box.max_lat + 90) / self.cell_degrees))
+        slices = []
+        for lon_low, lon_high in box.lon_ranges:
+            col_low = int(math.floor((lon_low + 180) / self.cell_degrees))
+            col_high = int(math.floor((lon_high + 180) / self.cell_degrees))
+            for row in range(row_low, row_high + 1):
+                for col in range(col_low, col_high + 1):
+                    cell = self._cells.get((row, col))
+                    if cell:
+                        slices.append(np.arange(*cell))
+        return np.concatenate(slices) if slices else np.array([], dtype=np.int64)
+
+
+def _haversine_np(latitude: float, longitude: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    phi1 = math.radians(latitude)
+    phi2 = np.radians(lats)
+    a = (
+        np.sin((phi2 - phi1) / 2) ** 2 +
+        math.cos(phi1) * np.cos(phi2) * np.sin(np.radians(lons - longitude) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(np.sqrt(a), 1.0))
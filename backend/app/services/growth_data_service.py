@@ -0,0 +1,280 @@
+"""
+Async, set-based access to plant growth photo timelines.
+
+The growth analytics services used to load plants, then time-lapse
+sessions per plant, then photos per session — all through a synchronous
+session inside ``async`` handlers. This module loads the photo timelines
+of any number of plants with one query on the async session: photos are
+joined to their plant, a ``count(*) OVER (PARTITION BY plant_id)`` window
+drops plants without enough photos in the database, and rows arrive
+ordered by ``(plant_id, captured_at)`` (served by
+``ix_growth_photos_plant_captured``).
+
+Results are returned as ``GrowthTimelines``: NumPy columns for the
+measurements plus per-plant offsets, so callers can compute per-plant
+metrics with array operations instead of walking ORM objects.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.growth_photo import GrowthPhoto
+from app.models.plant_care_log import PlantCareLog
+from app.models.user_plant import UserPlant
+
+# Above this many plants, filters scan the time window instead of using IN
+MAX_IN_LIST = 1000
+
+
+class GrowthPoint(NamedTuple):
+    """One photo's measurements; missing values are None."""
+    captured_at: datetime
+    height_cm: Optional[float]
+    leaf_count: Optional[int]
+    leaf_area_cm2: Optional[float]
+    health_score: Optional[float]
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+@dataclass
+class GrowthTimelines:
+    """Photo measurements for many plants in columnar form.
+
+    Rows are grouped by plant and sorted by capture time; plant ``i`` owns
+    rows ``offsets[i]:offsets[i + 1]``. Missing measurements are NaN.
+    """
+    plant_ids: List[Any]
+    species_ids: List[Any]
+    user_ids: List[Any]
+    locations: List[Optional[str]]
+    offsets: np.ndarray
+    captured_at: np.ndarray
+    height_cm: np.ndarray
+    leaf_count: np.ndarray
+    leaf_area_cm2: np.ndarray
+    health_score: np.ndarray
+    _index: Dict[str, int] = field(default_factory=dict, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Keyed by string so UUID and str plant ids both resolve
+        self._index = {str(plant_id): i for i, plant_id in enumerate(self.plant_ids)}
+
+    @classmethod
+    def empty(cls) -> "GrowthTimelines":
+        return cls(
+            plant_ids=[], species_ids=[], user_ids=[], locations=[],
+            offsets=np.zeros(1, dtype=np.int64),
+            captured_at=np.array([], dtype="datetime64[us]"),
+            height_cm=np.array([], dtype=float),
+            leaf_count=np.array([], dtype=float),
+            leaf_area_cm2=np.array([], dtype=float),
+            health_score=np.array([], dtype=float)
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Any]) -> "GrowthTimelines":
+        """Build from rows ordered by ``(plant_id, captured_at)``.
+
+        Each row holds ``plant_id, species_id, user_id, location,
+        captured_at, height_cm, leaf_count, leaf_area_cm2, health_score``.
+        """
+        if not rows:
+            return cls.empty()
+
+        (plant_col, species_col, user_col, location_col,
+         captured_col, height_col, leaf_count_col, leaf_area_col, health_col) = zip(*rows)
+
+        starts = [0] + [i for i in range(1, len(rows)) if plant_col[i] != plant_col[i - 1]]
+        return cls(
+            plant_ids=[plant_col[i] for i in starts],
+            species_ids=[species_col[i] for i in starts],
+            user_ids=[user_col[i] for i in starts],
+            locations=[location_col[i] for i in starts],
+            offsets=np.array(starts + [len(rows)], dtype=np.int64),
+            captured_at=np.array(captured_col, dtype="datetime64[us]"),
+            height_cm=np.array(height_col, dtype=float),
+            leaf_count=np.array(leaf_count_col, dtype=float),
+            leaf_area_cm2=np.array(leaf_area_col, dtype=float),
+            health_score=np.array(health_col, dtype=float)
+        )
+
+    def __len__(self) -> int:
+        return len(self.plant_ids)
+
+    def __contains__(self, plant_id: Any) -> bool:
+        return str(plant_id) in self._index
+
+    @property
+    def photo_count(self) -> int:
+        return int(self.offsets[-1])
+
+    def photo_counts(self) -> np.ndarray:
+        """Number of photos per plant."""
+        return np.diff(self.offsets)
+
+    def index_of(self, plant_id: Any) -> Optional[int]:
+        return self._index.get(str(plant_id))
+
+    def rows(self, plant_id: Any) -> slice:
+        """Row slice of a plant's photos (empty if the plant is absent)."""
+        index = self.index_of(plant_id)
+        if index is None:
+            return slice(0, 0)
+        return slice(int(self.offsets[index]), int(self.offsets[index + 1]))
+
+    def points(self, plant_id: Any) -> List[GrowthPoint]:
+        """A plant's photos as records, oldest first."""
+        rows = self.rows(plant_id)
+        return [
+            GrowthPoint(
+                captured_at=captured_at.astype(datetime),
+                height_cm=_optional(height),
+                leaf_count=None if np.isnan(leaf_count) else int(leaf_count),
+                leaf_area_cm2=_optional(leaf_area),
+                health_score=_optional(health)
+            )
+            for captured_at, height, leaf_count, leaf_area, health in zip(
+                self.captured_at[rows], self.height_cm[rows], self.leaf_count[rows],
+                self.leaf_area_cm2[rows], self.health_score[rows]
+            )
+        ]
+
+    def days_since(self, origin: datetime) -> np.ndarray:
+        """Fractional days between ``origin`` and each photo."""
+        return (self.captured_at - np.datetime64(origin, "us")) / np.timedelta64(1, "D")
+
+
+async def fetch_growth_timelines(
+    db: AsyncSession,
+    plant_ids: Optional[Sequence[Any]] = None,
+    species_id: Optional[Any] = None,
+    location: Optional[str] = None,
+    user_id: Optional[Any] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    min_photos: int = 1,
+    active_only: bool = False
+) -> GrowthTimelines:
+    """
+    Load photo timelines for every plant matching the filters in one query.
+
+    Args:
+        db: Database session
+        plant_ids: Restrict to these plants
+        species_id: Restrict to plants of this species
+        location: Case-insensitive substring of the plant location
+        user_id: Restrict to one owner's plants
+        since: Only photos captured at or after this time
+        until: Only photos captured before this time
+        min_photos: Drop plants with fewer matching photos
+        active_only: Skip plants marked inactive
+
+    Returns:
+        GrowthTimelines for the matching plants
+    """
+    conditions = []
+    if plant_ids is not None:
+        if not plant_ids:
+            return GrowthTimelines.empty()
+        conditions.append(GrowthPhoto.plant_id.in_(plant_ids))
+    if species_id is not None:
+        conditions.append(UserPlant.species_id == species_id)
+    if location:
+        conditions.append(UserPlant.location.ilike(f"%{location}%"))
+    if user_id is not None:
+        conditions.append(UserPlant.user_id == user_id)
+    if since is not None:
+        conditions.append(GrowthPhoto.captured_at >= since)
+    if until is not None:
+        conditions.append(GrowthPhoto.captured_at < until)
+    if active_only:
+        conditions.append(UserPlant.is_active.is_(True))
+
+    photos = (
+        select(
+            GrowthPhoto.plant_id,
+            UserPlant.species_id,
+            UserPlant.user_id,
+            UserPlant.location,
+            GrowthPhoto.captured_at,
+            GrowthPhoto.plant_height_cm,
+            GrowthPhoto.leaf_count,
+            GrowthPhoto.leaf_area_cm2,
+            GrowthPhoto.health_score,
+            func.count().over(partition_by=GrowthPhoto.plant_id).label("photo_count")
+        )
+        .join(UserPlant, UserPlant.id == GrowthPhoto.plant_id)
+        .where(*conditions)
+        .subquery()
+    )
+    query = (
+        select(*[column for column in photos.c if column.name != "photo_count"])
+        .where(photos.c.photo_count >= min_photos)
+        .order_by(photos.c.plant_id, photos.c.captured_at)
+    )
+    result = await db.execute(query)
+    return GrowthTimelines.from_rows(result.all())
+
+
+async def fetch_plant_timeline(
+    db: AsyncSession,
+    plant_id: Any,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+) -> GrowthTimelines:
+    """Load one plant's photo timeline (see ``fetch_growth_timelines``)."""
+    return await fetch_growth_timelines(db, plant_ids=[plant_id], since=since, until=until)
+
+
+async def fetch_care_counts(
+    db: AsyncSession,
+    plant_ids: Sequence[Any],
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Count care activities per plant and care type with one grouped query.
+
+    Args:
+        db: Database session
+        plant_ids: Plants to count for; defines the order of the arrays
+        since: Only care performed at or after this time
+        until: Only care performed before this time
+
+    Returns:
+        Dict mapping care type to an array of counts aligned with ``plant_ids``
+    """
+    if not plant_ids:
+        return {}
+
+    query = (
+        select(PlantCareLog.plant_id, PlantCareLog.care_type, func.count())
+        .group_by(PlantCareLog.plant_id, PlantCareLog.care_type)
+    )
+    # Community-wide loads would produce huge IN lists; group the whole
+    # window instead and drop plants that were not asked for
+    if len(plant_ids) <= MAX_IN_LIST:
+        query = query.where(PlantCareLog.plant_id.in_(plant_ids))
+    if since is not None:
+        query = query.where(PlantCareLog.performed_at >= since)
+    if until is not None:
+        query = query.where(PlantCareLog.performed_at < until)
+
+    positions = {str(plant_id): i for i, plant_id in enumerate(plant_ids)}
+    counts: Dict[str, np.ndarray] = {}
+    for plant_id, care_type, count in (await db.execute(query)).all():
+        position = positions.get(str(plant_id))
+        if position is None:
+            continue
+        if care_type not in counts:
+            counts[care_type] = np.zeros(len(plant_ids), dtype=np.int64)
+        counts[care_type][position] = count
+    return counts
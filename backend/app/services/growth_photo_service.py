@@ -15,6 +15,7 @@ from sqlalchemy.orm import Session
 from app.models.growth_photo import GrowthPhoto
 from app.models.user_plant import UserPlant
 from app.schemas.telemetry import GrowthPhotoResponse
+from app.utils.pagination import Page, paginate
 
 
 class GrowthPhotoService:
@@ -56,6 +57,49 @@ class GrowthPhotoService:
         Returns:
             List of growth photos matching the criteria
         """
+        query = self._growth_photos_query(user_id, plant_id, start_date, end_date, is_processed)
+        
+        # Order by capture date (newest first) and apply pagination
+        query = query.order_by(desc(GrowthPhoto.captured_at)).offset(skip).limit(limit)
+        
+        result = await self.db.execute(query)
+        return result.scalars().all()
+    
+    async def get_growth_photos_page(
+        self,
+        user_id: UUID,
+        plant_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        is_processed: Optional[bool] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """Retrieve one keyset page of growth photos, newest first.
+        
+        Takes the same filters as ``get_growth_photos``.
+        
+        Args:
+            limit: Maximum number of records to return
+            cursor: Cursor from the previous page
+            
+        Returns:
+            Page of growth photos
+        """
+        query = self._growth_photos_query(user_id, plant_id, start_date, end_date, is_processed)
+        return await paginate(
+            self.db, query, [GrowthPhoto.captured_at, GrowthPhoto.id], limit, cursor
+        )
+    
+    def _growth_photos_query(
+        self,
+        user_id: UUID,
+        plant_id: Optional[UUID],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        is_processed: Optional[bool],
+    ):
+        """Build the filtered growth photos query."""
         query = select(GrowthPhoto).where(GrowthPhoto.user_id == user_id)
         
         # Apply filters if provided
@@ -71,11 +115,7 @@ class GrowthPhotoService:
         if end_date is not None:
             query = query.where(GrowthPhoto.captured_at <= end_date)
         
-        # Order by capture date (newest first) and apply pagination
-        query = query.order_by(desc(GrowthPhoto.captured_at)).offset(skip).limit(limit)
-        
-        result = await self.db.execute(query)
-        return result.scalars().all()
+        return query
     
     async def get_growth_photo_by_id(self, photo_id: UUID, user_id: UUID) -> Optional[GrowthPhoto]:
         """Retrieve a specific growth photo by ID.
@@ -12,7 +12,7 @@ Focused on predictive modeling and future growth insights.
 
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import numpy as np
 from scipy import stats
 from sklearn.linear_model import LinearRegression
@@ -20,9 +20,8 @@ from sklearn.preprocessing import PolynomialFeatures
 from sklearn.metrics import r2_score
 import json
 
-from app.models.timelapse import TimelapseSession, GrowthMilestone
-from app.models.growth_photo import GrowthPhoto
 from app.models.user_plant import UserPlant
+from app.services.growth_data_service import fetch_plant_timeline
 
 
 class GrowthPredictionService:
@@ -33,7 +32,7 @@ class GrowthPredictionService:
     
     async def predict_growth_trends(
         self,
-        db: Session,
+        db: AsyncSession,
         plant_id: str,
         prediction_days: int = 30,
         model_type: str = "linear"
@@ -50,12 +49,12 @@ class GrowthPredictionService:
         Returns:
             Dictionary containing prediction results
         """
-        plant = db.query(UserPlant).filter(UserPlant.id == plant_id).first()
+        plant = await db.get(UserPlant, plant_id)
         if not plant:
             raise ValueError(f"Plant with id {plant_id} not found")
         
         # Get historical growth data
-        historical_data = self.collect_historical_data(db, plant_id)
+        historical_data = await self.collect_historical_data(db, plant_id)
         
         if len(historical_data) < 5:
             return self._insufficient_prediction_data_response(plant_id, len(historical_data))
@@ -94,7 +93,7 @@ class GrowthPredictionService:
             "prediction_confidence": self.calculate_overall_confidence(model_metrics)
         }
     
-    def collect_historical_data(self, db: Session, plant_id: str) -> List[Dict[str, Any]]:
+    async def collect_historical_data(self, db: AsyncSession, plant_id: str) -> List[Dict[str, Any]]:
         """
         Collect historical growth data for modeling.
         
@@ -105,30 +104,20 @@ class GrowthPredictionService:
         Returns:
             List of historical data points
         """
-        # Get timelapse sessions for the past 90 days
+        # Get growth photos for the past 90 days
         start_date = datetime.utcnow() - timedelta(days=90)
-        sessions = db.query(TimelapseSession).filter(
-            TimelapseSession.plant_id == plant_id,
-            TimelapseSession.created_at >= start_date
-        ).all()
-        
-        historical_data = []
-        for session in sessions:
-            photos = db.query(GrowthPhoto).filter(
-                GrowthPhoto.timelapse_session_id == session.id
-            ).order_by(GrowthPhoto.captured_at).all()
-            
-            for photo in photos:
-                days_since_start = (photo.captured_at - start_date).days
-                historical_data.append({
-                    "days_since_start": days_since_start,
-                    "height_cm": photo.height_cm or 0,
-                    "leaf_count": photo.leaf_count or 0,
-                    "health_score": photo.health_score or 0,
-                    "date": photo.captured_at
-                })
-        
-        return sorted(historical_data, key=lambda x: x["days_since_start"])
+        timeline = await fetch_plant_timeline(db, plant_id, since=start_date)
+        
+        return [
+            {
+                "days_since_start": (point.captured_at - start_date).days,
+                "height_cm": point.height_cm or 0,
+                "leaf_count": point.leaf_count or 0,
+                "health_score": point.health_score or 0,
+                "date": point.captured_at
+            }
+            for point in timeline.points(plant_id)
+        ]
     
     def prepare_modeling_data(self, historical_data: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -0,0 +1,385 @@
+"""Health-prediction inference with persisted models and micro-batching.
+
+``MLPlantHealthService`` used to build unfitted models and refit a scaler
+on every single-row request. This module keeps one fitted model bundle
+per process instead:
+
+- bundles (scaler plus the health classifier and care success regressor)
+  are trained by ``train_health_bundle``, saved as versioned joblib
+  artifacts, and the newest is loaded off the event loop; each process
+  re-reads the ``LATEST`` pointer every ``HEALTH_MODEL_RELOAD_SECONDS`` and
+  loads a new artifact when it changed, so bundles trained by another
+  worker are picked up;
+- concurrent ``predict`` calls are collected for a few milliseconds and
+  scored with one ``predict_proba``/``predict`` call per batch, off the
+  event loop;
+- retraining runs in a separate process and the new bundle replaces the
+  old one with a single reference swap, so in-flight batches finish on the
+  bundle they started with.
+
+Until a bundle has been trained, ``predict`` returns None and callers use
+their heuristics.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import joblib
+import numpy as np
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestClassifier
+from sklearn.metrics import accuracy_score, mean_absolute_error
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Feature order shared by training samples and prediction requests
+MODEL_FEATURES = (
+    "care_frequency",
+    "consistency",
+    "environmental_stress",
+    "species_difficulty",
+    "user_experience",
+)
+MIN_SAMPLES_PER_MODEL = 50
+LATEST_POINTER = "LATEST"
+
+
+@dataclass
+class HealthScores:
+    """Model outputs for one plant; None where the model is not trained."""
+    health_probability: Optional[float]
+    success_rate: Optional[float]
+    model_version: str
+
+
+@dataclass
+class HealthModelBundle:
+    """A fitted scaler and the models trained with it."""
+    version: str
+    scaler: StandardScaler
+    health_classifier: Optional[RandomForestClassifier]
+    success_predictor: Optional[GradientBoostingRegressor]
+    trained_at: datetime
+    performance: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def ready(self) -> bool:
+        return self.health_classifier is not None or self.success_predictor is not None
+
+    def predict(self, X: np.ndarray) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """Health probability and care success rate for each row of ``X``."""
+        scaled = self.scaler.transform(X)
+        health = None
+        if self.health_classifier is not None:
+            classes = list(self.health_classifier.classes_)
+            proba = self.health_classifier.predict_proba(scaled)
+            health = proba[:, classes.index(True)] if True in classes else np.zeros(len(X))
+        success = None
+        if self.success_predictor is not None:
+            success = np.clip(self.success_predictor.predict(scaled), 0.0, 1.0)
+        return health, success
+
+
+def feature_row(values: Dict[str, Any]) -> List[float]:
+    """Model input for a feature dict, defaulting missing features to 0.5."""
+    return [float(values.get(name, 0.5)) for name in MODEL_FEATURES]
+
+
+def _fit_health_classifier(X: np.ndarray, y: np.ndarray) -> Tuple[Optional[RandomForestClassifier], Dict[str, Any]]:
+    if len(y) < MIN_SAMPLES_PER_MODEL or len(set(y.tolist())) < 2:
+        return None, {"status": "insufficient_data", "samples": len(y)}
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    model = RandomForestClassifier(
+        n_estimators=200,
+        max_depth=15,
+        min_samples_split=5,
+        min_samples_leaf=2,
+        random_state=42,
+        class_weight='balanced'
+    )
+    model.fit(X_train, y_train)
+    accuracy = accuracy_score(y_test, model.predict(X_test))
+    return model, {"accuracy": float(accuracy), "samples": len(y)}
+
+
+def _fit_success_predictor(X: np.ndarray, y: np.ndarray) -> Tuple[Optional[GradientBoostingRegressor], Dict[str, Any]]:
+    if len(y) < MIN_SAMPLES_PER_MODEL:
+        return None, {"status": "insufficient_data", "samples": len(y)}
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    model = GradientBoostingRegressor(
+        n_estimators=100,
+        learning_rate=0.15,
+        max_depth=6,
+        random_state=42
+    )
+    model.fit(X_train, y_train)
+    mae = mean_absolute_error(y_test, model.predict(X_test))
+    return model, {"mae": float(mae), "samples": len(y)}
+
+
+def train_health_bundle(training_data: List[Dict[str, Any]], model_dir: str) -> Dict[str, Any]:
+    """Train a bundle from feedback samples and save it as the latest version.
+
+    Runs in a worker process, so it takes and returns plain data.
+
+    Args:
+        training_data: Samples with ``features``, ``feedback``, ``success``
+            and ``interaction_type``
+        model_dir: Directory holding the versioned artifacts
+
+    Returns:
+        Version, artifact path and per-model performance
+    """
+    health = [s for s in training_data if s["interaction_type"] == "health_prediction"]
+    care = [s for s in training_data if s["interaction_type"] == "care_optimization"]
+
+    scaler = StandardScaler().fit(np.array([feature_row(s["features"]) for s in training_data], dtype=float))
+
+    def scaled(samples):
+        if not samples:
+            return np.empty((0, len(MODEL_FEATURES)))
+        return scaler.transform(np.array([feature_row(s["features"]) for s in samples], dtype=float))
+
+    health_classifier, health_performance = _fit_health_classifier(
+        scaled(health), np.array([bool(s["success"]) for s in health])
+    )
+    success_predictor, care_performance = _fit_success_predictor(
+        scaled(care), np.array([s["feedback"] / 5.0 for s in care], dtype=float)
+    )
+
+    trained_at = datetime.utcnow()
+    bundle = HealthModelBundle(
+        version=trained_at.strftime("%Y%m%d%H%M%S"),
+        scaler=scaler,
+        health_classifier=health_classifier,
+        success_predictor=success_predictor,
+        trained_at=trained_at,
+        performance={
+            "health_model": health_performance,
+            "care_model": care_performance,
+            "training_samples": len(training_data),
+            "trained_at": trained_at.isoformat()
+        }
+    )
+    path = save_bundle(bundle, model_dir)
+    return {"version": bundle.version, "path": path, "performance": bundle.performance}
+
+
+def save_bundle(bundle: HealthModelBundle, model_dir: str) -> str:
+    """Write a bundle artifact and point ``LATEST`` at it (both atomically)."""
+    os.makedirs(model_dir, exist_ok=True)
+    path = os.path.join(model_dir, f"health_models_v{bundle.version}.joblib")
+    joblib.dump(bundle, f"{path}.tmp")
+    os.replace(f"{path}.tmp", path)
+
+    pointer = os.path.join(model_dir, LATEST_POINTER)
+    with open(f"{pointer}.tmp", "w") as f:
+        f.write(os.path.basename(path))
+    os.replace(f"{pointer}.tmp", pointer)
+    return path
+
+
+def read_latest_pointer(model_dir: str) -> Optional[str]:
+    """File name of the artifact ``LATEST`` points at, or None if nothing was trained yet."""
+    pointer = os.path.join(model_dir, LATEST_POINTER)
+    if not os.path.exists(pointer):
+        return None
+    with open(pointer) as f:
+        return f.read().strip() or None
+
+
+def load_latest_bundle(model_dir: str) -> Optional[HealthModelBundle]:
+    """Load the bundle ``LATEST`` points at, or None if nothing was trained yet."""
+    artifact = read_latest_pointer(model_dir)
+    return joblib.load(os.path.join(model_dir, artifact)) if artifact else None
+
+
+class HealthInferenceEngine:
+    """Process-wide model holder with micro-batched prediction."""
+
+    def __init__(
+        self,
+        model_dir: str,
+        max_batch: int = 64,
+        max_wait_ms: float = 5.0,
+        reload_interval_seconds: float = 60.0,
+    ):
+        self.model_dir = model_dir
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.reload_interval = reload_interval_seconds
+        self.bundle: Optional[HealthModelBundle] = None
+        # Artifact file the current bundle came from, and when to re-read LATEST
+        self._artifact: Optional[str] = None
+        self._next_check = 0.0
+        self._reload_lock = asyncio.Lock()
+        self._reload_task: Optional[asyncio.Task] = None
+        self._pending: List[Tuple[List[float], asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+        self._train_lock = asyncio.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.requests = 0
+        self.batches = 0
+        self.batch_seconds = 0.0
+
+    def load(self) -> Optional[HealthModelBundle]:
+        """Return the current bundle without blocking.
+
+        When a pointer check is due and an event loop is running, the check
+        (and any artifact load) is scheduled in the background.
+        """
+        if self._reload_due() and (self._reload_task is None or self._reload_task.done()):
+            try:
+                self._reload_task = asyncio.get_running_loop().create_task(self.refresh())
+            except RuntimeError:
+                pass
+        return self.bundle
+
+    async def refresh(self) -> Optional[HealthModelBundle]:
+        """Re-read ``LATEST`` if a check is due and load a changed artifact off the event loop."""
+        if not self._reload_due():
+            return self.bundle
+        async with self._reload_lock:
+            if self._reload_due():
+                self._next_check = time.monotonic() + self.reload_interval
+                try:
+                    await asyncio.to_thread(self._load_if_changed)
+                except Exception as e:
+                    logger.error(f"Error loading health models from {self.model_dir}: {str(e)}")
+        return self.bundle
+
+    def _reload_due(self) -> bool:
+        return time.monotonic() >= self._next_check
+
+    def _load_if_changed(self) -> None:
+        artifact = read_latest_pointer(self.model_dir)
+        if artifact is None or artifact == self._artifact:
+            return
+        bundle = joblib.load(os.path.join(self.model_dir, artifact))
+        self.bundle, self._artifact = bundle, artifact
+        logger.info(f"Loaded health models version {bundle.version}")
+
+    async def predict(self, features: Sequence[float]) -> Optional[HealthScores]:
+        """Score one plant, batched with concurrent callers.
+
+        Args:
+            features: Values in ``MODEL_FEATURES`` order
+
+        Returns:
+            HealthScores, or None when no trained models are available
+        """
+        bundle = await self.refresh()
+        if bundle is None or not bundle.ready:
+            return None
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((list(features), future))
+        self.requests += 1
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    async def retrain(self, training_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Train new models in a worker process and swap them in."""
+        async with self._train_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._pool, train_health_bundle, training_data, self.model_dir)
+            bundle = await asyncio.to_thread(joblib.load, result["path"])
+            self.bundle, self._artifact = bundle, os.path.basename(result["path"])
+            logger.info(f"Swapped in health models version {bundle.version}")
+            return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "model_version": self.bundle.version if self.bundle else None,
+            "requests": self.requests,
+            "batches": self.batches,
+            "avg_batch_size": self.requests / self.batches if self.batches else 0.0,
+            "avg_batch_ms": self.batch_seconds / self.batches * 1000 if self.batches else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        if self._reload_task is not None:
+            self._reload_task.cancel()
+            self._reload_task = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run_batch(batch, self.bundle))
+            self._batch_tasks.add(task)
+            task.add_done_callback(lambda done: self._batch_done(done, batch))
+
+    def _batch_done(self, task: asyncio.Task, batch: List[Tuple[List[float], asyncio.Future]]) -> None:
+        """Forget the finished batch task and fail its callers if it died unexpectedly."""
+        self._batch_tasks.discard(task)
+        if task.cancelled():
+            for _, future in batch:
+                future.cancel()
+            return
+        error = task.exception()
+        if error is not None:
+            logger.error(f"Health inference batch of {len(batch)} failed: {str(error)}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+
+    async def _run_batch(self, batch: List[Tuple[List[float], asyncio.Future]], bundle: HealthModelBundle) -> None:
+        start = time.perf_counter()
+        try:
+            X = np.array([features for features, _ in batch], dtype=float)
+            health, success = await asyncio.to_thread(bundle.predict, X)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self.batches += 1
+            self.batch_seconds += time.perf_counter() - start
+
+        for i, (_, future) in enumerate(batch):
+            if not future.done():
+                future.set_result(HealthScores(
+                    health_probability=float(health[i]) if health is not None else None,
+                    success_rate=float(success[i]) if success is not None else None,
+                    model_version=bundle.version
+                ))
+
+
+_health_inference_engine: Optional[HealthInferenceEngine] = None
+
+
+def get_health_inference_engine() -> HealthInferenceEngine:
+    """Get the process-wide health inference engine."""
+    global _health_inference_engine
+    if _health_inference_engine is None:
+        _health_inference_engine = HealthInferenceEngine(
+            model_dir=settings.HEALTH_MODEL_DIR,
+            max_batch=settings.HEALTH_INFERENCE_MAX_BATCH,
+            max_wait_ms=settings.HEALTH_INFERENCE_MAX_WAIT_MS,
+            reload_interval_seconds=settings.HEALTH_MODEL_RELOAD_SECONDS
+        )
+    return _health_inference_engine
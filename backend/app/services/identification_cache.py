@@ -0,0 +1,213 @@
+"""Perceptual-hash cache for AI plant identification results.
+
+Uploads are reduced to a 64-bit difference hash (dHash) of the
+orientation-corrected, grayscale, downscaled image, so re-encoded,
+resized or lightly recompressed copies of a photo hash to the same or a
+nearby value. Cached results are found with a multi-index hash table
+over Hamming distance and reused when the nearest entry is within the
+configured distance, was produced by the current vision model and has
+not expired.
+
+Changing the model version clears the cache. Expired entries are skipped
+on lookup and evicted, with the oldest live entries, when the cache
+outgrows its size limit.
+"""
+
+import io
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from PIL import Image, ImageOps
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def dhash(image_data: bytes, hash_size: int = 8) -> int:
+    """Difference hash of an image: one bit per horizontally adjacent pixel pair.
+
+    Args:
+        image_data: Encoded image bytes
+        hash_size: Hash is ``hash_size * hash_size`` bits
+
+    Returns:
+        Hash as an integer
+    """
+    with Image.open(io.BytesIO(image_data)) as image:
+        image = ImageOps.exif_transpose(image).convert("L")
+        image = image.resize((hash_size + 1, hash_size), Image.LANCZOS)
+        pixels = list(image.getdata())
+
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class MultiIndexHash:
+    """Hamming-radius index over 64-bit hashes (multi-index hashing).
+
+    Hashes are split into ``max_distance + 1`` disjoint bit blocks, each
+    with its own exact-match table. Two hashes within ``max_distance`` bits
+    of each other must agree on at least one whole block (pigeonhole), so
+    a query only verifies the entries sharing one of its blocks instead of
+    scanning every cached hash.
+    """
+
+    def __init__(self, max_distance: int, bits: int = 64):
+        self.max_distance = max_distance
+        count = max_distance + 1
+        sizes = [bits // count + (1 if i < bits % count else 0) for i in range(count)]
+        self._blocks: List[Tuple[int, int]] = []  # (shift, mask)
+        shift = bits
+        for size in sizes:
+            shift -= size
+            self._blocks.append((shift, (1 << size) - 1))
+        self._tables: List[Dict[int, Set[int]]] = [{} for _ in self._blocks]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, value: int) -> None:
+        for (shift, mask), table in zip(self._blocks, self._tables):
+            table.setdefault((value >> shift) & mask, set()).add(value)
+        self._size += 1
+
+    def remove(self, value: int) -> None:
+        for (shift, mask), table in zip(self._blocks, self._tables):
+            block = (value >> shift) & mask
+            bucket = table.get(block)
+            if bucket is not None:
+                bucket.discard(value)
+                if not bucket:
+                    del table[block]
+        self._size -= 1
+
+    def search(self, value: int) -> List[Tuple[int, int]]:
+        """All ``(distance, hash)`` pairs within ``max_distance``, nearest first."""
+        candidates: Set[int] = set()
+        for (shift, mask), table in zip(self._blocks, self._tables):
+            candidates.update(table.get((value >> shift) & mask, ()))
+        found = []
+        for candidate in candidates:
+            distance = hamming(value, candidate)
+            if distance <= self.max_distance:
+                found.append((distance, candidate))
+        found.sort()
+        return found
+
+
+@dataclass
+class CachedIdentification:
+    """A stored identification result."""
+    image_hash: int
+    result: Dict[str, Any]
+    model_version: str
+    expires_at: float
+
+
+class IdentificationCache:
+    """Near-duplicate image cache for vision model results."""
+
+    def __init__(
+        self,
+        model_version: str,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_distance: int = 6,
+        max_entries: int = 50000
+    ):
+        self.model_version = model_version
+        self.ttl_seconds = ttl_seconds
+        self.max_distance = max_distance
+        self.max_entries = max_entries
+        self._entries: Dict[int, CachedIdentification] = {}
+        self._index = MultiIndexHash(max_distance)
+        self.lookups = 0
+        self.hits = 0
+        self.external_calls = 0
+
+    def get(self, image_hash: int) -> Optional[Dict[str, Any]]:
+        """Cached result for the nearest matching image, or None."""
+        self.lookups += 1
+        now = time.time()
+        for distance, key in self._index.search(image_hash):
+            entry = self._entries.get(key)
+            if entry and entry.expires_at > now and entry.model_version == self.model_version:
+                self.hits += 1
+                return {**entry.result, "cache_distance": distance}
+        return None
+
+    def put(self, image_hash: int, result: Dict[str, Any]) -> None:
+        """Store the result of an external identification call."""
+        self.external_calls += 1
+        if image_hash not in self._entries:
+            self._index.add(image_hash)
+        self._entries[image_hash] = CachedIdentification(
+            image_hash=image_hash,
+            result=result,
+            model_version=self.model_version,
+            expires_at=time.time() + self.ttl_seconds
+        )
+        if len(self._entries) > self.max_entries:
+            self._evict()
+
+    def set_model_version(self, model_version: str) -> None:
+        """Switch to a new model version, discarding results from the old one."""
+        if model_version != self.model_version:
+            logger.info(f"Identification model changed to {model_version}, clearing cache")
+            self.model_version = model_version
+            self.clear()
+
+    def clear(self) -> None:
+        self._entries = {}
+        self._index = MultiIndexHash(self.max_distance)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "model_version": self.model_version,
+            "entries": len(self._entries),
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.lookups if self.lookups else 0.0,
+            "external_calls": self.external_calls,
+            "external_calls_avoided": self.hits,
+        }
+
+    def _evict(self) -> None:
+        # Drop expired entries, then the oldest until a tenth of the room is free
+        now = time.time()
+        by_expiry = sorted(self._entries.values(), key=lambda entry: entry.expires_at)
+        keep = int(self.max_entries * 0.9)
+        for position, entry in enumerate(by_expiry):
+            if entry.expires_at > now and len(by_expiry) - position <= keep:
+                break
+            del self._entries[entry.image_hash]
+            self._index.remove(entry.image_hash)
+
+
+_identification_cache: Optional[IdentificationCache] = None
+
+
+def get_identification_cache() -> IdentificationCache:
+    """Get the process-wide identification cache for the configured model."""
+    global _identification_cache
+    if _identification_cache is None:
+        _identification_cache = IdentificationCache(
+            model_version=settings.PLANT_ID_VISION_MODEL,
+            ttl_seconds=settings.PLANT_ID_CACHE_TTL_SECONDS,
+            max_distance=settings.PLANT_ID_CACHE_MAX_DISTANCE,
+            max_entries=settings.PLANT_ID_CACHE_MAX_ENTRIES
+        )
+    else:
+        _identification_cache.set_model_version(settings.PLANT_ID_VISION_MODEL)
+    return _identification_cache
@@ -17,6 +17,7 @@ from sqlalchemy.orm import Session
 from app.models.light_reading import LightReading, LightSource
 from app.models.user import User
 from app.schemas.telemetry import LightReadingCreate, LightReadingResponse
+from app.utils.pagination import Page, paginate
 
 
 class LightReadingService:
@@ -63,6 +64,63 @@ class LightReadingService:
         Returns:
             List of light readings matching the filters
         """
+        query = self._light_readings_query(
+            user_id, plant_id, source, location_name, start_date, end_date, min_lux, max_lux
+        )
+        
+        # Order by measured_at descending (newest first)
+        query = query.order_by(desc(LightReading.measured_at))
+        
+        # Apply pagination
+        query = query.offset(skip).limit(limit)
+        
+        # Execute query
+        result = await self.db.execute(query)
+        return result.scalars().all()
+    
+    async def get_light_readings_page(
+        self,
+        user_id: UUID,
+        plant_id: Optional[UUID] = None,
+        source: Optional[LightSource] = None,
+        location_name: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        min_lux: Optional[float] = None,
+        max_lux: Optional[float] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """Get one keyset page of light readings, newest first.
+        
+        Takes the same filters as ``get_light_readings``.
+        
+        Args:
+            limit: Maximum number of records to return
+            cursor: Cursor from the previous page
+            
+        Returns:
+            Page of light readings
+        """
+        query = self._light_readings_query(
+            user_id, plant_id, source, location_name, start_date, end_date, min_lux, max_lux
+        )
+        return await paginate(
+            self.db, query, [LightReading.measured_at, LightReading.id], limit, cursor
+        )
+    
+    def _light_readings_query(
+        self,
+        user_id: UUID,
+        plant_id: Optional[UUID],
+        source: Optional[LightSource],
+        location_name: Optional[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        min_lux: Optional[float],
+        max_lux: Optional[float],
+    ):
+        """Build the filtered light readings query."""
         # Build query with filters
         query = select(LightReading).filter(LightReading.user_id == user_id)
         
@@ -88,15 +146,7 @@ class LightReadingService:
         if max_lux is not None:
             query = query.filter(LightReading.lux_value <= max_lux)
         
-        # Order by measured_at descending (newest first)
-        query = query.order_by(desc(LightReading.measured_at))
-        
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
-        
-        # Execute query
-        result = await self.db.execute(query)
-        return result.scalars().all()
+        return query
     
     async def get_light_reading_by_id(
         self,
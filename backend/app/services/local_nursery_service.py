@@ -4,7 +4,7 @@ This module provides business logic for local nursery and garden center operatio
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 import math
 
@@ -14,6 +14,7 @@ from sqlalchemy.orm import selectinload
 
 from app.models.local_nursery import LocalNursery, NurseryReview, NurseryEvent, UserNurseryFavorite
 from app.schemas.nursery import LocalNurseryCreate, NurseryReviewCreate, NurserySearchFilters
+from app.services.geo_search import after_cursor_clause, encode_cursor, within_radius_clause
 
 
 class LocalNurseryService:
@@ -26,22 +27,72 @@ class LocalNurseryService:
         limit: int = 20,
         offset: int = 0
     ) -> List[LocalNursery]:
-        """Search for nurseries based on location and filters."""
-        query = select(LocalNursery).where(LocalNursery.is_active == True)
+        """Search for nurseries based on location and filters.
         
-        # Add location-based filtering if coordinates provided
-        if filters.latitude and filters.longitude:
-            # Use Haversine formula for distance calculation
-            distance_query = func.acos(
-                func.cos(func.radians(filters.latitude)) *
-                func.cos(func.radians(LocalNursery.latitude)) *
-                func.cos(func.radians(LocalNursery.longitude) - func.radians(filters.longitude)) +
-                func.sin(func.radians(filters.latitude)) *
-                func.sin(func.radians(LocalNursery.latitude))
-            ) * 6371  # Earth's radius in km
+        With coordinates, results are limited to the search radius and
+        ordered nearest first; otherwise they are ordered by rating.
+        """
+        query = LocalNurseryService._apply_nursery_filters(
+            select(LocalNursery).where(LocalNursery.is_active == True), filters
+        )
+        
+        if filters.latitude is not None and filters.longitude is not None:
+            within_radius, distance = within_radius_clause(
+                filters.latitude, filters.longitude, filters.radius_km,
+                LocalNursery.latitude, LocalNursery.longitude
+            )
+            query = query.where(within_radius).order_by(distance, LocalNursery.id)
+        else:
+            query = query.order_by(desc(LocalNursery.average_rating))
+        
+        result = await db.execute(query.limit(limit).offset(offset))
+        return result.scalars().all()
+    
+    @staticmethod
+    async def search_nearby_nurseries(
+        db: AsyncSession,
+        filters: NurserySearchFilters,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Tuple[LocalNursery, float]], Optional[str]]:
+        """Nearest-first nursery search with cursor pagination.
+        
+        Args:
+            db: Database session
+            filters: Search filters; latitude and longitude are required
+            limit: Page size
+            cursor: Cursor returned with the previous page
             
-            query = query.where(distance_query <= filters.radius_km)
+        Returns:
+            Page of (nursery, distance_km) pairs and the cursor for the next page
+        """
+        within_radius, distance = within_radius_clause(
+            filters.latitude, filters.longitude, filters.radius_km,
+            LocalNursery.latitude, LocalNursery.longitude
+        )
+        query = LocalNurseryService._apply_nursery_filters(
+            select(LocalNursery, distance.label("distance_km")).where(
+                and_(LocalNursery.is_active == True, within_radius)
+            ),
+            filters
+        )
         
+        after_cursor = after_cursor_clause(distance, LocalNursery.id, cursor)
+        if after_cursor is not None:
+            query = query.where(after_cursor)
+        
+        result = await db.execute(query.order_by(distance, LocalNursery.id).limit(limit + 1))
+        rows = [(nursery, float(distance_km)) for nursery, distance_km in result.all()]
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1][1], rows[-1][0].id)
+        return rows, next_cursor
+    
+    @staticmethod
+    def _apply_nursery_filters(query, filters: NurserySearchFilters):
+        """Apply business type and specialty filters to a nursery query."""
         # Add business type filter
         if filters.business_type:
             query = query.where(LocalNursery.business_type == filters.business_type)
@@ -56,11 +107,7 @@ class LocalNurseryService:
                 )
             query = query.where(or_(*specialty_conditions))
         
-        # Order by rating and distance
-        query = query.order_by(desc(LocalNursery.average_rating))
-        
-        result = await db.execute(query.limit(limit).offset(offset))
-        return result.scalars().all()
+        return query
     
     @staticmethod
     async def get_nursery_by_id(
@@ -251,16 +298,12 @@ class LocalNurseryService:
         )
         
         # Add location filter if coordinates provided
-        if latitude and longitude:
-            distance_query = func.acos(
-                func.cos(func.radians(latitude)) *
-                func.cos(func.radians(LocalNursery.latitude)) *
-                func.cos(func.radians(LocalNursery.longitude) - func.radians(longitude)) +
-                func.sin(func.radians(latitude)) *
-                func.sin(func.radians(LocalNursery.latitude))
-            ) * 6371
-            
-            query = query.where(distance_query <= radius_km)
+        if latitude is not None and longitude is not None:
+            within_radius, _ = within_radius_clause(
+                latitude, longitude, radius_km,
+                LocalNursery.latitude, LocalNursery.longitude
+            )
+            query = query.where(within_radius)
         
         # Add event type filter
         if event_type:
@@ -15,12 +15,13 @@ from fastapi import HTTPException, status
 from app.models.message import Message
 from app.schemas.message import MessageType, MessageStatus
 from app.models.user import User
-from app.models.friendship import Friendship, FriendshipStatus
 from app.schemas.message import (
     MessageCreate, MessageUpdate, MessageRead, MessageThread,
     MessageSearch, MessageAnalytics
 )
 from app.core.websocket import websocket_manager
+from app.services.friend_graph_service import get_friend_graph
+from app.services.full_text_search import text_search
 
 
 class MessageService:
@@ -28,6 +29,7 @@ class MessageService:
     
     def __init__(self):
         self.connection_manager = websocket_manager
+        self.friend_graph = get_friend_graph()
     
     async def send_message(
         self,
@@ -365,27 +367,25 @@ class MessageService:
         self,
         user_id: str,
         search_params: MessageSearch,
-        session: AsyncSession
+        session: AsyncSession,
+        limit: int = 50,
+        offset: int = 0
     ) -> List[MessageRead]:
-        """Search messages for a user."""
+        """Search messages for a user, most relevant first."""
         query = select(Message).where(
             and_(
                 or_(
                     Message.sender_id == user_id,
                     Message.recipient_id == user_id
                 ),
-                Message.status != MessageStatus.DELETED
+                Message.is_deleted == False
             )
         )
         
         # Add search filters
-        if search_params.query:
-            query = query.where(
-                or_(
-                    Message.content.ilike(f"%{search_params.query}%"),
-                    Message.caption.ilike(f"%{search_params.query}%")
-                )
-            )
+        search = text_search(search_params.query, Message.search_vector)
+        if search:
+            query = query.where(search.condition)
         
         if search_params.content_type:
             query = query.where(Message.content_type == search_params.content_type)
@@ -393,14 +393,18 @@ class MessageService:
         if search_params.sender_id:
             query = query.where(Message.sender_id == search_params.sender_id)
         
-        if search_params.start_date:
-            query = query.where(Message.created_at >= search_params.start_date)
+        if search_params.date_from:
+            query = query.where(Message.created_at >= search_params.date_from)
         
-        if search_params.end_date:
-            query = query.where(Message.created_at <= search_params.end_date)
+        if search_params.date_to:
+            query = query.where(Message.created_at <= search_params.date_to)
         
         # Add ordering and pagination
-        query = query.order_by(desc(Message.created_at)).limit(50)
+        if search:
+            query = query.order_by(desc(search.rank), desc(Message.created_at))
+        else:
+            query = query.order_by(desc(Message.created_at))
+        query = query.offset(offset).limit(limit)
         
         result = await session.execute(query)
         messages = result.scalars().all()
@@ -492,24 +496,7 @@ class MessageService:
         session: AsyncSession
     ) -> bool:
         """Check if two users are friends."""
-        result = await session.execute(
-            select(Friendship).where(
-                and_(
-                    or_(
-                        and_(
-                            Friendship.requester_id == user1_id,
-                            Friendship.addressee_id == user2_id
-                        ),
-                        and_(
-                            Friendship.requester_id == user2_id,
-                            Friendship.addressee_id == user1_id
-                        )
-                    ),
-                    Friendship.status == FriendshipStatus.ACCEPTED
-                )
-            )
-        )
-        return result.scalar_one_or_none() is not None
+        return await self.friend_graph.are_friends(session, user1_id, user2_id)
     
     async def _validate_message_content(self, message_data: MessageCreate):
         """Validate message content based on type."""
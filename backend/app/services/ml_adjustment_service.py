@@ -17,10 +17,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.models.user_plant import UserPlant
-from app.models.plant_care_log import PlantCareLog
 from app.models.growth_photo import GrowthPhoto
 from app.models.seasonal_ai import EnvironmentalDataCache
 from app.services.rule_engine_service import CareRecommendation
+from app.services.plant_feature_store import get_plant_feature_store
 
 
 class MLModelType(Enum):
@@ -52,6 +52,71 @@ class CareOutcome:
     growth_change: Optional[float] = None
 
 
+@dataclass
+class CareOutcomes:
+    """Care outcomes in columnar form, sorted by time."""
+    care_types: np.ndarray
+    performed_at: np.ndarray
+    outcome_scores: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.performed_at)
+    
+    def of_type(self, care_type: str) -> "CareOutcomes":
+        """Outcomes of one care type."""
+        mask = self.care_types == care_type
+        return CareOutcomes(
+            care_types=self.care_types[mask],
+            performed_at=self.performed_at[mask],
+            outcome_scores=self.outcome_scores[mask]
+        )
+
+
+def score_care_outcomes(
+    care_times: np.ndarray,
+    photo_times: np.ndarray,
+    photo_scores: np.ndarray,
+    before: timedelta = timedelta(days=3),
+    after: timedelta = timedelta(days=7)
+) -> np.ndarray:
+    """Score every care action by the health change around it.
+    
+    Compares the mean photo health score in ``[t - before, t]`` with the
+    mean in ``[t, t + after]`` for each care time ``t``. Window bounds are
+    found with ``searchsorted`` on the sorted photo times and window sums
+    come from a prefix sum, so all actions are scored in one pass.
+    
+    Args:
+        care_times: Care action times (datetime64)
+        photo_times: Photo capture times (datetime64), sorted
+        photo_scores: Health score of each photo
+        before: Window before the action
+        after: Window after the action
+        
+    Returns:
+        Outcome score per care action between 0.0 and 1.0 (0.5 when either
+        window has no photos)
+    """
+    if not len(care_times):
+        return np.array([], dtype=float)
+    
+    prefix = np.concatenate(([0.0], np.cumsum(photo_scores, dtype=float)))
+    before_start = np.searchsorted(photo_times, care_times - np.timedelta64(before), side="left")
+    at_start = np.searchsorted(photo_times, care_times, side="left")
+    at_end = np.searchsorted(photo_times, care_times, side="right")
+    after_end = np.searchsorted(photo_times, care_times + np.timedelta64(after), side="right")
+    
+    before_count = at_end - before_start
+    after_count = after_end - at_start
+    has_data = (before_count > 0) & (after_count > 0)
+    
+    with np.errstate(invalid="ignore", divide="ignore"):
+        before_mean = (prefix[at_end] - prefix[before_start]) / before_count
+        after_mean = (prefix[after_end] - prefix[at_start]) / after_count
+    improvement = np.clip((after_mean - before_mean + 1.0) / 2.0, 0.0, 1.0)
+    return np.where(has_data, improvement, 0.5)
+
+
 class MLAdjustmentService:
     """Service for ML-based care plan adjustments."""
     
@@ -127,7 +192,7 @@ class MLAdjustmentService:
         self,
         plant_id: UUID,
         days_back: int = 90
-    ) -> List[CareOutcome]:
+    ) -> CareOutcomes:
         """Get historical care outcomes for ML training.
         
         Args:
@@ -135,26 +200,18 @@ class MLAdjustmentService:
             days_back: Number of days to look back
             
         Returns:
-            List of care outcomes
+            Care outcomes, oldest first
         """
         cutoff_date = datetime.utcnow() - timedelta(days=days_back)
         
-        # Get care logs
-        care_result = await self.db.execute(
-            select(PlantCareLog)
-            .where(
-                and_(
-                    PlantCareLog.plant_id == plant_id,
-                    PlantCareLog.performed_at >= cutoff_date
-                )
-            )
-            .order_by(PlantCareLog.performed_at)
+        # Get care events from the plant's cached, windowed history
+        care_events = await get_plant_feature_store().care_events(
+            self.db, plant_id, cutoff_date
         )
-        care_logs = care_result.scalars().all()
         
         # Get health scores from photos
         health_result = await self.db.execute(
-            select(GrowthPhoto)
+            select(GrowthPhoto.captured_at, GrowthPhoto.health_score)
             .where(
                 and_(
                     GrowthPhoto.plant_id == plant_id,
@@ -164,87 +221,27 @@ class MLAdjustmentService:
             )
             .order_by(GrowthPhoto.captured_at)
         )
-        health_photos = health_result.scalars().all()
+        health_photos = health_result.all()
         
         # Correlate care actions with outcomes
-        outcomes = []
-        
-        for care_log in care_logs:
-            # Find health score changes after this care action
-            outcome_score = self._calculate_care_outcome(
-                care_log, health_photos
-            )
-            
-            outcome = CareOutcome(
-                care_type=care_log.care_type,
-                performed_at=care_log.performed_at,
-                parameters=self._extract_care_parameters(care_log),
-                outcome_score=outcome_score
-            )
-            outcomes.append(outcome)
-        
-        return outcomes
-    
-    def _calculate_care_outcome(
-        self,
-        care_log: PlantCareLog,
-        health_photos: List[GrowthPhoto]
-    ) -> float:
-        """Calculate outcome score for a care action.
-        
-        Args:
-            care_log: Care log entry
-            health_photos: List of health photos
-            
-        Returns:
-            Outcome score between 0.0 and 1.0
-        """
-        # Find health scores before and after care action
-        care_time = care_log.performed_at
-        
-        # Get health score within 3 days before care
-        before_photos = [
-            p for p in health_photos
-            if care_time - timedelta(days=3) <= p.captured_at <= care_time
-        ]
-        
-        # Get health score within 7 days after care
-        after_photos = [
-            p for p in health_photos
-            if care_time <= p.captured_at <= care_time + timedelta(days=7)
-        ]
-        
-        if not before_photos or not after_photos:
-            return 0.5  # Neutral score if no data
-        
-        before_score = np.mean([p.health_score for p in before_photos])
-        after_score = np.mean([p.health_score for p in after_photos])
-        
-        # Calculate improvement (0.0 to 1.0)
-        improvement = (after_score - before_score + 1.0) / 2.0
-        return max(0.0, min(1.0, improvement))
-    
-    def _extract_care_parameters(self, care_log: PlantCareLog) -> Dict[str, Any]:
-        """Extract care parameters from care log.
+        care_times = np.array([performed_at for _, performed_at in care_events], dtype="datetime64[us]")
+        outcome_scores = score_care_outcomes(
+            care_times,
+            np.array([captured_at for captured_at, _ in health_photos], dtype="datetime64[us]"),
+            np.array([health_score for _, health_score in health_photos], dtype=float)
+        )
         
-        Args:
-            care_log: Care log entry
-            
-        Returns:
-            Dictionary of care parameters
-        """
-        # This would extract structured parameters from notes or metadata
-        # For now, return basic structure
-        return {
-            "care_type": care_log.care_type,
-            "notes": care_log.notes
-        }
+        return CareOutcomes(
+            care_types=np.array([care_type for care_type, _ in care_events], dtype=object),
+            performed_at=care_times,
+            outcome_scores=outcome_scores
+        )
     
     async def _generate_predictions(
         self,
         plant_id: UUID,
         context: Dict[str, Any],
-        care_history: List[CareOutcome]
+        care_history: CareOutcomes
     ) -> Dict[MLModelType, MLPrediction]:
         """Generate ML predictions for different care aspects.
         
@@ -288,7 +285,7 @@ class MLAdjustmentService:
     def _predict_watering_frequency(
         self,
         context: Dict[str, Any],
-        care_history: List[CareOutcome]
+        care_history: CareOutcomes
     ) -> MLPrediction:
         """Predict optimal watering frequency.
         
@@ -300,12 +297,9 @@ class MLAdjustmentService:
             ML prediction for watering frequency
         """
         # Simple heuristic-based prediction (would be ML model in production)
-        watering_outcomes = [
-            outcome for outcome in care_history
-            if outcome.care_type == "watering"
-        ]
+        watering_outcomes = care_history.of_type("watering")
         
-        if not watering_outcomes:
+        if not len(watering_outcomes):
             return MLPrediction(
                 model_type=MLModelType.WATERING_FREQUENCY,
                 prediction={"interval_days": 7, "amount_ml": 200},
@@ -315,22 +309,11 @@ class MLAdjustmentService:
             )
         
         # Analyze successful watering patterns
-        successful_waterings = [
-            outcome for outcome in watering_outcomes
-            if outcome.outcome_score > 0.6
-        ]
-        
-        if successful_waterings:
-            # Calculate average interval between successful waterings
-            intervals = []
-            for i in range(1, len(successful_waterings)):
-                interval = (successful_waterings[i].performed_at - 
-                           successful_waterings[i-1].performed_at).days
-                intervals.append(interval)
-            
-            optimal_interval = int(np.mean(intervals)) if intervals else 7
-        else:
-            optimal_interval = 7
+        successful_times = watering_outcomes.performed_at[watering_outcomes.outcome_scores > 0.6]
+        
+        # Average whole-day interval between successful waterings
+        intervals = np.diff(successful_times) // np.timedelta64(1, "D")
+        optimal_interval = int(np.mean(intervals)) if len(intervals) else 7
         
         # Adjust based on environmental conditions
         env_data = context.get("environmental_data", {})
@@ -350,11 +333,11 @@ class MLAdjustmentService:
                 "interval_days": optimal_interval,
                 "amount_ml": 200,
                 "confidence_factors": {
-                    "historical_success": len(successful_waterings),
+                    "historical_success": len(successful_times),
                     "environmental_adjustment": True
                 }
             },
-            confidence=min(0.9, 0.5 + len(successful_waterings) * 0.1),
+            confidence=min(0.9, 0.5 + len(successful_times) * 0.1),
             feature_importance={
                 "historical_patterns": 0.6,
                 "temperature": 0.2,
@@ -366,7 +349,7 @@ class MLAdjustmentService:
     def _predict_fertilizer_timing(
         self,
         context: Dict[str, Any],
-        care_history: List[CareOutcome]
+        care_history: CareOutcomes
     ) -> MLPrediction:
         """Predict optimal fertilizer timing.
         
@@ -413,7 +396,7 @@ class MLAdjustmentService:
     def _predict_light_optimization(
         self,
         context: Dict[str, Any],
-        care_history: List[CareOutcome]
+        care_history: CareOutcomes
     ) -> MLPrediction:
         """Predict optimal light conditions.
         
@@ -463,7 +446,7 @@ class MLAdjustmentService:
     def _predict_health_trend(
         self,
         context: Dict[str, Any],
-        care_history: List[CareOutcome]
+        care_history: CareOutcomes
     ) -> MLPrediction:
         """Predict plant health trend.
         
@@ -479,9 +462,7 @@ class MLAdjustmentService:
         current_score = health_indicators.get("current_health_score", 0.7)
         
         # Predict future health based on current trend and care quality
-        care_quality = np.mean([
-            outcome.outcome_score for outcome in care_history
-        ]) if care_history else 0.5
+        care_quality = float(np.mean(care_history.outcome_scores)) if len(care_history) else 0.5
         
         # Simple trend prediction
         if current_trend == "improving" and care_quality > 0.6:
@@ -516,7 +497,7 @@ class MLAdjustmentService:
         recommendation: CareRecommendation,
         predictions: Dict[MLModelType, MLPrediction],
         context: Dict[str, Any],
-        care_history: List[CareOutcome]
+        care_history: CareOutcomes
     ) -> Tuple[CareRecommendation, Optional[Dict[str, Any]]]:
         """Adjust a single recommendation based on ML predictions.
         
@@ -6,50 +6,35 @@ advanced plant health prediction and care optimization.
 
 import logging
 import numpy as np
-import joblib
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingRegressor
-from sklearn.preprocessing import StandardScaler, LabelEncoder
-from sklearn.metrics import accuracy_score, mean_absolute_error
-from sklearn.model_selection import train_test_split
 import pandas as pd
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, desc, func
 from sqlalchemy.orm import selectinload
 
-from app.models.user import User
 from app.models.user_plant import UserPlant
-from app.models.plant_care_log import PlantCareLog
-from app.models.plant_species import PlantSpecies
 from app.models.rag_models import RAGInteraction, UserPreferenceEmbedding
 from app.services.rag_service import RAGService, UserContext, PlantData
 from app.services.embedding_service import EmbeddingService
+from app.services.plant_feature_store import (
+    PlantFeatureStore,
+    PlantHealthFeatures,
+    get_plant_feature_store
+)
+from app.services.health_inference import (
+    HealthInferenceEngine,
+    feature_row,
+    get_health_inference_engine
+)
 from app.services.seasonal_ai_service import SeasonalAIService
 from app.services.timelapse_service import TimelapseService
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class PlantHealthFeatures:
-    """Feature vector for plant health prediction."""
-    care_frequency_score: float
-    consistency_score: float
-    environmental_stress_score: float
-    species_difficulty_score: float
-    user_experience_score: float
-    seasonal_factor: float
-    days_since_last_care: int
-    care_type_diversity: float
-    historical_success_rate: float
-    plant_age_months: int
-    recent_activity_trend: float
-    care_pattern_deviation: float
-
-
 @dataclass
 class HealthPrediction:
     """ML-enhanced health prediction with confidence intervals."""
@@ -78,72 +63,46 @@ class CareOptimization:
 class MLPlantHealthService:
     """ML-Enhanced Plant Health Prediction and Care Optimization Service."""
     
+    # Risk and care-type models are not trained yet; predictions use heuristics
+    risk_predictor = None
+    care_optimizer = None
+    
     def __init__(self, rag_service: RAGService, embedding_service: EmbeddingService):
         self.rag_service = rag_service
         self.embedding_service = embedding_service
         self.seasonal_ai_service = None  # Will be injected to avoid circular imports
         self.timelapse_service = None  # Will be injected to avoid circular imports
         
-        # ML Models for health prediction
-        self.health_classifier = None
-        self.risk_predictor = None
-        self.care_optimizer = None
-        self.success_predictor = None
-        
-        # Feature processors
-        self.feature_scaler = StandardScaler()
-        self.risk_encoder = LabelEncoder()
-        
-        # Model metadata
-        self.model_version = "1.0"
-        self.last_trained = None
-        self.model_performance = {}
-        
-        # Initialize models
-        self._initialize_ml_models()
+        # Fitted models are shared by every instance and reloaded when a new artifact is published
+        self.inference: HealthInferenceEngine = get_health_inference_engine()
+        self.feature_store: PlantFeatureStore = get_plant_feature_store()
         
         logger.info("ML Plant Health Service initialized")
     
-    def _initialize_ml_models(self):
-        """Initialize ML models (load from saved models or create new ones)."""
-        try:
-            # Health Classification Model
-            self.health_classifier = RandomForestClassifier(
-                n_estimators=200,
-                max_depth=15,
-                min_samples_split=5,
-                min_samples_leaf=2,
-                random_state=42,
-                class_weight='balanced'
-            )
-            
-            # Risk Prediction Model
-            self.risk_predictor = GradientBoostingRegressor(
-                n_estimators=150,
-                learning_rate=0.1,
-                max_depth=8,
-                random_state=42
-            )
-            
-            # Care Optimization Model
-            self.care_optimizer = RandomForestClassifier(
-                n_estimators=100,
-                max_depth=12,
-                random_state=42
-            )
-            
-            # Success Prediction Model
-            self.success_predictor = GradientBoostingRegressor(
-                n_estimators=100,
-                learning_rate=0.15,
-                max_depth=6,
-                random_state=42
-            )
-            
-            logger.info(f"ML models initialized (version {self.model_version})")
-            
-        except Exception as e:
-            logger.error(f"Error initializing ML models: {str(e)}")
+    @property
+    def model_version(self) -> str:
+        bundle = self.inference.load()
+        return bundle.version if bundle else "heuristic"
+    
+    @property
+    def last_trained(self) -> Optional[datetime]:
+        bundle = self.inference.load()
+        return bundle.trained_at if bundle else None
+    
+    @property
+    def model_performance(self) -> Dict[str, Any]:
+        bundle = self.inference.load()
+        return bundle.performance if bundle else {}
+    
+    @property
+    def health_classifier(self):
+        bundle = self.inference.load()
+        return bundle.health_classifier if bundle else None
+    
+    @property
+    def success_predictor(self):
+        bundle = self.inference.load()
+        return bundle.success_predictor if bundle else None
     
     async def predict_plant_health_ml(
         self,
@@ -159,18 +118,22 @@ class MLPlantHealthService:
                 return await self._fallback_health_prediction(db, plant_id)
             
             # Convert features to ML format
-            feature_vector = self._features_to_vector(features)
-            scaled_features = self.feature_scaler.fit_transform([feature_vector])
+            feature_vector = np.array(self._features_to_vector(features))
             
-            # Predict health score
-            health_score = self._predict_health_score(scaled_features[0])
+            # Predict health score (trained model when available, batched
+            # with concurrent requests; heuristic otherwise)
+            scores = await self.inference.predict(self._model_features(features))
+            if scores and scores.health_probability is not None:
+                health_score = scores.health_probability
+            else:
+                health_score = self._predict_health_score(feature_vector)
             
             # Predict risk level with confidence
-            risk_level, risk_confidence = self._predict_risk_level(scaled_features[0])
+            risk_level, risk_confidence = self._predict_risk_level(feature_vector, health_score)
             
             # Identify specific risk factors using ML
             risk_factors = await self._identify_ml_risk_factors(
-                db, plant_id, features, scaled_features[0]
+                db, plant_id, features, feature_vector
             )
             
             # Generate prevention actions using RAG + ML
@@ -180,7 +143,7 @@ class MLPlantHealthService:
             
             # Predict specific issues that might occur
             predicted_issues = await self._predict_specific_issues(
-                db, plant_id, features, scaled_features[0]
+                db, plant_id, features, feature_vector
             )
             
             # Calculate optimal care window
@@ -236,9 +199,13 @@ class MLPlantHealthService:
             )
             
             # Predict success rate with this optimization
-            success_rate = self._predict_care_success_rate(
-                features, optimal_watering, fertilizing_schedule
-            )
+            scores = await self.inference.predict(self._model_features(features))
+            if scores and scores.success_rate is not None:
+                success_rate = scores.success_rate
+            else:
+                success_rate = self._predict_care_success_rate(
+                    features, optimal_watering, fertilizing_schedule
+                )
             
             # Generate personalized adjustments
             adjustments = await self._generate_personalized_adjustments(
@@ -294,32 +261,14 @@ class MLPlantHealthService:
                 logger.warning("Insufficient data for model training")
                 return {"status": "insufficient_data", "samples": len(training_data)}
             
-            # Prepare training datasets
-            health_data, care_data = self._prepare_training_data(training_data)
-            
-            # Train health prediction model
-            health_performance = self._train_health_model(health_data)
-            
-            # Train care optimization model
-            care_performance = self._train_care_model(care_data)
-            
-            # Update model metadata
-            self.last_trained = datetime.utcnow()
-            self.model_performance = {
-                "health_model": health_performance,
-                "care_model": care_performance,
-                "training_samples": len(training_data),
-                "trained_at": self.last_trained.isoformat()
-            }
-            
-            # Save models
-            await self._save_models()
+            # Train, save and swap in new models off the request path
+            result = await self.inference.retrain(training_data)
             
             logger.info(f"Models retrained with {len(training_data)} samples")
             return {
                 "status": "success",
-                "performance": self.model_performance,
-                "model_version": self.model_version
+                "performance": result["performance"],
+                "model_version": result["version"]
             }
             
         except Exception as e:
@@ -343,6 +292,16 @@ class MLPlantHealthService:
             features.care_pattern_deviation
         ]
     
+    def _model_features(self, features: PlantHealthFeatures) -> List[float]:
+        """Inputs of the trained models (see ``health_inference.MODEL_FEATURES``)."""
+        return feature_row({
+            "care_frequency": features.care_frequency_score,
+            "consistency": features.consistency_score,
+            "environmental_stress": features.environmental_stress_score,
+            "species_difficulty": features.species_difficulty_score,
+            "user_experience": features.user_experience_score
+        })
+    
     def _predict_health_score(self, feature_vector: np.ndarray) -> float:
         """Predict health score using trained model."""
         try:
@@ -363,10 +322,15 @@ class MLPlantHealthService:
             logger.error(f"Error predicting health score: {str(e)}")
             return 0.7  # Safe default
     
-    def _predict_risk_level(self, feature_vector: np.ndarray) -> Tuple[str, float]:
+    def _predict_risk_level(
+        self,
+        feature_vector: np.ndarray,
+        health_score: Optional[float] = None
+    ) -> Tuple[str, float]:
         """Predict risk level with confidence."""
         try:
-            health_score = self._predict_health_score(feature_vector)
+            if health_score is None:
+                health_score = self._predict_health_score(feature_vector)
             
             # Calculate risk factors
             risk_indicators = []
@@ -404,77 +368,9 @@ class MLPlantHealthService:
         plant_id: str,
         user_id: str
     ) -> Optional[PlantHealthFeatures]:
-        """Extract comprehensive features for health prediction."""
+        """Extract health features from the plant's windowed, cached care history."""
         try:
-            # Get plant and care history
-            plant_stmt = select(UserPlant).options(
-                selectinload(UserPlant.species),
-                selectinload(UserPlant.care_logs)
-            ).where(UserPlant.id == plant_id)
-            
-            plant_result = await db.execute(plant_stmt)
-            plant = plant_result.scalar_one_or_none()
-            
-            if not plant:
-                return None
-            
-            # Get user information
-            user_stmt = select(User).where(User.id == user_id)
-            user_result = await db.execute(user_stmt)
-            user = user_result.scalar_one_or_none()
-            
-            # Calculate care frequency score
-            care_logs = plant.care_logs or []
-            care_frequency = self._calculate_care_frequency_score(care_logs)
-            
-            # Calculate consistency score
-            consistency = self._calculate_consistency_score_ml(care_logs)
-            
-            # Calculate environmental stress
-            env_stress = self._calculate_environmental_stress(plant, care_logs)
-            
-            # Species difficulty score
-            species_difficulty = self._get_species_difficulty_score(plant.species)
-            
-            # User experience score
-            user_experience = self._calculate_user_experience_score(user, care_logs)
-            
-            # Seasonal factor
-            seasonal_factor = self._calculate_seasonal_factor()
-            
-            # Days since last care
-            days_since_care = self._days_since_last_care(care_logs)
-            
-            # Care type diversity
-            care_diversity = self._calculate_care_diversity(care_logs)
-            
-            # Historical success rate
-            success_rate = await self._calculate_historical_success_rate(db, user_id)
-            
-            # Plant age in months
-            plant_age = self._calculate_plant_age_months(plant)
-            
-            # Recent activity trend
-            activity_trend = self._calculate_activity_trend(care_logs)
-            
-            # Care pattern deviation
-            pattern_deviation = self._calculate_pattern_deviation(care_logs)
-            
-            return PlantHealthFeatures(
-                care_frequency_score=care_frequency,
-                consistency_score=consistency,
-                environmental_stress_score=env_stress,
-                species_difficulty_score=species_difficulty,
-                user_experience_score=user_experience,
-                seasonal_factor=seasonal_factor,
-                days_since_last_care=days_since_care,
-                care_type_diversity=care_diversity,
-                historical_success_rate=success_rate,
-                plant_age_months=plant_age,
-                recent_activity_trend=activity_trend,
-                care_pattern_deviation=pattern_deviation
-            )
-            
+            return await self.feature_store.get_features(db, plant_id)
         except Exception as e:
             logger.error(f"Error extracting health features: {str(e)}")
             return None
@@ -512,229 +408,6 @@ class MLPlantHealthService:
             predicted_growth_trajectory={}
         )
     
-    # Additional helper methods for ML feature extraction and training
-    def _calculate_care_frequency_score(self, care_logs: List[PlantCareLog]) -> float:
-        """Calculate care frequency score from logs."""
-        if not care_logs:
-            return 0.5
-        
-        watering_logs = [log for log in care_logs if log.care_type == "watering"]
-        if len(watering_logs) < 2:
-            return 0.5
-        
-        # Calculate average days between waterings
-        intervals = []
-        for i in range(1, len(watering_logs)):
-            interval = (watering_logs[i-1].care_date - watering_logs[i].care_date).days
-            intervals.append(abs(interval))
-        
-        avg_interval = np.mean(intervals) if intervals else 7
-        # Score based on optimal range (5-10 days for most plants)
-        if 5 <= avg_interval <= 10:
-            return 1.0
-        elif 3 <= avg_interval <= 14:
-            return 0.8
-        elif avg_interval <= 21:
-            return 0.6
-        else:
-            return 0.3
-    
-    def _calculate_consistency_score_ml(self, care_logs: List[PlantCareLog]) -> float:
-        """Calculate consistency score using ML-enhanced analysis."""
-        if not care_logs:
-            return 0.5
-        
-        # Group by care type and calculate consistency for each
-        care_types = {}
-        for log in care_logs:
-            if log.care_type not in care_types:
-                care_types[log.care_type] = []
-            care_types[log.care_type].append(log.care_date)
-        
-        consistency_scores = []
-        for care_type, dates in care_types.items():
-            if len(dates) < 3:
-                continue
-            
-            # Calculate coefficient of variation for intervals
-            dates.sort(reverse=True)
-            intervals = [(dates[i-1] - dates[i]).days for i in range(1, len(dates))]
-            
-            if intervals and np.std(intervals) > 0:
-                cv = np.std(intervals) / np.mean(intervals)
-                consistency = max(0, 1 - cv)  # Lower CV = higher consistency
-            else:
-                consistency = 1.0
-            
-            consistency_scores.append(consistency)
-        
-        return np.mean(consistency_scores) if consistency_scores else 0.5
-    
-    def _calculate_environmental_stress(self, plant: UserPlant, care_logs: List[PlantCareLog]) -> float:
-        """Calculate environmental stress score."""
-        stress_factors = []
-        
-        # Seasonal stress (simplified)
-        current_month = datetime.now().month
-        if current_month in [12, 1, 2]:  # Winter
-            stress_factors.append(0.3)
-        elif current_month in [6, 7, 8]:  # Summer
-            stress_factors.append(0.2)
-        else:
-            stress_factors.append(0.1)
-        
-        # Care inconsistency stress
-        consistency = self._calculate_consistency_score_ml(care_logs)
-        stress_factors.append(1 - consistency)
-        
-        return np.mean(stress_factors)
-    
-    def _get_species_difficulty_score(self, species: PlantSpecies) -> float:
-        """Get species difficulty score."""
-        if not species:
-            return 0.5
-        
-        # Map care level to difficulty score
-        care_level_mapping = {
-            "easy": 0.2,
-            "medium": 0.5,
-            "hard": 0.8,
-            "expert": 0.9
-        }
-        
-        return care_level_mapping.get(species.care_level, 0.5)
-    
-    def _calculate_user_experience_score(self, user: User, care_logs: List[PlantCareLog]) -> float:
-        """Calculate user experience score."""
-        if not user:
-            return 0.5
-        
-        # Base experience from profile
-        experience_mapping = {
-            "beginner": 0.3,
-            "intermediate": 0.6,
-            "advanced": 0.8,
-            "expert": 0.9
-        }
-        
-        base_score = experience_mapping.get(user.gardening_experience, 0.5)
-        
-        # Adjust based on care log volume (more logs = more experience)
-        if care_logs:
-            log_bonus = min(0.2, len(care_logs) / 100)  # Up to 0.2 bonus
-            return min(1.0, base_score + log_bonus)
-        
-        return base_score
-    
-    def _calculate_seasonal_factor(self) -> float:
-        """Calculate seasonal growth/stress factor."""
-        month = datetime.now().month
-        
-        # Growth seasons
-        if month in [3, 4, 5, 6]:  # Spring/early summer - high growth
-            return 0.9
-        elif month in [7, 8, 9]:  # Late summer/early fall - moderate growth
-            return 0.7
-        elif month in [10, 11]:  # Late fall - slowing growth
-            return 0.4
-        else:  # Winter - dormant period
-            return 0.2
-    
-    def _days_since_last_care(self, care_logs: List[PlantCareLog]) -> int:
-        """Calculate days since last care activity."""
-        if not care_logs:
-            return 30  # Assume long time if no logs
-        
-        latest_log = max(care_logs, key=lambda x: x.care_date)
-        return (datetime.now() - latest_log.care_date).days
-    
-    def _calculate_care_diversity(self, care_logs: List[PlantCareLog]) -> float:
-        """Calculate diversity of care types."""
-        if not care_logs:
-            return 0.0
-        
-        care_types = set(log.care_type for log in care_logs)
-        # Normalize by expected care types (watering, fertilizing, pruning, repotting)
-        return len(care_types) / 4.0
-    
-    async def _calculate_historical_success_rate(self, db: AsyncSession, user_id: str) -> float:
-        """Calculate user's historical plant care success rate."""
-        try:
-            # Get user's plant outcomes
-            plants_stmt = select(UserPlant).where(UserPlant.user_id == user_id)
-            plants_result = await db.execute(plants_stmt)
-            plants = plants_result.scalars().all()
-            
-            if not plants:
-                return 0.7  # Default for new users
-            
-            # Simple success metric: plants with recent care logs are "successful"
-            recent_date = datetime.now() - timedelta(days=30)
-            successful_plants = 0
-            
-            for plant in plants:
-                if plant.care_logs:
-                    recent_logs = [log for log in plant.care_logs if log.care_date >= recent_date]
-                    if recent_logs:
-                        successful_plants += 1
-            
-            return successful_plants / len(plants) if plants else 0.7
-            
-        except Exception as e:
-            logger.error(f"Error calculating success rate: {str(e)}")
-            return 0.7
-    
-    def _calculate_plant_age_months(self, plant: UserPlant) -> int:
-        """Calculate plant age in months."""
-        if not plant.acquired_date:
-            return 6  # Assume 6 months if unknown
-        
-        return max(1, (datetime.now() - plant.acquired_date).days // 30)
-    
-    def _calculate_activity_trend(self, care_logs: List[PlantCareLog]) -> float:
-        """Calculate recent activity trend."""
-        if not care_logs:
-            return 0.0
-        
-        # Compare last 2 weeks vs previous 2 weeks
-        now = datetime.now()
-        recent_cutoff = now - timedelta(days=14)
-        older_cutoff = now - timedelta(days=28)
-        
-        recent_logs = [log for log in care_logs if log.care_date >= recent_cutoff]
-        older_logs = [log for log in care_logs if older_cutoff <= log.care_date < recent_cutoff]
-        
-        recent_count = len(recent_logs)
-        older_count = len(older_logs)
-        
-        if older_count == 0:
-            return 1.0 if recent_count > 0 else 0.0
-        
-        return min(2.0, recent_count / older_count)
-    
-    def _calculate_pattern_deviation(self, care_logs: List[PlantCareLog]) -> float:
-        """Calculate deviation from expected care patterns."""
-        if not care_logs:
-            return 0.5
-        
-        # Calculate expected vs actual intervals
-        watering_logs = [log for log in care_logs if log.care_type == "watering"]
-        if len(watering_logs) < 3:
-            return 0.3
-        
-        watering_logs.sort(key=lambda x: x.care_date, reverse=True)
-        intervals = []
-        for i in range(1, len(watering_logs)):
-            interval = (watering_logs[i-1].care_date - watering_logs[i].care_date).days
-            intervals.append(interval)
-        
-        if not intervals:
-            return 0.3
-        
-        # Calculate coefficient of variation (higher = more deviation)
-        cv = np.std(intervals) / np.mean(intervals) if np.mean(intervals) > 0 else 1
-        return min(1.0, cv)
-    
     async def _identify_ml_risk_factors(
         self,
         db: AsyncSession,
@@ -1031,129 +704,6 @@ class MLPlantHealthService:
             logger.error(f"Error collecting training data: {str(e)}")
             return []
     
-    def _prepare_training_data(
-        self, 
-        training_data: List[Dict[str, Any]]
-    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
-        """Prepare training data for ML models."""
-        health_data = []
-        care_data = []
-        
-        for sample in training_data:
-            if sample["interaction_type"] == "health_prediction":
-                health_data.append(sample)
-            elif sample["interaction_type"] == "care_optimization":
-                care_data.append(sample)
-        
-        return health_data, care_data
-    
-    def _train_health_model(self, health_data: List[Dict[str, Any]]) -> Dict[str, float]:
-        """Train health prediction model."""
-        if len(health_data) < 50:
-            return {"status": "insufficient_data"}
-        
-        try:
-            # Prepare features and labels
-            X = []
-            y = []
-            
-            for sample in health_data:
-                features = sample["features"]
-                feature_vector = [
-                    features.get("care_frequency", 0.5),
-                    features.get("consistency", 0.5),
-                    features.get("environmental_stress", 0.5),
-                    features.get("species_difficulty", 0.5),
-                    features.get("user_experience", 0.5)
-                ]
-                X.append(feature_vector)
-                y.append(sample["success"])
-            
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=0.2, random_state=42
-            )
-            
-            # Train model
-            self.health_classifier.fit(X_train, y_train)
-            
-            # Evaluate
-            y_pred = self.health_classifier.predict(X_test)
-            accuracy = accuracy_score(y_test, y_pred)
-            
-            return {"accuracy": accuracy, "samples": len(health_data)}
-            
-        except Exception as e:
-            logger.error(f"Error training health model: {str(e)}")
-            return {"status": "error", "message": str(e)}
-    
-    def _train_care_model(self, care_data: List[Dict[str, Any]]) -> Dict[str, float]:
-        """Train care optimization model."""
-        if len(care_data) < 50:
-            return {"status": "insufficient_data"}
-        
-        try:
-            # Prepare features and labels (similar to health model)
-            X = []
-            y = []
-            
-            for sample in care_data:
-                features = sample["features"]
-                feature_vector = [
-                    features.get("care_frequency", 0.5),
-                    features.get("consistency", 0.5),
-                    features.get("environmental_stress", 0.5),
-                    features.get("species_difficulty", 0.5),
-                    features.get("user_experience", 0.5)
-                ]
-                X.append(feature_vector)
-                y.append(sample["feedback"] / 5.0)  # Normalize to 0-1
-            
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=0.2, random_state=42
-            )
-            
-            # Train model
-            self.success_predictor.fit(X_train, y_train)
-            
-            # Evaluate
-            y_pred = self.success_predictor.predict(X_test)
-            mae = mean_absolute_error(y_test, y_pred)
-            
-            return {"mae": mae, "samples": len(care_data)}
-            
-        except Exception as e:
-            logger.error(f"Error training care model: {str(e)}")
-            return {"status": "error", "message": str(e)}
-    
-    async def _save_models(self) -> None:
-        """Save trained models to disk."""
-        try:
-            model_dir = "backend/models"
-            import os
-            os.makedirs(model_dir, exist_ok=True)
-            
-            # Save models
-            joblib.dump(self.health_classifier, f"{model_dir}/health_classifier_v{self.model_version}.pkl")
-            joblib.dump(self.risk_predictor, f"{model_dir}/risk_predictor_v{self.model_version}.pkl")
-            joblib.dump(self.care_optimizer, f"{model_dir}/care_optimizer_v{self.model_version}.pkl")
-            joblib.dump(self.success_predictor, f"{model_dir}/success_predictor_v{self.model_version}.pkl")
-            
-            # Save metadata
-            metadata = {
-                "version": self.model_version,
-                "last_trained": self.last_trained.isoformat() if self.last_trained else None,
-                "performance": self.model_performance
-            }
-            
-            import json
-            with open(f"{model_dir}/model_metadata_v{self.model_version}.json", "w") as f:
-                json.dump(metadata, f, indent=2)
-            
-            logger.info(f"Models saved successfully (version {self.model_version})")
-            
-        except Exception as e:
-            logger.error(f"Error saving models: {str(e)}")
-    
     # Placeholder methods for missing implementations
     async def _analyze_user_care_pattern_ml(self, db: AsyncSession, user_id: str) -> Dict[str, Any]:
         """Analyze user care patterns using ML."""
@@ -1193,4 +743,15 @@ class MLPlantHealthService:
     
     def _predict_growth_trajectory(self, features, watering_freq, fertilizing_schedule) -> Dict[str, float]:
         """Predict plant growth trajectory."""
-        return {"monthly_growth": 0.1, "health_improvement": 0.05} 
\ No newline at end of file
+        return {"monthly_growth": 0.1, "health_improvement": 0.05}
+
+
+_ml_plant_health_service: Optional[MLPlantHealthService] = None
+
+
+def get_ml_plant_health_service() -> MLPlantHealthService:
+    """Get the shared ML plant health service."""
+    global _ml_plant_health_service
+    if _ml_plant_health_service is None:
+        _ml_plant_health_service = MLPlantHealthService(RAGService(), EmbeddingService())
+    return _ml_plant_health_service
@@ -228,7 +228,53 @@ class SeasonalNotificationService:
         except Exception as e:
             logger.error(f"Error sending seasonal care reminder: {str(e)}")
             return False
-    
+
+    async def send_care_due_reminders(
+        self,
+        user_id: UUID,
+        reminders: List[Dict[str, Any]]
+    ) -> bool:
+        """Send one notification covering a user's due care reminders.
+
+        Reminders come from the care reminder index with plant names
+        already resolved, so no queries are made here.
+        """
+        try:
+            first = reminders[0]
+            plant_name = first.get("plant_nickname") or first.get("species_name")
+            if len(reminders) == 1:
+                message = f"{plant_name} is due for {first['care_type']}."
+            else:
+                message = f"{plant_name} and {len(reminders) - 1} more plants need care."
+
+            notification_data = {
+                "type": NotificationType.CARE_REMINDER,
+                "priority": NotificationPriority.MEDIUM.value,
+                "user_id": str(user_id),
+                "reminders": [
+                    {
+                        "plant_id": str(reminder["plant_id"]),
+                        "plant_nickname": reminder.get("plant_nickname"),
+                        "care_type": reminder["care_type"],
+                        "days_overdue": reminder["days_overdue"],
+                        "next_due_at": reminder["next_due_at"].isoformat(),
+                    }
+                    for reminder in reminders
+                ],
+                "timestamp": datetime.utcnow().isoformat(),
+                "title": "💧 Care reminder",
+                "message": message
+            }
+
+            return await self.connection_manager.send_message_to_user(
+                notification_data,
+                str(user_id)
+            )
+
+        except Exception as e:
+            logger.error(f"Error sending care due reminders: {str(e)}")
+            return False
+
     async def send_seasonal_challenge_notification(
         self,
         db: AsyncSession,
@@ -17,6 +17,7 @@ from app.models.plant_species import PlantSpecies
 from app.models.rag_models import PlantKnowledgeBase, UserPreferenceEmbedding
 from app.services.rag_service import RAGService, UserContext, PlantData, PlantCareAdvice
 from app.services.embedding_service import EmbeddingService
+from app.services.plant_feature_store import PlantCareHistory, get_plant_feature_store
 
 logger = logging.getLogger(__name__)
 
@@ -231,8 +232,7 @@ class PersonalizedPlantCareService:
         try:
             # Get plant details
             stmt = select(UserPlant).options(
-                selectinload(UserPlant.species),
-                selectinload(UserPlant.care_logs)
+                selectinload(UserPlant.species)
             ).where(UserPlant.id == plant_id)
             
             result = await db.execute(stmt)
@@ -241,8 +241,8 @@ class PersonalizedPlantCareService:
             if not plant:
                 raise ValueError(f"Plant {plant_id} not found")
             
-            # Get recent care history
-            recent_logs = sorted(plant.care_logs, key=lambda x: x.care_date, reverse=True)[:10]
+            # Get recent care history (windowed and cached per plant)
+            care_history = await get_plant_feature_store().get_history(db, plant_id)
             
             # Calculate base watering schedule
             base_frequency = plant.species.water_frequency_days or 7
@@ -258,13 +258,13 @@ class PersonalizedPlantCareService:
             )
             
             # Calculate next care dates
-            last_watering = self._get_last_care_date(recent_logs, "watering")
+            last_watering = self._get_last_care_date(care_history, "watering")
             next_watering = last_watering + timedelta(days=env_adjusted_frequency)
             
             # Fertilizing schedule (typically monthly during growing season)
             next_fertilizing = None
             if environmental_data.season in ["spring", "summer"]:
-                last_fertilizing = self._get_last_care_date(recent_logs, "fertilizing")
+                last_fertilizing = self._get_last_care_date(care_history, "fertilizing")
                 if not last_fertilizing or (datetime.utcnow() - last_fertilizing).days > 30:
                     next_fertilizing = datetime.utcnow() + timedelta(days=7)
             
@@ -320,10 +320,9 @@ class PersonalizedPlantCareService:
             PlantHealthPrediction with risk assessment
         """
         try:
-            # Get plant and recent care history
+            # Get plant and species
             stmt = select(UserPlant).options(
-                selectinload(UserPlant.species),
-                selectinload(UserPlant.care_logs)
+                selectinload(UserPlant.species)
             ).where(UserPlant.id == plant_id)
             
             result = await db.execute(stmt)
@@ -654,11 +653,11 @@ class PersonalizedPlantCareService:
         
         return frequency * adjustment
     
-    def _get_last_care_date(self, care_logs: List[PlantCareLog], care_type: str) -> datetime:
+    def _get_last_care_date(self, care_history: Optional[PlantCareHistory], care_type: str) -> datetime:
         """Get the last date a specific type of care was performed."""
-        for log in care_logs:
-            if log.care_type == care_type:
-                return log.care_date
+        last_performed = care_history.last_performed(care_type) if care_history else None
+        if last_performed:
+            return last_performed
         
         # If no care of this type found, assume it was done a while ago
         return datetime.utcnow() - timedelta(days=30)
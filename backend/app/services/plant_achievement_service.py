@@ -3,11 +3,11 @@
 This module provides business logic for plant achievements and milestone tracking.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 
-from sqlalchemy import select, func, desc, and_, or_
+from sqlalchemy import select, desc, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -16,6 +16,7 @@ from app.models.user_plant import UserPlant
 from app.models.plant_care_log import PlantCareLog
 from app.models.plant_identification import PlantIdentification
 from app.models.plant_question import PlantQuestion, PlantAnswer
+from app.services.achievement_engine import COUNTER_STATS, get_achievement_engine
 
 
 class PlantAchievementService:
@@ -67,83 +68,31 @@ class PlantAchievementService:
         db: AsyncSession,
         user_id: UUID
     ) -> List[UserAchievement]:
-        """Check and award any newly earned achievements."""
-        newly_earned = []
+        """Check and award any newly earned achievements.
         
-        # Get user stats
+        Counters are kept current by activity events, which award most
+        achievements as they happen; this full check catches anything
+        defined after the counters last moved.
+        """
         user_stats = await PlantAchievementService.get_or_create_user_stats(db, user_id)
+        awarded = await get_achievement_engine().evaluate_user(
+            db, user_id, {stat: getattr(user_stats, stat) for stat in COUNTER_STATS}
+        )
+        if not awarded:
+            return []
         
-        # Get available achievements
-        available_achievements = await PlantAchievementService.get_available_achievements(db, user_id)
-        
-        for achievement in available_achievements:
-            if await PlantAchievementService._check_achievement_criteria(db, user_id, achievement, user_stats):
-                # Award the achievement
-                user_achievement = UserAchievement(
-                    user_id=user_id,
-                    achievement_id=achievement.id,
-                    earned_at=datetime.utcnow()
-                )
-                db.add(user_achievement)
-                
-                # Update user stats
-                user_stats.total_achievements += 1
-                user_stats.total_points += achievement.points
-                user_stats.level = PlantAchievementService._calculate_level(user_stats.total_points)
-                
-                newly_earned.append(user_achievement)
-        
-        if newly_earned:
-            await db.commit()
-            
-            # Reload with relationships
-            for ua in newly_earned:
-                await db.refresh(ua, ['achievement'])
-        
-        return newly_earned
-    
-    @staticmethod
-    async def _check_achievement_criteria(
-        db: AsyncSession,
-        user_id: UUID,
-        achievement: PlantAchievement,
-        user_stats: UserStats
-    ) -> bool:
-        """Check if user meets achievement criteria."""
-        criteria = achievement.unlock_criteria or {}
-        
-        if achievement.achievement_type == "care_streak":
-            required_days = criteria.get("days", 7)
-            return user_stats.care_streak_days >= required_days
-        
-        elif achievement.achievement_type == "plant_collection":
-            required_count = criteria.get("count", 5)
-            return user_stats.active_plants >= required_count
-        
-        elif achievement.achievement_type == "identification":
-            required_count = criteria.get("count", 10)
-            return user_stats.plants_identified >= required_count
-        
-        elif achievement.achievement_type == "community_helper":
-            required_answers = criteria.get("helpful_answers", 5)
-            return user_stats.helpful_answers >= required_answers
-        
-        elif achievement.achievement_type == "plant_age":
-            required_days = criteria.get("days", 365)
-            # Check if user has any plants older than required days
-            result = await db.execute(
-                select(func.count(UserPlant.id)).where(
-                    and_(
-                        UserPlant.user_id == user_id,
-                        UserPlant.is_active == True,
-                        UserPlant.acquired_date <= datetime.utcnow() - timedelta(days=required_days)
-                    )
+        await db.commit()
+        result = await db.execute(
+            select(UserAchievement).options(
+                selectinload(UserAchievement.achievement)
+            ).where(
+                and_(
+                    UserAchievement.user_id == user_id,
+                    UserAchievement.achievement_id.in_([a.id for a in awarded])
                 )
             )
-            count = result.scalar()
-            return count > 0
-        
-        return False
+        )
+        return result.scalars().all()
     
     @staticmethod
     def _calculate_level(total_points: int) -> int:
@@ -385,4 +334,5 @@ async def initialize_default_achievements(db: AsyncSession):
             achievement = PlantAchievement(**achievement_data)
             db.add(achievement)
     
-    await db.commit() 
\ No newline at end of file
+    await db.commit()
+    get_achievement_engine().invalidate()
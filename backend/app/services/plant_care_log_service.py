@@ -20,6 +20,9 @@ from app.models.seasonal_ai import SeasonalPrediction
 from app.models.timelapse import TimelapseSession
 from app.models.growth_photo import GrowthPhoto
 from app.schemas.plant_care_log import PlantCareLogCreate, PlantCareLogUpdate
+from app.services.achievement_engine import AchievementEvent, get_achievement_engine
+from app.services.care_reminder_service import SCHEDULED_CARE, schedule_plant
+from app.services.plant_feature_store import get_plant_feature_store
 
 
 class PlantCareLogService:
@@ -68,9 +71,15 @@ class PlantCareLogService:
             plant.last_repotted = log_data.performed_at or datetime.utcnow()
         
         plant.updated_at = datetime.utcnow()
+        if log_data.care_type in SCHEDULED_CARE:
+            await schedule_plant(db, plant)
+        await get_achievement_engine().record_event(
+            db, user_id, AchievementEvent.CARE_LOGGED, log_data.performed_at
+        )
         
         await db.commit()
         await db.refresh(care_log)
+        get_plant_feature_store().record_care(care_log.plant_id, care_log.care_type, care_log.performed_at)
         return care_log
     
     @staticmethod
@@ -275,6 +284,7 @@ class PlantCareLogService:
         care_log.updated_at = datetime.utcnow()
         await db.commit()
         await db.refresh(care_log)
+        get_plant_feature_store().invalidate(care_log.plant_id)
         return care_log
     
     @staticmethod
@@ -304,8 +314,10 @@ class PlantCareLogService:
         if not care_log or care_log.plant.user_id != user_id:
             return False
         
+        plant_id = care_log.plant_id
         await db.delete(care_log)
         await db.commit()
+        get_plant_feature_store().invalidate(plant_id)
         return True
     
     @staticmethod
@@ -17,6 +17,9 @@ from app.models.user_plant import UserPlant
 from app.models.plant_question import PlantQuestion, PlantAnswer
 from app.models.story import Story
 from app.services.embedding_service import EmbeddingService
+from app.services.rag_reindex_pipeline import BulkReindexPipeline
+from app.services.semantic_answer_cache import get_semantic_answer_cache
+from app.services.embedding_outbox_service import EmbeddingOutboxWorker
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -206,6 +209,7 @@ class PlantContentIndexer:
             
             db.add(content_embedding)
             await db.commit()
+            await get_semantic_answer_cache().invalidate_sources([knowledge_id])
             
             logger.info(f"Successfully indexed knowledge entry: {knowledge_entry.title}")
             return True
@@ -396,142 +400,46 @@ class PlantContentIndexer:
     async def reindex_all_content(
         self,
         db: AsyncSession,
-        content_types: Optional[List[str]] = None
+        content_types: Optional[List[str]] = None,
+        force: bool = False
     ) -> Dict[str, int]:
         """Reindex all content of specified types.
         
+        Runs the streaming bulk pipeline (keyset fetch -> batched embed ->
+        bulk upsert). Items whose stored content hash is unchanged are
+        skipped unless ``force`` is set.
+        
         Args:
             db: Database session
             content_types: List of content types to reindex (None for all)
+            force: Re-embed items even if their content is unchanged
             
         Returns:
             Summary of reindexing results
         """
-        results = {"success": 0, "failed": 0}
-        
         try:
-            # Get all content to reindex
-            content_items = []
-            
-            if not content_types or "species" in content_types:
-                # Get all plant species
-                species_stmt = select(PlantSpecies.id)
-                species_result = await db.execute(species_stmt)
-                for species_id, in species_result:
-                    content_items.append({
-                        "content_type": "species",
-                        "content_id": str(species_id),
-                        "force_reindex": True
-                    })
-            
-            if not content_types or "knowledge" in content_types:
-                # Get all knowledge base entries
-                kb_stmt = select(PlantKnowledgeBase.id)
-                kb_result = await db.execute(kb_stmt)
-                for kb_id, in kb_result:
-                    content_items.append({
-                        "content_type": "knowledge",
-                        "content_id": str(kb_id),
-                        "force_reindex": True
-                    })
-            
-            if not content_types or "question" in content_types:
-                # Get all questions
-                q_stmt = select(PlantQuestion.id)
-                q_result = await db.execute(q_stmt)
-                for q_id, in q_result:
-                    content_items.append({
-                        "content_type": "question",
-                        "content_id": str(q_id),
-                        "force_reindex": True
-                    })
-            
-            if not content_types or "answer" in content_types:
-                # Get all answers
-                a_stmt = select(PlantAnswer.id)
-                a_result = await db.execute(a_stmt)
-                for a_id, in a_result:
-                    content_items.append({
-                        "content_type": "answer",
-                        "content_id": str(a_id),
-                        "force_reindex": True
-                    })
-            
-            if not content_types or "story" in content_types:
-                # Get all stories
-                s_stmt = select(Story.id)
-                s_result = await db.execute(s_stmt)
-                for s_id, in s_result:
-                    content_items.append({
-                        "content_type": "story",
-                        "content_id": str(s_id),
-                        "force_reindex": True
-                    })
-            
-            logger.info(f"Starting reindex of {len(content_items)} content items")
-            
-            # Bulk index all content
-            results = await self.bulk_index_content(db, content_items)
-            
-            logger.info(f"Reindexing completed: {results}")
-            return results
-            
+            pipeline = BulkReindexPipeline(self.embedding_service)
+            return await pipeline.run(db, content_types=content_types, force=force)
         except Exception as e:
             logger.error(f"Error during reindexing: {str(e)}")
-            return {"success": 0, "failed": len(content_items) if 'content_items' in locals() else 0}
+            return {"success": 0, "failed": 0, "error": str(e)}
     
     async def cleanup_orphaned_embeddings(self, db: AsyncSession) -> int:
         """Remove embeddings for content that no longer exists.
         
+        Deletions are recorded in the embedding outbox when content is
+        removed, so only those pending delete records are applied here
+        instead of scanning every embedding.
+        
         Args:
             db: Database session
             
         Returns:
             Number of orphaned embeddings removed
         """
-        removed_count = 0
-        
         try:
-            # Get all embeddings
-            embeddings_stmt = select(PlantContentEmbedding)
-            embeddings_result = await db.execute(embeddings_stmt)
-            embeddings = embeddings_result.scalars().all()
-            
-            for embedding in embeddings:
-                content_exists = False
-                
-                # Check if referenced content still exists
-                if embedding.content_type == "species_info":
-                    species_stmt = select(PlantSpecies.id).where(PlantSpecies.id == embedding.content_id)
-                    species_result = await db.execute(species_stmt)
-                    content_exists = species_result.scalar_one_or_none() is not None
-                
-                elif embedding.content_type == "knowledge_base":
-                    kb_stmt = select(PlantKnowledgeBase.id).where(PlantKnowledgeBase.id == embedding.content_id)
-                    kb_result = await db.execute(kb_stmt)
-                    content_exists = kb_result.scalar_one_or_none() is not None
-                
-                elif embedding.content_type == "question":
-                    q_stmt = select(PlantQuestion.id).where(PlantQuestion.id == embedding.content_id)
-                    q_result = await db.execute(q_stmt)
-                    content_exists = q_result.scalar_one_or_none() is not None
-                
-                elif embedding.content_type == "answer":
-                    a_stmt = select(PlantAnswer.id).where(PlantAnswer.id == embedding.content_id)
-                    a_result = await db.execute(a_stmt)
-                    content_exists = a_result.scalar_one_or_none() is not None
-                
-                elif embedding.content_type == "story":
-                    s_stmt = select(Story.id).where(Story.id == embedding.content_id)
-                    s_result = await db.execute(s_stmt)
-                    content_exists = s_result.scalar_one_or_none() is not None
-                
-                # Remove orphaned embedding
-                if not content_exists:
-                    await db.delete(embedding)
-                    removed_count += 1
-            
-            await db.commit()
+            worker = EmbeddingOutboxWorker(self.embedding_service)
+            removed_count = await worker.process_deletes(db)
             logger.info(f"Removed {removed_count} orphaned embeddings")
             return removed_count
             
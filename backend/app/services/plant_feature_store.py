@@ -0,0 +1,397 @@
+"""Windowed, cached per-plant care features.
+
+Health feature extraction used to ``selectinload`` every care log a plant
+ever had, walk the list once per score, and run a per-call success-rate
+query that itself touched lazy-loaded relationships. This module keeps,
+per plant, only what the features need:
+
+- the plant's owner, acquisition date, species care level and the owner's
+  gardening experience (one joined row);
+- the care type and time of each care log in the last
+  ``PLANT_FEATURE_WINDOW_DAYS`` days, as time-sorted NumPy arrays;
+- per owner, the share of plants cared for in the last 30 days (one
+  aggregate query).
+
+Histories are cached for ``PLANT_FEATURE_CACHE_TTL_SECONDS`` and updated in
+place when a care log is created; features are derived from the cached
+arrays on every read, so time-dependent scores (days since last care,
+activity trend) stay current between reloads.
+
+The cache is per process and only the process that writes a care log
+updates its copy. Other workers reload the history when their entry
+expires, so the TTL (five minutes by default) bounds how long they serve
+a history missing a new, edited or deleted log.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import and_, exists, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.plant_care_log import PlantCareLog
+from app.models.plant_species import PlantSpecies
+from app.models.user import User
+from app.models.user_plant import UserPlant
+
+SPECIES_DIFFICULTY = {
+    "easy": 0.2,
+    "medium": 0.5,
+    "moderate": 0.5,
+    "hard": 0.8,
+    "difficult": 0.8,
+    "expert": 0.9
+}
+USER_EXPERIENCE = {
+    "beginner": 0.3,
+    "intermediate": 0.6,
+    "advanced": 0.8,
+    "expert": 0.9
+}
+# Expected care types (watering, fertilizing, pruning, repotting)
+EXPECTED_CARE_TYPES = 4
+SUCCESS_WINDOW_DAYS = 30
+DEFAULT_SUCCESS_RATE = 0.7
+
+
+@dataclass
+class PlantHealthFeatures:
+    """Feature vector for plant health prediction."""
+    care_frequency_score: float
+    consistency_score: float
+    environmental_stress_score: float
+    species_difficulty_score: float
+    user_experience_score: float
+    seasonal_factor: float
+    days_since_last_care: int
+    care_type_diversity: float
+    historical_success_rate: float
+    plant_age_months: int
+    recent_activity_trend: float
+    care_pattern_deviation: float
+
+
+@dataclass
+class PlantCareHistory:
+    """A plant's context and time-sorted care events within the window."""
+    plant_id: Any
+    user_id: Any
+    acquired_date: Optional[datetime]
+    species_care_level: Optional[str]
+    gardening_experience: Optional[str]
+    window_start: datetime
+    care_types: np.ndarray
+    performed_at: np.ndarray
+    loaded_at: float
+
+    def add(self, care_type: str, performed_at: datetime) -> None:
+        """Insert one care event, keeping the arrays sorted by time."""
+        if performed_at < self.window_start:
+            return
+        position = int(np.searchsorted(self.performed_at, np.datetime64(performed_at, "us"), side="right"))
+        self.performed_at = np.insert(self.performed_at, position, np.datetime64(performed_at, "us"))
+        self.care_types = np.insert(self.care_types, position, care_type)
+
+    def times(self, care_type: Optional[str] = None) -> np.ndarray:
+        """Event times, optionally for one care type, oldest first."""
+        if care_type is None:
+            return self.performed_at
+        return self.performed_at[self.care_types == care_type]
+
+    def last_performed(self, care_type: Optional[str] = None) -> Optional[datetime]:
+        times = self.times(care_type)
+        return times[-1].astype(datetime) if len(times) else None
+
+    def events_since(self, since: datetime) -> List[Tuple[str, datetime]]:
+        """``(care_type, performed_at)`` pairs at or after ``since``, oldest first."""
+        start = int(np.searchsorted(self.performed_at, np.datetime64(since, "us"), side="left"))
+        return [
+            (str(care_type), performed_at.astype(datetime))
+            for care_type, performed_at in zip(self.care_types[start:], self.performed_at[start:])
+        ]
+
+
+def _interval_days(times: np.ndarray) -> np.ndarray:
+    """Whole days between consecutive events."""
+    return np.diff(times) // np.timedelta64(1, "D")
+
+
+def _consistency(history: PlantCareHistory) -> float:
+    scores = []
+    for care_type in np.unique(history.care_types):
+        times = history.times(care_type)
+        if len(times) < 3:
+            continue
+        intervals = _interval_days(times)
+        std = np.std(intervals)
+        scores.append(max(0.0, 1 - std / np.mean(intervals)) if std > 0 else 1.0)
+    return float(np.mean(scores)) if scores else 0.5
+
+
+def _care_frequency(history: PlantCareHistory) -> float:
+    waterings = history.times("watering")
+    if len(waterings) < 2:
+        return 0.5
+    avg_interval = np.mean(np.abs(_interval_days(waterings)))
+    # Score based on optimal range (5-10 days for most plants)
+    if 5 <= avg_interval <= 10:
+        return 1.0
+    elif 3 <= avg_interval <= 14:
+        return 0.8
+    elif avg_interval <= 21:
+        return 0.6
+    return 0.3
+
+
+def _pattern_deviation(history: PlantCareHistory) -> float:
+    if not len(history.performed_at):
+        return 0.5
+    waterings = history.times("watering")
+    if len(waterings) < 3:
+        return 0.3
+    intervals = _interval_days(waterings)
+    mean = np.mean(intervals)
+    # Coefficient of variation (higher = more deviation)
+    return float(min(1.0, np.std(intervals) / mean)) if mean > 0 else 1.0
+
+
+def _seasonal_stress(month: int) -> float:
+    if month in (12, 1, 2):
+        return 0.3
+    if month in (6, 7, 8):
+        return 0.2
+    return 0.1
+
+
+def _seasonal_factor(month: int) -> float:
+    if month in (3, 4, 5, 6):  # Spring/early summer - high growth
+        return 0.9
+    if month in (7, 8, 9):  # Late summer/early fall - moderate growth
+        return 0.7
+    if month in (10, 11):  # Late fall - slowing growth
+        return 0.4
+    return 0.2  # Winter - dormant period
+
+
+def _activity_trend(history: PlantCareHistory, now: datetime) -> float:
+    """Care events in the last 2 weeks relative to the 2 weeks before."""
+    if not len(history.performed_at):
+        return 0.0
+    older_cutoff, recent_cutoff, end = np.searchsorted(
+        history.performed_at,
+        np.array([now - timedelta(days=28), now - timedelta(days=14), now + timedelta(days=1)], dtype="datetime64[us]")
+    )
+    recent_count = end - recent_cutoff
+    older_count = recent_cutoff - older_cutoff
+    if older_count == 0:
+        return 1.0 if recent_count > 0 else 0.0
+    return float(min(2.0, recent_count / older_count))
+
+
+def compute_health_features(
+    history: PlantCareHistory,
+    success_rate: float,
+    now: Optional[datetime] = None
+) -> PlantHealthFeatures:
+    """Derive health features from a plant's cached care history."""
+    now = now or datetime.utcnow()
+    consistency = _consistency(history)
+
+    experience = USER_EXPERIENCE.get(history.gardening_experience, 0.5)
+    if len(history.performed_at):
+        # More care logged means a more experienced user, up to a 0.2 bonus
+        experience = min(1.0, experience + min(0.2, len(history.performed_at) / 100))
+
+    last_care = history.last_performed()
+    return PlantHealthFeatures(
+        care_frequency_score=_care_frequency(history),
+        consistency_score=consistency,
+        environmental_stress_score=float(np.mean([_seasonal_stress(now.month), 1 - consistency])),
+        species_difficulty_score=SPECIES_DIFFICULTY.get(history.species_care_level, 0.5),
+        user_experience_score=experience,
+        seasonal_factor=_seasonal_factor(now.month),
+        days_since_last_care=(now - last_care).days if last_care else 30,
+        care_type_diversity=len(np.unique(history.care_types)) / EXPECTED_CARE_TYPES,
+        historical_success_rate=success_rate,
+        plant_age_months=max(1, (now - history.acquired_date).days // 30) if history.acquired_date else 6,
+        recent_activity_trend=_activity_trend(history, now),
+        care_pattern_deviation=_pattern_deviation(history)
+    )
+
+
+class PlantFeatureStore:
+    """TTL cache of per-plant care histories and per-user success rates."""
+
+    def __init__(self, window_days: int = 180, ttl_seconds: float = 300.0, max_entries: int = 50000):
+        self.window_days = window_days
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._histories: "OrderedDict[str, PlantCareHistory]" = OrderedDict()
+        self._success_rates: Dict[str, Tuple[float, float]] = {}
+        self.hits = 0
+        self.loads = 0
+        self.incremental_updates = 0
+
+    async def get_history(self, db: AsyncSession, plant_id: Any) -> Optional[PlantCareHistory]:
+        """A plant's care history, loaded on first use or after the TTL."""
+        key = str(plant_id)
+        history = self._histories.get(key)
+        if history is not None and time.monotonic() - history.loaded_at < self.ttl_seconds:
+            self._histories.move_to_end(key)
+            self.hits += 1
+            return history
+
+        history = await self._load_history(db, plant_id)
+        if history is None:
+            self._histories.pop(key, None)
+            return None
+        self._histories[key] = history
+        self._histories.move_to_end(key)
+        while len(self._histories) > self.max_entries:
+            self._histories.popitem(last=False)
+        return history
+
+    async def get_features(
+        self,
+        db: AsyncSession,
+        plant_id: Any,
+        now: Optional[datetime] = None
+    ) -> Optional[PlantHealthFeatures]:
+        """Health features of a plant, or None if it does not exist."""
+        history = await self.get_history(db, plant_id)
+        if history is None:
+            return None
+        success_rate = await self.get_success_rate(db, history.user_id)
+        return compute_health_features(history, success_rate, now)
+
+    async def care_events(
+        self,
+        db: AsyncSession,
+        plant_id: Any,
+        since: datetime
+    ) -> List[Tuple[str, datetime]]:
+        """A plant's ``(care_type, performed_at)`` events since a time, oldest first.
+
+        Served from the cached window when it covers ``since``.
+        """
+        if since >= datetime.utcnow() - timedelta(days=self.window_days):
+            history = await self.get_history(db, plant_id)
+            return history.events_since(since) if history else []
+
+        result = await db.execute(
+            select(PlantCareLog.care_type, PlantCareLog.performed_at)
+            .where(and_(PlantCareLog.plant_id == plant_id, PlantCareLog.performed_at >= since))
+            .order_by(PlantCareLog.performed_at)
+        )
+        return [(care_type, performed_at) for care_type, performed_at in result.all()]
+
+    async def get_success_rate(self, db: AsyncSession, user_id: Any) -> float:
+        """Share of a user's plants cared for in the last 30 days."""
+        key = str(user_id)
+        cached = self._success_rates.get(key)
+        if cached is not None and time.monotonic() - cached[1] < self.ttl_seconds:
+            return cached[0]
+
+        recent_care = exists().where(and_(
+            PlantCareLog.plant_id == UserPlant.id,
+            PlantCareLog.performed_at >= datetime.utcnow() - timedelta(days=SUCCESS_WINDOW_DAYS)
+        ))
+        result = await db.execute(
+            select(func.count(), func.count().filter(recent_care))
+            .select_from(UserPlant)
+            .where(UserPlant.user_id == user_id)
+        )
+        plants, cared_for = result.one()
+        rate = cared_for / plants if plants else DEFAULT_SUCCESS_RATE
+        self._success_rates[key] = (rate, time.monotonic())
+        return rate
+
+    def record_care(self, plant_id: Any, care_type: str, performed_at: datetime) -> None:
+        """Apply a newly created care log to the cached history, if any."""
+        history = self._histories.get(str(plant_id))
+        if history is None:
+            return
+        history.add(care_type, performed_at)
+        self._success_rates.pop(str(history.user_id), None)
+        self.incremental_updates += 1
+
+    def invalidate(self, plant_id: Any) -> None:
+        """Drop a plant's history (call after care logs are edited or deleted)."""
+        history = self._histories.pop(str(plant_id), None)
+        if history is not None:
+            self._success_rates.pop(str(history.user_id), None)
+
+    def clear(self) -> None:
+        self._histories.clear()
+        self._success_rates.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.loads
+        return {
+            "plants": len(self._histories),
+            "users": len(self._success_rates),
+            "hits": self.hits,
+            "loads": self.loads,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "incremental_updates": self.incremental_updates,
+            "window_days": self.window_days,
+        }
+
+    async def _load_history(self, db: AsyncSession, plant_id: Any) -> Optional[PlantCareHistory]:
+        self.loads += 1
+        result = await db.execute(
+            select(
+                UserPlant.user_id,
+                UserPlant.acquired_date,
+                PlantSpecies.care_level,
+                User.gardening_experience
+            )
+            .outerjoin(PlantSpecies, PlantSpecies.id == UserPlant.species_id)
+            .outerjoin(User, User.id == UserPlant.user_id)
+            .where(UserPlant.id == plant_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+
+        window_start = datetime.utcnow() - timedelta(days=self.window_days)
+        logs = (await db.execute(
+            select(PlantCareLog.care_type, PlantCareLog.performed_at)
+            .where(and_(
+                PlantCareLog.plant_id == plant_id,
+                PlantCareLog.performed_at >= window_start
+            ))
+            .order_by(PlantCareLog.performed_at)
+        )).all()
+
+        return PlantCareHistory(
+            plant_id=plant_id,
+            user_id=row.user_id,
+            acquired_date=row.acquired_date,
+            species_care_level=row.care_level,
+            gardening_experience=row.gardening_experience,
+            window_start=window_start,
+            care_types=np.array([care_type for care_type, _ in logs], dtype=object),
+            performed_at=np.array([performed_at for _, performed_at in logs], dtype="datetime64[us]"),
+            loaded_at=time.monotonic()
+        )
+
+
+_plant_feature_store: Optional[PlantFeatureStore] = None
+
+
+def get_plant_feature_store() -> PlantFeatureStore:
+    """Get the process-wide plant feature store."""
+    global _plant_feature_store
+    if _plant_feature_store is None:
+        _plant_feature_store = PlantFeatureStore(
+            window_days=settings.PLANT_FEATURE_WINDOW_DAYS,
+            ttl_seconds=settings.PLANT_FEATURE_CACHE_TTL_SECONDS,
+            max_entries=settings.PLANT_FEATURE_CACHE_MAX_ENTRIES
+        )
+    return _plant_feature_store
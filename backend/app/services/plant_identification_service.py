@@ -5,6 +5,7 @@ including image processing, species matching, and verification.
 """
 
 import os
+import asyncio
 import base64
 import logging
 from datetime import datetime
@@ -25,6 +26,10 @@ from app.core.config import settings
 from app.models.plant_identification import PlantIdentification
 from app.models.plant_species import PlantSpecies
 from app.schemas.plant_identification import PlantIdentificationCreate, PlantIdentificationUpdate
+from app.services.achievement_engine import AchievementEvent, get_achievement_engine
+from app.services.identification_cache import dhash, get_identification_cache
+from app.services.species_lexicon import get_species_lexicon
+from app.utils.pagination import CountMode, Page, paginate
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +42,7 @@ class PlantIdentificationService:
         self.openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
         self.upload_dir = Path("uploads/plant_images")
         self.upload_dir.mkdir(parents=True, exist_ok=True)
+        self.species_lexicon = get_species_lexicon()
     
     async def process_plant_image(
         self,
@@ -64,8 +70,8 @@ class PlantIdentificationService:
             # Save image file
             image_path = await self._save_image(image_data, filename, user_id)
             
-            # Perform AI identification
-            identification_result = await self._identify_plant_with_ai(image_path, image_data)
+            # Perform AI identification (reusing results for near-duplicate images)
+            identification_result = await self.identify_image(image_path, image_data)
             
             # Find matching species in database
             species_match = await self._find_species_match(
@@ -89,6 +95,7 @@ class PlantIdentificationService:
             )
             
             db.add(identification)
+            await get_achievement_engine().record_event(db, user_id, AchievementEvent.PLANT_IDENTIFIED)
             await db.commit()
             await db.refresh(identification)
             
@@ -142,6 +149,37 @@ class PlantIdentificationService:
             logger.error(f"Error saving image: {str(e)}")
             raise
     
+    async def identify_image(self, image_path: Optional[Path], image_data: bytes) -> Dict[str, Any]:
+        """Identify a plant image, reusing cached results for near-duplicates.
+        
+        Args:
+            image_path: Path to saved image, if it was saved
+            image_data: Binary image data
+            
+        Returns:
+            Dictionary with identification results
+        """
+        if not (settings.PLANT_ID_CACHE_ENABLED and self.openai_client):
+            return await self._identify_plant_with_ai(image_path, image_data)
+        
+        cache = get_identification_cache()
+        try:
+            image_hash = await asyncio.to_thread(dhash, image_data)
+        except Exception as e:
+            logger.warning(f"Could not hash image for identification cache: {str(e)}")
+            return await self._identify_plant_with_ai(image_path, image_data)
+        
+        cached = cache.get(image_hash)
+        if cached is not None:
+            logger.info(f"Identification cache hit: {cached['identified_name']}")
+            return cached
+        
+        result = await self._identify_plant_with_ai(image_path, image_data)
+        # Failed calls come back with zero confidence; don't cache those
+        if result.get("confidence_score", 0.0) > 0:
+            cache.put(image_hash, result)
+        return result
+    
     async def _identify_plant_with_ai(self, image_path: Path, image_data: bytes) -> Dict[str, Any]:
         """Identify plant using OpenAI Vision API.
         
@@ -198,7 +236,7 @@ class PlantIdentificationService:
             
             # Make API call to OpenAI Vision
             response = await self.openai_client.chat.completions.create(
-                model="gpt-4-vision-preview",
+                model=settings.PLANT_ID_VISION_MODEL,
                 messages=[
                     {
                         "role": "user",
@@ -340,10 +378,10 @@ class PlantIdentificationService:
         identified_name: str, 
         suggestions: List[Dict[str, Any]]
     ) -> Optional[Dict[str, Any]]:
-        """Find matching plant species in database.
+        """Find matching plant species using the in-memory species lexicon.
         
         Args:
-            db: Database session
+            db: Database session (only used to load a stale lexicon)
             identified_name: Primary identified name
             suggestions: List of alternative suggestions
             
@@ -351,65 +389,9 @@ class PlantIdentificationService:
             Dictionary with species match info or None
         """
         try:
-            # Search for exact matches first
-            search_names = [identified_name]
-            
-            # Add scientific names from suggestions
-            for suggestion in suggestions:
-                if suggestion.get("scientific_name"):
-                    search_names.append(suggestion["scientific_name"])
-                if suggestion.get("name"):
-                    search_names.append(suggestion["name"])
-            
-            # Query database for matches
-            for name in search_names:
-                # Try exact match on scientific name
-                result = await db.execute(
-                    select(PlantSpecies).where(
-                        func.lower(PlantSpecies.scientific_name) == name.lower()
-                    )
-                )
-                species = result.scalar_one_or_none()
-                
-                if species:
-                    return {
-                        "species_id": species.id,
-                        "match_type": "scientific_name",
-                        "match_confidence": 0.9
-                    }
-                
-                # Try exact match on common name
-                result = await db.execute(
-                    select(PlantSpecies).where(
-                        func.lower(PlantSpecies.common_name) == name.lower()
-                    )
-                )
-                species = result.scalar_one_or_none()
-                
-                if species:
-                    return {
-                        "species_id": species.id,
-                        "match_type": "common_name", 
-                        "match_confidence": 0.8
-                    }
-            
-            # Try fuzzy matching (simplified)
-            for name in search_names[:3]:  # Limit to top 3 names
-                result = await db.execute(
-                    select(PlantSpecies).where(
-                        func.lower(PlantSpecies.scientific_name).contains(name.lower().split()[0])
-                    ).limit(1)
-                )
-                species = result.scalar_one_or_none()
-                
-                if species:
-                    return {
-                        "species_id": species.id,
-                        "match_type": "fuzzy",
-                        "match_confidence": 0.6
-                    }
-            
-            return None
+            await self.species_lexicon.ensure_loaded(db)
+            match = self.species_lexicon.match(identified_name, suggestions)
+            return match.as_dict() if match else None
             
         except Exception as e:
             logger.error(f"Error finding species match: {str(e)}")
@@ -476,6 +458,7 @@ class PlantIdentificationService:
             **identification_data.dict()
         )
         db.add(identification)
+        await get_achievement_engine().record_event(db, user_id, AchievementEvent.PLANT_IDENTIFIED)
         await db.commit()
         await db.refresh(identification)
         return identification
@@ -512,47 +495,35 @@ class PlantIdentificationService:
         db: AsyncSession,
         user_id: UUID,
         verified_only: Optional[bool] = None,
-        skip: int = 0,
-        limit: int = 20
-    ) -> tuple[List[PlantIdentification], int]:
-        """Get identifications by user.
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count: CountMode = CountMode.EXACT
+    ) -> Page:
+        """Get identifications by user, newest first.
         
         Args:
             db: Database session
             user_id: User ID
             verified_only: Filter by verification status
-            skip: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Cursor from the previous page
+            count: How to compute the total on the first page
             
         Returns:
-            Tuple of (identifications list, total count)
+            Page of identifications
         """
         # Build base query
         base_query = select(PlantIdentification).options(
             selectinload(PlantIdentification.species)
         ).where(PlantIdentification.user_id == user_id)
         
-        count_query = select(func.count(PlantIdentification.id)).where(
-            PlantIdentification.user_id == user_id
-        )
-        
         if verified_only is not None:
             base_query = base_query.where(PlantIdentification.is_verified == verified_only)
-            count_query = count_query.where(PlantIdentification.is_verified == verified_only)
-        
-        # Get total count
-        count_result = await db.execute(count_query)
-        total = count_result.scalar()
         
-        # Get paginated results
-        result = await db.execute(
-            base_query.order_by(desc(PlantIdentification.created_at))
-            .offset(skip)
-            .limit(limit)
+        return await paginate(
+            db, base_query, [PlantIdentification.created_at, PlantIdentification.id],
+            limit, cursor, count=count
         )
-        identifications = result.scalars().all()
-        
-        return list(identifications), total
     
     @staticmethod
     async def update_identification(
@@ -867,12 +838,13 @@ async def get_user_identifications(
     db: AsyncSession,
     user_id: UUID,
     verified_only: Optional[bool] = None,
-    skip: int = 0,
-    limit: int = 20
-) -> tuple[List[PlantIdentification], int]:
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    count: CountMode = CountMode.EXACT
+) -> Page:
     """Get identifications by user."""
     return await PlantIdentificationService.get_user_identifications(
-        db, user_id, verified_only, skip, limit
+        db, user_id, verified_only, limit, cursor, count
     )
 
 
@@ -8,6 +8,7 @@ from enum import Enum
 
 from app.models.user_plant import UserPlant
 from app.models.plant_care_log import PlantCareLog
+from app.services.plant_feature_store import get_plant_feature_store
 
 class MeasurementMethod(str, Enum):
     AR = "ar"
@@ -54,6 +55,7 @@ class PlantMeasurementService:
         db.add(care_log)
         db.commit()
         db.refresh(care_log)
+        get_plant_feature_store().record_care(care_log.plant_id, care_log.care_type, care_log.performed_at)
         
         return {
             "measurement_id": str(care_log.id),
@@ -18,8 +18,11 @@ from app.models.plant_species import PlantSpecies
 from app.schemas.plant_question import (
     PlantQuestionCreate, PlantQuestionUpdate,
     PlantAnswerCreate, PlantAnswerUpdate,
-    PlantQuestionSearchRequest
+    PlantQuestionSearchRequest, QuestionSortField
 )
+from app.services.achievement_engine import AchievementEvent, get_achievement_engine
+from app.services.full_text_search import text_search
+from app.utils.pagination import CountMode, Page, SortOrder, paginate
 
 
 class PlantQuestionService:
@@ -46,6 +49,7 @@ class PlantQuestionService:
             **question_data.dict()
         )
         db.add(question)
+        await get_achievement_engine().record_event(db, user_id, AchievementEvent.QUESTION_ASKED)
         await db.commit()
         await db.refresh(question)
         return question
@@ -85,37 +89,38 @@ class PlantQuestionService:
     async def search_questions(
         db: AsyncSession,
         search_params: PlantQuestionSearchRequest,
-        skip: int = 0,
-        limit: int = 20
-    ) -> tuple[List[PlantQuestion], int]:
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count: CountMode = CountMode.EXACT
+    ) -> Page:
         """Search plant questions with filters.
         
+        Results are ordered by ``sort_by`` in ``sort_order``, defaulting to
+        relevance for text searches and creation time otherwise; every
+        order is paged with keyset cursors.
+        
         Args:
             db: Database session
             search_params: Search parameters
-            skip: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Cursor from the previous page
+            count: How to compute the total on the first page
             
         Returns:
-            Tuple of (questions list, total count)
+            Page of questions
         """
         # Build base query
         base_query = select(PlantQuestion).options(
-            selectinload(PlantQuestion.author),
+            selectinload(PlantQuestion.user),
             selectinload(PlantQuestion.species)
         )
         
-        count_query = select(func.count(PlantQuestion.id))
-        
         # Apply search filters
         filters = []
         
-        if search_params.query:
-            search_filter = or_(
-                PlantQuestion.title.ilike(f"%{search_params.query}%"),
-                PlantQuestion.content.ilike(f"%{search_params.query}%")
-            )
-            filters.append(search_filter)
+        search = text_search(search_params.query, PlantQuestion.search_vector, [PlantQuestion.title])
+        if search:
+            filters.append(search.condition)
         
         if search_params.species_id:
             filters.append(PlantQuestion.species_id == search_params.species_id)
@@ -131,41 +136,33 @@ class PlantQuestionService:
         if search_params.is_solved is not None:
             filters.append(PlantQuestion.is_solved == search_params.is_solved)
         
-        if search_params.author_id:
-            filters.append(PlantQuestion.author_id == search_params.author_id)
+        if search_params.user_id:
+            filters.append(PlantQuestion.user_id == search_params.user_id)
         
-        # Apply filters to queries
         if filters:
-            filter_condition = and_(*filters)
-            base_query = base_query.where(filter_condition)
-            count_query = count_query.where(filter_condition)
-        
-        # Apply sorting
-        if search_params.sort_by == "newest":
-            base_query = base_query.order_by(desc(PlantQuestion.created_at))
-        elif search_params.sort_by == "oldest":
-            base_query = base_query.order_by(asc(PlantQuestion.created_at))
-        elif search_params.sort_by == "most_answers":
-            # Count answers for each question
-            base_query = base_query.outerjoin(PlantAnswer).group_by(PlantQuestion.id)
-            base_query = base_query.order_by(desc(func.count(PlantAnswer.id)))
-        elif search_params.sort_by == "unsolved":
-            base_query = base_query.where(PlantQuestion.is_solved == False)
-            base_query = base_query.order_by(desc(PlantQuestion.created_at))
-        else:  # Default to newest
-            base_query = base_query.order_by(desc(PlantQuestion.created_at))
+            base_query = base_query.where(and_(*filters))
         
-        # Get total count
-        count_result = await db.execute(count_query)
-        total = count_result.scalar()
-        
-        # Get paginated results
-        result = await db.execute(
-            base_query.offset(skip).limit(limit)
+        sort_by = search_params.sort_by or (
+            QuestionSortField.RELEVANCE if search else QuestionSortField.CREATED_AT
         )
-        questions = result.scalars().all()
+        descending = search_params.sort_order == SortOrder.DESC
         
-        return list(questions), total
+        if sort_by == QuestionSortField.CREATED_AT:
+            return await paginate(
+                db, base_query, [PlantQuestion.created_at, PlantQuestion.id],
+                limit, cursor, descending=descending, count=count
+            )
+        
+        if not search:
+            raise ValueError("Sorting by relevance requires a search query")
+        page = await paginate(
+            db, base_query.add_columns(search.rank.label("search_rank")),
+            [search.rank, PlantQuestion.id], limit, cursor,
+            descending=descending, count=count,
+            key=lambda row: (row.search_rank, row.PlantQuestion.id)
+        )
+        page.items = [row.PlantQuestion for row in page.items]
+        return page
     
     @staticmethod
     async def update_question(
@@ -335,6 +332,7 @@ class PlantAnswerService:
             **answer_data.dict()
         )
         db.add(answer)
+        await get_achievement_engine().record_event(db, user_id, AchievementEvent.QUESTION_ANSWERED)
         await db.commit()
         await db.refresh(answer)
         return answer
@@ -479,6 +477,10 @@ class PlantAnswerService:
         # Update vote counts
         if is_upvote:
             answer.upvotes += 1
+            # An upvote is a helpful vote for the answer's author
+            await get_achievement_engine().record_event(
+                db, answer.user_id, AchievementEvent.ANSWER_MARKED_HELPFUL
+            )
         else:
             answer.downvotes += 1
         
@@ -543,11 +545,12 @@ async def get_question_by_id(
 async def search_questions(
     db: AsyncSession,
     search_params: PlantQuestionSearchRequest,
-    skip: int = 0,
-    limit: int = 20
-) -> tuple[List[PlantQuestion], int]:
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    count: CountMode = CountMode.EXACT
+) -> Page:
     """Search plant questions."""
-    return await PlantQuestionService.search_questions(db, search_params, skip, limit)
+    return await PlantQuestionService.search_questions(db, search_params, limit, cursor, count)
 
 
 async def create_answer(
@@ -14,6 +14,11 @@ from sqlalchemy.orm import selectinload
 
 from app.models.plant_species import PlantSpecies
 from app.schemas.plant_species import PlantSpeciesCreate, PlantSpeciesUpdate
+from app.services.care_reminder_service import SCHEDULED_CARE, schedule_species
+from app.services.species_lexicon import get_species_lexicon
+
+# Species fields that move the care reminder due dates of its plants
+_INTERVAL_FIELDS = {column for _, column in SCHEDULED_CARE.values()}
 
 
 class PlantSpeciesService:
@@ -36,6 +41,7 @@ class PlantSpeciesService:
         species = PlantSpecies(**species_data.dict())
         db.add(species)
         await db.commit()
+        get_species_lexicon().invalidate()
         await db.refresh(species)
         return species
     
@@ -169,7 +175,11 @@ class PlantSpeciesService:
         for field, value in update_data.items():
             setattr(species, field, value)
         
+        if _INTERVAL_FIELDS.intersection(update_data):
+            await db.flush()
+            await schedule_species(db, species.id)
         await db.commit()
+        get_species_lexicon().invalidate()
         await db.refresh(species)
         return species
     
@@ -197,6 +207,7 @@ class PlantSpeciesService:
         
         await db.delete(species)
         await db.commit()
+        get_species_lexicon().invalidate()
         return True
     
     @staticmethod
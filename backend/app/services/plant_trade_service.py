@@ -8,14 +8,16 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 
-from sqlalchemy import and_, or_, func, desc, asc
+from sqlalchemy import and_, or_, func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
 from app.models.plant_trade import PlantTrade, TradeStatus, TradeType
 from app.models.plant_species import PlantSpecies
-from app.schemas.plant_trade import PlantTradeCreate, PlantTradeUpdate, PlantTradeSearchRequest
+from app.schemas.plant_trade import PlantTradeCreate, PlantTradeUpdate, PlantTradeSearchRequest, TradeSortField
+from app.services.full_text_search import text_search
+from app.utils.pagination import CountMode, Page, SortOrder, paginate
 
 
 class PlantTradeService:
@@ -141,62 +143,47 @@ class PlantTradeService:
     async def search_trades(
         db: AsyncSession,
         search_params: PlantTradeSearchRequest,
-        skip: int = 0,
-        limit: int = 20
-    ) -> tuple[List[PlantTrade], int]:
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count: CountMode = CountMode.EXACT
+    ) -> Page:
         """Search plant trades with filters.
         
+        Results are ordered by ``sort_by`` in ``sort_order``, defaulting to
+        relevance for text searches and creation time otherwise; every
+        order is paged with keyset cursors.
+        
         Args:
             db: Database session
             search_params: Search parameters
-            skip: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Cursor from the previous page
+            count: How to compute the total on the first page
             
         Returns:
-            Tuple of (trades list, total count)
+            Page of trades
         """
         # Build base query
         base_query = select(PlantTrade).options(
             selectinload(PlantTrade.owner),
             selectinload(PlantTrade.species)
-        ).where(
-            and_(
-                PlantTrade.is_active == True,
-                PlantTrade.status == TradeStatus.AVAILABLE
-            )
-        )
-        
-        count_query = select(func.count(PlantTrade.id)).where(
-            and_(
-                PlantTrade.is_active == True,
-                PlantTrade.status == TradeStatus.AVAILABLE
-            )
-        )
+        ).where(PlantTrade.status == TradeStatus.AVAILABLE)
         
         # Apply search filters
-        if search_params.query:
-            search_filter = or_(
-                PlantTrade.title.ilike(f"%{search_params.query}%"),
-                PlantTrade.description.ilike(f"%{search_params.query}%")
-            )
-            base_query = base_query.where(search_filter)
-            count_query = count_query.where(search_filter)
+        search = text_search(search_params.query, PlantTrade.search_vector, [PlantTrade.title])
+        if search:
+            base_query = base_query.where(search.condition)
         
         if search_params.trade_type:
             base_query = base_query.where(PlantTrade.trade_type == search_params.trade_type)
-            count_query = count_query.where(PlantTrade.trade_type == search_params.trade_type)
         
         if search_params.species_id:
             base_query = base_query.where(PlantTrade.species_id == search_params.species_id)
-            count_query = count_query.where(PlantTrade.species_id == search_params.species_id)
         
         if search_params.location:
             base_query = base_query.where(
                 PlantTrade.location.ilike(f"%{search_params.location}%")
             )
-            count_query = count_query.where(
-                PlantTrade.location.ilike(f"%{search_params.location}%")
-            )
         
         if search_params.max_price is not None:
             base_query = base_query.where(
@@ -205,34 +192,32 @@ class PlantTradeService:
                     PlantTrade.price.is_(None)  # Include free items
                 )
             )
-            count_query = count_query.where(
-                or_(
-                    PlantTrade.price <= search_params.max_price,
-                    PlantTrade.price.is_(None)
-                )
-            )
         
-        # Apply sorting
-        if search_params.sort_by == "price_low":
-            base_query = base_query.order_by(asc(PlantTrade.price.nulls_first()))
-        elif search_params.sort_by == "price_high":
-            base_query = base_query.order_by(desc(PlantTrade.price.nulls_last()))
-        elif search_params.sort_by == "newest":
-            base_query = base_query.order_by(desc(PlantTrade.created_at))
-        else:  # Default to newest
-            base_query = base_query.order_by(desc(PlantTrade.created_at))
-        
-        # Get total count
-        count_result = await db.execute(count_query)
-        total = count_result.scalar()
-        
-        # Get paginated results
-        result = await db.execute(
-            base_query.offset(skip).limit(limit)
+        sort_by = search_params.sort_by or (
+            TradeSortField.RELEVANCE if search else TradeSortField.CREATED_AT
+        )
+        descending = search_params.sort_order == SortOrder.DESC
+        
+        if sort_by == TradeSortField.RELEVANCE:
+            if not search:
+                raise ValueError("Sorting by relevance requires a search query")
+            page = await paginate(
+                db, base_query.add_columns(search.rank.label("search_rank")),
+                [search.rank, PlantTrade.id], limit, cursor,
+                descending=descending, count=count,
+                key=lambda row: (row.search_rank, row.PlantTrade.id)
+            )
+            page.items = [row.PlantTrade for row in page.items]
+            return page
+        
+        sort_column = {
+            TradeSortField.CREATED_AT: PlantTrade.created_at,
+            TradeSortField.TITLE: PlantTrade.title,
+        }[sort_by]
+        return await paginate(
+            db, base_query, [sort_column, PlantTrade.id], limit, cursor,
+            descending=descending, count=count
         )
-        trades = result.scalars().all()
-        
-        return list(trades), total
     
     @staticmethod
     async def update_trade(
@@ -585,11 +570,12 @@ async def get_trade_by_id(
 async def search_trades(
     db: AsyncSession,
     search_params: PlantTradeSearchRequest,
-    skip: int = 0,
-    limit: int = 20
-) -> tuple[List[PlantTrade], int]:
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    count: CountMode = CountMode.EXACT
+) -> Page:
     """Search plant trades."""
-    return await PlantTradeService.search_trades(db, search_params, skip, limit)
+    return await PlantTradeService.search_trades(db, search_params, limit, cursor, count)
 
 
 async def express_interest(
@@ -0,0 +1,132 @@
+"""In-process cache of authenticated principals.
+
+Resolving a bearer token used to cost a JWT decode plus a ``select(User)``
+on every API request and WebSocket connect. Two small caches remove both:
+
+- decoded claims, keyed by a digest of the token and kept until the token
+  expires or the TTL passes, whichever comes first;
+- a snapshot of the user row, keyed by user id and kept for the TTL.
+
+The snapshot holds the row's column values only (no relationships). On a
+hit it is turned back into a ``User`` and merged into the request session
+without a query, so endpoints still receive a session-bound ``User`` whose
+changes flush normally. Role grants and revokes, profile updates and
+deactivation call ``invalidate_user``; other worker processes pick such
+changes up when the TTL expires.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.models.user import User
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class PrincipalCache:
+    """TTL and size bounded caches of token claims and user snapshots."""
+
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._claims: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._users: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._columns = [attribute.key for attribute in sa_inspect(User).mapper.column_attrs]
+        self.claim_hits = 0
+        self.user_hits = 0
+        self.user_misses = 0
+
+    def get_claims(self, token: str) -> Optional[Dict[str, Any]]:
+        """Decoded claims for a token seen recently, or None."""
+        key = _token_key(token)
+        entry = self._claims.get(key)
+        if entry is None:
+            return None
+        claims, expires_at = entry
+        if expires_at <= time.time():
+            del self._claims[key]
+            return None
+        self._claims.move_to_end(key)
+        self.claim_hits += 1
+        return claims
+
+    def put_claims(self, token: str, claims: Dict[str, Any]) -> None:
+        """Remember the claims of a verified token."""
+        expires_at = time.time() + self.ttl_seconds
+        if isinstance(claims.get("exp"), (int, float)):
+            expires_at = min(expires_at, claims["exp"])
+        self._store(self._claims, _token_key(token), (claims, expires_at))
+
+    def get_user_values(self, user_id: Any) -> Optional[Dict[str, Any]]:
+        """Cached column values of a user, or None."""
+        key = str(user_id)
+        entry = self._users.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            self._users.pop(key, None)
+            self.user_misses += 1
+            return None
+        self._users.move_to_end(key)
+        self.user_hits += 1
+        return entry[0]
+
+    def put_user(self, user: User) -> None:
+        """Snapshot a freshly loaded user."""
+        values = {column: getattr(user, column) for column in self._columns}
+        self._store(self._users, str(user.id), (values, time.monotonic() + self.ttl_seconds))
+
+    async def get_user(self, user_id: Any, session: AsyncSession) -> Optional[User]:
+        """Cached user merged into ``session`` without a query, or None."""
+        values = self.get_user_values(user_id)
+        if values is None:
+            return None
+        user = User(**values)
+        make_transient_to_detached(user)
+        return await session.merge(user, load=False)
+
+    def invalidate_user(self, user_id: Any) -> None:
+        """Drop a user's snapshot (call after role, status or profile changes)."""
+        self._users.pop(str(user_id), None)
+
+    def clear(self) -> None:
+        self._claims.clear()
+        self._users.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.user_hits + self.user_misses
+        return {
+            "claims": len(self._claims),
+            "users": len(self._users),
+            "claim_hits": self.claim_hits,
+            "user_hits": self.user_hits,
+            "user_misses": self.user_misses,
+            "user_hit_rate": self.user_hits / lookups if lookups else 0.0,
+        }
+
+    def _store(self, entries: OrderedDict, key: str, value: Tuple[Dict[str, Any], float]) -> None:
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+
+_principal_cache: Optional[PrincipalCache] = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Get the process-wide principal cache."""
+    global _principal_cache
+    if _principal_cache is None:
+        _principal_cache = PrincipalCache(
+            ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+            max_entries=settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES
+        )
+    return _principal_cache
@@ -1,7 +1,6 @@
 """RAG Content Pipeline for embedding generation and content indexing."""
 
 import logging
-import asyncio
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime, timedelta
 import json
@@ -18,6 +17,8 @@ from app.models.plant_question import PlantQuestion, PlantAnswer
 from app.models.story import Story
 from app.services.embedding_service import EmbeddingService
 from app.services.vector_database_service import VectorDatabaseService
+from app.services.rag_reindex_pipeline import BulkReindexPipeline
+from app.services.semantic_answer_cache import get_semantic_answer_cache
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -222,6 +223,7 @@ class RAGContentPipeline:
             
             db.add(content_embedding)
             await db.commit()
+            await get_semantic_answer_cache().invalidate_sources([knowledge_id])
             
             logger.info(f"Successfully indexed knowledge entry: {knowledge_entry.title}")
             return True
@@ -312,45 +314,15 @@ class RAGContentPipeline:
             await db.rollback()
             return False
     
-    async def bulk_index_all_species(self, db: AsyncSession) -> Dict[str, int]:
-        """Index all plant species in the database."""
+    async def bulk_index_all_species(self, db: AsyncSession, force: bool = False) -> Dict[str, int]:
+        """Index all plant species in the database.
+        
+        Species are streamed through the bulk reindex pipeline; species whose
+        content is unchanged since the last run are skipped.
+        """
         try:
-            # Get all plant species
-            species_stmt = select(PlantSpecies.id, PlantSpecies.scientific_name)
-            species_result = await db.execute(species_stmt)
-            all_species = species_result.fetchall()
-            
-            results = {"success": 0, "failed": 0, "total": len(all_species)}
-            
-            logger.info(f"Starting bulk indexing of {len(all_species)} plant species")
-            
-            # Process in batches
-            batch_size = 5
-            for i in range(0, len(all_species), batch_size):
-                batch = all_species[i:i + batch_size]
-                batch_tasks = []
-                
-                for species_id, scientific_name in batch:
-                    task = self.index_plant_species(db, str(species_id))
-                    batch_tasks.append(task)
-                
-                # Process batch
-                batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-                
-                for j, result in enumerate(batch_results):
-                    if isinstance(result, Exception):
-                        results["failed"] += 1
-                        logger.error(f"Failed to index species {batch[j][1]}: {str(result)}")
-                    elif result:
-                        results["success"] += 1
-                    else:
-                        results["failed"] += 1
-                
-                # Small delay between batches to avoid overwhelming the system
-                await asyncio.sleep(0.1)
-            
-            logger.info(f"Bulk species indexing completed: {results}")
-            return results
+            pipeline = BulkReindexPipeline(self.embedding_service)
+            return await pipeline.run(db, content_types=["species"], force=force)
             
         except Exception as e:
             logger.error(f"Error in bulk species indexing: {str(e)}")
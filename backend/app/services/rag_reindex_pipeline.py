@@ -0,0 +1,456 @@
+"""Streaming bulk reindex pipeline for the RAG corpus.
+
+Reindexing runs as three stages connected by bounded queues:
+
+1. fetch   - source rows are read page by page with keyset pagination and
+             turned into documents; documents whose content hash matches
+             the stored embedding are skipped.
+2. embed   - documents are embedded in provider-sized batches by a fixed
+             number of concurrent workers.
+3. upsert  - embedded batches are written to ``PlantContentEmbedding`` with
+             one bulk delete and one bulk insert per content type.
+
+The bounded queues keep memory flat regardless of corpus size and let the
+database reads, embedding calls and writes overlap.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.database import AsyncSessionLocal
+from app.models.plant_question import PlantAnswer, PlantQuestion
+from app.models.plant_species import PlantSpecies
+from app.models.rag_models import PlantContentEmbedding, PlantKnowledgeBase
+from app.models.story import Story
+from app.services.embedding_service import EmbeddingService
+from app.services.semantic_answer_cache import get_semantic_answer_cache
+
+logger = logging.getLogger(__name__)
+
+# Source keys accepted by ``run`` (matching the reindex API) mapped to the
+# ``content_type`` stored on ``PlantContentEmbedding``.
+EMBEDDING_CONTENT_TYPES: Dict[str, str] = {
+    "species": "species_info",
+    "knowledge": "knowledge_base",
+    "question": "question",
+    "answer": "answer",
+    "story": "story",
+}
+
+
+def compute_content_hash(text: str) -> str:
+    """Return the SHA-256 hash used to detect unchanged content."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class IndexDocument:
+    """A single piece of content ready to be embedded."""
+    content_type: str
+    content_id: UUID
+    text: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def content_hash(self) -> str:
+        return compute_content_hash(self.text)
+
+
+@dataclass
+class ReindexStats:
+    """Counters collected while the pipeline runs."""
+    fetched: int = 0
+    skipped: int = 0
+    success: int = 0
+    failed: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = max(time.perf_counter() - self.started_at, 1e-9)
+        return {
+            "success": self.success,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "total": self.fetched,
+            "elapsed_seconds": round(elapsed, 3),
+            "items_per_second": round(self.success / elapsed, 2),
+        }
+
+
+def _species_document(species: PlantSpecies) -> IndexDocument:
+    common_names = ", ".join(species.common_names) if species.common_names else "None"
+    text_parts = [
+        f"Plant: {species.scientific_name}",
+        f"Common names: {common_names}",
+        f"Family: {species.family}",
+        f"Care level: {species.care_level}",
+    ]
+    if species.light_requirements:
+        text_parts.append(f"Light requirements: {species.light_requirements}")
+    if species.water_frequency_days:
+        text_parts.append(f"Water every {species.water_frequency_days} days")
+    if species.humidity_preference:
+        text_parts.append(f"Humidity preference: {species.humidity_preference}")
+    if species.temperature_range:
+        text_parts.append(f"Temperature range: {species.temperature_range}")
+    if species.toxicity_info:
+        text_parts.append(f"Toxicity: {species.toxicity_info}")
+    if species.care_notes:
+        text_parts.append(f"Care notes: {species.care_notes}")
+    text = "\n".join(text_parts)
+
+    return IndexDocument(
+        content_type="species_info",
+        content_id=species.id,
+        text=text,
+        metadata={
+            "scientific_name": species.scientific_name,
+            "common_names": species.common_names,
+            "family": species.family,
+            "care_level": species.care_level,
+            "light_requirements": species.light_requirements,
+            "water_frequency_days": species.water_frequency_days,
+            "humidity_preference": species.humidity_preference,
+            "temperature_range": species.temperature_range,
+            "content_length": len(text),
+        },
+    )
+
+
+def _knowledge_document(entry: PlantKnowledgeBase) -> IndexDocument:
+    text_parts = [
+        f"Title: {entry.title}",
+        f"Content: {entry.content}",
+        f"Type: {entry.content_type}",
+    ]
+    if entry.difficulty_level:
+        text_parts.append(f"Difficulty: {entry.difficulty_level}")
+    if entry.season:
+        text_parts.append(f"Season: {entry.season}")
+    if entry.tags:
+        text_parts.append(f"Tags: {', '.join(entry.tags)}")
+
+    metadata = {
+        "title": entry.title,
+        "content_type": entry.content_type,
+        "difficulty_level": entry.difficulty_level,
+        "season": entry.season,
+        "climate_zones": entry.climate_zones,
+        "tags": entry.tags,
+        "verified": entry.verified,
+        "helpful_count": entry.helpful_count,
+        "content_length": len(entry.content),
+    }
+    if entry.plant_species_id:
+        metadata["plant_species_id"] = str(entry.plant_species_id)
+
+    return IndexDocument(
+        content_type="knowledge_base",
+        content_id=entry.id,
+        text="\n".join(text_parts),
+        metadata=metadata,
+    )
+
+
+def _question_document(question: PlantQuestion) -> IndexDocument:
+    return IndexDocument(
+        content_type="question",
+        content_id=question.id,
+        text=f"{question.title}\n{question.content or ''}",
+        metadata={
+            "title": question.title,
+            "tags": question.tags,
+            "is_solved": question.is_solved,
+            "species_id": str(question.species_id) if question.species_id else None,
+            "user_experience": question.user.gardening_experience if question.user else "unknown",
+        },
+    )
+
+
+def _answer_document(answer: PlantAnswer) -> IndexDocument:
+    return IndexDocument(
+        content_type="answer",
+        content_id=answer.id,
+        text=answer.content,
+        metadata={
+            "question_id": str(answer.question_id),
+            "is_accepted": answer.is_accepted,
+            "upvotes": answer.upvotes,
+            "user_experience": answer.user.gardening_experience if answer.user else "unknown",
+            "answer_length": len(answer.content),
+        },
+    )
+
+
+def _story_document(story: Story) -> IndexDocument:
+    return IndexDocument(
+        content_type="story",
+        content_id=story.id,
+        text=f"{story.caption or ''}\n{story.plant_tags or ''}",
+        metadata={
+            "plant_tags": story.plant_tags,
+            "location": story.location,
+            "user_experience": story.user.gardening_experience if story.user else "unknown",
+        },
+    )
+
+
+# Source key -> (model, eager-load options, document builder)
+_SOURCES: Dict[str, Tuple[Any, Sequence[Any], Callable[[Any], IndexDocument]]] = {
+    "species": (PlantSpecies, (), _species_document),
+    "knowledge": (PlantKnowledgeBase, (), _knowledge_document),
+    "question": (PlantQuestion, (selectinload(PlantQuestion.user),), _question_document),
+    "answer": (PlantAnswer, (selectinload(PlantAnswer.user),), _answer_document),
+    "story": (Story, (selectinload(Story.user),), _story_document),
+}
+
+
+class BulkReindexPipeline:
+    """Fetch -> embed -> upsert pipeline for bulk RAG reindexing."""
+
+    _DONE = object()
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        page_size: int = 500,
+        embed_batch_size: int = 64,
+        embed_concurrency: int = 4,
+        queue_size: int = 8,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ):
+        self.embedding_service = embedding_service
+        self.page_size = page_size
+        self.embed_batch_size = embed_batch_size
+        self.embed_concurrency = embed_concurrency
+        self.queue_size = queue_size
+        self.session_factory = session_factory
+
+    async def run(
+        self,
+        db: AsyncSession,
+        content_types: Optional[List[str]] = None,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """Reindex the requested content types.
+
+        Args:
+            db: Database session used for reading source rows
+            content_types: Source keys to reindex (None for all)
+            force: Re-embed even when the stored content hash matches
+
+        Returns:
+            Summary with success/failed/skipped counts and throughput
+        """
+        sources = [key for key in _SOURCES if not content_types or key in content_types]
+        stats = ReindexStats()
+        embed_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        write_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        logger.info(f"Starting bulk reindex of {sources} (force={force})")
+
+        embed_workers = [
+            asyncio.create_task(self._embed_worker(embed_queue, write_queue, stats))
+            for _ in range(self.embed_concurrency)
+        ]
+        writer = asyncio.create_task(self._write_worker(write_queue, stats))
+
+        try:
+            await self._produce(db, sources, force, embed_queue, stats)
+        finally:
+            for _ in embed_workers:
+                await embed_queue.put(self._DONE)
+            await asyncio.gather(*embed_workers, return_exceptions=True)
+            await write_queue.put(self._DONE)
+            await writer
+
+        summary = stats.to_dict()
+        logger.info(f"Bulk reindex completed: {summary}")
+        return summary
+
+    async def index_ids(
+        self,
+        db: AsyncSession,
+        source: str,
+        content_ids: Sequence[Any],
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """Embed a known set of items of one source without queueing.
+
+        Used by incremental updates where the set of dirty items is small.
+        """
+        model, options, build = _SOURCES[source]
+        stats = ReindexStats()
+
+        rows = (await db.execute(
+            select(model).options(*options).where(model.id.in_(list(content_ids)))
+        )).scalars().all()
+        documents = [build(row) for row in rows]
+        stats.fetched = len(documents)
+        if documents and not force:
+            documents = await self._drop_unchanged(db, documents, stats)
+
+        for start in range(0, len(documents), self.embed_batch_size):
+            batch = documents[start:start + self.embed_batch_size]
+            try:
+                embeddings = await self.embedding_service.generate_batch_embeddings(
+                    [document.text for document in batch]
+                )
+                await self.write_batch(batch, embeddings)
+                stats.success += len(batch)
+            except Exception as e:
+                logger.error(f"Failed to index {len(batch)} {source} items: {str(e)}")
+                stats.failed += len(batch)
+
+        return stats.to_dict()
+
+    async def iter_documents(
+        self,
+        db: AsyncSession,
+        sources: List[str],
+        force: bool,
+        stats: ReindexStats,
+    ) -> AsyncIterator[List[IndexDocument]]:
+        """Yield pages of documents that need (re)embedding."""
+        for source in sources:
+            model, options, build = _SOURCES[source]
+            last_id = None
+
+            while True:
+                stmt = select(model).options(*options).order_by(model.id).limit(self.page_size)
+                if last_id is not None:
+                    stmt = stmt.where(model.id > last_id)
+                rows = (await db.execute(stmt)).scalars().all()
+                if not rows:
+                    break
+                last_id = rows[-1].id
+
+                documents = [build(row) for row in rows]
+                stats.fetched += len(documents)
+                if not force:
+                    documents = await self._drop_unchanged(db, documents, stats)
+                if documents:
+                    yield documents
+
+                if len(rows) < self.page_size:
+                    break
+
+    async def write_batch(self, documents: List[IndexDocument], embeddings: List[List[float]]) -> None:
+        """Replace stored embeddings for a batch of documents."""
+        by_type: Dict[str, List[Tuple[IndexDocument, List[float]]]] = {}
+        for document, embedding in zip(documents, embeddings):
+            by_type.setdefault(document.content_type, []).append((document, embedding))
+
+        async with self.session_factory() as db:
+            try:
+                for content_type, pairs in by_type.items():
+                    await db.execute(
+                        delete(PlantContentEmbedding).where(
+                            and_(
+                                PlantContentEmbedding.content_type == content_type,
+                                PlantContentEmbedding.content_id.in_([d.content_id for d, _ in pairs])
+                            )
+                        )
+                    )
+                    await db.execute(
+                        insert(PlantContentEmbedding),
+                        [
+                            {
+                                "content_type": content_type,
+                                "content_id": document.content_id,
+                                "embedding": embedding,
+                                "meta_data": {**document.metadata, "content_hash": document.content_hash},
+                            }
+                            for document, embedding in pairs
+                        ]
+                    )
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+        # Cached answers built from re-embedded knowledge may now be stale
+        knowledge_ids = [d.content_id for d, _ in by_type.get("knowledge_base", [])]
+        if knowledge_ids:
+            await get_semantic_answer_cache().invalidate_sources(knowledge_ids)
+
+    async def _produce(
+        self,
+        db: AsyncSession,
+        sources: List[str],
+        force: bool,
+        embed_queue: asyncio.Queue,
+        stats: ReindexStats,
+    ) -> None:
+        pending: List[IndexDocument] = []
+        async for documents in self.iter_documents(db, sources, force, stats):
+            pending.extend(documents)
+            while len(pending) >= self.embed_batch_size:
+                await embed_queue.put(pending[:self.embed_batch_size])
+                pending = pending[self.embed_batch_size:]
+        if pending:
+            await embed_queue.put(pending)
+
+    async def _drop_unchanged(
+        self,
+        db: AsyncSession,
+        documents: List[IndexDocument],
+        stats: ReindexStats,
+    ) -> List[IndexDocument]:
+        content_type = documents[0].content_type
+        stmt = select(
+            PlantContentEmbedding.content_id,
+            PlantContentEmbedding.meta_data["content_hash"].astext
+        ).where(
+            and_(
+                PlantContentEmbedding.content_type == content_type,
+                PlantContentEmbedding.content_id.in_([d.content_id for d in documents])
+            )
+        )
+        stored = {str(content_id): content_hash for content_id, content_hash in await db.execute(stmt)}
+
+        changed = [d for d in documents if stored.get(str(d.content_id)) != d.content_hash]
+        stats.skipped += len(documents) - len(changed)
+        return changed
+
+    async def _embed_worker(
+        self,
+        embed_queue: asyncio.Queue,
+        write_queue: asyncio.Queue,
+        stats: ReindexStats,
+    ) -> None:
+        while True:
+            batch = await embed_queue.get()
+            if batch is self._DONE:
+                return
+            try:
+                embeddings = await self.embedding_service.generate_batch_embeddings(
+                    [document.text for document in batch]
+                )
+            except Exception as e:
+                logger.error(f"Failed to embed batch of {len(batch)} documents: {str(e)}")
+                stats.failed += len(batch)
+                continue
+            await write_queue.put((batch, embeddings))
+
+    async def _write_worker(self, write_queue: asyncio.Queue, stats: ReindexStats) -> None:
+        while True:
+            item = await write_queue.get()
+            if item is self._DONE:
+                return
+            documents, embeddings = item
+            try:
+                await self.write_batch(documents, embeddings)
+                stats.success += len(documents)
+            except Exception as e:
+                logger.error(f"Failed to write batch of {len(documents)} embeddings: {str(e)}")
+                stats.failed += len(documents)
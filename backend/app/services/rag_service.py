@@ -1,8 +1,9 @@
 """Main RAG service for intelligent plant care and content generation."""
 
+import asyncio
 import logging
 import time
-from typing import List, Dict, Any, Optional, Union
+from typing import AsyncIterator, List, Dict, Any, Optional, Set, Union
 from datetime import datetime
 from dataclasses import dataclass
 
@@ -11,12 +12,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal
 from app.models.rag_models import RAGInteraction, PlantKnowledgeBase
 from app.models.user import User
 from app.models.user_plant import UserPlant
 from app.models.plant_species import PlantSpecies
 from app.services.embedding_service import EmbeddingService
 from app.services.vector_database_service import VectorDatabaseService
+from app.services.semantic_answer_cache import SemanticAnswerCache, get_semantic_answer_cache
 
 logger = logging.getLogger(__name__)
 
@@ -54,13 +57,33 @@ class PlantCareAdvice:
     care_schedule_updates: Dict[str, Any] = None
 
 
+# Knowledge groups searched in parallel by the streaming advice path
+RETRIEVAL_SOURCES: List[List[str]] = [
+    ['care_guide', 'technique'],
+    ['species_info'],
+    ['problem_solution'],
+]
+
+
 class RAGService:
     """Main RAG service for intelligent plant care assistance."""
     
-    def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-        self.embedding_service = EmbeddingService()
-        self.vector_service = VectorDatabaseService(self.embedding_service)
+    def __init__(
+        self,
+        llm_client: Optional[AsyncOpenAI] = None,
+        embedding_service: Optional[EmbeddingService] = None,
+        vector_service: Optional[VectorDatabaseService] = None,
+        session_factory=AsyncSessionLocal,
+        answer_cache: Optional[SemanticAnswerCache] = None
+    ):
+        self.client = llm_client or AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        self.embedding_service = embedding_service or EmbeddingService()
+        self.vector_service = vector_service or VectorDatabaseService(self.embedding_service)
+        self.session_factory = session_factory
+        if answer_cache is None and settings.SEMANTIC_CACHE_ENABLED:
+            answer_cache = get_semantic_answer_cache()
+        self.answer_cache = answer_cache
+        self._background_tasks: Set[asyncio.Task] = set()
         
     async def generate_plant_care_advice(
         self,
@@ -83,13 +106,27 @@ class RAGService:
         start_time = time.time()
         
         try:
+            query_embedding = await self.embedding_service.generate_text_embedding(query)
+            
+            # Reuse an answer to a semantically equivalent question
+            cached = await self._lookup_cached_answer(query_embedding, user_context, plant_data)
+            if cached:
+                return PlantCareAdvice(
+                    advice=cached["advice"],
+                    confidence=cached["confidence"],
+                    sources=cached["sources"],
+                    urgent_actions=self._extract_urgent_actions(cached["advice"]),
+                    follow_up_questions=self._generate_follow_up_questions(query, cached["advice"])
+                )
+            
             # Search for relevant plant knowledge
             relevant_docs = await self.vector_service.search_plant_knowledge(
                 db=db,
                 query=query,
                 plant_species_id=plant_data.species_id,
                 difficulty_level=self._map_experience_to_difficulty(user_context.experience_level),
-                limit=5
+                limit=5,
+                query_embedding=query_embedding
             )
             
             # Build context for LLM
@@ -124,15 +161,20 @@ class RAGService:
                 follow_up_questions=self._generate_follow_up_questions(query, advice_text)
             )
             
-            # Log interaction
-            await self._log_rag_interaction(
-                db=db,
+            response_time_ms = int((time.time() - start_time) * 1000)
+            self._store_cached_answer(
+                query_embedding, user_context, plant_data,
+                advice_text, confidence, relevant_docs, response_time_ms
+            )
+            
+            # Log interaction off the response path
+            self._schedule_interaction_log(
                 user_id=user_context.user_id,
                 interaction_type="care_advice",
                 query=query,
                 retrieved_docs=relevant_docs,
                 response=advice_text,
-                response_time_ms=int((time.time() - start_time) * 1000),
+                response_time_ms=response_time_ms,
                 confidence=confidence
             )
             
@@ -148,6 +190,126 @@ class RAGService:
                 sources=[]
             )
     
+    async def stream_plant_care_advice(
+        self,
+        user_context: UserContext,
+        plant_data: PlantData,
+        query: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream personalized plant care advice as it is generated.
+        
+        Retrieval runs concurrently across all knowledge sources, each on
+        its own session, and LLM tokens are yielded as they arrive. The
+        interaction is logged in the background once the stream completes.
+        
+        Args:
+            user_context: User context information
+            plant_data: Plant-specific data
+            query: User's question or concern
+            
+        Yields:
+            Events of the form {"event": name, "data": payload} where name
+            is "sources", "token", "done" or "error"
+        """
+        start_time = time.time()
+        
+        try:
+            query_embedding = await self.embedding_service.generate_text_embedding(query)
+            
+            cached = await self._lookup_cached_answer(query_embedding, user_context, plant_data)
+            if cached:
+                yield {
+                    "event": "sources",
+                    "data": {"sources": cached["sources"], "confidence": cached["confidence"]}
+                }
+                yield {"event": "token", "data": cached["advice"]}
+                yield {
+                    "event": "done",
+                    "data": {
+                        "confidence": cached["confidence"],
+                        "urgent_actions": self._extract_urgent_actions(cached["advice"]),
+                        "follow_up_questions": self._generate_follow_up_questions(query, cached["advice"]),
+                        "response_time_ms": int((time.time() - start_time) * 1000),
+                        "cached": True
+                    }
+                }
+                return
+            
+            relevant_docs = await self._retrieve_knowledge_concurrently(
+                query_embedding=query_embedding,
+                query=query,
+                plant_species_id=plant_data.species_id,
+                difficulty_level=self._map_experience_to_difficulty(user_context.experience_level),
+                limit=5
+            )
+            confidence = self._calculate_confidence(relevant_docs)
+            yield {
+                "event": "sources",
+                "data": {"sources": relevant_docs, "confidence": confidence}
+            }
+            
+            context = self._build_care_advice_context(user_context, plant_data, relevant_docs)
+            stream = await self.client.chat.completions.create(
+                model="gpt-4-turbo-preview",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": self._get_plant_care_system_prompt()
+                    },
+                    {
+                        "role": "user",
+                        "content": f"Context: {context}\n\nQuestion: {query}"
+                    }
+                ],
+                temperature=0.7,
+                max_tokens=800,
+                stream=True
+            )
+            
+            parts: List[str] = []
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                token = chunk.choices[0].delta.content
+                if token:
+                    parts.append(token)
+                    yield {"event": "token", "data": token}
+            
+            advice_text = "".join(parts)
+            response_time_ms = int((time.time() - start_time) * 1000)
+            yield {
+                "event": "done",
+                "data": {
+                    "confidence": confidence,
+                    "urgent_actions": self._extract_urgent_actions(advice_text),
+                    "follow_up_questions": self._generate_follow_up_questions(query, advice_text),
+                    "response_time_ms": response_time_ms,
+                    "cached": False
+                }
+            }
+            
+            self._store_cached_answer(
+                query_embedding, user_context, plant_data,
+                advice_text, confidence, relevant_docs, response_time_ms
+            )
+            
+            self._schedule_interaction_log(
+                user_id=user_context.user_id,
+                interaction_type="care_advice",
+                query=query,
+                retrieved_docs=relevant_docs,
+                response=advice_text,
+                response_time_ms=response_time_ms,
+                confidence=confidence
+            )
+            
+        except Exception as e:
+            logger.error(f"Error streaming plant care advice: {str(e)}")
+            yield {
+                "event": "error",
+                "data": "I'm having trouble accessing plant care information right now. Please try again later or consult basic care guides."
+            }
+    
     async def generate_personalized_caption(
         self,
         db: AsyncSession,
@@ -536,6 +698,94 @@ class RAGService:
         
         return preferences
     
+    async def _retrieve_knowledge_concurrently(
+        self,
+        query_embedding: List[float],
+        query: str,
+        plant_species_id: Optional[str],
+        difficulty_level: Optional[str],
+        limit: int = 5
+    ) -> List[Dict[str, Any]]:
+        """Search all knowledge sources in parallel and merge by similarity."""
+        async def search(content_types: List[str]) -> List[Dict[str, Any]]:
+            async with self.session_factory() as session:
+                return await self.vector_service.search_plant_knowledge(
+                    db=session,
+                    query=query,
+                    plant_species_id=plant_species_id,
+                    difficulty_level=difficulty_level,
+                    content_types=content_types,
+                    limit=limit,
+                    query_embedding=query_embedding
+                )
+        
+        results = await asyncio.gather(
+            *(search(content_types) for content_types in RETRIEVAL_SOURCES),
+            return_exceptions=True
+        )
+        
+        merged: Dict[str, Dict[str, Any]] = {}
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Knowledge source search failed: {str(result)}")
+                continue
+            for doc in result:
+                merged.setdefault(doc['id'], doc)
+        
+        return sorted(merged.values(), key=lambda doc: doc['similarity_score'], reverse=True)[:limit]
+    
+    async def _lookup_cached_answer(
+        self,
+        query_embedding: List[float],
+        user_context: UserContext,
+        plant_data: PlantData
+    ) -> Optional[Dict[str, Any]]:
+        """Look up a cached answer for an equivalent question, if caching is on."""
+        if not self.answer_cache:
+            return None
+        await self.answer_cache.sync_invalidations()
+        return self.answer_cache.lookup(
+            query_embedding,
+            plant_data.species_id,
+            user_context.experience_level,
+            location=user_context.location,
+            current_health=plant_data.current_health
+        )
+    
+    def _store_cached_answer(
+        self,
+        query_embedding: List[float],
+        user_context: UserContext,
+        plant_data: PlantData,
+        advice_text: str,
+        confidence: float,
+        relevant_docs: List[Dict[str, Any]],
+        response_time_ms: int
+    ) -> None:
+        """Cache a freshly generated answer keyed by its query embedding."""
+        if not self.answer_cache or not advice_text:
+            return
+        self.answer_cache.store(
+            query_embedding,
+            plant_data.species_id,
+            user_context.experience_level,
+            answer={"advice": advice_text, "confidence": confidence, "sources": relevant_docs},
+            source_ids=[doc['id'] for doc in relevant_docs],
+            response_time_ms=response_time_ms,
+            location=user_context.location,
+            current_health=plant_data.current_health
+        )
+    
+    def _schedule_interaction_log(self, **interaction: Any) -> None:
+        """Write a RAG interaction log entry in the background."""
+        async def write() -> None:
+            async with self.session_factory() as session:
+                await self._log_rag_interaction(db=session, **interaction)
+        
+        task = asyncio.create_task(write())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
     async def _log_rag_interaction(
         self,
         db: AsyncSession,
@@ -3,12 +3,19 @@
 This module provides a rule-based system for generating care recommendations
 based on plant species, environmental conditions, and care history.
 It processes aggregated context data and applies configurable care rules.
+
+Rules are compiled once per rule set: field paths are split once and
+resolved once per context, conditions become (slot, operator, value,
+weight) tuples, and rules are bucketed by species and season filter so
+a context only evaluates the rules that can apply to it.
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from itertools import chain
+from typing import Callable, Dict, Iterable, List, Optional, Any, Tuple
 from uuid import UUID
 import json
+import operator
 from dataclasses import dataclass
 from enum import Enum
 
@@ -63,24 +70,228 @@ class CareRule:
     enabled: bool = True
 
 
+# Matches any species or season in the rule index
+_ANY = object()
+
+_OPERATORS: Dict[RuleConditionOperator, Callable[[Any, Any], bool]] = {
+    RuleConditionOperator.EQUALS: operator.eq,
+    RuleConditionOperator.NOT_EQUALS: operator.ne,
+    RuleConditionOperator.GREATER_THAN: operator.gt,
+    RuleConditionOperator.LESS_THAN: operator.lt,
+    RuleConditionOperator.GREATER_EQUAL: operator.ge,
+    RuleConditionOperator.LESS_EQUAL: operator.le,
+    RuleConditionOperator.CONTAINS: lambda actual, expected: expected in str(actual),
+    RuleConditionOperator.IN_RANGE: lambda actual, bounds: bounds[0] <= actual <= bounds[1],
+    RuleConditionOperator.EXISTS: lambda actual, expected: True,
+}
+
+
+def _compile_accessor(field_path: str) -> Callable[[Dict[str, Any]], Any]:
+    """Accessor for a dot-separated path; missing keys yield None."""
+    keys = tuple(field_path.split("."))
+
+    def get(data: Dict[str, Any]) -> Any:
+        current = data
+        for key in keys:
+            if isinstance(current, dict) and key in current:
+                current = current[key]
+            else:
+                return None
+        return current
+
+    return get
+
+
+_NEVER: Callable[[Any, Any], bool] = lambda actual, expected: False
+
+
+@dataclass
+class CompiledRule:
+    """A care rule with its conditions compiled to accessor tuples.
+
+    Each condition is ``(path slot, operator function, expected value,
+    weight)``; the slot indexes the context values resolved once per
+    context by ``CompiledRuleSet.resolve``.
+    """
+    index: int
+    rule: CareRule
+    conditions: List[Tuple[int, Callable[[Any, Any], bool], Any, float]]
+    total_weight: float
+
+    @classmethod
+    def compile(cls, index: int, rule: CareRule, slot_for: Callable[[str], int]) -> "CompiledRule":
+        conditions = []
+        for condition in rule.conditions:
+            expected = condition.value
+            if condition.operator == RuleConditionOperator.IN_RANGE:
+                expected = tuple(expected)
+            conditions.append((
+                slot_for(condition.field_path),
+                _OPERATORS.get(condition.operator, _NEVER),
+                expected,
+                condition.weight
+            ))
+        return cls(
+            index=index,
+            rule=rule,
+            conditions=conditions,
+            total_weight=sum(condition.weight for condition in rule.conditions)
+        )
+
+    def score(self, values: Tuple[Any, ...]) -> float:
+        """Weighted share of conditions met, between 0.0 and 1.0.
+
+        A missing value never meets a condition, EXISTS included.
+        """
+        if not self.conditions:
+            return 1.0
+        if self.total_weight <= 0:
+            return 0.0
+        met = 0.0
+        for slot, test, expected, weight in self.conditions:
+            actual = values[slot]
+            if actual is not None and test(actual, expected):
+                met += weight
+        return met / self.total_weight
+
+
+class CompiledRuleSet:
+    """Compiled rules indexed by (species, season) filter.
+
+    Every distinct field path gets one accessor, so a context's values
+    are resolved once and shared by all rules evaluated against it.
+    """
+
+    def __init__(self, rules: Iterable[CareRule]):
+        self._buckets: Dict[Tuple[Any, Any], List[CompiledRule]] = {}
+        self._slots: Dict[str, int] = {}
+        self._accessors: List[Callable[[Dict[str, Any]], Any]] = []
+        for index, rule in enumerate(rules):
+            compiled = CompiledRule.compile(index, rule, self._slot_for)
+            for species in rule.species_filter or (_ANY,):
+                for season in rule.season_filter or (_ANY,):
+                    self._buckets.setdefault((species, season), []).append(compiled)
+
+    def _slot_for(self, field_path: str) -> int:
+        slot = self._slots.get(field_path)
+        if slot is None:
+            slot = self._slots[field_path] = len(self._accessors)
+            self._accessors.append(_compile_accessor(field_path))
+        return slot
+
+    def resolve(self, context: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Values of every field path used by the rules, by slot."""
+        return tuple(get(context) for get in self._accessors)
+
+    def candidates(self, species_id: Any, season: Any) -> List[CompiledRule]:
+        """Rules whose filters admit this species and season, in rule order."""
+        buckets = [
+            bucket for bucket in (
+                self._buckets.get((_ANY, _ANY)),
+                self._buckets.get((species_id, _ANY)),
+                self._buckets.get((_ANY, season)),
+                self._buckets.get((species_id, season)),
+            )
+            if bucket
+        ]
+        if len(buckets) == 1:
+            return buckets[0]
+        return sorted(chain.from_iterable(buckets), key=lambda compiled: compiled.index)
+
+
+class CareRuleSet(list):
+    """List of care rules that keeps its compiled form.
+
+    The compiled rule set is built on first use and dropped whenever the
+    list changes. Call ``invalidate`` after editing a rule's conditions
+    or filters in place; ``enabled`` is read at evaluation time.
+    """
+
+    _compiled: Optional[CompiledRuleSet] = None
+
+    def compiled(self) -> CompiledRuleSet:
+        if self._compiled is None:
+            self._compiled = CompiledRuleSet(self)
+        return self._compiled
+
+    def invalidate(self) -> None:
+        self._compiled = None
+
+    def append(self, rule: CareRule) -> None:
+        self._compiled = None
+        super().append(rule)
+
+    def extend(self, rules: Iterable[CareRule]) -> None:
+        self._compiled = None
+        super().extend(rules)
+
+    def insert(self, index: int, rule: CareRule) -> None:
+        self._compiled = None
+        super().insert(index, rule)
+
+    def remove(self, rule: CareRule) -> None:
+        self._compiled = None
+        super().remove(rule)
+
+    def pop(self, index: int = -1) -> CareRule:
+        self._compiled = None
+        return super().pop(index)
+
+    def clear(self) -> None:
+        self._compiled = None
+        super().clear()
+
+    def sort(self, *args, **kwargs) -> None:
+        self._compiled = None
+        super().sort(*args, **kwargs)
+
+    def reverse(self) -> None:
+        self._compiled = None
+        super().reverse()
+
+    def __setitem__(self, index, value) -> None:
+        self._compiled = None
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index) -> None:
+        self._compiled = None
+        super().__delitem__(index)
+
+    def __iadd__(self, rules: Iterable[CareRule]) -> "CareRuleSet":
+        self._compiled = None
+        return super().__iadd__(rules)
+
+
 class RuleEngineService:
     """Service for processing care rules and generating recommendations."""
     
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        rules: Optional[List[CareRule]] = None,
+        context_service: Optional[ContextAggregationService] = None
+    ):
         """Initialize the rule engine service.
         
         Args:
             db: Database session
+            rules: Rule set to evaluate (the default rules if None); pass the
+                same ``CareRuleSet`` to share one rule set and its compiled
+                form between services. Plain lists are copied into one.
+            context_service: Context aggregation service to reuse
         """
         self.db = db
-        self.context_service = ContextAggregationService(db)
-        self.rules = self._load_default_rules()
+        self.context_service = context_service or ContextAggregationService(db)
+        if rules is None:
+            rules = self._load_default_rules()
+        self.rules = rules if isinstance(rules, CareRuleSet) else CareRuleSet(rules)
     
     async def generate_care_recommendations(
         self,
         plant_id: UUID,
         user_id: UUID,
-        context_window_days: int = 30
+        context_window_days: int = 30,
+        context: Optional[Dict[str, Any]] = None
     ) -> Tuple[List[CareRecommendation], Dict[str, Any]]:
         """Generate care recommendations for a plant.
         
@@ -88,29 +299,80 @@ class RuleEngineService:
             plant_id: Plant ID
             user_id: User ID
             context_window_days: Days of historical data to consider
+            context: Already aggregated context for this plant, if any
             
         Returns:
             Tuple of (recommendations list, processing metadata)
         """
         # Get aggregated context
-        context = await self.context_service.aggregate_plant_context(
-            plant_id, user_id, context_window_days
+        if context is None:
+            context = await self.context_service.aggregate_plant_context(
+                plant_id, user_id, context_window_days
+            )
+        
+        compiled = self.rules.compiled()
+        candidates = compiled.candidates(*self._filter_key(context))
+        return self._evaluate_context(context, compiled.resolve(context), candidates)
+    
+    def evaluate_contexts(
+        self,
+        contexts: List[Dict[str, Any]]
+    ) -> List[Tuple[List[CareRecommendation], Dict[str, Any]]]:
+        """Apply the rules to many aggregated plant contexts at once.
+        
+        Candidate rules are looked up once per (species, season) pair.
+        
+        Args:
+            contexts: Aggregated plant contexts
+            
+        Returns:
+            (recommendations list, processing metadata) per context, in order
+        """
+        compiled = self.rules.compiled()
+        candidates_by_key: Dict[Tuple[Any, Any], List[CompiledRule]] = {}
+        results = []
+        for context in contexts:
+            key = self._filter_key(context)
+            candidates = candidates_by_key.get(key)
+            if candidates is None:
+                candidates = candidates_by_key[key] = compiled.candidates(*key)
+            results.append(self._evaluate_context(context, compiled.resolve(context), candidates))
+        return results
+    
+    def _filter_key(self, context: Dict[str, Any]) -> Tuple[Any, Any]:
+        """(species, season) of a context, as matched by rule filters."""
+        return (
+            context.get("plant_info", {}).get("species_id"),
+            context.get("seasonal_context", {}).get("current_season")
         )
+    
+    def _evaluate_context(
+        self,
+        context: Dict[str, Any],
+        values: Tuple[Any, ...],
+        candidates: List[CompiledRule]
+    ) -> Tuple[List[CareRecommendation], Dict[str, Any]]:
+        """Score candidate rules against one context.
         
-        # Apply rules to generate recommendations
+        Args:
+            context: Plant context data
+            values: Context values resolved by the compiled rule set
+            candidates: Rules whose species and season filters admit the context
+            
+        Returns:
+            Tuple of (recommendations list, processing metadata)
+        """
         recommendations = []
         applied_rules = []
+        evaluated = 0
         
-        for rule in self.rules:
+        for compiled in candidates:
+            rule = compiled.rule
             if not rule.enabled:
                 continue
             
-            # Check if rule applies to this plant/context
-            if not self._rule_applies(rule, context):
-                continue
-            
-            # Evaluate rule conditions
-            rule_score = self._evaluate_rule_conditions(rule, context)
+            evaluated += 1
+            rule_score = compiled.score(values)
             
             if rule_score > 0.5:  # Rule threshold
                 # Generate recommendations from this rule
@@ -135,7 +397,8 @@ class RuleEngineService:
         metadata = {
             "processing_timestamp": datetime.utcnow().isoformat(),
             "context_completeness": context["contextual_metadata"]["data_completeness_score"],
-            "rules_evaluated": len(self.rules),
+            "rules_total": len(self.rules),
+            "rules_evaluated": evaluated,
             "rules_applied": len(applied_rules),
             "applied_rules": applied_rules,
             "total_recommendations": len(recommendations)
@@ -143,113 +406,6 @@ class RuleEngineService:
         
         return recommendations, metadata
     
-    def _rule_applies(self, rule: CareRule, context: Dict[str, Any]) -> bool:
-        """Check if a rule applies to the given context.
-        
-        Args:
-            rule: Care rule to check
-            context: Plant context data
-            
-        Returns:
-            True if rule applies, False otherwise
-        """
-        # Check species filter
-        if rule.species_filter:
-            species_id = context.get("plant_info", {}).get("species_id")
-            if species_id not in rule.species_filter:
-                return False
-        
-        # Check season filter
-        if rule.season_filter:
-            current_season = context.get("seasonal_context", {}).get("current_season")
-            if current_season not in rule.season_filter:
-                return False
-        
-        return True
-    
-    def _evaluate_rule_conditions(self, rule: CareRule, context: Dict[str, Any]) -> float:
-        """Evaluate all conditions for a rule.
-        
-        Args:
-            rule: Care rule to evaluate
-            context: Plant context data
-            
-        Returns:
-            Rule score between 0.0 and 1.0
-        """
-        if not rule.conditions:
-            return 1.0
-        
-        total_weight = sum(condition.weight for condition in rule.conditions)
-        weighted_score = 0.0
-        
-        for condition in rule.conditions:
-            condition_met = self._evaluate_condition(condition, context)
-            if condition_met:
-                weighted_score += condition.weight
-        
-        return weighted_score / total_weight if total_weight > 0 else 0.0
-    
-    def _evaluate_condition(self, condition: RuleCondition, context: Dict[str, Any]) -> bool:
-        """Evaluate a single rule condition.
-        
-        Args:
-            condition: Rule condition to evaluate
-            context: Plant context data
-            
-        Returns:
-            True if condition is met, False otherwise
-        """
-        # Get value from context using field path
-        actual_value = self._get_nested_value(context, condition.field_path)
-        
-        if actual_value is None and condition.operator != RuleConditionOperator.EXISTS:
-            return False
-        
-        # Evaluate based on operator
-        if condition.operator == RuleConditionOperator.EQUALS:
-            return actual_value == condition.value
-        elif condition.operator == RuleConditionOperator.NOT_EQUALS:
-            return actual_value != condition.value
-        elif condition.operator == RuleConditionOperator.GREATER_THAN:
-            return actual_value > condition.value
-        elif condition.operator == RuleConditionOperator.LESS_THAN:
-            return actual_value < condition.value
-        elif condition.operator == RuleConditionOperator.GREATER_EQUAL:
-            return actual_value >= condition.value
-        elif condition.operator == RuleConditionOperator.LESS_EQUAL:
-            return actual_value <= condition.value
-        elif condition.operator == RuleConditionOperator.CONTAINS:
-            return condition.value in str(actual_value)
-        elif condition.operator == RuleConditionOperator.IN_RANGE:
-            min_val, max_val = condition.value
-            return min_val <= actual_value <= max_val
-        elif condition.operator == RuleConditionOperator.EXISTS:
-            return actual_value is not None
-        
-        return False
-    
-    def _get_nested_value(self, data: Dict[str, Any], field_path: str) -> Any:
-        """Get nested value from dictionary using dot notation.
-        
-        Args:
-            data: Dictionary to search
-            field_path: Dot-separated path (e.g., "environmental_data.temperature.average")
-            
-        Returns:
-            Value at the specified path or None if not found
-        """
-        keys = field_path.split(".")
-        current = data
-        
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return None
-        
-        return current
-    
     def _generate_rule_recommendations(
         self,
         rule: CareRule,
@@ -267,10 +423,10 @@ class RuleEngineService:
             List of care recommendations
         """
         recommendations = []
+        context_completeness = context["contextual_metadata"]["data_completeness_score"]
         
         for base_rec in rule.recommendations:
             # Adjust confidence based on rule score and context completeness
-            context_completeness = context["contextual_metadata"]["data_completeness_score"]
             adjusted_confidence = base_rec.confidence * rule_score * context_completeness
             
             # Create personalized recommendation
@@ -11,13 +11,11 @@ Focused on seasonal patterns and environmental correlations.
 
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
 import json
 
-from app.models.timelapse import TimelapseSession, GrowthMilestone
-from app.models.growth_photo import GrowthPhoto
 from app.models.user_plant import UserPlant
+from app.services.growth_data_service import GrowthPoint, fetch_plant_timeline
 
 
 class SeasonalGrowthAnalyticsService:
@@ -28,7 +26,7 @@ class SeasonalGrowthAnalyticsService:
     
     async def analyze_seasonal_patterns(
         self,
-        db: Session,
+        db: AsyncSession,
         plant_id: str,
         location: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -43,27 +41,18 @@ class SeasonalGrowthAnalyticsService:
         Returns:
             Dictionary containing seasonal analysis results
         """
-        plant = db.query(UserPlant).filter(UserPlant.id == plant_id).first()
+        plant = await db.get(UserPlant, plant_id)
         if not plant:
             raise ValueError(f"Plant with id {plant_id} not found")
         
         # Get growth data for the past year
         start_date = datetime.utcnow() - timedelta(days=365)
-        sessions = db.query(TimelapseSession).filter(
-            TimelapseSession.plant_id == plant_id,
-            TimelapseSession.created_at >= start_date
-        ).all()
+        timelines = await fetch_plant_timeline(db, plant_id, since=start_date)
         
-        if not sessions:
+        if not timelines.photo_count:
             return self._empty_seasonal_analysis_response(plant_id)
         
-        # Get growth photos from sessions
-        photos = []
-        for session in sessions:
-            session_photos = db.query(GrowthPhoto).filter(
-                GrowthPhoto.timelapse_session_id == session.id
-            ).all()
-            photos.extend(session_photos)
+        photos = timelines.points(plant_id)
         
         if len(photos) < 10:
             return self._insufficient_seasonal_data_response(plant_id, len(photos))
@@ -86,7 +75,7 @@ class SeasonalGrowthAnalyticsService:
             "seasonal_health_score": self.calculate_seasonal_health_score(seasonal_breakdown)
         }
     
-    def analyze_seasonal_breakdown(self, photos: List[GrowthPhoto]) -> Dict[str, Any]:
+    def analyze_seasonal_breakdown(self, photos: List[GrowthPoint]) -> Dict[str, Any]:
         """
         Break down growth data by seasons.
         
@@ -128,7 +117,7 @@ class SeasonalGrowthAnalyticsService:
         
         return seasons
     
-    def calculate_seasonal_growth_rate(self, photos: List[GrowthPhoto]) -> float:
+    def calculate_seasonal_growth_rate(self, photos: List[GrowthPoint]) -> float:
         """
         Calculate growth rate for a season.
         
@@ -146,7 +135,7 @@ class SeasonalGrowthAnalyticsService:
         
         return total_growth / total_days if total_days > 0 else 0.0
     
-    def detect_seasonal_transitions(self, photos: List[GrowthPhoto]) -> List[Dict[str, Any]]:
+    def detect_seasonal_transitions(self, photos: List[GrowthPoint]) -> List[Dict[str, Any]]:
         """
         Detect seasonal transition periods and their effects.
         
@@ -184,7 +173,7 @@ class SeasonalGrowthAnalyticsService:
         
         return transitions
     
-    def calculate_growth_rate_between_photos(self, photo1: GrowthPhoto, photo2: GrowthPhoto) -> float:
+    def calculate_growth_rate_between_photos(self, photo1: GrowthPoint, photo2: GrowthPoint) -> float:
         """Calculate growth rate between two photos."""
         height_diff = (photo2.height_cm or 0) - (photo1.height_cm or 0)
         days_diff = (photo2.captured_at - photo1.captured_at).days
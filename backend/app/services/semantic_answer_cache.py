@@ -0,0 +1,312 @@
+"""Semantic response cache for RAG plant care answers.
+
+Answers are cached with the normalized embedding of the query that produced
+them, partitioned by species, experience level, location and plant health
+(all part of the prompt). A new query is served from the cache when its
+cosine similarity to a cached query exceeds the configured threshold, so
+near-identical questions ("why are my monstera leaves yellow" / "monstera
+leaves turning yellow why") skip the LLM.
+
+Entries expire after a TTL and are dropped when any knowledge entry they
+were generated from is reindexed. The cache lives in each process; with
+``SEMANTIC_CACHE_SHARED_INVALIDATION`` on, invalidations are also appended
+to a Redis stream that every process reads before a lookup, so a reindex
+in one worker drops stale answers in all of them. Without Redis, other
+processes keep stale answers until their TTL expires.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.core.cache import get_redis_client
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Redis stream of invalidations shared by all processes, trimmed to about
+# this many entries
+INVALIDATION_STREAM = "semantic_answer_cache:invalidations"
+INVALIDATION_STREAM_MAXLEN = 10000
+
+
+# (species, experience level, location, current health)
+PartitionKey = Tuple[str, str, str, str]
+
+
+@dataclass
+class CachedAnswer:
+    """A cached answer and the query embedding it was generated for."""
+    key: int
+    partition: PartitionKey
+    embedding: np.ndarray
+    answer: Dict[str, Any]
+    source_ids: Set[str]
+    response_time_ms: int
+    expires_at: float
+    hits: int = 0
+
+
+@dataclass
+class _Partition:
+    entries: List[CachedAnswer] = field(default_factory=list)
+    matrix: Optional[np.ndarray] = None
+
+    def invalidate_matrix(self) -> None:
+        self.matrix = None
+
+    def get_matrix(self) -> np.ndarray:
+        if self.matrix is None:
+            self.matrix = np.vstack([entry.embedding for entry in self.entries])
+        return self.matrix
+
+
+class SemanticAnswerCache:
+    """In-process similarity cache for generated answers."""
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.92,
+        ttl_seconds: int = 6 * 3600,
+        max_entries_per_partition: int = 1000,
+        redis_client=None,
+    ):
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries_per_partition = max_entries_per_partition
+        self.redis = redis_client
+        # Id of the last shared invalidation applied (None until the first sync)
+        self._stream_id: Optional[str] = None
+
+        self._partitions: Dict[PartitionKey, _Partition] = {}
+        self._by_source: Dict[str, Set[int]] = {}
+        self._entries: Dict[int, CachedAnswer] = {}
+        self._next_key = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.latency_saved_ms = 0.0
+
+    async def sync_invalidations(self) -> None:
+        """Apply invalidations other processes published since the last sync.
+
+        A no-op without Redis. Errors are logged and the lookup proceeds on
+        the local cache.
+        """
+        if self.redis is None:
+            return
+        try:
+            if self._stream_id is None:
+                # Start from the current end of the stream
+                latest = await self.redis.xrevrange(INVALIDATION_STREAM, count=1)
+                self._stream_id = latest[0][0] if latest else "0-0"
+                return
+            entries = await self.redis.xrange(INVALIDATION_STREAM, min=f"({self._stream_id}")
+        except Exception as e:
+            logger.warning(f"Could not read semantic cache invalidations: {str(e)}")
+            return
+
+        for entry_id, fields in entries:
+            if fields.get("clear"):
+                self._clear_local()
+            else:
+                self._invalidate_local(fields.get("ids", "").split(","))
+            self._stream_id = entry_id
+
+    def lookup(
+        self,
+        query_embedding: List[float],
+        species_id: Optional[str],
+        experience_level: Optional[str],
+        location: Optional[str] = None,
+        current_health: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Return a cached answer for a semantically equivalent query.
+
+        Args:
+            query_embedding: Embedding of the incoming query
+            species_id: Species the question is about
+            experience_level: Asking user's experience level
+            location: Asking user's location
+            current_health: Reported health of the plant
+
+        Returns:
+            Cached answer payload, or None on a miss
+        """
+        started = time.perf_counter()
+        partition = self._partitions.get(
+            self._partition_key(species_id, experience_level, location, current_health)
+        )
+        if partition:
+            self._evict_expired(partition)
+        if not partition or not partition.entries:
+            self.misses += 1
+            return None
+
+        similarities = partition.get_matrix() @ self._normalize(query_embedding)
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            self.misses += 1
+            return None
+
+        entry = partition.entries[best]
+        entry.hits += 1
+        self.hits += 1
+        lookup_ms = (time.perf_counter() - started) * 1000
+        self.latency_saved_ms += max(entry.response_time_ms - lookup_ms, 0.0)
+        return entry.answer
+
+    def store(
+        self,
+        query_embedding: List[float],
+        species_id: Optional[str],
+        experience_level: Optional[str],
+        answer: Dict[str, Any],
+        source_ids: Iterable[str],
+        response_time_ms: int,
+        location: Optional[str] = None,
+        current_health: Optional[str] = None,
+    ) -> None:
+        """Cache an answer generated for a query."""
+        key = self._partition_key(species_id, experience_level, location, current_health)
+        partition = self._partitions.setdefault(key, _Partition())
+
+        entry = CachedAnswer(
+            key=self._next_key,
+            partition=key,
+            embedding=self._normalize(query_embedding),
+            answer=answer,
+            source_ids={str(source_id) for source_id in source_ids},
+            response_time_ms=response_time_ms,
+            expires_at=time.time() + self.ttl_seconds,
+        )
+        self._next_key += 1
+
+        partition.entries.append(entry)
+        partition.invalidate_matrix()
+        self._entries[entry.key] = entry
+        for source_id in entry.source_ids:
+            self._by_source.setdefault(source_id, set()).add(entry.key)
+
+        if len(partition.entries) > self.max_entries_per_partition:
+            self._remove(partition.entries[0])
+
+    async def invalidate_sources(self, content_ids: Iterable[Any]) -> int:
+        """Drop cached answers generated from any of the given knowledge entries.
+
+        Returns:
+            Number of cached answers removed in this process
+        """
+        ids = [str(content_id) for content_id in content_ids]
+        removed = self._invalidate_local(ids)
+        if ids:
+            await self._publish({"ids": ",".join(ids)})
+        return removed
+
+    async def clear(self) -> None:
+        """Remove every cached answer."""
+        self._clear_local()
+        await self._publish({"clear": "1"})
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit rate and latency saved since process start."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "partitions": len(self._partitions),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "latency_saved_ms": round(self.latency_saved_ms, 1),
+            "similarity_threshold": self.similarity_threshold,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+    def _invalidate_local(self, content_ids: Iterable[str]) -> int:
+        keys: Set[int] = set()
+        for content_id in content_ids:
+            keys |= self._by_source.pop(content_id, set())
+
+        removed = 0
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry:
+                self._remove(entry)
+                removed += 1
+        if removed:
+            logger.info(f"Invalidated {removed} cached answers after knowledge reindex")
+        return removed
+
+    def _clear_local(self) -> None:
+        self._partitions.clear()
+        self._by_source.clear()
+        self._entries.clear()
+
+    async def _publish(self, fields: Dict[str, str]) -> None:
+        if self.redis is None:
+            return
+        try:
+            await self.redis.xadd(
+                INVALIDATION_STREAM, fields, maxlen=INVALIDATION_STREAM_MAXLEN, approximate=True
+            )
+        except Exception as e:
+            logger.warning(f"Could not publish semantic cache invalidation: {str(e)}")
+
+    def _remove(self, entry: CachedAnswer) -> None:
+        self._entries.pop(entry.key, None)
+        partition = self._partitions.get(entry.partition)
+        if partition:
+            partition.entries = [e for e in partition.entries if e.key != entry.key]
+            partition.invalidate_matrix()
+            if not partition.entries:
+                del self._partitions[entry.partition]
+        for source_id in entry.source_ids:
+            keys = self._by_source.get(source_id)
+            if keys:
+                keys.discard(entry.key)
+                if not keys:
+                    del self._by_source[source_id]
+
+    def _evict_expired(self, partition: _Partition) -> None:
+        now = time.time()
+        for entry in [e for e in partition.entries if e.expires_at <= now]:
+            self._remove(entry)
+
+    @staticmethod
+    def _partition_key(
+        species_id: Optional[str],
+        experience_level: Optional[str],
+        location: Optional[str],
+        current_health: Optional[str],
+    ) -> PartitionKey:
+        return (
+            str(species_id or ""),
+            experience_level or "beginner",
+            (location or "").strip().lower(),
+            (current_health or "").strip().lower(),
+        )
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+_semantic_answer_cache: Optional[SemanticAnswerCache] = None
+
+
+def get_semantic_answer_cache() -> SemanticAnswerCache:
+    """Get the process-wide semantic answer cache."""
+    global _semantic_answer_cache
+    if _semantic_answer_cache is None:
+        _semantic_answer_cache = SemanticAnswerCache(
+            similarity_threshold=settings.SEMANTIC_CACHE_SIMILARITY_THRESHOLD,
+            ttl_seconds=settings.SEMANTIC_CACHE_TTL_SECONDS,
+            max_entries_per_partition=settings.SEMANTIC_CACHE_MAX_ENTRIES_PER_PARTITION,
+            redis_client=get_redis_client() if settings.SEMANTIC_CACHE_SHARED_INVALIDATION else None,
+        )
+    return _semantic_answer_cache
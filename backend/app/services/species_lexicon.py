@@ -0,0 +1,287 @@
+"""In-memory species name index for identification matching.
+
+Every name a species is known by (scientific name, its bare binomial when
+the scientific name carries a cultivar or variety, and common names) is
+normalized and indexed once. Matching the names returned by the vision
+model is then a dict lookup for exact names, a binary search over the
+sorted names for prefixes (e.g. genus-only answers) and a trigram
+postings scan for misspellings — all without touching the database.
+
+The index is loaded with a single query, reloaded after a TTL so other
+processes' edits are picked up, and invalidated immediately when this
+process creates, updates or deletes a species.
+"""
+
+import asyncio
+import bisect
+import logging
+import re
+import time
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.plant_species import PlantSpecies
+
+logger = logging.getLogger(__name__)
+
+# Match type -> confidence for exact matches; earlier entries win ties
+EXACT_CONFIDENCE = {
+    "scientific_name": 0.9,
+    "binomial": 0.85,
+    "common_name": 0.8,
+}
+PREFIX_CONFIDENCE = 0.65
+# Fuzzy confidence scales with trigram similarity up to this value
+FUZZY_MAX_CONFIDENCE = 0.7
+
+_NON_WORD = re.compile(r"[^\w\s]|_")
+_HYBRID_MARKER = re.compile(r"(?<!\w)[x×](?!\w)")
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """Lowercase, strip accents, punctuation and hybrid markers, collapse spaces."""
+    if not name:
+        return ""
+    text = unicodedata.normalize("NFKD", name.replace("×", " x "))
+    text = "".join(char for char in text if not unicodedata.combining(char)).lower()
+    text = _HYBRID_MARKER.sub(" ", _NON_WORD.sub(" ", text))
+    return " ".join(text.split())
+
+
+def binomial(scientific_name: Optional[str]) -> Optional[str]:
+    """Normalized genus and specific epithet of a longer scientific name.
+
+    Only lowercase epithets count, so cultivar names (``'Pink Princess'``)
+    and hybrid markers never become aliases.
+    """
+    parts = (scientific_name or "").split()
+    if len(parts) > 2 and parts[1].isalpha() and parts[1].islower() and parts[1] not in ("sp", "spp", "x"):
+        return normalize_name(f"{parts[0]} {parts[1]}")
+    return None
+
+
+def trigrams(normalized_name: str) -> Set[str]:
+    """Word trigrams padded like ``pg_trgm`` (two spaces before, one after)."""
+    grams: Set[str] = set()
+    for word in normalized_name.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+@dataclass
+class SpeciesMatch:
+    """A species resolved from an identified name."""
+    species_id: Any
+    matched_name: str
+    match_type: str
+    match_confidence: float
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "species_id": self.species_id,
+            "match_type": self.match_type,
+            "match_confidence": self.match_confidence,
+        }
+
+
+class SpeciesLexicon:
+    """Normalized exact, prefix and trigram index over species names."""
+
+    def __init__(self, ttl_seconds: float = 600.0, fuzzy_threshold: float = 0.45):
+        self.ttl_seconds = ttl_seconds
+        self.fuzzy_threshold = fuzzy_threshold
+        self._names: List[str] = []
+        self._entries: List[Tuple[Any, str]] = []  # (species_id, match_type) per name
+        self._exact: Dict[str, int] = {}
+        self._sorted: List[Tuple[str, int]] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._name_trigram_counts: List[int] = []
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self.lookups = 0
+        self.exact_hits = 0
+        self.fuzzy_hits = 0
+
+    def build(self, species: Iterable[Tuple[Any, str, Sequence[str]]]) -> "SpeciesLexicon":
+        """Index ``(species_id, scientific_name, common_names)`` rows, replacing previous data."""
+        names: List[str] = []
+        entries: List[Tuple[Any, str]] = []
+        exact: Dict[str, int] = {}
+
+        def add(name: str, species_id: Any, match_type: str) -> None:
+            if not name:
+                return
+            existing = exact.get(name)
+            if existing is not None:
+                # Keep the stronger name type when two species share a name
+                if EXACT_CONFIDENCE[entries[existing][1]] >= EXACT_CONFIDENCE[match_type]:
+                    return
+                entries[existing] = (species_id, match_type)
+                return
+            exact[name] = len(names)
+            names.append(name)
+            entries.append((species_id, match_type))
+
+        rows = list(species)
+        for species_id, scientific_name, _ in rows:
+            add(normalize_name(scientific_name), species_id, "scientific_name")
+        for species_id, scientific_name, common_names in rows:
+            short = binomial(scientific_name)
+            if short:
+                add(short, species_id, "binomial")
+            for common_name in common_names or ():
+                add(normalize_name(common_name), species_id, "common_name")
+
+        postings: Dict[str, List[int]] = {}
+        trigram_counts: List[int] = []
+        for index, name in enumerate(names):
+            grams = trigrams(name)
+            trigram_counts.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(index)
+
+        self._names, self._entries, self._exact = names, entries, exact
+        self._sorted = sorted((name, index) for index, name in enumerate(names))
+        self._postings, self._name_trigram_counts = postings, trigram_counts
+        self._loaded_at = time.monotonic()
+        return self
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def invalidate(self) -> None:
+        """Force a reload on the next lookup (call after species changes)."""
+        self._loaded_at = None
+
+    def is_stale(self) -> bool:
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl_seconds
+
+    async def ensure_loaded(self, session: AsyncSession) -> None:
+        """Load or refresh the index from ``plant_species`` if it is stale."""
+        if not self.is_stale():
+            return
+        async with self._lock:
+            if not self.is_stale():
+                return
+            result = await session.execute(
+                select(PlantSpecies.id, PlantSpecies.scientific_name, PlantSpecies.common_names)
+            )
+            self.build(result.all())
+            logger.info(f"Species lexicon loaded with {len(self._names)} names")
+
+    def lookup(self, name: Optional[str]) -> Optional[SpeciesMatch]:
+        """Resolve one name: exact, then prefix, then trigram similarity."""
+        self.lookups += 1
+        query = normalize_name(name)
+        if not query:
+            return None
+
+        index = self._exact.get(query)
+        if index is not None:
+            self.exact_hits += 1
+            species_id, match_type = self._entries[index]
+            return SpeciesMatch(species_id, self._names[index], match_type, EXACT_CONFIDENCE[match_type])
+
+        match = self._prefix_match(query) or self._fuzzy_match(query)
+        if match:
+            self.fuzzy_hits += 1
+        return match
+
+    def match(
+        self,
+        identified_name: Optional[str],
+        suggestions: Sequence[Dict[str, Any]] = ()
+    ) -> Optional[SpeciesMatch]:
+        """Best species for an identification and its alternative suggestions.
+
+        Candidate names are tried in the order the model returned them; an
+        exact match on any candidate beats a fuzzy match on an earlier one.
+        """
+        candidates = [identified_name]
+        for suggestion in suggestions:
+            candidates.append(suggestion.get("scientific_name"))
+            candidates.append(suggestion.get("name"))
+
+        best: Optional[SpeciesMatch] = None
+        seen: Set[str] = set()
+        for candidate in candidates:
+            key = normalize_name(candidate)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            match = self.lookup(key)
+            if match and match.match_type in EXACT_CONFIDENCE:
+                return match
+            if match and (best is None or match.match_confidence > best.match_confidence):
+                best = match
+        return best
+
+    def resolve(self, names: Iterable[Optional[str]]) -> Dict[str, Optional[SpeciesMatch]]:
+        """Resolve several names in one pass, keyed by the original name."""
+        return {name: self.lookup(name) for name in names if name}
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "names": len(self._names),
+            "lookups": self.lookups,
+            "exact_hits": self.exact_hits,
+            "fuzzy_hits": self.fuzzy_hits,
+            "age_seconds": None if self._loaded_at is None else time.monotonic() - self._loaded_at,
+        }
+
+    def _prefix_match(self, query: str) -> Optional[SpeciesMatch]:
+        # A genus-only or truncated answer: pick the shortest indexed name
+        # extending it at a word boundary
+        if len(query) < 4:
+            return None
+        start = bisect.bisect_left(self._sorted, (query,))
+        best: Optional[Tuple[str, int]] = None
+        for name, index in self._sorted[start:start + 50]:
+            if not name.startswith(query):
+                break
+            if len(name) > len(query) and name[len(query)] != " ":
+                continue
+            if best is None or len(name) < len(best[0]):
+                best = (name, index)
+        if best is None:
+            return None
+        species_id, _ = self._entries[best[1]]
+        return SpeciesMatch(species_id, best[0], "prefix", PREFIX_CONFIDENCE)
+
+    def _fuzzy_match(self, query: str) -> Optional[SpeciesMatch]:
+        query_grams = trigrams(query)
+        shared: Counter = Counter()
+        for gram in query_grams:
+            shared.update(self._postings.get(gram, ()))
+        best_index, best_similarity = None, 0.0
+        for index, common in shared.items():
+            similarity = common / (len(query_grams) + self._name_trigram_counts[index] - common)
+            if similarity > best_similarity:
+                best_index, best_similarity = index, similarity
+        if best_index is None or best_similarity < self.fuzzy_threshold:
+            return None
+        species_id, _ = self._entries[best_index]
+        return SpeciesMatch(
+            species_id, self._names[best_index], "fuzzy", round(FUZZY_MAX_CONFIDENCE * best_similarity, 3)
+        )
+
+
+_species_lexicon: Optional[SpeciesLexicon] = None
+
+
+def get_species_lexicon() -> SpeciesLexicon:
+    """Get the process-wide species lexicon."""
+    global _species_lexicon
+    if _species_lexicon is None:
+        _species_lexicon = SpeciesLexicon(
+            ttl_seconds=settings.SPECIES_LEXICON_TTL_SECONDS,
+            fuzzy_threshold=settings.SPECIES_LEXICON_FUZZY_THRESHOLD
+        )
+    return _species_lexicon
@@ -24,6 +24,8 @@ from app.schemas.story import (
     StoryViewCreate, StoryView, StoryAnalytics, StorySearch
 )
 from app.core.websocket import websocket_manager
+from app.services.friend_graph_service import get_friend_graph
+from app.utils.pagination import Page, paginate
 
 
 class StoryService:
@@ -31,6 +33,7 @@ class StoryService:
     
     def __init__(self):
         self.connection_manager = websocket_manager
+        self.friend_graph = get_friend_graph()
     
     async def create_story(
         self,
@@ -135,9 +138,11 @@ class StoryService:
         user_id: str,
         viewer_id: str,
         session: AsyncSession,
-        include_expired: bool = False
-    ) -> List[StoryRead]:
-        """Get all stories for a specific user."""
+        include_expired: bool = False,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Page:
+        """Get a page of a user's stories, newest first."""
         # Build query
         query = select(Story, User).join(User, User.id == Story.user_id).where(
             and_(
@@ -153,15 +158,15 @@ class StoryService:
         if viewer_id != user_id:
             can_view = await self._can_view_user_stories(user_id, viewer_id, session)
             if not can_view:
-                return []
-        
-        query = query.order_by(desc(Story.created_at))
+                return Page(items=[])
         
-        result = await session.execute(query)
-        stories_users = result.all()
+        page = await paginate(
+            session, query, [Story.created_at, Story.id], limit, cursor,
+            key=lambda row: (row.Story.created_at, row.Story.id)
+        )
         
         story_reads = []
-        for story, user in stories_users:
+        for story, user in page.items:
             # Check individual story permissions
             if await self._can_view_story(story, viewer_id, session):
                 has_viewed = await self._has_user_viewed_story(str(story.id), viewer_id, session)
@@ -190,7 +195,8 @@ class StoryService:
                 )
                 story_reads.append(story_read)
         
-        return story_reads
+        page.items = story_reads
+        return page
     
     async def get_stories_feed(
         self,
@@ -200,23 +206,7 @@ class StoryService:
     ) -> List[StoryFeed]:
         """Get stories feed for a user (friends' stories)."""
         # Get user's friends
-        friends_query = select(
-            func.case(
-                (Friendship.requester_id == user_id, Friendship.addressee_id),
-                else_=Friendship.requester_id
-            ).label("friend_id")
-        ).where(
-            and_(
-                or_(
-                    Friendship.requester_id == user_id,
-                    Friendship.addressee_id == user_id
-                ),
-                Friendship.status == FriendshipStatus.ACCEPTED
-            )
-        )
-        
-        friends_result = await session.execute(friends_query)
-        friend_ids = [row.friend_id for row in friends_result]
+        friend_ids = list(await self.friend_graph.get_friend_ids(session, user_id, fresh=True))
         
         if not friend_ids:
             return []
@@ -410,23 +400,7 @@ class StoryService:
     ) -> List[StoryRead]:
         """Search stories accessible to the user."""
         # Get user's friends for privacy filtering
-        friends_query = select(
-            func.case(
-                (Friendship.requester_id == user_id, Friendship.addressee_id),
-                else_=Friendship.requester_id
-            ).label("friend_id")
-        ).where(
-            and_(
-                or_(
-                    Friendship.requester_id == user_id,
-                    Friendship.addressee_id == user_id
-                ),
-                Friendship.status == FriendshipStatus.ACCEPTED
-            )
-        )
-        
-        friends_result = await session.execute(friends_query)
-        friend_ids = [row.friend_id for row in friends_result]
+        friend_ids = list(await self.friend_graph.get_friend_ids(session, user_id, fresh=True))
         friend_ids.append(user_id)  # Include own stories
         
         # Build search query
@@ -661,23 +635,7 @@ class StoryService:
     ) -> List[StoryRead]:
         """Get feed of time-lapse stories from friends."""
         # Get user's friends
-        friends_query = select(
-            func.case(
-                (Friendship.requester_id == user_id, Friendship.addressee_id),
-                else_=Friendship.requester_id
-            ).label("friend_id")
-        ).where(
-            and_(
-                or_(
-                    Friendship.requester_id == user_id,
-                    Friendship.addressee_id == user_id
-                ),
-                Friendship.status == FriendshipStatus.ACCEPTED
-            )
-        )
-        
-        friends_result = await session.execute(friends_query)
-        friend_ids = [row.friend_id for row in friends_result]
+        friend_ids = list(await self.friend_graph.get_friend_ids(session, user_id, fresh=True))
         friend_ids.append(user_id)  # Include own stories
         
         # Get time-lapse stories
@@ -791,24 +749,7 @@ class StoryService:
         session: AsyncSession
     ) -> bool:
         """Check if two users are friends."""
-        result = await session.execute(
-            select(Friendship).where(
-                and_(
-                    or_(
-                        and_(
-                            Friendship.requester_id == user1_id,
-                            Friendship.addressee_id == user2_id
-                        ),
-                        and_(
-                            Friendship.requester_id == user2_id,
-                            Friendship.addressee_id == user1_id
-                        )
-                    ),
-                    Friendship.status == FriendshipStatus.ACCEPTED
-                )
-            )
-        )
-        return result.scalar_one_or_none() is not None
+        return await self.friend_graph.are_friends(session, user1_id, user2_id)
     
     async def _are_close_friends(
         self,
@@ -935,23 +876,7 @@ class StoryService:
     ):
         """Send enhanced notifications for time-lapse stories."""
         # Get friends
-        friends_query = select(
-            func.case(
-                (Friendship.requester_id == str(story.user_id), Friendship.addressee_id),
-                else_=Friendship.requester_id
-            ).label("friend_id")
-        ).where(
-            and_(
-                or_(
-                    Friendship.requester_id == str(story.user_id),
-                    Friendship.addressee_id == str(story.user_id)
-                ),
-                Friendship.status == FriendshipStatus.ACCEPTED
-            )
-        )
-        
-        result = await session.execute(friends_query)
-        friend_ids = [row.friend_id for row in result]
+        friend_ids = list(await self.friend_graph.get_friend_ids(session, str(story.user_id), fresh=True))
         
         # Get story owner info
         owner = await session.get(User, story.user_id)
@@ -993,12 +918,16 @@ async def create_story(
 
 async def get_user_stories(
     user_id: str,
+    viewer_id: str,
     session: AsyncSession,
+    include_expired: bool = False,
     limit: int = 50,
-    offset: int = 0
-) -> List[StoryRead]:
-    """Get user's stories."""
-    return await story_service.get_user_stories(user_id, session, limit, offset)
+    cursor: Optional[str] = None
+) -> Page:
+    """Get a page of a user's stories."""
+    return await story_service.get_user_stories(
+        user_id, viewer_id, session, include_expired, limit, cursor
+    )
 
 
 async def get_friends_stories(
@@ -24,6 +24,7 @@ from app.schemas.telemetry import (
 )
 from app.services.light_reading_service import LightReadingService
 from app.services.growth_photo_service import GrowthPhotoService
+from app.utils.pagination import Page
 
 
 class TelemetryService:
@@ -88,6 +89,41 @@ class TelemetryService:
             limit=limit
         )
     
+    async def get_light_readings_page(
+        self,
+        user_id: UUID,
+        plant_id: Optional[UUID] = None,
+        source: Optional[LightSource] = None,
+        location_name: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        min_lux: Optional[float] = None,
+        max_lux: Optional[float] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """Get one keyset page of light readings, newest first.
+        
+        Args:
+            limit: Maximum number of records to return
+            cursor: Cursor from the previous page
+            
+        Returns:
+            Page of light readings matching the filters
+        """
+        return await self.light_reading_service.get_light_readings_page(
+            user_id=user_id,
+            plant_id=plant_id,
+            source=source,
+            location_name=location_name,
+            start_date=start_date,
+            end_date=end_date,
+            min_lux=min_lux,
+            max_lux=max_lux,
+            limit=limit,
+            cursor=cursor
+        )
+    
     async def get_light_reading_by_id(
         self,
         reading_id: UUID,
@@ -181,6 +217,35 @@ class TelemetryService:
             limit=limit
         )
     
+    async def get_growth_photos_page(
+        self,
+        user_id: UUID,
+        plant_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        is_processed: Optional[bool] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """Retrieve one keyset page of growth photos, newest first.
+        
+        Args:
+            limit: Maximum number of records to return
+            cursor: Cursor from the previous page
+            
+        Returns:
+            Page of growth photos matching the criteria
+        """
+        return await self.growth_photo_service.get_growth_photos_page(
+            user_id=user_id,
+            plant_id=plant_id,
+            start_date=start_date,
+            end_date=end_date,
+            is_processed=is_processed,
+            limit=limit,
+            cursor=cursor
+        )
+    
     async def get_growth_photo_by_id(
         self, 
         photo_id: UUID, 
@@ -17,6 +17,11 @@ from app.models.user_plant import UserPlant
 from app.models.plant_species import PlantSpecies
 from app.models.plant_care_log import PlantCareLog
 from app.schemas.user_plant import UserPlantCreate, UserPlantUpdate
+from app.services.achievement_engine import AchievementEvent, get_achievement_engine
+from app.services.care_reminder_service import SCHEDULED_CARE, get_due_reminders, schedule_plant
+
+# Plant fields that move care reminder due dates
+_SCHEDULE_FIELDS = {"species_id", "is_active", *(column for column, _ in SCHEDULED_CARE.values())}
 
 
 class UserPlantService:
@@ -43,6 +48,10 @@ class UserPlantService:
             **plant_data.dict()
         )
         db.add(plant)
+        await db.flush()
+        await schedule_plant(db, plant)
+        if plant.is_active:
+            await get_achievement_engine().record_event(db, user_id, AchievementEvent.PLANT_ADDED)
         await db.commit()
         await db.refresh(plant)
         return plant
@@ -152,11 +161,17 @@ class UserPlantService:
             return None
         
         # Update fields
+        was_active = plant.is_active
         update_data = plant_data.dict(exclude_unset=True)
         for field, value in update_data.items():
             setattr(plant, field, value)
         
         plant.updated_at = datetime.utcnow()
+        if _SCHEDULE_FIELDS.intersection(update_data):
+            await schedule_plant(db, plant)
+        if plant.is_active != was_active:
+            event = AchievementEvent.PLANT_REACTIVATED if plant.is_active else AchievementEvent.PLANT_DEACTIVATED
+            await get_achievement_engine().record_event(db, user_id, event)
         await db.commit()
         await db.refresh(plant)
         return plant
@@ -190,8 +205,12 @@ class UserPlantService:
         if not plant:
             return False
         
+        was_active = plant.is_active
         plant.is_active = False
         plant.updated_at = datetime.utcnow()
+        await schedule_plant(db, plant)
+        if was_active:
+            await get_achievement_engine().record_event(db, user_id, AchievementEvent.PLANT_DEACTIVATED)
         await db.commit()
         return True
     
@@ -200,7 +219,7 @@ class UserPlantService:
         db: AsyncSession,
         user_id: UUID
     ) -> List[dict]:
-        """Get care reminders for user's plants.
+        """Get due care reminders for user's plants from the reminder index.
         
         Args:
             db: Database session
@@ -209,41 +228,7 @@ class UserPlantService:
         Returns:
             List of care reminder data
         """
-        # Get plants with species info
-        result = await db.execute(
-            select(UserPlant).options(
-                selectinload(UserPlant.species)
-            ).where(
-                and_(
-                    UserPlant.user_id == user_id,
-                    UserPlant.is_active == True
-                )
-            )
-        )
-        plants = result.scalars().all()
-        
-        reminders = []
-        current_time = datetime.utcnow()
-        
-        for plant in plants:
-            if not plant.species or not plant.species.water_frequency_days:
-                continue
-            
-            # Check watering reminder
-            if plant.last_watered:
-                days_since_watered = (current_time - plant.last_watered).days
-                if days_since_watered >= plant.species.water_frequency_days:
-                    reminders.append({
-                        "plant_id": plant.id,
-                        "plant_nickname": plant.nickname,
-                        "species_name": plant.species.scientific_name,
-                        "care_type": "watering",
-                        "days_overdue": days_since_watered - plant.species.water_frequency_days,
-                        "last_care_date": plant.last_watered,
-                        "recommended_frequency_days": plant.species.water_frequency_days
-                    })
-        
-        return reminders
+        return await get_due_reminders(db, user_id)
     
     @staticmethod
     async def update_care_activity(
@@ -290,6 +275,8 @@ class UserPlantService:
             plant.last_repotted = care_date
         
         plant.updated_at = datetime.utcnow()
+        if care_type in SCHEDULED_CARE:
+            await schedule_plant(db, plant)
         await db.commit()
         return True
     
@@ -17,6 +17,7 @@ from app.models.user import User
 from app.models.friendship import Friendship, FriendshipStatus
 from app.models.message import Message
 from app.models.story import Story
+from app.services.principal_cache import get_principal_cache
 from app.schemas.user import (
     UserUpdate, UserSearch, UserStats, UserSearchFilters,
     UserActivity, UserPreferences
@@ -24,6 +25,9 @@ from app.schemas.user import (
 from app.schemas.auth import UserCreate
 from app.schemas.friendship import FriendProfile
 from app.services.auth_service import auth_service
+from app.services.friend_graph_service import get_friend_graph
+from app.services.friend_suggestion_service import get_friend_suggestion_service
+from app.services.friendship_counter_service import friendship_state, get_counts, record_transition
 
 
 class UserService:
@@ -39,7 +43,7 @@ class UserService:
     ) -> User:
         """Create a new user."""
         # Hash the password
-        hashed_password = self.auth_service.get_password_hash(user_data.password)
+        hashed_password = await self.auth_service.get_password_hash_async(user_data.password)
         
         # Create user instance
         user = User(
@@ -261,6 +265,7 @@ class UserService:
         user.updated_at = datetime.utcnow()
         await session.commit()
         await session.refresh(user)
+        get_principal_cache().invalidate_user(user.id)
         
         return user
     
@@ -271,17 +276,7 @@ class UserService:
     ) -> UserStats:
         """Get user statistics."""
         # Count friends
-        friends_count = await session.scalar(
-            select(func.count(Friendship.id)).where(
-                and_(
-                    or_(
-                        Friendship.requester_id == user_id,
-                        Friendship.addressee_id == user_id
-                    ),
-                    Friendship.status == FriendshipStatus.ACCEPTED
-                )
-            )
-        ) or 0
+        friends_count = (await get_counts(session, user_id))["friends_count"]
         
         # Count stories
         stories_count = await session.scalar(
@@ -322,66 +317,25 @@ class UserService:
         session: AsyncSession,
         limit: int = 10
     ) -> List[UserSearch]:
-        """Get user suggestions based on mutual friends and interests."""
-        # Get users who are friends of friends but not direct friends
-        mutual_friends_query = """
-        SELECT DISTINCT u.id, u.username, u.display_name, u.avatar_url, u.bio,
-               u.gardening_experience, u.location, u.is_verified,
-               COUNT(mf.friend_id) as mutual_count
-        FROM users u
-        JOIN (
-            SELECT CASE 
-                WHEN f1.requester_id = :user_id THEN f1.addressee_id
-                ELSE f1.requester_id
-            END as friend_id
-            FROM friendships f1
-            WHERE (f1.requester_id = :user_id OR f1.addressee_id = :user_id)
-            AND f1.status = 'accepted'
-        ) mf ON (
-            (u.id IN (
-                SELECT CASE 
-                    WHEN f2.requester_id = mf.friend_id THEN f2.addressee_id
-                    ELSE f2.requester_id
-                END
-                FROM friendships f2
-                WHERE (f2.requester_id = mf.friend_id OR f2.addressee_id = mf.friend_id)
-                AND f2.status = 'accepted'
-            ))
-        )
-        WHERE u.id != :user_id
-        AND u.is_active = true
-        AND u.id NOT IN (
-            SELECT CASE 
-                WHEN f3.requester_id = :user_id THEN f3.addressee_id
-                ELSE f3.requester_id
-            END
-            FROM friendships f3
-            WHERE (f3.requester_id = :user_id OR f3.addressee_id = :user_id)
-        )
-        GROUP BY u.id, u.username, u.display_name, u.avatar_url, u.bio,
-                 u.gardening_experience, u.location, u.is_verified
-        ORDER BY mutual_count DESC, u.created_at DESC
-        LIMIT :limit
+        """Get friend-of-friend suggestions ranked by mutual friends.
+
+        Reads the suggestions precomputed by the friend suggestion job.
         """
-        
-        result = await session.execute(
-            mutual_friends_query,
-            {"user_id": user_id, "limit": limit}
-        )
+        rows = await get_friend_suggestion_service().get_suggestions(session, user_id, limit)
         
         suggestions = []
-        for row in result:
+        for user, mutual_count in rows:
             suggestion = UserSearch(
-                id=str(row.id),
-                username=row.username,
-                display_name=row.display_name,
-                avatar_url=row.avatar_url,
-                bio=row.bio,
-                gardening_experience=row.gardening_experience,
-                location=row.location,
-                is_verified=row.is_verified,
+                id=str(user.id),
+                username=user.username,
+                display_name=user.display_name,
+                avatar_url=user.profile_picture_url,
+                bio=user.bio,
+                gardening_experience=user.gardening_experience,
+                is_verified=user.is_verified,
+                is_private=user.is_private,
                 friendship_status="none",
-                mutual_friends_count=row.mutual_count
+                mutual_friends_count=mutual_count
             )
             suggestions.append(suggestion)
         
@@ -413,8 +367,10 @@ class UserService:
         
         if friendship:
             # Update existing friendship to blocked
+            before = friendship_state(friendship)
             friendship.status = FriendshipStatus.BLOCKED
             friendship.updated_at = datetime.utcnow()
+            await record_transition(session, before, friendship_state(friendship))
         else:
             # Create new blocked relationship
             new_friendship = Friendship(
@@ -423,8 +379,11 @@ class UserService:
                 status=FriendshipStatus.BLOCKED
             )
             session.add(new_friendship)
+            await record_transition(session, None, friendship_state(new_friendship))
         
         await session.commit()
+        get_friend_graph().remove_friendship(blocker_id, blocked_id)
+        get_friend_suggestion_service().mark_changed(blocker_id, blocked_id)
         return True
     
     async def unblock_user(
@@ -446,7 +405,9 @@ class UserService:
         friendship = friendship.scalar_one_or_none()
         
         if friendship:
+            before = friendship_state(friendship)
             await session.delete(friendship)
+            await record_transition(session, before, None)
             await session.commit()
             return True
         
@@ -114,7 +114,8 @@ class VectorDatabaseService:
         difficulty_level: Optional[str] = None,
         season: Optional[str] = None,
         content_types: Optional[List[str]] = None,
-        limit: int = 5
+        limit: int = 5,
+        query_embedding: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         """Search plant knowledge base using semantic similarity.
         
@@ -126,13 +127,16 @@ class VectorDatabaseService:
             season: Filter by season
             content_types: Filter by content types
             limit: Maximum number of results
+            query_embedding: Precomputed query embedding, to share one
+                embedding across several searches
             
         Returns:
             List of relevant knowledge base entries
         """
         try:
             # Generate query embedding
-            query_embedding = await self.embedding_service.generate_text_embedding(query)
+            if query_embedding is None:
+                query_embedding = await self.embedding_service.generate_text_embedding(query)
             
             # Build filters
             filters = {}
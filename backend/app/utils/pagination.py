@@ -0,0 +1,236 @@
+"""
+Keyset (cursor) pagination for list queries.
+
+Pages are fetched with ``WHERE (sort_key, id) < (:last_key, :last_id)``
+instead of ``OFFSET``, so a deep page costs the same as the first one when
+an index covers the ordering. Cursors are opaque tokens holding the sort
+values of the last row on a page; sort keys must be non-null and the last
+ordering column must be unique (normally the primary key).
+
+Totals are optional and only computed for the first page:
+
+- ``CountMode.EXACT`` runs ``count(*)`` over the filtered query.
+- ``CountMode.ESTIMATED`` reads the planner's row estimate from
+  ``EXPLAIN``, falling back to an exact count when the estimate is small
+  enough for counting to be cheap.
+- ``CountMode.NONE`` skips counting (infinite scroll).
+"""
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+from uuid import UUID
+
+from sqlalchemy import asc, desc, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+T = TypeVar("T")
+
+# Below this many estimated rows an exact count is cheap enough to run
+EXACT_COUNT_THRESHOLD = 1000
+
+
+class CountMode(str, Enum):
+    """How to compute the total for the first page."""
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+class SortOrder(str, Enum):
+    """Sort direction accepted by list endpoints."""
+    ASC = "asc"
+    DESC = "desc"
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of results plus the cursor for the next page."""
+    items: List[T]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"u": str(value)}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _load(value: Any) -> Any:
+    if isinstance(value, dict):
+        (tag, raw), = value.items()
+        return {
+            "dt": datetime.fromisoformat,
+            "d": date.fromisoformat,
+            "u": UUID,
+            "n": Decimal,
+        }[tag](raw)
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the sort values of a row as an opaque cursor.
+
+    Args:
+        values: Sort key values followed by the row id
+
+    Returns:
+        str: URL-safe cursor token
+    """
+    payload = json.dumps([_dump(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> Tuple[Any, ...]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor token
+        size: Expected number of sort values
+
+    Returns:
+        Tuple[Any, ...]: Sort values of the last row of the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = [_load(value) for value in json.loads(base64.urlsafe_b64decode(padded.encode()))]
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {str(e)}")
+    if len(values) != size:
+        raise ValueError("Invalid cursor: wrong number of sort values")
+    return tuple(values)
+
+
+def keyset_condition(order_by: Sequence[Any], values: Sequence[Any], descending: bool = True):
+    """Row-value predicate selecting rows after ``values`` in the given order."""
+    if len(order_by) == 1:
+        return order_by[0] < values[0] if descending else order_by[0] > values[0]
+    left = tuple_(*order_by)
+    right = tuple_(*values)
+    return left < right if descending else left > right
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def estimate_rows(session: AsyncSession, query) -> Optional[int]:
+    """
+    Planner row estimate for a query, read from ``EXPLAIN``.
+
+    Returns:
+        Optional[int]: Estimated row count, or None if no plan was returned
+    """
+    plan = (await session.execute(_Explain(query))).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    if not plan:
+        return None
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_rows(session: AsyncSession, query, mode: CountMode) -> Tuple[Optional[int], bool]:
+    """
+    Count the rows a query returns.
+
+    Args:
+        session: Database session
+        query: Filtered select (ordering and limits are ignored)
+        mode: Counting mode
+
+    Returns:
+        Tuple[Optional[int], bool]: Total (None for ``CountMode.NONE``) and
+        whether it is an estimate
+    """
+    if mode == CountMode.NONE:
+        return None, False
+    query = query.order_by(None).limit(None).offset(None)
+    if mode == CountMode.ESTIMATED:
+        estimate = await estimate_rows(session, query)
+        if estimate is not None and estimate > EXACT_COUNT_THRESHOLD:
+            return estimate, True
+    total = await session.scalar(select(func.count()).select_from(query.subquery()))
+    return total or 0, False
+
+
+async def paginate(
+    session: AsyncSession,
+    query,
+    order_by: Sequence[Any],
+    limit: int,
+    cursor: Optional[str] = None,
+    descending: bool = True,
+    count: CountMode = CountMode.NONE,
+    key: Optional[Callable[[Any], Sequence[Any]]] = None
+) -> Page:
+    """
+    Fetch one keyset page of a query.
+
+    Args:
+        session: Database session
+        query: Filtered select without ordering or pagination
+        order_by: Sort columns, ending with a unique column such as the id
+        limit: Page size
+        cursor: Cursor from the previous page, or None for the first page
+        descending: Sort direction (applied to every sort column)
+        count: How to compute the total on the first page
+        key: Extracts the sort values from a result row; defaults to reading
+            the ``order_by`` column names from a single-entity row
+
+    Returns:
+        Page: Items (ORM entities for single-entity queries, rows otherwise)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    total, total_is_estimate = (None, False)
+    if cursor is None:
+        total, total_is_estimate = await count_rows(session, query, count)
+    else:
+        query = query.where(keyset_condition(order_by, decode_cursor(cursor, len(order_by)), descending))
+
+    direction = desc if descending else asc
+    query = query.order_by(*(direction(column) for column in order_by)).limit(limit + 1)
+    result = await session.execute(query)
+    if len(query.column_descriptions) == 1:
+        rows = list(result.scalars().all())
+    else:
+        rows = list(result.all())
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        values = key(last) if key else [getattr(last, column.key) for column in order_by]
+        next_cursor = encode_cursor(values)
+
+    return Page(items=rows, next_cursor=next_cursor, total=total, total_is_estimate=total_is_estimate)
@@ -7,6 +7,9 @@ CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 -- Enable pgvector extension for future RAG features
 CREATE EXTENSION IF NOT EXISTS vector;
 
+-- Enable trigram matching for fuzzy full-text search
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- Create indexes for better performance (will be created by Alembic migrations)
 -- This file serves as documentation for manual setup if needed
 
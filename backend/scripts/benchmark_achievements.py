@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Benchmark event-driven achievement evaluation.
+
+Replays a stream of activity events (care logs, plants added,
+identifications, helpful votes) for synthetic users through
+``AchievementEngine.record_event`` against an in-memory session with a
+simulated round-trip latency, and compares database round trips and
+throughput with the previous full re-check per call: loading the user's
+stats, earned ids and every available achievement, one count query per
+``plant_age`` achievement, then a commit and a refresh per newly earned
+row.
+
+Usage:
+    python scripts/benchmark_achievements.py --users 500 --events 20000 --latency-ms 0.5
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.models.plant_achievement import PlantAchievement  # noqa: E402
+from app.services.achievement_engine import (  # noqa: E402
+    COUNTER_CRITERIA,
+    COUNTER_STATS,
+    AchievementEngine,
+    AchievementEvent,
+)
+from app.services.plant_achievement_service import DEFAULT_ACHIEVEMENTS  # noqa: E402
+
+EVENT_STATS = {
+    AchievementEvent.CARE_LOGGED: "care_streak_days",
+    AchievementEvent.PLANT_ADDED: "active_plants",
+    AchievementEvent.PLANT_IDENTIFIED: "plants_identified",
+    AchievementEvent.ANSWER_MARKED_HELPFUL: "helpful_answers",
+}
+
+
+class Result:
+    def __init__(self, rows=(), rowcount=0):
+        self.rows = list(rows)
+        self.rowcount = rowcount
+
+    def one_or_none(self):
+        return self.rows[0] if self.rows else None
+
+    def one(self):
+        return self.rows[0]
+
+    def all(self):
+        return self.rows
+
+    def scalars(self):
+        return ScalarResult(self.rows)
+
+
+class ScalarResult(list):
+    def all(self):
+        return list(self)
+
+
+class SimulatedSession:
+    """Answers the engine's statements from in-memory state, counting round trips."""
+
+    def __init__(self, achievements, latency: float):
+        self.achievements = achievements
+        self.latency = latency
+        self.stats = {}
+        self.earned = set()
+        self.round_trips = 0
+        self.event = None
+        self.user_id = None
+
+    async def _round_trip(self):
+        self.round_trips += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def execute(self, stmt):
+        await self._round_trip()
+        table = stmt.table.name if hasattr(stmt, "table") else None
+        if stmt.is_update and table == "user_stats" and stmt._returning:
+            stats = self.stats.get(self.user_id)
+            if stats is None:
+                return Result()
+            stats[EVENT_STATS[self.event]] += 1
+            return Result([SimpleNamespace(_mapping=dict(stats))])
+        if stmt.is_insert and table == "user_stats":
+            self.stats.setdefault(self.user_id, {stat: 0 for stat in COUNTER_STATS})
+            return Result()
+        if stmt.is_insert and table == "user_achievements":
+            # multi-row VALUES are keyed by Column objects
+            values = [{column.key: value for column, value in params.items()} for params in stmt._multi_values[0]]
+            rows = [(v["user_id"], v["achievement_id"]) for v in values]
+            rows = [row for row in rows if row not in self.earned]
+            self.earned.update(rows)
+            return Result(rows)
+        if stmt.is_select and stmt.column_descriptions[0]["name"] == "PlantAchievement":
+            return Result(self.achievements)
+        if stmt.is_select:
+            return Result(achievement_id for user_id, achievement_id in self.earned if user_id == self.user_id)
+        return Result()
+
+    async def commit(self):
+        await self._round_trip()
+
+
+async def replay(args, achievements, events):
+    engine = AchievementEngine()
+    db = SimulatedSession(achievements, args.latency_ms / 1000)
+    awarded = 0
+    start = time.perf_counter()
+    for user_id, event in events:
+        db.user_id, db.event = user_id, event
+        awarded += len(await engine.record_event(db, user_id, event))
+        await db.commit()
+    return time.perf_counter() - start, db.round_trips, awarded
+
+
+async def replay_full_check(args, achievements, events):
+    """Round trips of the previous per-call re-check, with the same latency."""
+    db = SimulatedSession(achievements, args.latency_ms / 1000)
+    counts = {}
+    earned = set()
+    plant_age = sum(1 for a in achievements if a.achievement_type == "plant_age")
+    awarded = 0
+    start = time.perf_counter()
+    for user_id, event in events:
+        stats = counts.setdefault(user_id, {stat: 0 for stat in COUNTER_STATS})
+        stats[EVENT_STATS[event]] += 1
+        # user stats, earned ids, available achievements, plant-age counts
+        for _ in range(3 + plant_age):
+            await db._round_trip()
+        newly = []
+        for achievement in achievements:
+            counter = COUNTER_CRITERIA.get(achievement.achievement_type)
+            if counter is None or (user_id, achievement.id) in earned:
+                continue
+            threshold = achievement.unlock_criteria.get(counter.criteria_key, counter.default_threshold)
+            if stats[counter.stat] >= threshold:
+                newly.append(achievement.id)
+        if newly:
+            earned.update((user_id, achievement_id) for achievement_id in newly)
+            await db._round_trip()  # commit
+            for _ in newly:
+                await db._round_trip()  # refresh
+            awarded += len(newly)
+    return time.perf_counter() - start, db.round_trips, awarded
+
+
+def main(args):
+    achievements = [PlantAchievement(id=uuid.uuid4(), is_active=True, **data) for data in DEFAULT_ACHIEVEMENTS]
+    for index in range(args.extra_achievements):
+        achievement_type = random.choice(list(COUNTER_CRITERIA))
+        counter = COUNTER_CRITERIA[achievement_type]
+        achievements.append(PlantAchievement(
+            id=uuid.uuid4(), is_active=True, achievement_type=achievement_type, title=f"Extra {index}",
+            points=random.randint(10, 200), unlock_criteria={counter.criteria_key: random.randint(3, 60)}
+        ))
+
+    users = [uuid.uuid4() for _ in range(args.users)]
+    event_types = list(EVENT_STATS)
+    weights = [0.7, 0.1, 0.1, 0.1]
+    events = [(random.choice(users), random.choices(event_types, weights)[0]) for _ in range(args.events)]
+
+    for label, run in (("full re-check per call", replay_full_check), ("event-driven", replay)):
+        elapsed, round_trips, awarded = asyncio.run(run(args, achievements, events))
+        print(f"{label:<24} {len(events) / elapsed:9,.0f} events/s  "
+              f"{round_trips / len(events):5.2f} round trips/event  {awarded:,} awarded")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--extra-achievements", type=int, default=40)
+    parser.add_argument("--latency-ms", type=float, default=0.5)
+    main(parser.parse_args())
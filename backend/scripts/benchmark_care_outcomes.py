@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Benchmark care-outcome scoring for plants with multi-year histories.
+
+Compares the per-care-log scan over the photo list (one pass over every
+photo for each care action) with the sorted-array ``searchsorted`` join
+used by ``MLAdjustmentService``, and checks that both give the same
+scores.
+
+Usage:
+    python scripts/benchmark_care_outcomes.py --years 1 3 5 --logs-per-week 5 --photos-per-week 3
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.ml_adjustment_service import score_care_outcomes  # noqa: E402
+
+
+def scan_outcome(care_time, health_photos):
+    """The previous per-care-log computation."""
+    before = [p for p in health_photos if care_time - timedelta(days=3) <= p.captured_at <= care_time]
+    after = [p for p in health_photos if care_time <= p.captured_at <= care_time + timedelta(days=7)]
+    if not before or not after:
+        return 0.5
+    improvement = (np.mean([p.health_score for p in after]) - np.mean([p.health_score for p in before]) + 1.0) / 2.0
+    return max(0.0, min(1.0, improvement))
+
+
+def generate(years: float, logs_per_week: float, photos_per_week: float):
+    now = datetime.utcnow().replace(microsecond=0)
+    days = years * 365
+
+    def times(per_week):
+        return sorted(now - timedelta(seconds=random.uniform(0, days * 86400)) for _ in range(int(years * 52 * per_week)))
+
+    photos = [SimpleNamespace(captured_at=t, health_score=random.random()) for t in times(photos_per_week)]
+    return times(logs_per_week), photos
+
+
+def main(args):
+    for years in args.years:
+        care_times, photos = generate(years, args.logs_per_week, args.photos_per_week)
+
+        start = time.perf_counter()
+        expected = [scan_outcome(t, photos) for t in care_times]
+        scan = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scores = score_care_outcomes(
+            np.array(care_times, dtype="datetime64[us]"),
+            np.array([p.captured_at for p in photos], dtype="datetime64[us]"),
+            np.array([p.health_score for p in photos], dtype=float)
+        )
+        vectorized = time.perf_counter() - start
+
+        assert np.allclose(scores, expected), "vectorized scores differ from the scan"
+        print(
+            f"{years:>4} years: {len(care_times):6d} logs x {len(photos):6d} photos | "
+            f"scan {scan * 1000:9.1f} ms, searchsorted {vectorized * 1000:7.2f} ms "
+            f"({scan / vectorized:,.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=float, nargs="+", default=[1, 3, 5])
+    parser.add_argument("--logs-per-week", type=float, default=5)
+    parser.add_argument("--photos-per-week", type=float, default=3)
+    main(parser.parse_args())
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Benchmark care reminder reads and fleet-wide dispatch in Postgres.
+
+Seeds temporary tables shaped like ``user_plants`` (with a watering
+interval inlined) and ``care_reminders`` with its indexes, then compares:
+
+- per user: loading every active plant and checking it in Python (the
+  old ``get_care_reminders``) with the ``(user_id, next_due_at)`` range
+  read;
+- fleet-wide: scanning all active plants for due ones with popping a
+  batch of pending rows in due order from the partial index and marking
+  them notified, as ``CareReminderDispatcher`` does.
+
+Requires the configured database; nothing is written outside the
+temporary tables.
+
+Usage:
+    python scripts/benchmark_care_reminders.py --users 20000 --plants-per-user 25
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import text  # noqa: E402
+
+from app.core.database import engine  # noqa: E402
+
+SEED_SQL = """
+INSERT INTO benchmark_plants (user_id, is_active, last_watered, water_frequency_days)
+SELECT
+    u,
+    random() > 0.1,
+    now() at time zone 'utc' - make_interval(secs => random() * 30 * 86400),
+    (ARRAY[3, 5, 7, 10, 14, 21])[1 + floor(random() * 6)::int]
+FROM generate_series(1, :users) AS u, generate_series(1, :plants) AS p
+"""
+
+INDEX_SQL = """
+INSERT INTO benchmark_reminders (plant_id, user_id, next_due_at, notified_at)
+SELECT id, user_id, last_watered + make_interval(days => water_frequency_days), NULL
+FROM benchmark_plants
+WHERE is_active
+"""
+
+USER_SCAN = text("""
+    SELECT id, last_watered, water_frequency_days
+    FROM benchmark_plants
+    WHERE user_id = :user_id AND is_active
+""")
+
+USER_RANGE = text("""
+    SELECT plant_id, next_due_at
+    FROM benchmark_reminders
+    WHERE user_id = :user_id AND next_due_at <= :now
+    ORDER BY next_due_at
+""")
+
+FLEET_SCAN = text("""
+    SELECT id, user_id
+    FROM benchmark_plants
+    WHERE is_active AND last_watered + make_interval(days => water_frequency_days) <= :now
+""")
+
+FLEET_POP = text("""
+    WITH due AS (
+        SELECT plant_id
+        FROM benchmark_reminders
+        WHERE notified_at IS NULL AND next_due_at <= :now
+        ORDER BY next_due_at
+        LIMIT :batch
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE benchmark_reminders AS r
+    SET notified_at = :now
+    FROM due
+    WHERE r.plant_id = due.plant_id
+    RETURNING r.plant_id, r.user_id
+""")
+
+
+async def time_per_user(conn, statement, user_ids, now, check=None):
+    timings = []
+    for user_id in user_ids:
+        start = time.perf_counter()
+        rows = (await conn.execute(statement, {"user_id": user_id, "now": now})).all()
+        if check:
+            rows = [row for row in rows if check(row)]
+        timings.append((time.perf_counter() - start) * 1000)
+    return np.percentile(timings, 50), np.percentile(timings, 95)
+
+
+async def main(args):
+    async with engine.connect() as conn:
+        await conn.execute(text("""
+            CREATE TEMPORARY TABLE benchmark_plants (
+                id bigserial PRIMARY KEY,
+                user_id integer NOT NULL,
+                is_active boolean NOT NULL,
+                last_watered timestamp NOT NULL,
+                water_frequency_days integer NOT NULL
+            )
+        """))
+        await conn.execute(text("""
+            CREATE TEMPORARY TABLE benchmark_reminders (
+                plant_id bigint PRIMARY KEY,
+                user_id integer NOT NULL,
+                next_due_at timestamp NOT NULL,
+                notified_at timestamp
+            )
+        """))
+
+        start = time.perf_counter()
+        await conn.execute(text(SEED_SQL), {"users": args.users, "plants": args.plants_per_user})
+        await conn.execute(text("CREATE INDEX ON benchmark_plants (user_id)"))
+        await conn.execute(text(INDEX_SQL))
+        await conn.execute(text("CREATE INDEX ON benchmark_reminders (user_id, next_due_at)"))
+        await conn.execute(text(
+            "CREATE INDEX ON benchmark_reminders (next_due_at) WHERE notified_at IS NULL"
+        ))
+        await conn.execute(text("ANALYZE benchmark_plants"))
+        await conn.execute(text("ANALYZE benchmark_reminders"))
+        print(f"seeded {args.users * args.plants_per_user:,} plants in {time.perf_counter() - start:.1f} s")
+
+        now = datetime.utcnow()
+        user_ids = random.sample(range(1, args.users + 1), min(args.queries, args.users))
+
+        def is_due(row):
+            return (now - row.last_watered).days >= row.water_frequency_days
+
+        scan_p50, scan_p95 = await time_per_user(conn, USER_SCAN, user_ids, now, check=is_due)
+        range_p50, range_p95 = await time_per_user(conn, USER_RANGE, user_ids, now)
+        print(f"per user     scan p50 {scan_p50:7.2f} ms  p95 {scan_p95:7.2f} ms   "
+              f"range read p50 {range_p50:7.2f} ms  p95 {range_p95:7.2f} ms")
+
+        start = time.perf_counter()
+        due = len((await conn.execute(FLEET_SCAN, {"now": now})).all())
+        print(f"fleet scan   {due:,} due plants in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        popped = 0
+        batch_times = []
+        start = time.perf_counter()
+        while True:
+            batch_start = time.perf_counter()
+            rows = (await conn.execute(FLEET_POP, {"now": now, "batch": args.batch_size})).all()
+            if not rows:
+                break
+            batch_times.append((time.perf_counter() - batch_start) * 1000)
+            popped += len(rows)
+        elapsed = time.perf_counter() - start
+        print(f"dispatch     {popped:,} reminders in {len(batch_times)} batches, "
+              f"{popped / elapsed:,.0f} reminders/s, batch p50 {np.percentile(batch_times, 50):.1f} ms")
+
+        start = time.perf_counter()
+        await conn.execute(FLEET_POP, {"now": now, "batch": args.batch_size})
+        print(f"idle poll    {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--plants-per-user", type=int, default=25)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=500)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Benchmark challenge leaderboard operations at 100k participants.
+
+Compares the in-memory sorted-set store with re-sorting the participant
+list on every read, as the challenge service used to.
+
+Usage:
+    python scripts/benchmark_challenge_leaderboard.py --participants 100000
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.challenge_leaderboard_service import InMemoryLeaderboardStore  # noqa: E402
+
+
+def timed(label: str, runs: int, elapsed: float) -> None:
+    print(f"{label:<28} {elapsed / runs * 1e6:10.1f} us/op")
+
+
+async def main(args):
+    challenge_id = "bench"
+    users = [str(uuid.uuid4()) for _ in range(args.participants)]
+    participants = [{"user_id": user_id, "score": 0.0} for user_id in users]
+    store = InMemoryLeaderboardStore()
+
+    start = time.perf_counter()
+    for user_id in users:
+        await store.update_score(challenge_id, user_id, random.random() * 100, str(uuid.uuid4()))
+    timed("store: initial load", len(users), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(args.ops):
+        await store.update_score(challenge_id, random.choice(users), random.random() * 100)
+    timed("store: score update", args.ops, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(args.ops):
+        await store.get_rank(challenge_id, random.choice(users))
+    timed("store: rank of user", args.ops, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(args.ops):
+        await store.get_top(challenge_id, random.randrange(0, 1000), 50)
+    timed("store: top-50 page", args.ops, time.perf_counter() - start)
+
+    runs = max(args.ops // 100, 1)
+    start = time.perf_counter()
+    for _ in range(runs):
+        random.choice(participants)["score"] = random.random() * 100
+        sorted(participants, key=lambda p: p.get("score", 0), reverse=True)[:50]
+    timed("list sort: update + top-50", runs, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--participants", type=int, default=100000)
+    parser.add_argument("--ops", type=int, default=10000)
+    asyncio.run(main(parser.parse_args()))
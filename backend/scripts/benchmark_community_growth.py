@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Benchmark community growth metrics over synthetic photo timelines.
+
+Builds timelines for a synthetic community and compares the previous
+per-plant Python loop (ORM-style records, ``statistics`` quantiles) with
+the grouped NumPy metrics and cached cell lookups of the community growth
+engine. No database is needed.
+
+Usage:
+    python scripts/benchmark_community_growth.py --plants 50000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.community_growth_engine import CommunityGrowthSnapshot, compute_plant_metrics  # noqa: E402
+from app.services.growth_data_service import GrowthTimelines  # noqa: E402
+
+LOCATIONS = ["Living room window", "Bedroom", "Kitchen", "Office", "Balcony", None]
+
+
+def generate(plants: int, period_days: int):
+    start = datetime.utcnow() - timedelta(days=period_days)
+    species = [uuid.uuid4() for _ in range(max(plants // 200, 1))]
+    rows = []
+    for _ in range(plants):
+        plant_id = uuid.uuid4()
+        species_id = random.choice(species)
+        location = random.choice(LOCATIONS)
+        rate = random.uniform(0.0, 0.5)
+        days = sorted(random.sample(range(period_days), random.randint(1, 12)))
+        for day in days:
+            height = 10 + rate * day + random.gauss(0, 0.5) if random.random() > 0.1 else None
+            rows.append((plant_id, species_id, "user", location, start + timedelta(days=day),
+                         height, random.randint(3, 30), None, None))
+    return rows, species
+
+
+def loop_metrics(timelines: GrowthTimelines):
+    community_data = []
+    for plant_id in timelines.plant_ids:
+        photos = timelines.points(plant_id)
+        if len(photos) < 3:
+            continue
+        total_growth = (photos[-1].height_cm or 0) - (photos[0].height_cm or 0)
+        days_tracked = (photos[-1].captured_at - photos[0].captured_at).days
+        if days_tracked > 0:
+            community_data.append({
+                "growth_rate": total_growth / days_tracked,
+                "avg_leaf_count": sum(p.leaf_count or 0 for p in photos) / len(photos)
+            })
+    rates = [data["growth_rate"] for data in community_data if data["growth_rate"] > 0]
+    return statistics.quantiles(rates, n=4), statistics.quantiles(rates, n=10)
+
+
+def main(args):
+    rows, species = generate(args.plants, args.days)
+    timelines = GrowthTimelines.from_rows(rows)
+    print(f"{len(timelines):,} plants, {timelines.photo_count:,} photos")
+
+    start = time.perf_counter()
+    loop_metrics(timelines)
+    print(f"per-plant loop:         {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+    start = time.perf_counter()
+    snapshot = CommunityGrowthSnapshot(
+        compute_plant_metrics(timelines), args.days, datetime.utcnow(), datetime.utcnow()
+    )
+    snapshot.cell()
+    print(f"grouped NumPy snapshot: {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+    start = time.perf_counter()
+    for species_id in species:
+        snapshot.cell(species_id=species_id)
+    print(f"first species cells:    {(time.perf_counter() - start) / len(species) * 1000:9.3f} ms each")
+
+    start = time.perf_counter()
+    for species_id in species:
+        snapshot.cell(species_id=species_id)
+    print(f"cached species cells:   {(time.perf_counter() - start) / len(species) * 1e6:9.1f} us each")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plants", type=int, default=50000)
+    parser.add_argument("--days", type=int, default=90)
+    main(parser.parse_args())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Report discovery feed latency with cold and warm candidate pools.
+
+Pool loaders are replaced with generators of synthetic candidates that
+sleep for a configurable query latency, so the numbers reflect concurrent
+pool fetching and vectorized scoring rather than Postgres.
+
+Usage:
+    python scripts/benchmark_discovery_feed.py --requests 200 --pool-size 500
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.contextual_discovery_service import (  # noqa: E402
+    ContentType,
+    ContextualDiscoveryService,
+    DiscoveryItem,
+    FeedContext,
+)
+from app.services.discovery_feed_pools import CandidatePool, DiscoveryCandidatePools  # noqa: E402
+
+SPECIES = [str(uuid.uuid4()) for _ in range(50)]
+NAMES = [f"species {i}" for i in range(len(SPECIES))]
+LOCATIONS = ["portland", "seattle", "austin", "denver", "boston"]
+
+
+def synthetic_loader(content_type: ContentType, latency_ms: float):
+    async def load(db, pool_size: int) -> CandidatePool:
+        await asyncio.sleep(latency_ms / 1000)
+        now = datetime.utcnow()
+        rows = []
+        for _ in range(pool_size):
+            species = random.randrange(len(SPECIES))
+            item = DiscoveryItem(
+                id=str(uuid.uuid4()), content_type=content_type, title=NAMES[species],
+                content="", author_id=None, author_name=None, relevance_score=0.5,
+                engagement_score=random.random(), personalization_factors=[], tags=[content_type.value],
+                plant_species=None, created_at=now - timedelta(hours=random.uniform(0, 72)), metadata={},
+            )
+            rows.append((item, SPECIES[species], random.choice(LOCATIONS), f"loving my {NAMES[species]}"))
+        return CandidatePool.build(content_type, rows)
+    return load
+
+
+@asynccontextmanager
+async def null_session():
+    yield None
+
+
+def build_service(args) -> ContextualDiscoveryService:
+    pools = DiscoveryCandidatePools(
+        pool_size=args.pool_size,
+        session_factory=null_session,
+        loaders={kind: synthetic_loader(kind, args.query_ms) for kind in
+                 (ContentType.STORY, ContentType.QUESTION, ContentType.TRADE, ContentType.KNOWLEDGE)},
+    )
+    service = ContextualDiscoveryService(vector_service=None, embedding_service=None, candidate_pools=pools)
+
+    async def build_context(db, user_id, feed_type):
+        plants = random.sample(range(len(SPECIES)), 5)
+        return FeedContext(
+            user_id=user_id, user_preferences={}, recent_activity=[], location=random.choice(LOCATIONS),
+            current_plants=[{"species_id": SPECIES[i], "species_name": NAMES[i]} for i in plants],
+            seasonal_context={"season": "spring"}, time_of_day="morning", feed_type=feed_type,
+        )
+
+    service._build_feed_context = build_context
+    return service
+
+
+async def main(args):
+    service = build_service(args)
+    for i in range(args.requests):
+        if i % args.cold_every == 0:
+            service.candidate_pools.invalidate()
+        await service.generate_personalized_feed(db=None, user_id=f"user-{i}")
+
+    for cache_state, stats in service.get_feed_latency_stats().items():
+        print(f"{cache_state:>5}: {stats['requests']:5d} requests  "
+              f"p50 {stats['p50_ms']} ms  p95 {stats['p95_ms']} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--pool-size", type=int, default=500)
+    parser.add_argument("--query-ms", type=float, default=25)
+    parser.add_argument("--cold-every", type=int, default=10, help="Drop the pools every N requests")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark mutual-friend counts for a friends page on large friend graphs.
+
+A fake session serves friendship rows from a generated graph and sleeps
+per query, so the comparison is between one query per friend and the
+friend graph's single batched load plus set intersections.
+
+Usage:
+    python scripts/benchmark_friend_graph.py --users 20000 --friends 1500
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.friend_graph_service import FriendGraph  # noqa: E402
+
+
+class FakeSession:
+    """Answers the friend graph's adjacency query from an in-memory edge list."""
+
+    def __init__(self, adjacency, latency_ms: float):
+        self.adjacency = adjacency
+        self.latency = latency_ms / 1000
+        self.queries = 0
+
+    async def execute(self, stmt):
+        self.queries += 1
+        await asyncio.sleep(self.latency)
+        user_ids = set()
+        for clause in stmt.whereclause.clauses[0].clauses:
+            user_ids.update(clause.right.value)
+        return [(user_id, friend_id) for user_id in user_ids for friend_id in self.adjacency.get(user_id, ())]
+
+
+def build_graph(users: int, friends: int, page_size: int):
+    """Generate the viewer's friends and the friend lists of one page of them."""
+    ids = [str(uuid.uuid4()) for _ in range(users)]
+    viewer = ids[0]
+    adjacency = {viewer: set(random.sample(ids[1:], friends))}
+    for friend_id in list(adjacency[viewer])[:page_size]:
+        adjacency[friend_id] = set(random.sample(ids, friends)) - {friend_id} | {viewer}
+    return ids, viewer, adjacency
+
+
+async def main(args):
+    _, viewer, adjacency = build_graph(args.users, args.friends, args.page_size)
+    page = list(adjacency[viewer])[:args.page_size]
+    print(f"viewer has {len(adjacency[viewer])} friends; page of {len(page)}")
+
+    # Baseline: one adjacency query per friend on the page
+    session = FakeSession(adjacency, args.query_ms)
+    start = time.perf_counter()
+    own = (await FriendGraph(ttl_seconds=0)._load(session, [viewer]))[viewer]
+    for friend_id in page:
+        other = (await FriendGraph(ttl_seconds=0)._load(session, [friend_id]))[friend_id]
+        len(own & other)
+    baseline = time.perf_counter() - start
+    print(f"per-friend queries: {baseline * 1000:8.1f} ms ({session.queries} queries)")
+
+    graph = FriendGraph()
+    session = FakeSession(adjacency, args.query_ms)
+    start = time.perf_counter()
+    await graph.mutual_friend_counts(session, viewer, page)
+    cold = time.perf_counter() - start
+    print(f"batched, cold:      {cold * 1000:8.1f} ms ({session.queries} queries)")
+
+    start = time.perf_counter()
+    for _ in range(args.runs):
+        await graph.mutual_friend_counts(session, viewer, page)
+    warm = (time.perf_counter() - start) / args.runs
+    print(f"batched, warm:      {warm * 1000:8.1f} ms ({session.queries} queries total)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--friends", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--query-ms", type=float, default=3)
+    parser.add_argument("--runs", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
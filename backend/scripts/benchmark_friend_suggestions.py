@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Benchmark precomputed friend-of-friend suggestions.
+
+A fake session serves friendship rows from a generated graph and sleeps
+per query. The script compares computing one user's suggestions on
+request (two adjacency loads and the count on a cold graph) with the
+background job's batched throughput over all users, and measures the
+incremental refresh after a burst of friendship changes. Serving stored
+suggestions is one indexed read per request.
+
+Usage:
+    python scripts/benchmark_friend_suggestions.py --users 20000 --friends 150
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.friend_graph_service import FriendGraph  # noqa: E402
+from app.services.friend_suggestion_service import FriendSuggestionService  # noqa: E402
+
+
+class FakeSession:
+    """Answers adjacency queries from an in-memory graph; writes are counted and dropped."""
+
+    def __init__(self, adjacency, latency_ms: float):
+        self.adjacency = adjacency
+        self.latency = latency_ms / 1000
+        self.queries = 0
+        self.rows_written = 0
+
+    async def execute(self, stmt):
+        self.queries += 1
+        await asyncio.sleep(self.latency)
+        if stmt.is_insert:
+            self.rows_written += len(stmt._multi_values[0])
+            return None
+        if stmt.is_delete:
+            return None
+        user_ids = set()
+        for clause in stmt.whereclause.clauses[0].clauses:
+            user_ids.update(clause.right.value)
+        return [(user_id, friend_id) for user_id in user_ids for friend_id in self.adjacency.get(user_id, ())]
+
+    async def commit(self):
+        await asyncio.sleep(self.latency)
+
+
+def build_graph(users: int, friends: int):
+    """Generate an undirected graph with about ``friends`` friends per user."""
+    ids = [str(uuid.uuid4()) for _ in range(users)]
+    adjacency = {user_id: set() for user_id in ids}
+    for _ in range(users * friends // 2):
+        a, b = random.sample(ids, 2)
+        adjacency[a].add(b)
+        adjacency[b].add(a)
+    return ids, adjacency
+
+
+async def main(args):
+    ids, adjacency = build_graph(args.users, args.friends)
+    print(f"{len(ids)} users, {sum(map(len, adjacency.values())) // 2} friendships")
+
+    # Baseline: compute each requester's suggestions on request with a cold graph
+    session = FakeSession(adjacency, args.query_ms)
+    viewers = random.sample(ids, args.requests)
+    start = time.perf_counter()
+    for viewer in viewers:
+        service = FriendSuggestionService(graph=FriendGraph(ttl_seconds=0), per_user=args.per_user)
+        await service.refresh_users(session, [viewer])
+    on_request = (time.perf_counter() - start) / len(viewers)
+    print(f"on request:        {on_request * 1000:8.1f} ms/request ({session.queries / len(viewers):.1f} queries)")
+
+    # Background job: all users in batches sharing one friend graph
+    session = FakeSession(adjacency, args.query_ms)
+    service = FriendSuggestionService(
+        graph=FriendGraph(max_users=args.users * 2), per_user=args.per_user, batch_size=args.batch_size
+    )
+    start = time.perf_counter()
+    for offset in range(0, len(ids), args.batch_size):
+        await service.refresh_users(session, ids[offset:offset + args.batch_size])
+    elapsed = time.perf_counter() - start
+    print(f"batch job:         {len(ids) / elapsed:8,.0f} users/s ({session.queries} queries, "
+          f"{session.rows_written:,} rows)")
+
+    # Incremental refresh after a burst of new friendships
+    for _ in range(args.changes):
+        a, b = random.sample(ids, 2)
+        adjacency[a].add(b)
+        adjacency[b].add(a)
+        service.graph.add_friendship(a, b)
+        service.mark_changed(a, b)
+    session = FakeSession(adjacency, args.query_ms)
+    start = time.perf_counter()
+    refreshed = await service.refresh_changed(session)
+    elapsed = time.perf_counter() - start
+    print(f"incremental:       {elapsed * 1000:8.1f} ms for {args.changes} changes "
+          f"({refreshed} users updated, {session.queries} queries)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--friends", type=int, default=150)
+    parser.add_argument("--per-user", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--changes", type=int, default=100)
+    parser.add_argument("--query-ms", type=float, default=3)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark text search over a seeded corpus in Postgres.
+
+Seeds a temporary table shaped like ``plant_trades`` (title, description,
+generated ``search_vector``, GIN and trigram indexes), then compares the
+old ``ilike('%term%')`` filter with the shared full-text query builder.
+Requires the configured database and the ``pg_trgm`` extension; nothing
+is written outside the temporary table.
+
+Usage:
+    python scripts/benchmark_full_text_search.py --rows 1000000
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import column, desc, or_, select, table, text  # noqa: E402
+
+from app.core.database import engine  # noqa: E402
+from app.services.full_text_search import text_search  # noqa: E402
+
+WORDS = (
+    "monstera deliciosa philodendron pothos golden marble queen fiddle leaf fig ficus "
+    "snake plant sansevieria zz zamioculcas calathea maranta prayer alocasia elephant ear "
+    "begonia maculata hoya carnosa peperomia pilea peperomioides string pearls succulent "
+    "cactus echeveria haworthia aloe jade crassula orchid phalaenopsis fern boston maidenhair "
+    "bird nest anthurium spathiphyllum peace lily dracaena rubber tree palm areca parlor "
+    "cutting rooted node variegated healthy mature baby starter pot terracotta ceramic "
+    "repotted propagated water soil leca moss pole trellis bright indirect light humid "
+    "trade swap sell free pickup local shipping offer looking for rare pink albo thai "
+    "constellation mint splash large small medium hanging basket climbing trailing"
+).split()
+
+CORPUS = table(
+    "benchmark_fts_corpus",
+    column("id"), column("title"), column("description"), column("search_vector")
+)
+
+SEED_SQL = """
+INSERT INTO benchmark_fts_corpus (title, description)
+SELECT
+    (SELECT string_agg(w[1 + floor(random() * array_length(w, 1))::int], ' ')
+     FROM generate_series(1, 3 + (g % 4)) AS s WHERE g > 0),
+    (SELECT string_agg(w[1 + floor(random() * array_length(w, 1))::int], ' ')
+     FROM generate_series(1, 20 + (g % 30)) AS s WHERE g > 0)
+        || ' ' || substr(md5(g::text), 1, 8)
+FROM generate_series(1, :rows) AS g, (SELECT CAST(:words AS text[]) AS w) AS v
+"""
+
+
+async def time_queries(conn, statements):
+    timings = []
+    for statement in statements:
+        start = time.perf_counter()
+        await conn.execute(statement)
+        timings.append((time.perf_counter() - start) * 1000)
+    return np.percentile(timings, 50), np.percentile(timings, 95)
+
+
+async def main(args):
+    async with engine.connect() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.execute(text("""
+            CREATE TEMPORARY TABLE benchmark_fts_corpus (
+                id bigserial PRIMARY KEY,
+                title varchar(200) NOT NULL,
+                description text,
+                search_vector tsvector GENERATED ALWAYS AS (
+                    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+                    setweight(to_tsvector('english', coalesce(description, '')), 'B')
+                ) STORED
+            )
+        """))
+
+        start = time.perf_counter()
+        await conn.execute(text(SEED_SQL), {"rows": args.rows, "words": list(WORDS)})
+        print(f"seeded {args.rows:,} rows in {time.perf_counter() - start:.1f} s")
+
+        start = time.perf_counter()
+        await conn.execute(text("CREATE INDEX ON benchmark_fts_corpus USING gin (search_vector)"))
+        await conn.execute(text("CREATE INDEX ON benchmark_fts_corpus USING gin (title gin_trgm_ops)"))
+        await conn.execute(text("ANALYZE benchmark_fts_corpus"))
+        print(f"built indexes in {time.perf_counter() - start:.1f} s")
+
+        rare_tokens = (await conn.execute(text(
+            "SELECT substr(md5(g::text), 1, 8) FROM generate_series(1, :rows) AS g "
+            "ORDER BY random() LIMIT :count"
+        ), {"rows": args.rows, "count": args.queries})).scalars().all()
+        workloads = {
+            "common word": [random.choice(WORDS) for _ in range(args.queries)],
+            "two words": [" ".join(random.sample(WORDS, 2)) for _ in range(args.queries)],
+            "rare token": list(rare_tokens),
+        }
+
+        for label, terms in workloads.items():
+            ilike = [
+                select(CORPUS.c.id).where(or_(
+                    CORPUS.c.title.ilike(f"%{term}%"), CORPUS.c.description.ilike(f"%{term}%")
+                )).limit(args.limit)
+                for term in terms
+            ]
+            full_text = []
+            for term in terms:
+                search = text_search(term, CORPUS.c.search_vector, [CORPUS.c.title])
+                full_text.append(
+                    select(CORPUS.c.id).where(search.condition).order_by(desc(search.rank)).limit(args.limit)
+                )
+
+            ilike_p50, ilike_p95 = await time_queries(conn, ilike)
+            fts_p50, fts_p95 = await time_queries(conn, full_text)
+            print(f"{label:<12} ilike p50 {ilike_p50:8.1f} ms  p95 {ilike_p95:8.1f} ms   "
+                  f"full-text p50 {fts_p50:8.1f} ms  p95 {fts_p95:8.1f} ms")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Benchmark radius search latency as the number of nurseries grows.
+
+Compares a full scan (exact distance for every point, as the unindexed
+query did) with the grid index, which only computes distances for points
+inside the search bounding box.
+
+Usage:
+    python scripts/benchmark_geo_search.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.geo_search import GridIndex, _haversine_np  # noqa: E402
+
+
+def generate(count: int):
+    # Cluster points around "cities" so density resembles real listings
+    cities = [(random.uniform(-55, 70), random.uniform(-180, 180)) for _ in range(500)]
+    points = []
+    for i in range(count):
+        lat, lon = random.choice(cities)
+        points.append((i, lat + random.gauss(0, 1.0), ((lon + random.gauss(0, 1.0) + 180) % 360) - 180))
+    return cities, points
+
+
+def main(args):
+    for size in args.sizes:
+        cities, points = generate(size)
+        lats = np.array([p[1] for p in points])
+        lons = np.array([p[2] for p in points])
+        index = GridIndex(cell_degrees=args.cell_degrees).build(points)
+        queries = [random.choice(cities) for _ in range(args.queries)]
+
+        start = time.perf_counter()
+        for lat, lon in queries:
+            distances = _haversine_np(lat, lon, lats, lons)
+            within = np.flatnonzero(distances <= args.radius_km)
+            within[np.argsort(distances[within])][:args.limit]
+        scan_ms = (time.perf_counter() - start) / len(queries) * 1000
+
+        grid_times = []
+        for lat, lon in queries:
+            start = time.perf_counter()
+            index.search(lat, lon, args.radius_km, args.limit)
+            grid_times.append((time.perf_counter() - start) * 1000)
+
+        print(f"{size:>9,} nurseries: full scan {scan_ms:8.2f} ms   "
+              f"grid p50 {np.percentile(grid_times, 50):6.2f} ms  p95 {np.percentile(grid_times, 95):6.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--radius-km", type=float, default=50)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--cell-degrees", type=float, default=0.5)
+    main(parser.parse_args())
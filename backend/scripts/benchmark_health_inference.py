@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark micro-batched health inference against per-request scoring.
+
+Trains a model bundle on synthetic feedback samples, then serves the same
+burst of concurrent single-plant requests twice: once scoring each request
+with its own ``predict_proba`` call, and once through the inference
+engine, which batches requests arriving within a few milliseconds.
+
+Usage:
+    python scripts/benchmark_health_inference.py --requests 512 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.health_inference import (  # noqa: E402
+    MODEL_FEATURES,
+    HealthInferenceEngine,
+    feature_row,
+    train_health_bundle,
+)
+
+
+def synthetic_samples(count: int):
+    samples = []
+    for i in range(count):
+        features = {name: random.random() for name in MODEL_FEATURES}
+        quality = (features["care_frequency"] + features["consistency"] - features["environmental_stress"]) / 2
+        feedback = max(1, min(5, round(1 + 4 * (quality + 0.5) / 1.5 + random.gauss(0, 0.5))))
+        samples.append({
+            "features": features,
+            "feedback": feedback,
+            "success": feedback >= 4,
+            "interaction_type": "health_prediction" if i % 2 else "care_optimization",
+        })
+    return samples
+
+
+async def serve(score, rows, concurrency: int):
+    """Run requests with bounded concurrency; return per-request latencies and wall time."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def request(row):
+        async with semaphore:
+            start = time.perf_counter()
+            await score(row)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[request(row) for row in rows])
+    return latencies, time.perf_counter() - start
+
+
+def report(label: str, latencies, elapsed: float):
+    ms = sorted(latency * 1000 for latency in latencies)
+    p99 = ms[min(len(ms) - 1, int(len(ms) * 0.99))]
+    print(
+        f"{label:<12} {len(ms) / elapsed:8.0f} req/s, "
+        f"p50 {statistics.median(ms):7.1f} ms, p99 {p99:7.1f} ms"
+    )
+
+
+async def main(args):
+    with tempfile.TemporaryDirectory() as model_dir:
+        start = time.perf_counter()
+        result = train_health_bundle(synthetic_samples(args.samples), model_dir)
+        print(f"trained version {result['version']} in {time.perf_counter() - start:.1f}s: {result['performance']}")
+
+        engine = HealthInferenceEngine(model_dir, max_batch=args.max_batch, max_wait_ms=args.max_wait_ms)
+        bundle = engine.load()
+        rows = [feature_row({name: random.random() for name in MODEL_FEATURES}) for _ in range(args.requests)]
+
+        async def per_request(row):
+            await asyncio.to_thread(bundle.predict, [row])
+
+        latencies, elapsed = await serve(per_request, rows, args.concurrency)
+        report("per-request", latencies, elapsed)
+
+        latencies, elapsed = await serve(engine.predict, rows, args.concurrency)
+        report("batched", latencies, elapsed)
+        print(engine.get_stats())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=2000, help="synthetic training samples")
+    parser.add_argument("--requests", type=int, default=512)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    asyncio.run(main(parser.parse_args()))
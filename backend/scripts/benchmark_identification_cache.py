@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Benchmark near-duplicate lookups in the identification cache.
+
+Fills the cache with random 64-bit image hashes, then replays uploads of
+which a share are near-duplicates (a few flipped bits, as re-encoding or
+resizing produces) of cached images. Reports indexed lookup latency
+against a linear Hamming scan, the hit rate and the vision model calls
+that would have been avoided.
+
+Usage:
+    python scripts/benchmark_identification_cache.py --entries 50000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.identification_cache import IdentificationCache, hamming  # noqa: E402
+
+
+def flip_bits(value: int, count: int) -> int:
+    for bit in random.sample(range(64), count):
+        value ^= 1 << bit
+    return value
+
+
+def main(args):
+    cache = IdentificationCache(
+        model_version="benchmark", max_distance=args.max_distance, max_entries=args.entries * 2
+    )
+    hashes = [random.getrandbits(64) for _ in range(args.entries)]
+    start = time.perf_counter()
+    for value in hashes:
+        cache.put(value, {"identified_name": hex(value), "confidence_score": 0.9})
+    print(f"cached {len(hashes):,} results in {(time.perf_counter() - start) * 1000:.1f} ms")
+    cache.external_calls = 0
+
+    uploads = []
+    for _ in range(args.uploads):
+        if random.random() < args.duplicate_share:
+            uploads.append(flip_bits(random.choice(hashes), random.randint(0, args.max_distance)))
+        else:
+            uploads.append(random.getrandbits(64))
+
+    start = time.perf_counter()
+    for value in uploads:
+        if cache.get(value) is None:
+            cache.put(value, {"identified_name": hex(value), "confidence_score": 0.9})
+    indexed_elapsed = time.perf_counter() - start
+
+    sample = uploads[:args.linear_sample]
+    start = time.perf_counter()
+    for value in sample:
+        min((hamming(value, cached), cached) for cached in hashes)
+    linear_elapsed = (time.perf_counter() - start) / len(sample) * len(uploads)
+
+    print(f"{len(uploads):,} uploads: indexed {indexed_elapsed / len(uploads) * 1e6:.1f} us each, "
+          f"linear scan {linear_elapsed / len(uploads) * 1e6:.1f} us each")
+    print(cache.get_stats())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=50000)
+    parser.add_argument("--uploads", type=int, default=5000)
+    parser.add_argument("--duplicate-share", type=float, default=0.3)
+    parser.add_argument("--max-distance", type=int, default=6)
+    parser.add_argument("--linear-sample", type=int, default=200)
+    main(parser.parse_args())
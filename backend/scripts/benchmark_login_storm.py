@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Benchmark event-loop lag while the API verifies a storm of logins.
+
+A ticker measures how late the event loop wakes it up while many
+concurrent login attempts verify bcrypt hashes, first inline on the event
+loop (the old behaviour) and then on the bounded password hashing pool.
+Lag is what every other request on the worker pays during the storm.
+
+Usage:
+    python scripts/benchmark_login_storm.py --logins 64 --workers 4
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.security import PasswordHasher, PasswordHashingBusy, pwd_context  # noqa: E402
+
+
+async def monitor(lags, interval: float, stop: asyncio.Event):
+    """Record how late each tick fires."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def storm(verify, hashed: str, logins: int, interval: float):
+    lags = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(monitor(lags, interval, stop))
+    await asyncio.sleep(interval * 2)
+
+    async def attempt():
+        try:
+            return await verify("not-the-password", hashed)
+        except PasswordHashingBusy:
+            return None
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*[attempt() for _ in range(logins)])
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    return elapsed, lags, sum(result is None for result in results)
+
+
+def report(label: str, elapsed: float, lags, rejected: int, logins: int):
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(
+        f"{label:<8} {elapsed * 1000:8.0f} ms total, {(logins - rejected) / elapsed:6.1f} logins/s, "
+        f"loop lag p50 {statistics.median(lags_ms):7.1f} ms, p99 {p99:7.1f} ms, max {lags_ms[-1]:7.1f} ms, "
+        f"rejected {rejected}"
+    )
+
+
+async def main(args):
+    hashed = pwd_context.hash("correct horse battery staple")
+    interval = args.tick_ms / 1000
+
+    async def inline_verify(password, hashed_password):
+        return pwd_context.verify(password, hashed_password)
+
+    elapsed, lags, rejected = await storm(inline_verify, hashed, args.logins, interval)
+    report("inline", elapsed, lags, rejected, args.logins)
+
+    hasher = PasswordHasher(max_workers=args.workers, max_pending=args.max_pending)
+    elapsed, lags, rejected = await storm(hasher.verify, hashed, args.logins, interval)
+    report("pooled", elapsed, lags, rejected, args.logins)
+    print(hasher.get_stats())
+    hasher.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=64, help="concurrent login attempts")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-pending", type=int, default=64)
+    parser.add_argument("--tick-ms", type=float, default=5.0, help="lag monitor interval")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Benchmark health feature extraction for plants with multi-year care logs.
+
+A fake session serves a generated care history and sleeps per query and
+per row, so the comparison covers what each strategy transfers from the
+database as well as the feature computation itself:
+
+- full history: every care log loaded on every call (the old behaviour);
+- windowed, cold: only the feature window loaded on every call;
+- windowed, cached: features derived from the cached window;
+- incremental: a new care log applied to the cache, then features read.
+
+Usage:
+    python scripts/benchmark_plant_features.py --years 5 --logs-per-week 6
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.plant_feature_store import PlantFeatureStore  # noqa: E402
+
+CARE_TYPES = ["watering", "watering", "watering", "fertilizing", "pruning", "misting"]
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+    def one(self):
+        return self.rows[0]
+
+    def one_or_none(self):
+        return self.rows[0] if self.rows else None
+
+
+class FakeSession:
+    """Answers the feature store's three queries from a generated history."""
+
+    def __init__(self, logs, window_days: int, query_ms: float, row_us: float):
+        self.logs = logs
+        self.window_days = window_days
+        self.query_latency = query_ms / 1000
+        self.row_latency = row_us / 1e6
+        self.queries = 0
+        self.rows = 0
+
+    async def execute(self, stmt):
+        self.queries += 1
+        first = stmt.selected_columns[0].name
+        if first == "user_id":
+            rows = [SimpleNamespace(
+                user_id=uuid.uuid4(), acquired_date=datetime.utcnow() - timedelta(days=900),
+                care_level="moderate", gardening_experience="intermediate"
+            )]
+        elif first == "care_type":
+            since = datetime.utcnow() - timedelta(days=self.window_days)
+            rows = [log for log in self.logs if log[1] >= since]
+        else:
+            rows = [(12, 9)]
+        self.rows += len(rows)
+        await asyncio.sleep(self.query_latency + self.row_latency * len(rows))
+        return FakeResult(rows)
+
+
+def generate_history(years: float, logs_per_week: float):
+    now = datetime.utcnow()
+    count = int(years * 52 * logs_per_week)
+    times = sorted(now - timedelta(days=random.uniform(0, years * 365)) for _ in range(count))
+    return [(random.choice(CARE_TYPES), performed_at) for performed_at in times]
+
+
+async def timed(label: str, store: PlantFeatureStore, session: FakeSession, plant_id, runs: int, before=None):
+    start = time.perf_counter()
+    for _ in range(runs):
+        if before:
+            before()
+        features = await store.get_features(session, plant_id)
+    elapsed = (time.perf_counter() - start) / runs
+    print(
+        f"{label:<18} {elapsed * 1000:8.2f} ms/call, "
+        f"{session.queries / runs:4.1f} queries/call, {session.rows / runs:8.0f} rows/call"
+    )
+    return features
+
+
+async def main(args):
+    logs = generate_history(args.years, args.logs_per_week)
+    plant_id = uuid.uuid4()
+    print(f"{len(logs)} care logs over {args.years} years")
+
+    full_days = int(args.years * 365) + 1
+    full = PlantFeatureStore(window_days=full_days, ttl_seconds=0)
+    await timed("full history", full, FakeSession(logs, full_days, args.query_ms, args.row_us), plant_id, args.runs)
+
+    cold = PlantFeatureStore(window_days=args.window_days, ttl_seconds=0)
+    await timed("windowed, cold", cold, FakeSession(logs, args.window_days, args.query_ms, args.row_us), plant_id, args.runs)
+
+    cached = PlantFeatureStore(window_days=args.window_days, ttl_seconds=3600)
+    session = FakeSession(logs, args.window_days, args.query_ms, args.row_us)
+    await cached.get_features(session, plant_id)
+    session.queries = session.rows = 0
+    await timed("windowed, cached", cached, session, plant_id, args.runs)
+
+    features = await timed(
+        "incremental", cached, session, plant_id, args.runs,
+        before=lambda: cached.record_care(plant_id, "watering", datetime.utcnow())
+    )
+    print(features)
+    print(cached.get_stats())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=float, default=5)
+    parser.add_argument("--logs-per-week", type=float, default=6)
+    parser.add_argument("--window-days", type=int, default=180)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--query-ms", type=float, default=1.0, help="simulated query latency")
+    parser.add_argument("--row-us", type=float, default=5.0, help="simulated per-row transfer and ORM cost")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark bearer-token resolution with and without the principal cache.
+
+A fake session returns a prebuilt user and sleeps per query, so the
+comparison is between a JWT decode plus a user query on every request and
+the principal cache's cached claims and merged user snapshot.
+
+Usage:
+    python scripts/benchmark_principal_cache.py --requests 2000 --query-ms 1.0
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.models.user import User  # noqa: E402
+from app.services.auth_service import AuthService  # noqa: E402
+from app.services.principal_cache import get_principal_cache  # noqa: E402
+
+
+class FakeResult:
+    def __init__(self, user):
+        self.user = user
+
+    def scalar_one_or_none(self):
+        return self.user
+
+
+class FakeSession:
+    """Answers every user query with the same user."""
+
+    def __init__(self, user: User, latency_ms: float):
+        self.user = user
+        self.latency = latency_ms / 1000
+        self.queries = 0
+
+    async def execute(self, stmt):
+        self.queries += 1
+        await asyncio.sleep(self.latency)
+        return FakeResult(self.user)
+
+    async def merge(self, instance, load=True):
+        return instance
+
+
+async def resolve(service: AuthService, session: FakeSession, tokens, runs: int, cold: bool) -> float:
+    cache = get_principal_cache()
+    start = time.perf_counter()
+    for i in range(runs):
+        if cold:
+            cache.clear()
+        user = await service.get_current_user(tokens[i % len(tokens)], session)
+        assert user is not None
+    return (time.perf_counter() - start) / runs
+
+
+async def main(args):
+    service = AuthService()
+    user = User(
+        id=uuid.uuid4(), email="bench@example.com", username="bench",
+        hashed_password="x", is_active=True, is_superuser=False, is_verified=True,
+        is_admin=False, is_expert=False, is_moderator=False
+    )
+    tokens = [service.create_access_token({"sub": str(user.id)}) for _ in range(args.sessions)]
+
+    session = FakeSession(user, args.query_ms)
+    uncached = await resolve(service, session, tokens, args.requests, cold=True)
+    print(f"decode + query:  {uncached * 1e6:9.1f} us/request ({session.queries} queries)")
+
+    session = FakeSession(user, args.query_ms)
+    get_principal_cache().clear()
+    cached = await resolve(service, session, tokens, args.requests, cold=False)
+    print(f"principal cache: {cached * 1e6:9.1f} us/request ({session.queries} queries)")
+    print(f"speedup: {uncached / cached:.1f}x")
+    print(get_principal_cache().get_stats())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--sessions", type=int, default=50, help="distinct tokens for the same user")
+    parser.add_argument("--query-ms", type=float, default=1.0, help="simulated user query latency")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Benchmark the bulk RAG reindex pipeline with a local stub embedder.
+
+The database stages are replaced with in-memory stand-ins so the numbers
+reflect pipeline overhead and embedding batching, not Postgres.
+
+Usage:
+    python scripts/benchmark_rag_reindex.py --items 20000 --latency-ms 40
+"""
+
+import argparse
+import asyncio
+import sys
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.rag_reindex_pipeline import BulkReindexPipeline, IndexDocument  # noqa: E402
+
+
+class StubEmbeddingService:
+    """Embedder that sleeps per request like a remote provider would."""
+
+    def __init__(self, latency_ms: float, dimension: int = 1536):
+        self.latency = latency_ms / 1000
+        self.dimension = dimension
+        self.requests = 0
+
+    async def generate_text_embedding(self, text: str):
+        return (await self.generate_batch_embeddings([text]))[0]
+
+    async def generate_batch_embeddings(self, texts):
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        return [[float(len(text) % 7)] * self.dimension for text in texts]
+
+
+class InMemoryReindexPipeline(BulkReindexPipeline):
+    """Pipeline reading from a generated corpus and writing to a dict."""
+
+    def __init__(self, corpus, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.corpus = corpus
+        self.store = {}
+
+    async def iter_documents(self, db, sources, force, stats):
+        for start in range(0, len(self.corpus), self.page_size):
+            page = self.corpus[start:start + self.page_size]
+            stats.fetched += len(page)
+            if not force:
+                changed = [d for d in page if self.store.get(d.content_id) != d.content_hash]
+                stats.skipped += len(page) - len(changed)
+                page = changed
+            if page:
+                yield page
+
+    async def write_batch(self, documents, embeddings):
+        for document in documents:
+            self.store[document.content_id] = document.content_hash
+
+
+async def sequential_baseline(corpus, embedder, batch_size=10):
+    """Per-item embedding in small gathered groups, like the old reindex path."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for i in range(0, len(corpus), batch_size):
+        batch = corpus[i:i + batch_size]
+        await asyncio.gather(*(embedder.generate_text_embedding(d.text) for d in batch))
+        await asyncio.sleep(0.1)
+    return len(corpus) / (loop.time() - start)
+
+
+async def main(args):
+    corpus = [
+        IndexDocument("species_info", uuid.uuid4(), f"Plant {i}\nWater weekly\nBright indirect light")
+        for i in range(args.items)
+    ]
+
+    embedder = StubEmbeddingService(args.latency_ms)
+    pipeline = InMemoryReindexPipeline(
+        corpus,
+        embedder,
+        page_size=args.page_size,
+        embed_batch_size=args.batch_size,
+        embed_concurrency=args.concurrency,
+    )
+
+    first = await pipeline.run(db=None)
+    print(f"full reindex:      {first['items_per_second']:>10.1f} items/s "
+          f"({embedder.requests} embedding requests)")
+
+    second = await pipeline.run(db=None)
+    print(f"unchanged rerun:   skipped {second['skipped']} of {second['total']} items")
+
+    if args.baseline:
+        baseline_embedder = StubEmbeddingService(args.latency_ms)
+        rate = await sequential_baseline(corpus[:min(len(corpus), 1000)], baseline_embedder)
+        print(f"per-item baseline: {rate:>10.1f} items/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--baseline", action="store_true", help="Also run the per-item baseline")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Compare time-to-first-byte of buffered vs streamed RAG care advice.
+
+Retrieval, embeddings and the chat model are replaced with local stubs
+that sleep for configurable latencies, so only orchestration is measured.
+
+Usage:
+    python scripts/benchmark_rag_streaming.py --runs 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.rag_service import PlantData, RAGService, UserContext  # noqa: E402
+
+
+class FakeStreamingLLM:
+    """Mimics ``AsyncOpenAI().chat.completions.create`` with and without streaming."""
+
+    def __init__(self, first_token_ms: float, token_ms: float, tokens: int):
+        self.first_token = first_token_ms / 1000
+        self.per_token = token_ms / 1000
+        self.tokens = tokens
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, stream: bool = False, **kwargs):
+        if stream:
+            return self._stream()
+        await asyncio.sleep(self.first_token + self.per_token * self.tokens)
+        message = SimpleNamespace(content="water " * self.tokens)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async def _stream(self):
+        await asyncio.sleep(self.first_token)
+        for _ in range(self.tokens):
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="water "))])
+            await asyncio.sleep(self.per_token)
+
+
+class FakeEmbeddingService:
+    def __init__(self, latency_ms: float):
+        self.latency = latency_ms / 1000
+
+    async def generate_text_embedding(self, text):
+        await asyncio.sleep(self.latency)
+        return [0.0] * 1536
+
+
+class FakeVectorService:
+    def __init__(self, embedding_service, latency_ms: float):
+        self.embedding_service = embedding_service
+        self.latency = latency_ms / 1000
+
+    async def search_plant_knowledge(self, db, query, query_embedding=None, content_types=None, **kwargs):
+        if query_embedding is None:
+            await self.embedding_service.generate_text_embedding(query)
+        # One round trip per source group, as the real service does
+        await asyncio.sleep(self.latency * (1 if content_types else 3))
+        label = "-".join(content_types or ["all"])
+        return [{
+            "id": f"{label}-{i}", "title": label, "content": "Keep soil moist",
+            "similarity_score": 0.9 - i / 10, "verified": "verified",
+        } for i in range(3)]
+
+
+@asynccontextmanager
+async def null_session():
+    yield None
+
+
+def build_service(args) -> RAGService:
+    embedding_service = FakeEmbeddingService(args.embed_ms)
+    service = RAGService(
+        llm_client=FakeStreamingLLM(args.first_token_ms, args.token_ms, args.tokens),
+        embedding_service=embedding_service,
+        vector_service=FakeVectorService(embedding_service, args.search_ms),
+        session_factory=null_session,
+    )
+
+    async def no_log(**kwargs):
+        return None
+
+    service._log_rag_interaction = no_log
+    return service
+
+
+async def main(args):
+    service = build_service(args)
+    user = UserContext(user_id="bench", experience_level="beginner")
+    plant = PlantData(species_id="s1", species_name="Monstera deliciosa", care_level="easy")
+    query = "why are my monstera leaves yellow"
+
+    buffered, first_byte, complete = [], [], []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        await service.generate_plant_care_advice(db=None, user_context=user, plant_data=plant, query=query)
+        buffered.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        first = None
+        async for event in service.stream_plant_care_advice(user, plant, query):
+            if first is None:
+                first = time.perf_counter() - start
+        first_byte.append(first)
+        complete.append(time.perf_counter() - start)
+
+    ms = lambda values: f"{statistics.median(values) * 1000:8.1f} ms"
+    print(f"buffered response (TTFB = total): {ms(buffered)}")
+    print(f"streamed first event:             {ms(first_byte)}")
+    print(f"streamed complete:                {ms(complete)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--embed-ms", type=float, default=60)
+    parser.add_argument("--search-ms", type=float, default=40)
+    parser.add_argument("--first-token-ms", type=float, default=400)
+    parser.add_argument("--token-ms", type=float, default=15)
+    parser.add_argument("--tokens", type=int, default=200)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Benchmark compiled care rule evaluation.
+
+Adds thousands of synthetic custom rules through ``add_custom_rule`` (a
+mix of species-specific, seasonal and global rules) and times evaluating
+aggregated plant contexts, one call per context and in one batch call,
+against the previous approach of walking every rule per request,
+splitting each field path and dispatching on the operator per condition.
+
+Usage:
+    python scripts/benchmark_rule_engine.py --rules 5000 --contexts 2000
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.rule_engine_service import (  # noqa: E402
+    CareRecommendation,
+    CareRule,
+    RuleCondition,
+    RuleConditionOperator,
+    RuleEngineService,
+)
+
+SEASONS = ["spring", "summer", "autumn", "winter"]
+
+FIELDS = [
+    ("environmental_data.humidity.average", RuleConditionOperator.LESS_THAN, lambda: random.uniform(15, 45)),
+    ("environmental_data.temperature.average", RuleConditionOperator.GREATER_THAN, lambda: random.uniform(22, 36)),
+    ("environmental_data.light_intensity.average", RuleConditionOperator.IN_RANGE,
+     lambda: sorted(random.uniform(50, 800) for _ in range(2))),
+    ("growth_patterns.growth_trend", RuleConditionOperator.EQUALS,
+     lambda: random.choice(["growing", "stable", "declining"])),
+    ("plant_health_indicators.health_trend", RuleConditionOperator.EQUALS, lambda: "declining"),
+    ("care_history.watering.count", RuleConditionOperator.GREATER_EQUAL, lambda: random.randint(4, 14)),
+]
+
+
+def legacy_value(data, field_path):
+    current = data
+    for key in field_path.split("."):
+        if isinstance(current, dict) and key in current:
+            current = current[key]
+        else:
+            return None
+    return current
+
+
+def legacy_condition(condition, context):
+    actual = legacy_value(context, condition.field_path)
+    if actual is None and condition.operator != RuleConditionOperator.EXISTS:
+        return False
+    if condition.operator == RuleConditionOperator.EQUALS:
+        return actual == condition.value
+    elif condition.operator == RuleConditionOperator.NOT_EQUALS:
+        return actual != condition.value
+    elif condition.operator == RuleConditionOperator.GREATER_THAN:
+        return actual > condition.value
+    elif condition.operator == RuleConditionOperator.LESS_THAN:
+        return actual < condition.value
+    elif condition.operator == RuleConditionOperator.GREATER_EQUAL:
+        return actual >= condition.value
+    elif condition.operator == RuleConditionOperator.LESS_EQUAL:
+        return actual <= condition.value
+    elif condition.operator == RuleConditionOperator.CONTAINS:
+        return condition.value in str(actual)
+    elif condition.operator == RuleConditionOperator.IN_RANGE:
+        min_val, max_val = condition.value
+        return min_val <= actual <= max_val
+    elif condition.operator == RuleConditionOperator.EXISTS:
+        return actual is not None
+    return False
+
+
+def legacy_applied(engine, context):
+    """Rule ids the previous engine applied to a context, building the same recommendations."""
+    rules = engine.rules
+    species_id = context["plant_info"]["species_id"]
+    season = context["seasonal_context"]["current_season"]
+    applied = []
+    recommendations = []
+    for rule in rules:
+        if not rule.enabled:
+            continue
+        if rule.species_filter and species_id not in rule.species_filter:
+            continue
+        if rule.season_filter and season not in rule.season_filter:
+            continue
+        total = sum(c.weight for c in rule.conditions)
+        met = sum(c.weight for c in rule.conditions if legacy_condition(c, context))
+        score = met / total if rule.conditions and total > 0 else (1.0 if not rule.conditions else 0.0)
+        if score > 0.5:
+            recommendations.extend(engine._generate_rule_recommendations(rule, context, score))
+            applied.append(rule.rule_id)
+    recommendations.sort(key=lambda r: (engine._priority_score(r.priority), r.confidence), reverse=True)
+    return applied
+
+
+def generate_rule(index, species_ids, args):
+    conditions = []
+    for field_path, op, value in random.sample(FIELDS, random.randint(1, 3)):
+        conditions.append(RuleCondition(field_path, op, value(), weight=random.choice([0.5, 1.0])))
+    kind = random.random()
+    species_filter = random.sample(species_ids, random.randint(1, 3)) if kind < args.species_fraction else None
+    season_filter = [random.choice(SEASONS)] if random.random() < args.season_fraction else None
+    return CareRule(
+        rule_id=f"custom_{index}",
+        name=f"Custom rule {index}",
+        description="Synthetic benchmark rule",
+        conditions=conditions,
+        recommendations=[CareRecommendation(
+            action_type="watering",
+            priority=random.choice(["high", "medium", "low"]),
+            recommendation="Check {plant_name}",
+            parameters={},
+            confidence=0.8,
+            reasoning="Synthetic"
+        )],
+        species_filter=species_filter,
+        season_filter=season_filter,
+    )
+
+
+def generate_context(species_ids):
+    return {
+        "plant_info": {"species_id": random.choice(species_ids), "nickname": "Fern", "species_name": "Nephrolepis"},
+        "seasonal_context": {"current_season": random.choice(SEASONS)},
+        "environmental_data": {
+            "humidity": {"average": random.uniform(20, 80)},
+            "temperature": {"average": random.uniform(12, 34)},
+            "light_intensity": {"average": random.uniform(30, 900)},
+        },
+        "growth_patterns": {"growth_trend": random.choice(["growing", "stable", "insufficient_data"])},
+        "plant_health_indicators": {"health_trend": random.choice(["improving", "stable", "declining"])},
+        "care_history": {"watering": {"count": random.randint(0, 12)}},
+        "contextual_metadata": {"data_completeness_score": random.uniform(0.3, 1.0)},
+    }
+
+
+def main(args):
+    species_ids = [str(uuid.uuid4()) for _ in range(args.species)]
+    engine = RuleEngineService(db=None, rules=[])
+    for index in range(args.rules):
+        engine.add_custom_rule(generate_rule(index, species_ids, args))
+    contexts = [generate_context(species_ids) for _ in range(args.contexts)]
+
+    start = time.perf_counter()
+    engine.rules.compiled()
+    print(f"compiled {len(engine.rules):,} rules in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    legacy = [legacy_applied(engine, context) for context in contexts]
+    legacy_seconds = time.perf_counter() - start
+
+    async def evaluate_each():
+        return [await engine.generate_care_recommendations(None, None, context=context) for context in contexts]
+
+    start = time.perf_counter()
+    single = asyncio.run(evaluate_each())
+    single_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = engine.evaluate_contexts(contexts)
+    batch_seconds = time.perf_counter() - start
+
+    for expected, (_, metadata) in zip(legacy, batch):
+        assert expected == [rule["rule_id"] for rule in metadata["applied_rules"]]
+    evaluated = sum(metadata["rules_evaluated"] for _, metadata in single) / len(contexts)
+    applied = sum(metadata["rules_applied"] for _, metadata in single) / len(contexts)
+
+    for label, seconds in (("walk every rule", legacy_seconds), ("compiled, per context", single_seconds),
+                           ("compiled, batch", batch_seconds)):
+        print(f"{label:<22} {len(contexts) / seconds:9,.0f} contexts/s "
+              f"({seconds / len(contexts) * 1000:.3f} ms each)")
+    print(f"per context: {evaluated:,.0f} candidate rules of {len(engine.rules):,}, {applied:,.0f} applied")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rules", type=int, default=5000)
+    parser.add_argument("--contexts", type=int, default=2000)
+    parser.add_argument("--species", type=int, default=500)
+    parser.add_argument("--species-fraction", type=float, default=0.7, help="share of species-specific rules")
+    parser.add_argument("--season-fraction", type=float, default=0.5, help="share of seasonal rules")
+    main(parser.parse_args())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Benchmark species name matching with the in-memory lexicon.
+
+Builds a lexicon over synthetic species and times resolving identification
+results (a primary name plus alternative suggestions) that are exact,
+genus-only, misspelled or unknown. The previous implementation issued two
+database queries per candidate name plus up to three LIKE scans.
+
+Usage:
+    python scripts/benchmark_species_lexicon.py --species 20000
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.species_lexicon import SpeciesLexicon  # noqa: E402
+
+
+def word(length: int) -> str:
+    return "".join(random.choice(string.ascii_lowercase) for _ in range(length))
+
+
+def generate(count: int):
+    genera = [word(random.randint(6, 10)).capitalize() for _ in range(max(count // 20, 1))]
+    species = []
+    for _ in range(count):
+        name = f"{random.choice(genera)} {word(random.randint(6, 11))}"
+        if random.random() < 0.1:
+            name += f" '{word(5).capitalize()} {word(6).capitalize()}'"
+        common = [f"{word(5)} {word(6)}" for _ in range(random.randint(0, 3))]
+        species.append((uuid.uuid4(), name, common))
+    return species
+
+
+def misspell(name: str) -> str:
+    position = random.randrange(1, len(name) - 1)
+    return name[:position] + random.choice(string.ascii_lowercase) + name[position + 1:]
+
+
+def main(args):
+    species = generate(args.species)
+    start = time.perf_counter()
+    lexicon = SpeciesLexicon().build(species)
+    print(f"built index of {len(lexicon):,} names in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    requests = []
+    for _ in range(args.requests):
+        _, name, common = random.choice(species)
+        kind = random.random()
+        if kind < 0.4:
+            primary = name
+        elif kind < 0.6:
+            primary = name.split()[0]
+        elif kind < 0.9:
+            primary = misspell(name)
+        else:
+            primary = f"{word(8)} {word(8)}"
+        suggestions = [{"name": random.choice(common) if common else word(8), "scientific_name": misspell(name)}
+                       for _ in range(4)]
+        requests.append((primary, suggestions))
+
+    start = time.perf_counter()
+    matched = sum(1 for primary, suggestions in requests if lexicon.match(primary, suggestions))
+    elapsed = time.perf_counter() - start
+    print(f"{len(requests):,} identifications resolved in {elapsed * 1000:.1f} ms "
+          f"({elapsed / len(requests) * 1e6:.1f} us each, {matched / len(requests):.0%} matched)")
+    print(lexicon.get_stats())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--species", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=5000)
+    main(parser.parse_args())
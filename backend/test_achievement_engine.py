@@ -0,0 +1,237 @@
+"""Tests for event-driven achievement awards.
+
+Events update the user's counters with one UPDATE ... RETURNING and only
+the achievements indexed under that event are checked and awarded.
+Statements are inspected through their compiled PostgreSQL form.
+"""
+
+import os
+import sys
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql
+
+# Add the backend directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from app.models.plant_achievement import PlantAchievement, UserStats
+from app.services.achievement_engine import (
+    COUNTER_STATS,
+    AchievementEngine,
+    AchievementEvent,
+    _counter_updates,
+)
+
+# Counter moved by each event; CARE_LOGGED events are replayed as consecutive days
+EVENT_STATS = {
+    AchievementEvent.CARE_LOGGED: "care_streak_days",
+    AchievementEvent.PLANT_ADDED: "active_plants",
+    AchievementEvent.PLANT_IDENTIFIED: "plants_identified",
+    AchievementEvent.ANSWER_MARKED_HELPFUL: "helpful_answers",
+}
+
+
+def compile_pg(stmt):
+    return stmt.compile(dialect=postgresql.dialect())
+
+
+class Result:
+    def __init__(self, rows=(), scalar=None):
+        self.rows = list(rows)
+        self._scalar = scalar
+
+    def one_or_none(self):
+        return self.rows[0] if self.rows else None
+
+    def one(self):
+        return self.rows[0]
+
+    def all(self):
+        return self.rows
+
+    def scalars(self):
+        return ScalarResult(self.rows)
+
+
+class ScalarResult(list):
+    def all(self):
+        return list(self)
+
+
+class FakeSession:
+    """Answers the engine's statements from in-memory counters and awards."""
+
+    def __init__(self, achievements, oldest_plant=None):
+        self.achievements = achievements
+        self.oldest_plant = oldest_plant
+        self.stats = {}
+        self.earned = set()
+        self.points_updates = 0
+        self.event = None
+        self.user_id = None
+
+    async def execute(self, stmt):
+        compiled = compile_pg(stmt)
+        sql = str(compiled)
+        if sql.startswith("UPDATE user_stats") and " RETURNING " in sql:
+            stats = self.stats.get(self.user_id)
+            if stats is None:
+                return Result()
+            stat = EVENT_STATS.get(self.event)
+            if stat:
+                stats[stat] += 1
+            return Result([SimpleNamespace(_mapping=dict(stats))])
+        if sql.startswith("UPDATE user_stats"):
+            self.points_updates += 1
+            return Result()
+        if sql.startswith("INSERT INTO user_stats"):
+            self.stats.setdefault(self.user_id, {stat: 0 for stat in COUNTER_STATS})
+            return Result()
+        if sql.startswith("INSERT INTO user_achievements"):
+            params = compiled.params
+            rows = []
+            index = 0
+            while f"user_id_m{index}" in params:
+                rows.append((params[f"user_id_m{index}"], params[f"achievement_id_m{index}"]))
+                index += 1
+            rows = [row for row in rows if row not in self.earned]
+            self.earned.update(rows)
+            return Result(rows)
+        if "FROM plant_achievements" in sql:
+            return Result(self.achievements)
+        return Result(achievement_id for user_id, achievement_id in self.earned if user_id == self.user_id)
+
+    async def scalar(self, stmt):
+        assert "min(user_plants.acquired_date)" in str(compile_pg(stmt))
+        return self.oldest_plant
+
+    async def record(self, engine, user_id, event):
+        self.user_id, self.event = user_id, event
+        return await engine.record_event(self, user_id, event)
+
+
+def make_achievement(achievement_type, criteria, points=50):
+    return PlantAchievement(
+        id=uuid4(), is_active=True, achievement_type=achievement_type,
+        title=achievement_type, points=points, unlock_criteria=criteria
+    )
+
+
+@pytest.fixture
+def achievements():
+    return [
+        make_achievement("care_streak", {"days": 3}),
+        make_achievement("plant_collection", {"count": 2}, points=25),
+        make_achievement("identification", {"count": 1}, points=10),
+    ]
+
+
+def test_care_event_streak_sql():
+    """The streak restarts, holds for the same day or continues from yesterday."""
+    stmt = (
+        update(UserStats)
+        .where(UserStats.user_id == uuid4())
+        .values(**_counter_updates(AchievementEvent.CARE_LOGGED, datetime(2026, 5, 2, 10)))
+    )
+    compiled = compile_pg(stmt)
+    sql = " ".join(str(compiled).split())
+    params = compiled.params
+
+    streak = (
+        "CASE WHEN (user_stats.last_care_activity IS NULL) THEN %(param_1)s "
+        "WHEN (CAST(user_stats.last_care_activity AS DATE) >= %(param_2)s) THEN user_stats.care_streak_days "
+        "WHEN (CAST(user_stats.last_care_activity AS DATE) = %(param_3)s) "
+        "THEN user_stats.care_streak_days + %(care_streak_days_1)s "
+        "ELSE %(param_4)s END"
+    )
+    assert f"care_streak_days={streak}" in sql
+    assert f"longest_care_streak=greatest(user_stats.longest_care_streak, {streak})" in sql
+    assert "last_care_activity=greatest(user_stats.last_care_activity, %(greatest_1)s)" in sql
+    assert (params["param_1"], params["care_streak_days_1"], params["param_4"]) == (1, 1, 1)
+    assert params["param_2"] == date(2026, 5, 2)
+    assert params["param_3"] == date(2026, 5, 1)
+
+
+def test_counter_event_sql_never_goes_negative():
+    stmt = update(UserStats).values(
+        **_counter_updates(AchievementEvent.PLANT_DEACTIVATED, datetime.utcnow())
+    )
+    compiled = compile_pg(stmt)
+    assert "active_plants=greatest(user_stats.active_plants + %(active_plants_1)s, %(greatest_1)s)" in str(compiled)
+    assert compiled.params["active_plants_1"] == -1
+    assert compiled.params["greatest_1"] == 0
+
+
+@pytest.mark.asyncio
+async def test_counter_event_awards_once_when_threshold_is_reached(achievements):
+    engine = AchievementEngine()
+    db = FakeSession(achievements)
+    user_id = uuid4()
+
+    awarded = [await db.record(engine, user_id, AchievementEvent.CARE_LOGGED) for _ in range(5)]
+
+    assert [len(batch) for batch in awarded] == [0, 0, 1, 0, 0]
+    assert awarded[2][0].id == achievements[0].id
+    assert db.earned == {(user_id, achievements[0].id)}
+    assert db.points_updates == 1
+    assert engine.awarded == 1
+
+
+@pytest.mark.asyncio
+async def test_event_only_checks_achievements_it_can_unlock(achievements):
+    engine = AchievementEngine()
+    db = FakeSession(achievements)
+    user_id = uuid4()
+
+    await db.record(engine, user_id, AchievementEvent.PLANT_ADDED)
+    awarded = await db.record(engine, user_id, AchievementEvent.PLANT_ADDED)
+
+    assert [a.id for a in awarded] == [achievements[1].id]
+    # Two plant events, each checked against the single plant_collection achievement
+    assert engine.evaluated == 2
+    assert await db.record(engine, user_id, AchievementEvent.QUESTION_ASKED) == []
+    assert engine.evaluated == 2
+
+
+@pytest.mark.asyncio
+async def test_first_event_creates_missing_counter_row(achievements):
+    engine = AchievementEngine()
+    db = FakeSession(achievements)
+    user_id = uuid4()
+
+    awarded = await db.record(engine, user_id, AchievementEvent.PLANT_IDENTIFIED)
+
+    assert db.stats[user_id]["plants_identified"] == 1
+    assert [a.id for a in awarded] == [achievements[2].id]
+
+
+@pytest.mark.asyncio
+async def test_event_without_indexed_achievements_awards_nothing(achievements):
+    engine = AchievementEngine()
+    db = FakeSession([a for a in achievements if a.achievement_type != "identification"])
+    user_id = uuid4()
+
+    assert await db.record(engine, user_id, AchievementEvent.PLANT_IDENTIFIED) == []
+    assert db.earned == set()
+
+
+@pytest.mark.asyncio
+async def test_evaluate_user_awards_plant_age_from_timestamp():
+    """acquired_date is a timestamp column; the age check must accept a datetime."""
+    plant_age = make_achievement("plant_age", {"days": 30})
+    engine = AchievementEngine()
+    db = FakeSession([plant_age], oldest_plant=datetime.utcnow() - timedelta(days=45, hours=3))
+    db.user_id = uuid4()
+
+    awarded = await engine.evaluate_user(db, db.user_id, {stat: 0 for stat in COUNTER_STATS})
+
+    assert [a.id for a in awarded] == [plant_age.id]
+
+    db.oldest_plant = datetime.utcnow() - timedelta(days=10)
+    other = uuid4()
+    db.user_id = other
+    assert await engine.evaluate_user(db, other, {stat: 0 for stat in COUNTER_STATS}) == []
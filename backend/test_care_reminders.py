@@ -0,0 +1,121 @@
+"""Tests for care reminder dispatch and rescheduling.
+
+Reminders are marked notified only when their user's notification was
+delivered; species interval edits reschedule the species' plants.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+
+# Add the backend directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from app.models.care_reminder import CareReminder
+from app.schemas.plant_species import PlantSpeciesUpdate
+from app.services.care_reminder_service import CareReminderDispatcher
+from app.services.plant_species_service import PlantSpeciesService
+
+
+def make_reminder(user_id, days_overdue=1):
+    now = datetime.utcnow()
+    return CareReminder(
+        plant_id=uuid4(),
+        care_type="watering",
+        user_id=user_id,
+        last_care_at=now - timedelta(days=7 + days_overdue),
+        interval_days=7,
+        next_due_at=now - timedelta(days=days_overdue),
+    )
+
+
+def make_session(rows):
+    result = Mock()
+    result.all.return_value = rows
+    db = Mock()
+    db.execute = AsyncMock(return_value=result)
+    db.commit = AsyncMock()
+    return db
+
+
+@pytest.mark.asyncio
+async def test_dispatch_marks_only_delivered_reminders():
+    delivered_user, offline_user, failing_user = uuid4(), uuid4(), uuid4()
+    delivered = [make_reminder(delivered_user, 3), make_reminder(delivered_user, 2)]
+    offline = [make_reminder(offline_user, 2)]
+    failing = [make_reminder(failing_user, 1)]
+    rows = [(reminder, "Fern", "Nephrolepis exaltata") for reminder in delivered + offline + failing]
+
+    async def send(user_id, reminders):
+        if user_id == failing_user:
+            raise RuntimeError("push gateway down")
+        return user_id == delivered_user
+
+    dispatcher = CareReminderDispatcher(batch_size=10, retry_seconds=600)
+    dispatcher.notifier = Mock(send_care_due_reminders=AsyncMock(side_effect=send))
+    db = make_session(rows)
+
+    result = await dispatcher.process_once(db)
+
+    assert result == {"due": 4, "users": 3, "delivered": 1}
+    assert all(reminder.notified_at is not None for reminder in delivered)
+    assert all(reminder.retry_after is None for reminder in delivered)
+    for reminder in offline + failing:
+        assert reminder.notified_at is None
+        assert reminder.retry_after is not None
+        assert reminder.retry_after > datetime.utcnow() + timedelta(seconds=500)
+    db.commit.assert_awaited_once()
+
+    sent = dispatcher.notifier.send_care_due_reminders.await_args_list
+    assert [len(call.args[1]) for call in sent] == [2, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_with_nothing_due_sends_nothing():
+    dispatcher = CareReminderDispatcher()
+    dispatcher.notifier = Mock(send_care_due_reminders=AsyncMock())
+    db = make_session([])
+
+    assert await dispatcher.process_once(db) == {"due": 0, "users": 0, "delivered": 0}
+    dispatcher.notifier.send_care_due_reminders.assert_not_awaited()
+
+
+def make_species_session(species):
+    result = Mock()
+    result.scalar_one_or_none.return_value = species
+    db = Mock()
+    db.execute = AsyncMock(return_value=result)
+    db.flush = AsyncMock()
+    db.commit = AsyncMock()
+    db.refresh = AsyncMock()
+    return db
+
+
+@pytest.mark.asyncio
+async def test_species_interval_change_reschedules_plants():
+    species = Mock(id=uuid4(), water_frequency_days=7)
+    db = make_species_session(species)
+
+    with patch(
+        "app.services.plant_species_service.schedule_species", AsyncMock(return_value=3)
+    ) as schedule_species:
+        await PlantSpeciesService.update_species(db, species.id, PlantSpeciesUpdate(water_frequency_days=3))
+
+    assert species.water_frequency_days == 3
+    schedule_species.assert_awaited_once_with(db, species.id)
+    db.flush.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_species_edit_without_interval_change_keeps_reminders():
+    species = Mock(id=uuid4(), water_frequency_days=7)
+    db = make_species_session(species)
+
+    with patch("app.services.plant_species_service.schedule_species", AsyncMock()) as schedule_species:
+        await PlantSpeciesService.update_species(db, species.id, PlantSpeciesUpdate(care_level="easy"))
+
+    schedule_species.assert_not_awaited()
@@ -0,0 +1,139 @@
+"""Tests for precomputed friend-of-friend suggestions.
+
+A full batch at the default settings writes more suggestion rows than one
+INSERT can bind under asyncpg's 32,767 parameter limit, so the refresh
+has to split its writes.
+"""
+
+import os
+import sys
+import uuid
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+# Add the backend directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from app.core.config import settings
+from app.services.friend_suggestion_service import FriendSuggestionService, rank_friends_of_friends
+
+ASYNCPG_MAX_PARAMS = 32767
+
+
+class FakeGraph:
+    def __init__(self, adjacency):
+        self.adjacency = adjacency
+
+    async def get_friend_ids(self, session, user_id):
+        return frozenset(self.adjacency.get(user_id, ()))
+
+    async def get_many(self, session, user_ids):
+        return {user_id: frozenset(self.adjacency.get(user_id, ())) for user_id in user_ids}
+
+
+class RecordingSession:
+    """Records executed statements with their compiled bind parameter counts."""
+
+    def __init__(self):
+        self.inserts = []
+        self.deletes = 0
+        self.commits = 0
+
+    async def execute(self, stmt):
+        if stmt.is_insert:
+            compiled = stmt.compile(dialect=postgresql.dialect())
+            rows = sum(1 for key in compiled.params if key == "user_id" or key.startswith("user_id_m"))
+            self.inserts.append((rows, len(compiled.params)))
+        elif stmt.is_delete:
+            self.deletes += 1
+
+    async def commit(self):
+        self.commits += 1
+
+
+def build_graph(users, friends_per_user, pool):
+    """Each user befriends a few hubs that share a large pool of other friends."""
+    hubs = [str(uuid.uuid4()) for _ in range(friends_per_user)]
+    others = [str(uuid.uuid4()) for _ in range(pool)]
+    adjacency = {user_id: set(hubs) for user_id in users}
+    for hub in hubs:
+        adjacency[hub] = set(users) | set(others)
+    return adjacency
+
+
+@pytest.mark.asyncio
+async def test_refresh_with_default_batch_splits_inserts_under_param_limit():
+    users = [str(uuid.uuid4()) for _ in range(settings.FRIEND_SUGGESTIONS_BATCH_SIZE)]
+    adjacency = build_graph(users, friends_per_user=3, pool=settings.FRIEND_SUGGESTIONS_PER_USER * 2)
+    service = FriendSuggestionService(
+        graph=FakeGraph(adjacency),
+        per_user=settings.FRIEND_SUGGESTIONS_PER_USER,
+        batch_size=settings.FRIEND_SUGGESTIONS_BATCH_SIZE,
+    )
+    session = RecordingSession()
+
+    written = await service.refresh_users(session, users)
+
+    expected = settings.FRIEND_SUGGESTIONS_BATCH_SIZE * settings.FRIEND_SUGGESTIONS_PER_USER
+    assert written == expected
+    assert sum(rows for rows, _ in session.inserts) == expected
+    assert expected * 4 > ASYNCPG_MAX_PARAMS
+    assert len(session.inserts) > 1
+    assert all(params <= ASYNCPG_MAX_PARAMS for _, params in session.inserts)
+    assert session.deletes == 1
+    assert session.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_without_candidates_only_clears_rows():
+    user_id = str(uuid.uuid4())
+    service = FriendSuggestionService(graph=FakeGraph({user_id: set()}))
+    session = RecordingSession()
+
+    assert await service.refresh_users(session, [user_id]) == 0
+    assert session.inserts == []
+    assert session.deletes == 1
+
+
+@pytest.mark.asyncio
+async def test_inline_refresh_does_not_commit_caller_session():
+    users = [str(uuid.uuid4())]
+    adjacency = build_graph(users, friends_per_user=2, pool=5)
+    refresh_session = RecordingSession()
+
+    @asynccontextmanager
+    async def session_factory():
+        yield refresh_session
+
+    reads = []
+
+    class UnstoredSuggestions(FriendSuggestionService):
+        """Nothing stored yet; records which session each read used."""
+
+        async def _read(self, session, user_id, limit):
+            reads.append(session)
+            return []
+
+        async def _has_stored(self, session, user_id):
+            return False
+
+    service = UnstoredSuggestions(graph=FakeGraph(adjacency), session_factory=session_factory)
+    caller_session = RecordingSession()
+
+    await service.get_suggestions(caller_session, users[0])
+
+    assert caller_session.commits == 0
+    assert caller_session.inserts == []
+    assert refresh_session.commits == 1
+    assert sum(rows for rows, _ in refresh_session.inserts) == 5
+    assert reads == [caller_session, caller_session]
+
+
+def test_rank_excludes_self_and_existing_friends():
+    graph = {
+        "a": {"me", "b", "x", "y"},
+        "b": {"me", "a", "x"},
+    }
+    assert rank_friends_of_friends("me", {"a", "b"}, graph, limit=10) == [("x", 2), ("y", 1)]
@@ -0,0 +1,154 @@
+"""Tests for the friends list endpoint serialization.
+
+``get_friends_list`` returns ``FriendProfile`` rows keyed by ``user_id``;
+the endpoint must map them onto the ``UserSearch`` response model. The
+service query itself is compiled for PostgreSQL and answered by a fake
+session, so it is exercised without a database.
+"""
+
+import os
+import sys
+from collections import namedtuple
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+# Add the backend directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from app.api.api_v1.endpoints.friends import get_friends_list_endpoint
+from app.models.friendship import Friendship, FriendshipStatus
+from app.models.user import User
+from app.schemas.friendship import FriendProfile, FriendsList
+from app.schemas.user import UserSearch
+from app.services.friendship_service import friendship_service
+
+FriendRow = namedtuple("FriendRow", ["Friendship", "User", "friend_id", "sort_name"])
+
+
+def make_friend(**overrides):
+    data = dict(
+        user_id=str(uuid4()),
+        username="fern_fan",
+        display_name="Fern Fan",
+        bio="Mostly ferns",
+        gardening_experience="intermediate",
+        friendship_id=str(uuid4()),
+        is_close_friend=True,
+        friends_since=datetime(2025, 4, 1),
+        mutual_friends_count=3,
+    )
+    data.update(overrides)
+    return FriendProfile(**data)
+
+
+@pytest.mark.asyncio
+async def test_friends_list_serializes_friend_profiles():
+    """Each friend becomes a UserSearch with its user id and accepted status."""
+    friends = [make_friend(), make_friend(username="cactus_carl", display_name="Carl", is_close_friend=False)]
+    friends_list = FriendsList(
+        friends=friends,
+        total_count=7,
+        close_friends_count=1,
+        online_friends_count=0,
+        next_cursor="next-page",
+    )
+    response = Mock(headers={})
+    current_user = SimpleNamespace(id=uuid4())
+
+    with patch(
+        "app.api.api_v1.endpoints.friends.get_friends_list",
+        AsyncMock(return_value=friends_list),
+    ):
+        result = await get_friends_list_endpoint(
+            response=response, limit=2, cursor=None, current_user=current_user, db=Mock()
+        )
+
+    assert [item.id for item in result] == [friend.user_id for friend in friends]
+    assert all(isinstance(item, UserSearch) for item in result)
+    assert all(item.friendship_status == "accepted" for item in result)
+    assert [item.is_close_friend for item in result] == [True, False]
+    assert result[0].mutual_friends_count == 3
+    assert result[0].gardening_experience == "intermediate"
+    assert response.headers == {"X-Next-Cursor": "next-page", "X-Total-Count": "7"}
+
+
+@pytest.mark.asyncio
+async def test_friends_list_omits_cursor_on_last_page():
+    friends_list = FriendsList(friends=[], total_count=0, close_friends_count=0, online_friends_count=0)
+    response = Mock(headers={})
+
+    with patch(
+        "app.api.api_v1.endpoints.friends.get_friends_list",
+        AsyncMock(return_value=friends_list),
+    ):
+        result = await get_friends_list_endpoint(
+            response=response, limit=50, cursor=None, current_user=SimpleNamespace(id=uuid4()), db=Mock()
+        )
+
+    assert result == []
+    assert response.headers == {"X-Total-Count": "0"}
+
+
+class CompilingSession:
+    """Compiles each statement for PostgreSQL and returns canned rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt.compile(dialect=postgresql.dialect()))
+        result = Mock()
+        result.all.return_value = self.rows
+        return result
+
+
+def make_row(user_id, name):
+    friend = User(
+        id=uuid4(), username=name.lower(), display_name=name, profile_picture_url=None, bio=None,
+        gardening_experience="beginner", favorite_plants=None, location=None, last_active=None
+    )
+    friendship = Friendship(
+        id=uuid4(), requester_id=user_id, addressee_id=friend.id,
+        status=FriendshipStatus.ACCEPTED, is_close_friend=False, created_at=datetime(2025, 1, 1)
+    )
+    return FriendRow(friendship, friend, friend.id, name)
+
+
+@pytest.mark.asyncio
+async def test_friends_list_runs_service_query():
+    """The real service query compiles and its rows reach the response."""
+    user_id = uuid4()
+    rows = [make_row(user_id, name) for name in ("Aloe", "Basil", "Cactus")]
+    session = CompilingSession(rows)
+    response = Mock(headers={})
+    graph = Mock(mutual_friend_counts=AsyncMock(
+        return_value={str(row.friend_id): 1 for row in rows}
+    ))
+
+    with patch(
+        "app.services.friendship_service.get_counts",
+        AsyncMock(return_value={"friends_count": 3, "close_friends_count": 0}),
+    ), patch.object(friendship_service, "friend_graph", graph):
+        result = await get_friends_list_endpoint(
+            response=response, limit=2, cursor=None, current_user=SimpleNamespace(id=user_id), db=session
+        )
+
+    sql = str(session.statements[0])
+    assert (
+        "CASE WHEN (friendships.requester_id = %(requester_id_1)s::UUID) "
+        "THEN friendships.addressee_id ELSE friendships.requester_id END AS friend_id"
+    ) in sql
+    assert "ORDER BY coalesce(users.display_name, users.username) ASC, friendships.id ASC" in sql
+    assert "LIMIT %(param_1)s" in sql
+    assert session.statements[0].params["param_1"] == 3
+
+    assert [item.display_name for item in result] == ["Aloe", "Basil"]
+    assert [item.id for item in result] == [str(row.User.id) for row in rows[:2]]
+    assert response.headers["X-Total-Count"] == "3"
+    assert "X-Next-Cursor" in response.headers
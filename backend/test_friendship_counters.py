@@ -0,0 +1,82 @@
+"""Tests for denormalized friendship counters.
+
+A user without a counter row must have it backfilled from the
+friendships table, not seeded with the delta of the current mutation.
+"""
+
+import os
+import sys
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+# Add the backend directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from app.models.friendship import FriendshipStatus
+from app.services.friendship_counter_service import COUNTER_COLUMNS, counter_deltas, record_transition
+
+
+class CounterSession:
+    """Answers counter updates with a fixed rowcount and counts queries with fixed source counts."""
+
+    def __init__(self, has_row, source_counts):
+        self.has_row = has_row
+        self.source_counts = source_counts
+        self.flushes = 0
+        self.statements = []
+
+    async def flush(self):
+        self.flushes += 1
+
+    async def execute(self, stmt):
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        self.statements.append((str(compiled), compiled.params))
+        if stmt.is_update:
+            return SimpleNamespace(rowcount=1 if self.has_row else 0)
+        if stmt.is_insert:
+            return SimpleNamespace(rowcount=1)
+        return SimpleNamespace(one=lambda: SimpleNamespace(**self.source_counts))
+
+
+def accepted(requester_id, addressee_id):
+    return (requester_id, addressee_id, FriendshipStatus.ACCEPTED, False)
+
+
+def pending(requester_id, addressee_id):
+    return (requester_id, addressee_id, FriendshipStatus.PENDING, False)
+
+
+@pytest.mark.asyncio
+async def test_existing_row_gets_delta_only():
+    requester_id, addressee_id = str(uuid.uuid4()), str(uuid.uuid4())
+    session = CounterSession(has_row=True, source_counts={})
+
+    await record_transition(session, pending(requester_id, addressee_id), accepted(requester_id, addressee_id))
+
+    assert session.flushes == 1
+    assert [sql.split()[0] for sql, _ in session.statements] == ["UPDATE", "UPDATE"]
+    sql, params = session.statements[0]
+    assert "friends_count=(friendship_counters.friends_count + %(friends_count_1)s)" in sql
+    assert params["friends_count_1"] == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_row_is_backfilled_from_source_counts():
+    requester_id, addressee_id = str(uuid.uuid4()), str(uuid.uuid4())
+    source_counts = {column: 0 for column in COUNTER_COLUMNS}
+    source_counts.update(friends_count=7, pending_sent_count=2)
+    session = CounterSession(has_row=False, source_counts=source_counts)
+    deltas = counter_deltas(pending(requester_id, addressee_id), accepted(requester_id, addressee_id))
+
+    await record_transition(session, pending(requester_id, addressee_id), accepted(requester_id, addressee_id))
+
+    inserts = [(sql, params) for sql, params in session.statements if sql.startswith("INSERT")]
+    assert len(inserts) == len(deltas) == 2
+    for sql, params in inserts:
+        assert {column: params[column] for column in COUNTER_COLUMNS} == source_counts
+        assert "ON CONFLICT (user_id) DO UPDATE" in sql
+        assert "friends_count = (friendship_counters.friends_count + %(friends_count_1)s)" in sql
+        assert params["friends_count_1"] == 1